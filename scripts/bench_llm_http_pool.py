@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Latency benchmark for pooled LLM adapter HTTP connections.
+
+Serves OpenAI-style chat completions from a local keep-alive HTTP/1.1 stub
+server and compares a fresh ``httpx.Client`` per call (the previous adapter
+behaviour) with ``OpenAIAdapter`` reusing its ``PooledHTTPClient``.
+
+The stub has no TLS, so ``--handshake-ms`` can add a delay to every new
+connection to model the TCP + TLS handshake round trips of a remote API.
+
+Usage:
+    python scripts/bench_llm_http_pool.py [--calls N] [--handshake-ms 0,30]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+# Add src to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from kira.adapters.llm import Message, OpenAIAdapter  # noqa: E402
+
+RESPONSE = json.dumps(
+    {
+        "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 12, "completion_tokens": 1, "total_tokens": 13},
+    }
+).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Keep-alive chat completions endpoint with a per-connection delay."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # avoid delayed-ACK stalls on kept-alive sockets
+    handshake_seconds = 0.0
+    connections = 0
+
+    def setup(self) -> None:
+        """Count the connection and simulate its handshake."""
+        super().setup()
+        type(self).connections += 1
+        time.sleep(self.handshake_seconds)
+
+    def do_POST(self) -> None:
+        """Return a canned completion."""
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE)))
+        self.end_headers()
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Silence request logging."""
+
+
+def per_call_client(url: str, messages: list[Message]) -> None:
+    """One request the way adapters used to send it: a new client each call."""
+    payload = {"model": "gpt-4", "messages": [{"role": m.role, "content": m.content} for m in messages]}
+    with httpx.Client(timeout=30.0) as client:
+        client.post(url, json=payload, headers={"Authorization": "Bearer test"}).raise_for_status()
+
+
+def main() -> int:
+    """Run benchmark and print per-call latency."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--handshake-ms", default="0,30")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    messages = [Message(role="user", content="ping")]
+
+    print(f"{'handshake ms':>12} {'mode':>9} {'ms/call':>8} {'connections':>11}")
+    try:
+        for handshake_ms in (float(value) for value in args.handshake_ms.split(",")):
+            StubHandler.handshake_seconds = handshake_ms / 1000
+            with OpenAIAdapter(api_key="test", base_url=base_url) as adapter:
+                runs = {
+                    "per-call": lambda: per_call_client(f"{base_url}/chat/completions", messages),
+                    "pooled": lambda adapter=adapter: adapter.chat(messages),
+                }
+                for mode, run in runs.items():
+                    run()  # warm up (opens the pooled connection)
+                    StubHandler.connections = 0
+                    start = time.perf_counter()
+                    for _ in range(args.calls):
+                        run()
+                    ms = (time.perf_counter() - start) * 1000 / args.calls
+                    print(f"{handshake_ms:>12.0f} {mode:>9} {ms:>8.2f} {StubHandler.connections:>11}")
+    finally:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Throughput benchmark for plugin JSON-RPC framing (ADR-004).
+
+Compares the text transport (Content-Length header + JSON) with the
+negotiated binary transport (length prefix + MessagePack-style payload)
+by round-tripping ``vault.list``-shaped responses through
+``StdioTransport`` over in-memory streams.
+
+Usage:
+    python scripts/bench_rpc_transport.py [--iterations N] [--sizes 10,1000,10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import timeit
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Add src to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from kira.plugin_sdk.rpc import JSONRPCMessage, StdioTransport  # noqa: E402
+
+
+def make_response(entity_count: int) -> JSONRPCMessage:
+    """Build a vault.list response with ``entity_count`` task entities."""
+    entities = [
+        {
+            "id": f"task-20251008-1200-item-{i}",
+            "type": "task",
+            "metadata": {
+                "title": f"Подготовить отчёт {i}",
+                "status": "todo",
+                "priority": i % 3,
+                "tags": ["work", "reports"],
+                "estimate": 1.5,
+                "due_date": "2025-10-15T18:00:00+00:00",
+            },
+        }
+        for i in range(entity_count)
+    ]
+    return JSONRPCMessage(id=1, result={"entities": entities, "count": entity_count})
+
+
+def make_round_trip(message: JSONRPCMessage, mode: str) -> tuple[Callable[[], None], int]:
+    """Return a send-then-receive callable for one mode and its frame size."""
+
+    def run() -> JSONRPCMessage:
+        stream = io.BytesIO()
+        StdioTransport(io.BytesIO(), stream, mode=mode).send(message)
+        stream.seek(0)
+        return StdioTransport(stream, io.BytesIO(), mode=mode).receive()
+
+    assert run().result == message.result, f"{mode} round trip changed the payload"
+
+    stream = io.BytesIO()
+    StdioTransport(io.BytesIO(), stream, mode=mode).send(message)
+    return run, stream.tell()
+
+
+def main() -> int:
+    """Run benchmark and print per-message timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--sizes", default="10,1000,10000")
+    args = parser.parse_args()
+
+    print(f"{'entities':>8} {'mode':>6} {'frame KB':>9} {'ms/msg':>8} {'MB/s':>7}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        message = make_response(size)
+        for mode in ("text", "binary"):
+            run, frame_size = make_round_trip(message, mode)
+            seconds = min(timeit.repeat(run, number=args.iterations, repeat=3)) / args.iterations
+            throughput = frame_size / seconds / 1e6
+            print(f"{size:>8} {mode:>6} {frame_size / 1024:>9.1f} {seconds * 1000:>8.2f} {throughput:>7.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Microbenchmark for frontmatter serialization (ADR-001).
+
+Compares ``serialize_frontmatter`` (direct emitter) with the reference
+implementation that calls ``yaml.dump`` once per value.
+
+Usage:
+    python scripts/bench_yaml_serializer.py [--iterations N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from datetime import UTC, datetime
+from pathlib import Path
+
+# Add src to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from kira.core.yaml_serializer import (  # noqa: E402
+    _serialize_frontmatter_pyyaml,
+    get_canonical_key_order,
+    normalize_timestamps_to_utc,
+    serialize_frontmatter,
+)
+
+SAMPLE_FRONTMATTER = {
+    "id": "task-20251008-1200-quarterly-report",
+    "title": "Подготовить квартальный отчёт: Q3",
+    "status": "doing",
+    "priority": "high",
+    "created": datetime(2025, 10, 8, 12, 0, tzinfo=UTC),
+    "updated": datetime(2025, 10, 9, 8, 30, tzinfo=UTC),
+    "due_date": "2025-10-15T18:00:00+00:00",
+    "tags": ["work", "reports", "q3"],
+    "relates_to": ["[[project-finance]]", "[[note-20251001-metrics]]"],
+    "estimate": 3.5,
+    "x-kira": {"source": "telegram", "version": 4, "last_write_ts": "2025-10-09T08:30:00+00:00"},
+}
+
+
+def main() -> int:
+    """Run benchmark and print per-call timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    def reference() -> str:
+        normalized = normalize_timestamps_to_utc(SAMPLE_FRONTMATTER)
+        return _serialize_frontmatter_pyyaml(normalized, get_canonical_key_order(list(SAMPLE_FRONTMATTER)))
+
+    def fast() -> str:
+        return serialize_frontmatter(SAMPLE_FRONTMATTER)
+
+    assert fast() == reference(), "fast emitter output diverged from reference"
+
+    results = {}
+    for name, func in (("yaml.dump per value", reference), ("direct emitter", fast)):
+        seconds = min(timeit.repeat(func, number=args.iterations, repeat=3))
+        results[name] = seconds / args.iterations * 1e6
+        print(f"{name:>20}: {results[name]:8.1f} µs/call")
+
+    print(f"{'speedup':>20}: {results['yaml.dump per value'] / results['direct emitter']:8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
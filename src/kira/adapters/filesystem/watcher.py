@@ -0,0 +1,624 @@
+"""Filesystem watcher keeping Vault caches and indexes hot (ADR-006).
+
+Long-running services (Telegram bot, agent service) share the Vault with
+editors such as Obsidian, so caches cannot rely on the HostAPI write path
+alone. ``VaultWatcher`` observes entity folders and feeds changed files to
+``HostAPI.apply_file_changes``, which incrementally updates the entity
+index (metadata, secondary and full-text indexes), the entity cache and
+the link graph. Each applied change is published as ``file.changed``.
+
+Backends:
+- ``inotify`` (Linux, via libc; no third-party dependency)
+- ``polling`` (portable fallback comparing (mtime_ns, size, inode))
+
+Events are debounced per file and coalesced into batches, so an editor
+saving a file several times in a row costs one re-index.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from ...core.entity_index import FileFingerprint
+from ...core.host import ENTITY_FOLDERS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ...core.events import EventBus
+    from ...core.host import FileChange, HostAPI
+
+__all__ = [
+    "InotifyBackend",
+    "PollingBackend",
+    "VaultWatcher",
+    "WatcherBackend",
+    "create_vault_watcher",
+    "inotify_available",
+]
+
+DEFAULT_DEBOUNCE_SECONDS = 0.5
+DEFAULT_POLL_INTERVAL_SECONDS = 2.0
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+
+_FOLDER_MASK = (
+    _IN_CLOSE_WRITE
+    | _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+)
+_ROOT_MASK = _IN_CREATE | _IN_MOVED_TO | _IN_ONLYDIR
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _is_entity_file(name: str) -> bool:
+    """Markdown files, excluding hidden and temporary files (atomic writes)."""
+    return name.endswith(".md") and not name.startswith(".")
+
+
+class WatcherBackend(Protocol):
+    """Source of raw file change notifications."""
+
+    def read(self, timeout: float) -> list[Path] | None:
+        """Wait up to ``timeout`` seconds for changed files.
+
+        Returns
+        -------
+        list[Path] | None
+            Changed entity files (possibly empty), or None if events were
+            lost and the caller must resynchronize from disk
+        """
+        ...
+
+    def close(self) -> None:
+        """Release backend resources."""
+        ...
+
+
+def _load_libc() -> Any | None:
+    """Load libc with inotify support, or None if unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    if not all(hasattr(libc, name) for name in ("inotify_init1", "inotify_add_watch", "inotify_rm_watch")):
+        return None
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+def inotify_available() -> bool:
+    """Whether the inotify backend can be used on this system."""
+    return _load_libc() is not None
+
+
+class InotifyBackend:
+    """Linux inotify backend.
+
+    Watches the Vault root for entity folders that appear later and each
+    entity folder for file changes. Atomic writes (temp file + rename)
+    surface as ``IN_MOVED_TO`` of the final name.
+    """
+
+    def __init__(self, vault_path: Path, folders: Iterable[str]) -> None:
+        """Initialize inotify watches.
+
+        Parameters
+        ----------
+        vault_path
+            Vault root
+        folders
+            Entity folder names relative to the Vault root
+
+        Raises
+        ------
+        OSError
+            If inotify is unavailable or cannot be initialized
+        """
+        libc = _load_libc()
+        if libc is None:
+            raise OSError("inotify is not available on this platform")
+        self._libc = libc
+        self.vault_path = Path(vault_path)
+        self.folders = set(folders)
+
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+        self._fd = fd
+        # watch descriptor -> watched directory
+        self._watches: dict[int, Path] = {}
+        self._root_wd = self._add_watch(self.vault_path, _ROOT_MASK)
+        for folder_name in self.folders:
+            self._add_watch(self.vault_path / folder_name, _FOLDER_MASK)
+
+    def _add_watch(self, directory: Path, mask: int) -> int | None:
+        """Watch a directory; missing directories are skipped."""
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), mask)
+        if wd < 0:
+            return None
+        self._watches[wd] = directory
+        return int(wd)
+
+    def read(self, timeout: float) -> list[Path] | None:
+        """Wait for inotify events and decode changed entity files."""
+        try:
+            ready, _, _ = select.select([self._fd], [], [], max(timeout, 0.0))
+        except (OSError, ValueError):
+            # Closed concurrently
+            return []
+        if not ready:
+            return []
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        return self._decode(data)
+
+    def _decode(self, data: bytes) -> list[Path] | None:
+        """Decode a buffer of ``inotify_event`` records."""
+        changed: list[Path] = []
+        overflow = False
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                overflow = True
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+
+            if mask & _IN_IGNORED:
+                # Watched directory was removed
+                self._watches.pop(wd, None)
+                continue
+
+            if wd == self._root_wd:
+                if mask & _IN_ISDIR and name in self.folders:
+                    # New entity folder: watch it and pick up files created
+                    # before the watch was in place
+                    folder_path = directory / name
+                    self._add_watch(folder_path, _FOLDER_MASK)
+                    with contextlib.suppress(OSError):
+                        changed.extend(
+                            Path(entry.path) for entry in os.scandir(folder_path) if _is_entity_file(entry.name)
+                        )
+                continue
+
+            if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF):
+                # Folder deleted or moved away: everything in it is gone
+                overflow = True
+                continue
+
+            if name and not mask & _IN_ISDIR and _is_entity_file(name):
+                changed.append(directory / name)
+
+        return None if overflow else changed
+
+    def close(self) -> None:
+        """Close the inotify descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._watches.clear()
+
+
+class PollingBackend:
+    """Portable backend comparing file fingerprints at a fixed interval."""
+
+    def __init__(
+        self,
+        vault_path: Path,
+        folders: Iterable[str],
+        *,
+        interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize polling backend and take the first snapshot.
+
+        Parameters
+        ----------
+        vault_path
+            Vault root
+        folders
+            Entity folder names relative to the Vault root
+        interval
+            Seconds between directory scans
+        """
+        self.vault_path = Path(vault_path)
+        self.folders = list(folders)
+        self.interval = interval
+        self._closed = threading.Event()
+        self._next_scan = time.monotonic() + interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, FileFingerprint]:
+        """Stat all entity files."""
+        snapshot: dict[Path, FileFingerprint] = {}
+        for folder_name in self.folders:
+            try:
+                entries = list(os.scandir(self.vault_path / folder_name))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for entry in entries:
+                if not _is_entity_file(entry.name):
+                    continue
+                with contextlib.suppress(OSError):
+                    if entry.is_file():
+                        snapshot[Path(entry.path)] = FileFingerprint.from_stat(entry.stat())
+        return snapshot
+
+    def read(self, timeout: float) -> list[Path] | None:
+        """Scan when the interval elapsed and report files that differ."""
+        wait = self._next_scan - time.monotonic()
+        if wait > 0:
+            self._closed.wait(min(wait, max(timeout, 0.0)))
+            if self._closed.is_set() or time.monotonic() < self._next_scan:
+                return []
+
+        self._next_scan = time.monotonic() + self.interval
+        snapshot = self._scan()
+        previous = self._snapshot
+        self._snapshot = snapshot
+
+        changed = [path for path, fingerprint in snapshot.items() if previous.get(path) != fingerprint]
+        changed.extend(path for path in previous if path not in snapshot)
+        return changed
+
+    def close(self) -> None:
+        """Stop waiting."""
+        self._closed.set()
+
+
+class VaultWatcher:
+    """Debouncing watcher that applies external Vault edits to HostAPI.
+
+    Raw notifications are collected per file; a file is processed once it
+    has been quiet for ``debounce`` seconds. Files that become quiet
+    together are applied as one batch (one index transaction).
+    """
+
+    def __init__(
+        self,
+        host_api: HostAPI,
+        *,
+        event_bus: EventBus | None = None,
+        folders: Iterable[str] | None = None,
+        backend: WatcherBackend | str = "auto",
+        debounce: float = DEFAULT_DEBOUNCE_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        logger: Any = None,
+    ) -> None:
+        """Initialize watcher.
+
+        Parameters
+        ----------
+        host_api
+            Host API whose caches and indexes are kept up to date
+        event_bus
+            Event bus for ``file.changed`` (default: ``host_api.event_bus``)
+        folders
+            Entity folders to watch (default: all HostAPI entity folders)
+        backend
+            "auto" (inotify, falling back to polling), "inotify",
+            "polling", or a backend instance
+        debounce
+            Quiet period in seconds before a changed file is processed
+        poll_interval
+            Scan interval of the polling backend in seconds
+        logger
+            Optional logger for structured logging
+        """
+        self.host_api = host_api
+        self.event_bus = event_bus if event_bus is not None else host_api.event_bus
+        self.folders = list(folders) if folders is not None else list(ENTITY_FOLDERS)
+        self.debounce = debounce
+        self.logger = logger or host_api.logger
+
+        self._backend_option = backend
+        self._poll_interval = poll_interval
+        self._backend: WatcherBackend | None = backend if not isinstance(backend, str) else None
+
+        # path -> monotonic time of the latest notification
+        self._pending: dict[Path, float] = {}
+        self._resync_pending = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._stats = {"notifications": 0, "batches": 0, "changes": 0, "resyncs": 0, "errors": 0}
+
+    @property
+    def backend_name(self) -> str | None:
+        """Name of the active backend ("inotify", "polling" or custom)."""
+        if self._backend is None:
+            return None
+        if isinstance(self._backend, InotifyBackend):
+            return "inotify"
+        if isinstance(self._backend, PollingBackend):
+            return "polling"
+        return type(self._backend).__name__
+
+    @property
+    def running(self) -> bool:
+        """Whether the watcher thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _create_backend(self) -> WatcherBackend:
+        """Create backend according to the configured option."""
+        option = self._backend_option
+        vault_path = self.host_api.vault_path
+
+        if option in ("auto", "inotify"):
+            try:
+                return InotifyBackend(vault_path, self.folders)
+            except OSError as exc:
+                if option == "inotify":
+                    raise
+                if self.logger:
+                    self.logger.info(f"inotify unavailable, polling Vault instead: {exc}")
+        elif option != "polling":
+            raise ValueError(f"Unknown watcher backend: {option}")
+
+        return PollingBackend(vault_path, self.folders, interval=self._poll_interval)
+
+    def start(self) -> None:
+        """Start watching in a background thread."""
+        if self.running:
+            return
+        if self._backend is None:
+            self._backend = self._create_backend()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="kira-vault-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Stop watching, applying changes that are still pending.
+
+        Parameters
+        ----------
+        timeout
+            Seconds to wait for the watcher thread
+        """
+        self._stop.set()
+        if self._backend is not None:
+            self._backend.close()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+        self._backend = None if isinstance(self._backend_option, str) else self._backend
+
+    def __enter__(self) -> VaultWatcher:
+        """Context manager entry."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.stop()
+
+    def notify(self, paths: Iterable[Path] | None) -> None:
+        """Record raw change notifications.
+
+        Parameters
+        ----------
+        paths
+            Changed files, or None if notifications were lost and the
+            Vault must be resynchronized
+        """
+        now = time.monotonic()
+        with self._lock:
+            if paths is None:
+                self._resync_pending = True
+                self._pending.clear()
+                self._stats["notifications"] += 1
+                return
+            for path in paths:
+                self._pending[Path(path)] = now
+                self._stats["notifications"] += 1
+
+    def process_pending(self, *, force: bool = False) -> list[FileChange]:
+        """Apply files that have been quiet for the debounce period.
+
+        Parameters
+        ----------
+        force
+            Apply all pending files regardless of debounce
+
+        Returns
+        -------
+        list[FileChange]
+            Changes applied to HostAPI
+        """
+        now = time.monotonic()
+        with self._lock:
+            resync = self._resync_pending
+            self._resync_pending = False
+            if force:
+                ready = list(self._pending)
+            else:
+                ready = [path for path, seen in self._pending.items() if now - seen >= self.debounce]
+            for path in ready:
+                del self._pending[path]
+
+        if resync:
+            self._resync()
+        if not ready:
+            return []
+
+        try:
+            changes = self.host_api.apply_file_changes(ready)
+        except Exception as exc:
+            self._count("errors")
+            if self.logger:
+                self.logger.error(f"Failed to apply {len(ready)} Vault file change(s): {exc}")
+            return []
+
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["changes"] += len(changes)
+        for change in changes:
+            self._publish(change)
+        return changes
+
+    def flush(self) -> list[FileChange]:
+        """Apply all pending changes immediately.
+
+        Returns
+        -------
+        list[FileChange]
+            Changes applied to HostAPI
+        """
+        return self.process_pending(force=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get watcher statistics.
+
+        Returns
+        -------
+        dict[str, Any]
+            Counters, pending files and active backend
+        """
+        with self._lock:
+            stats: dict[str, Any] = {**self._stats, "pending": len(self._pending)}
+        stats["backend"] = self.backend_name
+        return stats
+
+    def _count(self, name: str) -> None:
+        """Increment a statistics counter (called from the watcher thread too)."""
+        with self._lock:
+            self._stats[name] += 1
+
+    def _run(self) -> None:
+        """Watcher thread: read notifications, apply quiet files."""
+        backend = self._backend
+        assert backend is not None
+
+        while not self._stop.is_set():
+            with self._lock:
+                if self._pending:
+                    oldest = min(self._pending.values())
+                    timeout = max(0.0, oldest + self.debounce - time.monotonic())
+                else:
+                    timeout = self.debounce if self._resync_pending else 1.0
+
+            try:
+                paths = backend.read(timeout)
+            except Exception as exc:
+                self._count("errors")
+                if self.logger:
+                    self.logger.error(f"Vault watcher backend failed: {exc}")
+                self._stop.wait(1.0)
+                continue
+
+            if paths is None or paths:
+                self.notify(paths)
+            self.process_pending()
+
+    def _resync(self) -> None:
+        """Recover from lost notifications by reloading HostAPI state."""
+        self._count("resyncs")
+        if self.logger:
+            self.logger.warning("Vault watcher lost events, reloading from disk")
+        self.host_api.reload_from_disk()
+        if self.event_bus:
+            self.event_bus.publish(
+                "file.changed",
+                {"path": None, "kind": "rescan", "entity_id": None, "previous_entity_id": None},
+            )
+
+    def _publish(self, change: FileChange) -> None:
+        """Publish ``file.changed`` for an applied change."""
+        if self.event_bus is None:
+            return
+        self.event_bus.publish(
+            "file.changed",
+            {
+                "path": str(change.path),
+                "kind": change.kind,
+                "entity_id": change.entity_id,
+                "previous_entity_id": change.previous_entity_id,
+            },
+        )
+
+
+def create_vault_watcher(
+    host_api: HostAPI,
+    *,
+    event_bus: EventBus | None = None,
+    backend: WatcherBackend | str = "auto",
+    debounce: float = DEFAULT_DEBOUNCE_SECONDS,
+    poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    logger: Any = None,
+) -> VaultWatcher:
+    """Create Vault watcher.
+
+    Parameters
+    ----------
+    host_api
+        Host API whose caches and indexes are kept up to date
+    event_bus
+        Event bus for ``file.changed`` (default: ``host_api.event_bus``)
+    backend
+        "auto", "inotify", "polling" or a backend instance
+    debounce
+        Quiet period in seconds before a changed file is processed
+    poll_interval
+        Scan interval of the polling backend in seconds
+    logger
+        Optional logger
+
+    Returns
+    -------
+    VaultWatcher
+        Watcher (call ``start()`` to begin watching)
+    """
+    return VaultWatcher(
+        host_api,
+        event_bus=event_bus,
+        backend=backend,
+        debounce=debounce,
+        poll_interval=poll_interval,
+        logger=logger,
+    )
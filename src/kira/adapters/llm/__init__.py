@@ -6,13 +6,19 @@ Provides provider-agnostic interface for LLM interactions with support for:
 - Tool calling
 - Multiple providers (OpenRouter, OpenAI, Anthropic, Ollama)
 - Multi-provider routing with fallback
+- Pooled keep-alive HTTP connections per adapter
+- Opt-in response cache for repeated requests
+- Opt-in hedging of slow requests across providers
 """
 
 from .adapter import LLMAdapter, LLMError, LLMRateLimitError, LLMResponse, LLMTimeoutError, Message, Tool, ToolCall
 from .anthropic_adapter import AnthropicAdapter
+from .hedging import LatencyTracker
+from .http_pool import HTTPPoolConfig, PooledHTTPClient
 from .ollama_adapter import OllamaAdapter
 from .openai_adapter import OpenAIAdapter
 from .openrouter_adapter import OpenRouterAdapter
+from .response_cache import ResponseCache, create_response_cache
 from .router import LLMErrorEnhanced, LLMRouter, RouterConfig, TaskType
 
 __all__ = [
@@ -29,7 +35,12 @@ __all__ = [
     "OpenRouterAdapter",
     "AnthropicAdapter",
     "OllamaAdapter",
+    "HTTPPoolConfig",
+    "PooledHTTPClient",
+    "ResponseCache",
+    "create_response_cache",
     "LLMRouter",
     "RouterConfig",
+    "LatencyTracker",
     "TaskType",
 ]
@@ -3,13 +3,17 @@
 Defines the interface for LLM providers with support for:
 - generate(): Single-turn text completion
 - chat(): Multi-turn conversation
+- chat_stream(): Multi-turn conversation streamed as text deltas
 - tool_call(): Function calling with structured output
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Literal, Protocol
+from typing import TYPE_CHECKING, Any, Literal, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 __all__ = [
     "LLMAdapter",
@@ -167,6 +171,46 @@ class LLMAdapter(Protocol):
         """
         ...
 
+    def chat_stream(
+        self,
+        messages: list[Message],
+        *,
+        model: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        timeout: float = 30.0,
+    ) -> Iterator[str]:
+        """Multi-turn chat conversation, streamed as it is generated.
+
+        Parameters
+        ----------
+        messages
+            List of conversation messages
+        model
+            Model name (provider-specific)
+        temperature
+            Sampling temperature (0.0-2.0)
+        max_tokens
+            Maximum tokens to generate
+        timeout
+            Maximum seconds to wait for the next chunk
+
+        Yields
+        ------
+        str
+            Text deltas; their concatenation is the full response
+
+        Raises
+        ------
+        LLMError
+            On API errors
+        LLMTimeoutError
+            On timeout
+        LLMRateLimitError
+            On rate limit
+        """
+        ...
+
     def tool_call(
         self,
         messages: list[Message],
@@ -6,11 +6,16 @@ Direct Anthropic API integration for Claude models.
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
 from .adapter import LLMError, LLMRateLimitError, LLMResponse, LLMTimeoutError, Message, Tool, ToolCall
+from .http_pool import HTTPPoolConfig, PooledHTTPClient
+from .streaming import iter_sse_json, raise_for_stream_status
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 __all__ = ["AnthropicAdapter"]
 
@@ -28,6 +33,7 @@ class AnthropicAdapter:
         base_url: str = "https://api.anthropic.com/v1",
         default_model: str = "claude-3-5-sonnet-20241022",
         api_version: str = "2023-06-01",
+        http_pool: HTTPPoolConfig | None = None,
     ) -> None:
         """Initialize Anthropic adapter.
 
@@ -41,11 +47,26 @@ class AnthropicAdapter:
             Default model to use
         api_version
             API version header
+        http_pool
+            Connection pool limits (default ``HTTPPoolConfig()``)
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.default_model = default_model
         self.api_version = api_version
+        self._http = PooledHTTPClient(http_pool)
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._http.close()
+
+    def __enter__(self) -> AnthropicAdapter:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
 
     def _make_headers(self) -> dict[str, str]:
         """Create request headers."""
@@ -162,12 +183,12 @@ class AnthropicAdapter:
             payload["system"] = system_prompt
 
         try:
-            with httpx.Client(timeout=timeout) as client:
-                response = client.post(
-                    f"{self.base_url}/messages",
-                    headers=self._make_headers(),
-                    json=payload,
-                )
+            response = self._http.post(
+                f"{self.base_url}/messages",
+                headers=self._make_headers(),
+                json=payload,
+                timeout=timeout,
+            )
 
             if response.status_code == 429:
                 raise LLMRateLimitError("Anthropic rate limit exceeded")
@@ -189,6 +210,62 @@ class AnthropicAdapter:
         except (httpx.HTTPError, httpx.RequestError) as e:
             raise LLMError(f"Anthropic HTTP error: {e}") from e
 
+    def chat_stream(
+        self,
+        messages: list[Message],
+        *,
+        model: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        timeout: float = 30.0,
+    ) -> Iterator[str]:
+        """Multi-turn chat conversation streamed as server-sent events."""
+        model = model or self.default_model
+
+        system_prompt, anthropic_messages = self._messages_to_anthropic(messages)
+
+        payload: dict[str, Any] = {
+            "model": model,
+            "messages": anthropic_messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True,
+        }
+
+        if system_prompt:
+            payload["system"] = system_prompt
+
+        try:
+            with self._http.stream(
+                f"{self.base_url}/messages",
+                headers=self._make_headers(),
+                json=payload,
+                timeout=timeout,
+            ) as response:
+                raise_for_stream_status(response, "Anthropic")
+
+                for event, data in iter_sse_json(response.iter_lines()):
+                    if event == "message_stop":
+                        break
+                    if event == "error":
+                        self._raise_stream_error(data.get("error", {}))
+                    if event == "content_block_delta":
+                        delta = data.get("delta", {})
+                        if delta.get("type") == "text_delta" and delta.get("text"):
+                            yield delta["text"]
+
+        except httpx.TimeoutException as e:
+            raise LLMTimeoutError(f"Anthropic request timed out after {timeout}s") from e
+        except (httpx.HTTPError, httpx.RequestError) as e:
+            raise LLMError(f"Anthropic HTTP error: {e}") from e
+
+    @staticmethod
+    def _raise_stream_error(error: dict[str, Any]) -> None:
+        """Raise the adapter error for an ``error`` event of a message stream."""
+        if error.get("type") == "overloaded_error":
+            raise LLMRateLimitError(f"Anthropic overloaded: {error.get('message', '')}")
+        raise LLMError(f"Anthropic stream error: {error.get('message', error)}")
+
     def tool_call(
         self,
         messages: list[Message],
@@ -216,12 +293,12 @@ class AnthropicAdapter:
             payload["system"] = system_prompt
 
         try:
-            with httpx.Client(timeout=timeout) as client:
-                response = client.post(
-                    f"{self.base_url}/messages",
-                    headers=self._make_headers(),
-                    json=payload,
-                )
+            response = self._http.post(
+                f"{self.base_url}/messages",
+                headers=self._make_headers(),
+                json=payload,
+                timeout=timeout,
+            )
 
             if response.status_code == 429:
                 raise LLMRateLimitError("Anthropic rate limit exceeded")
@@ -0,0 +1,69 @@
+"""Per-provider latency tracking for hedged LLM requests.
+
+``LLMRouter`` records the latency of every successful provider call. With
+hedging enabled, a request that takes longer than the primary provider's
+p95 latency is also sent to the next provider and the first successful
+answer wins, so one slow provider no longer costs the full timeout.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import defaultdict, deque
+
+__all__ = ["LatencyTracker"]
+
+
+class LatencyTracker:
+    """Rolling window of call latencies per provider. Thread-safe."""
+
+    def __init__(self, window: int = 100, min_samples: int = 10) -> None:
+        """Initialize latency tracker.
+
+        Parameters
+        ----------
+        window
+            Number of most recent latencies kept per provider
+        min_samples
+            Samples required before quantiles are reported
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._samples: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=self.window))
+
+    def record(self, provider: str, seconds: float) -> None:
+        """Record the latency of a successful call.
+
+        Parameters
+        ----------
+        provider
+            Provider name
+        seconds
+            Call duration in seconds
+        """
+        with self._lock:
+            self._samples[provider].append(seconds)
+
+    def quantile(self, provider: str, q: float = 0.95) -> float | None:
+        """Get a latency quantile (nearest rank) for a provider.
+
+        Parameters
+        ----------
+        provider
+            Provider name
+        q
+            Quantile between 0 and 1
+
+        Returns
+        -------
+        float | None
+            Latency in seconds, or None with fewer than ``min_samples`` samples
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(provider, ()))
+        if not samples or len(samples) < self.min_samples:
+            return None
+        rank = max(math.ceil(q * len(samples)), 1)
+        return samples[rank - 1]
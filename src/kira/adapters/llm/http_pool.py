@@ -0,0 +1,151 @@
+"""Long-lived HTTP connection pools for LLM adapters.
+
+Each adapter owns one ``PooledHTTPClient`` for its whole lifetime, so the
+several LLM calls behind one agent turn (plan, reflect, respond) reuse
+kept-alive connections instead of paying a TCP and TLS handshake each.
+HTTP/2 is negotiated when the optional ``h2`` package is installed.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+__all__ = ["HTTPPoolConfig", "PooledHTTPClient", "http2_available"]
+
+
+def http2_available() -> bool:
+    """Check whether httpx can negotiate HTTP/2 (needs the ``h2`` package)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class HTTPPoolConfig:
+    """Connection pool limits for an adapter.
+
+    Attributes
+    ----------
+    max_connections : int
+        Maximum concurrent connections
+    max_keepalive_connections : int
+        Idle connections kept open for reuse
+    keepalive_expiry : float
+        Seconds an idle connection is kept
+    connect_timeout : float
+        Seconds allowed for establishing a connection
+    http2 : bool
+        Use HTTP/2 where the server and installed packages support it
+    """
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    connect_timeout: float = 10.0
+    http2: bool = True
+
+
+class PooledHTTPClient:
+    """Thread-safe, lazily created ``httpx.Client`` shared by all calls of an adapter.
+
+    The client is created on first use and recreated after ``close``, so
+    adapters cost nothing until they make a request.
+    """
+
+    def __init__(self, config: HTTPPoolConfig | None = None) -> None:
+        """Initialize pooled client.
+
+        Parameters
+        ----------
+        config
+            Pool limits (defaults to ``HTTPPoolConfig()``)
+        """
+        self.config = config or HTTPPoolConfig()
+        self._client: httpx.Client | None = None
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    @property
+    def http2(self) -> bool:
+        """Whether HTTP/2 is enabled for this pool."""
+        return self.config.http2 and http2_available()
+
+    def _get_client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    http2=self.http2,
+                    limits=httpx.Limits(
+                        max_connections=self.config.max_connections,
+                        max_keepalive_connections=self.config.max_keepalive_connections,
+                        keepalive_expiry=self.config.keepalive_expiry,
+                    ),
+                    timeout=httpx.Timeout(30.0, connect=self.config.connect_timeout),
+                )
+            self.requests += 1
+            return self._client
+
+    def post(self, url: str, *, timeout: float, **kwargs: Any) -> httpx.Response:
+        """Send a POST request over the pool.
+
+        Parameters
+        ----------
+        url
+            Absolute request URL
+        timeout
+            Read/write/pool timeout in seconds for this request
+        **kwargs
+            Passed to ``httpx.Client.post`` (``headers``, ``json``, ...)
+
+        Returns
+        -------
+        httpx.Response
+            Response (body fully read)
+        """
+        return self._get_client().post(url, timeout=self._timeout(timeout), **kwargs)
+
+    @contextmanager
+    def stream(self, url: str, *, timeout: float, **kwargs: Any) -> Generator[httpx.Response, None, None]:
+        """Send a POST request and stream the response body.
+
+        Parameters
+        ----------
+        url
+            Absolute request URL
+        timeout
+            Read timeout in seconds between received chunks
+        **kwargs
+            Passed to ``httpx.Client.stream``
+
+        Yields
+        ------
+        httpx.Response
+            Response with unread body; the connection returns to the pool on exit
+        """
+        with self._get_client().stream("POST", url, timeout=self._timeout(timeout), **kwargs) as response:
+            yield response
+
+    def _timeout(self, timeout: float) -> httpx.Timeout:
+        return httpx.Timeout(timeout, connect=min(timeout, self.config.connect_timeout))
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def __enter__(self) -> PooledHTTPClient:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
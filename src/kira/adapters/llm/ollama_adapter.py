@@ -6,11 +6,16 @@ Provides local fallback when remote providers are unavailable.
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
 from .adapter import LLMError, LLMRateLimitError, LLMResponse, LLMTimeoutError, Message, Tool, ToolCall
+from .http_pool import HTTPPoolConfig, PooledHTTPClient
+from .streaming import iter_ndjson
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 __all__ = ["OllamaAdapter"]
 
@@ -26,6 +31,7 @@ class OllamaAdapter:
         *,
         base_url: str = "http://localhost:11434",
         default_model: str = "llama2",
+        http_pool: HTTPPoolConfig | None = None,
     ) -> None:
         """Initialize Ollama adapter.
 
@@ -35,9 +41,24 @@ class OllamaAdapter:
             Ollama API base URL
         default_model
             Default model to use
+        http_pool
+            Connection pool limits (default ``HTTPPoolConfig()``)
         """
         self.base_url = base_url.rstrip("/")
         self.default_model = default_model
+        self._http = PooledHTTPClient(http_pool)
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._http.close()
+
+    def __enter__(self) -> OllamaAdapter:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
 
     def _messages_to_prompt(self, messages: list[Message]) -> str:
         """Convert messages to a single prompt string."""
@@ -74,11 +95,11 @@ class OllamaAdapter:
         }
 
         try:
-            with httpx.Client(timeout=timeout) as client:
-                response = client.post(
-                    f"{self.base_url}/api/generate",
-                    json=payload,
-                )
+            response = self._http.post(
+                f"{self.base_url}/api/generate",
+                json=payload,
+                timeout=timeout,
+            )
 
             if response.status_code >= 400:
                 error_msg = response.text
@@ -127,6 +148,59 @@ class OllamaAdapter:
         prompt += "\n\nAssistant:"
         return self.generate(prompt, model=model, temperature=temperature, max_tokens=max_tokens, timeout=timeout)
 
+    def chat_stream(
+        self,
+        messages: list[Message],
+        *,
+        model: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        timeout: float = 30.0,
+    ) -> Iterator[str]:
+        """Multi-turn chat conversation streamed as newline-delimited JSON."""
+        model = model or self.default_model
+
+        payload = {
+            "model": model,
+            "prompt": self._messages_to_prompt(messages) + "\n\nAssistant:",
+            "stream": True,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens,
+            },
+        }
+
+        try:
+            with self._http.stream(
+                f"{self.base_url}/api/generate",
+                json=payload,
+                timeout=timeout,
+            ) as response:
+                if response.status_code >= 400:
+                    response.read()
+                    error_msg = response.text
+                    try:
+                        error_data = response.json()
+                        error_msg = error_data.get("error", error_msg)
+                    except Exception:
+                        pass
+                    raise LLMError(f"Ollama API error ({response.status_code}): {error_msg}")
+
+                for chunk in iter_ndjson(response.iter_lines()):
+                    if "error" in chunk:
+                        raise LLMError(f"Ollama stream error: {chunk['error']}")
+                    if chunk.get("response"):
+                        yield chunk["response"]
+                    if chunk.get("done"):
+                        break
+
+        except httpx.TimeoutException as e:
+            raise LLMTimeoutError(f"Ollama request timed out after {timeout}s") from e
+        except httpx.ConnectError as e:
+            raise LLMError(f"Ollama not available: {e}") from e
+        except (httpx.HTTPError, httpx.RequestError) as e:
+            raise LLMError(f"Ollama HTTP error: {e}") from e
+
     def tool_call(
         self,
         messages: list[Message],
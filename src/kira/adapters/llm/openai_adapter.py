@@ -6,11 +6,16 @@ Direct OpenAI API integration for GPT models.
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
 from .adapter import LLMError, LLMRateLimitError, LLMResponse, LLMTimeoutError, Message, Tool, ToolCall
+from .http_pool import HTTPPoolConfig, PooledHTTPClient
+from .streaming import iter_chat_deltas, raise_for_stream_status
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 __all__ = ["OpenAIAdapter"]
 
@@ -28,6 +33,7 @@ class OpenAIAdapter:
         base_url: str = "https://api.openai.com/v1",
         default_model: str = "gpt-4-turbo-preview",
         organization: str | None = None,
+        http_pool: HTTPPoolConfig | None = None,
     ) -> None:
         """Initialize OpenAI adapter.
 
@@ -41,11 +47,26 @@ class OpenAIAdapter:
             Default model to use
         organization
             Optional organization ID
+        http_pool
+            Connection pool limits (default ``HTTPPoolConfig()``)
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.default_model = default_model
         self.organization = organization
+        self._http = PooledHTTPClient(http_pool)
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._http.close()
+
+    def __enter__(self) -> OpenAIAdapter:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
 
     def _make_headers(self) -> dict[str, str]:
         """Create request headers."""
@@ -169,12 +190,12 @@ class OpenAIAdapter:
         }
 
         try:
-            with httpx.Client(timeout=timeout) as client:
-                response = client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=self._make_headers(),
-                    json=payload,
-                )
+            response = self._http.post(
+                f"{self.base_url}/chat/completions",
+                headers=self._make_headers(),
+                json=payload,
+                timeout=timeout,
+            )
 
             if response.status_code == 429:
                 raise LLMRateLimitError("OpenAI rate limit exceeded")
@@ -196,6 +217,41 @@ class OpenAIAdapter:
         except (httpx.HTTPError, httpx.RequestError) as e:
             raise LLMError(f"OpenAI HTTP error: {e}") from e
 
+    def chat_stream(
+        self,
+        messages: list[Message],
+        *,
+        model: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        timeout: float = 30.0,
+    ) -> Iterator[str]:
+        """Multi-turn chat conversation streamed as server-sent events."""
+        model = model or self.default_model
+
+        payload = {
+            "model": model,
+            "messages": self._messages_to_dict(messages),
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True,
+        }
+
+        try:
+            with self._http.stream(
+                f"{self.base_url}/chat/completions",
+                headers=self._make_headers(),
+                json=payload,
+                timeout=timeout,
+            ) as response:
+                raise_for_stream_status(response, "OpenAI")
+                yield from iter_chat_deltas(response.iter_lines(), "OpenAI")
+
+        except httpx.TimeoutException as e:
+            raise LLMTimeoutError(f"OpenAI request timed out after {timeout}s") from e
+        except (httpx.HTTPError, httpx.RequestError) as e:
+            raise LLMError(f"OpenAI HTTP error: {e}") from e
+
     def tool_call(
         self,
         messages: list[Message],
@@ -218,12 +274,12 @@ class OpenAIAdapter:
         }
 
         try:
-            with httpx.Client(timeout=timeout) as client:
-                response = client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=self._make_headers(),
-                    json=payload,
-                )
+            response = self._http.post(
+                f"{self.base_url}/chat/completions",
+                headers=self._make_headers(),
+                json=payload,
+                timeout=timeout,
+            )
 
             if response.status_code == 429:
                 raise LLMRateLimitError("OpenAI rate limit exceeded")
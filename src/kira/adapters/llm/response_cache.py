@@ -0,0 +1,309 @@
+"""Response cache for ``LLMRouter``.
+
+Telegram traffic is dominated by near-identical requests ("покажи задачи",
+"what's on today"). Responses are keyed on a canonical hash of the request
+(normalized messages, tool definitions, provider, model, temperature and
+``max_tokens``), so a repeated request is answered without a provider
+round trip. Entries expire after a per-request TTL and the least recently
+used ones are evicted beyond ``max_entries``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .adapter import LLMResponse, ToolCall
+
+if TYPE_CHECKING:
+    from .adapter import Message, Tool
+
+__all__ = [
+    "ResponseCache",
+    "create_response_cache",
+    "response_cache_key",
+]
+
+# Only complete answers are worth replaying
+_CACHEABLE_FINISH_REASONS = ("stop", "tool_calls")
+
+
+def _normalize_text(text: str) -> str:
+    """Normalize Unicode forms and collapse whitespace."""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def _message_fields(message: Message | dict[str, Any]) -> dict[str, Any]:
+    fields = message if isinstance(message, dict) else asdict(message)
+    return {
+        "role": fields.get("role"),
+        "content": _normalize_text(fields.get("content") or ""),
+        "name": fields.get("name"),
+        "tool_call_id": fields.get("tool_call_id"),
+    }
+
+
+def response_cache_key(
+    method: str,
+    provider: str,
+    messages: list[Message],
+    tools: list[Tool] | None = None,
+    *,
+    model: str | None,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Compute the cache key of a request.
+
+    Message text is NFKC-normalized with whitespace collapsed; tools are
+    ordered by name and their schemas serialized with sorted keys, so
+    formatting differences do not defeat the cache.
+
+    Parameters
+    ----------
+    method
+        Router method (``"chat"`` or ``"tool_call"``)
+    provider
+        Provider the request is routed to
+    messages
+        Chat messages
+    tools
+        Tool definitions offered to the model
+    model
+        Model override (``None`` for the provider default)
+    temperature
+        Sampling temperature
+    max_tokens
+        Maximum tokens
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest of the canonical request
+    """
+    canonical = {
+        "method": method,
+        "provider": provider,
+        "model": model,
+        "temperature": round(temperature, 4),
+        "max_tokens": max_tokens,
+        "messages": [_message_fields(message) for message in messages],
+        "tools": [
+            {"name": tool.name, "description": _normalize_text(tool.description), "parameters": tool.parameters}
+            for tool in sorted(tools or [], key=lambda tool: tool.name)
+        ],
+    }
+    data = json.dumps(canonical, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def _dump_response(response: LLMResponse) -> str:
+    return json.dumps(
+        {
+            "content": response.content,
+            "finish_reason": response.finish_reason,
+            "tool_calls": [asdict(call) for call in response.tool_calls],
+            "usage": response.usage,
+            "model": response.model,
+        },
+        ensure_ascii=False,
+    )
+
+
+def _load_response(data: str) -> LLMResponse:
+    fields = json.loads(data)
+    return LLMResponse(
+        content=fields["content"],
+        finish_reason=fields["finish_reason"],
+        tool_calls=[ToolCall(**call) for call in fields["tool_calls"]],
+        usage=fields["usage"],
+        model=fields["model"],
+    )
+
+
+class ResponseCache:
+    """Size-bounded SQLite cache of LLM responses.
+
+    Without ``db_path`` the cache lives in an in-memory database for the
+    lifetime of the process. Thread-safe.
+    """
+
+    def __init__(self, db_path: Path | str | None = None, *, max_entries: int = 1000) -> None:
+        """Initialize response cache.
+
+        Parameters
+        ----------
+        db_path
+            Optional SQLite database file for persistence across restarts
+        max_entries
+            Maximum number of cached responses
+        """
+        self.db_path = Path(db_path) if db_path is not None else None
+        self.max_entries = max_entries
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self.hits = 0
+        self.misses = 0
+        self.saved_tokens = 0
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """Create the database directory and schema."""
+        if self.db_path is not None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._get_connection()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get database connection, creating the schema on connect."""
+        if self._conn is None:
+            database = str(self.db_path) if self.db_path is not None else ":memory:"
+            conn = sqlite3.connect(database, check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses(last_used)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Look up a cached response.
+
+        Parameters
+        ----------
+        key
+            Key from ``response_cache_key``
+
+        Returns
+        -------
+        LLMResponse | None
+            Cached response, or None if absent or expired
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._get_connection()
+            row = conn.execute(
+                "SELECT response FROM llm_responses WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute("UPDATE llm_responses SET last_used = ? WHERE key = ?", (now, key))
+            conn.commit()
+            response = _load_response(row[0])
+            self.hits += 1
+            self.saved_tokens += response.usage.get("total_tokens", 0)
+            return response
+
+    def put(self, key: str, response: LLMResponse, ttl: float) -> bool:
+        """Cache a response.
+
+        Truncated and failed responses are not cached.
+
+        Parameters
+        ----------
+        key
+            Key from ``response_cache_key``
+        response
+            Provider response
+        ttl
+            Seconds the response stays valid
+
+        Returns
+        -------
+        bool
+            True if the response was cached
+        """
+        if ttl <= 0 or response.finish_reason not in _CACHEABLE_FINISH_REASONS:
+            return False
+
+        now = time.time()
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_responses (key, response, expires_at, last_used)
+                VALUES (?, ?, ?, ?)
+            """,
+                (key, _dump_response(response), now + ttl, now),
+            )
+            self._evict(conn, now)
+            conn.commit()
+        return True
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries and the least recently used beyond ``max_entries``."""
+        conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (now,))
+        conn.execute(
+            """
+            DELETE FROM llm_responses WHERE key IN (
+                SELECT key FROM llm_responses ORDER BY last_used DESC LIMIT -1 OFFSET ?
+            )
+        """,
+            (self.max_entries,),
+        )
+
+    def __len__(self) -> int:
+        """Number of stored responses (including not yet evicted expired ones)."""
+        with self._lock:
+            return self._get_connection().execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute("DELETE FROM llm_responses")
+            conn.commit()
+
+    def close(self) -> None:
+        """Close database connection.
+
+        An in-memory cache loses its contents.
+        """
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> ResponseCache:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+def create_response_cache(vault_path: Path, *, max_entries: int = 1000) -> ResponseCache:
+    """Create persistent LLM response cache for a vault.
+
+    Parameters
+    ----------
+    vault_path
+        Path to vault
+    max_entries
+        Maximum number of cached responses
+
+    Returns
+    -------
+    ResponseCache
+        Cache at ``.kira/llm_cache.db`` inside the vault
+    """
+    return ResponseCache(vault_path / ".kira" / "llm_cache.db", max_entries=max_entries)
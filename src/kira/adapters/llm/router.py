@@ -1,26 +1,37 @@
 """Multi-provider LLM router with fallback support.
 
 Routes requests to appropriate providers based on task type.
-Implements fallback to local Ollama when remote providers fail.
+Implements fallback to local Ollama when remote providers fail and,
+optionally, hedging of slow requests across providers.
 """
 
 from __future__ import annotations
 
+import itertools
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from enum import Enum
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from ...observability.loguru_config import get_logger, timing_context
 from .adapter import LLMAdapter, LLMError, LLMRateLimitError, LLMResponse, LLMTimeoutError, Message, Tool
 from .anthropic_adapter import AnthropicAdapter
+from .hedging import LatencyTracker
 from .ollama_adapter import OllamaAdapter
 from .openai_adapter import OpenAIAdapter
 from .openrouter_adapter import OpenRouterAdapter
+from .response_cache import ResponseCache, response_cache_key
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from ...agent.metrics import MetricsCollector
 
 # Loguru logger for LLM operations
 llm_logger = get_logger("langgraph")
 
-__all__ = ["LLMRouter", "TaskType", "RouterConfig", "LLMErrorEnhanced"]
+__all__ = ["LLMRouter", "TaskType", "RouterConfig", "LLMErrorEnhanced", "DEFAULT_CACHE_TTL"]
 
 
 class TaskType(Enum):
@@ -31,6 +42,14 @@ class TaskType(Enum):
     DEFAULT = "default"  # General tasks
 
 
+# Seconds a cached response stays valid, per task type
+DEFAULT_CACHE_TTL: dict[TaskType, float] = {
+    TaskType.PLANNING: 600.0,
+    TaskType.STRUCTURING: 3600.0,
+    TaskType.DEFAULT: 300.0,
+}
+
+
 class LLMErrorEnhanced(LLMError):
     """Enhanced LLM error with retry information."""
 
@@ -75,6 +94,14 @@ class RouterConfig:
         initial_backoff: float = 1.0,
         max_backoff: float = 30.0,
         backoff_multiplier: float = 2.0,
+        cache_ttl: dict[TaskType, float] | None = None,
+        cache_nonzero_temperature: bool = False,
+        enable_hedging: bool = False,
+        hedge_providers: list[str] | None = None,
+        max_hedges: int = 1,
+        hedge_quantile: float = 0.95,
+        hedge_initial_delay: float = 2.0,
+        hedge_min_delay: float = 0.25,
     ) -> None:
         """Initialize router configuration.
 
@@ -96,6 +123,25 @@ class RouterConfig:
             Maximum backoff delay in seconds
         backoff_multiplier
             Backoff multiplier
+        cache_ttl
+            Seconds responses stay cached per task type (0 disables caching
+            for that type); defaults to ``DEFAULT_CACHE_TTL``
+        cache_nonzero_temperature
+            Also cache requests sampled with temperature > 0
+        enable_hedging
+            Send a slow request to the next provider as well and take the
+            first successful answer
+        hedge_providers
+            Providers to hedge with, in order; defaults to all configured
+            providers (Ollama last)
+        max_hedges
+            Maximum extra providers a request is sent to
+        hedge_quantile
+            Latency quantile of the primary provider after which to hedge
+        hedge_initial_delay
+            Hedge delay in seconds until enough latencies are recorded
+        hedge_min_delay
+            Lower bound of the hedge delay in seconds
         """
         self.planning_provider = planning_provider
         self.structuring_provider = structuring_provider
@@ -105,6 +151,14 @@ class RouterConfig:
         self.initial_backoff = initial_backoff
         self.max_backoff = max_backoff
         self.backoff_multiplier = backoff_multiplier
+        self.cache_ttl = {**DEFAULT_CACHE_TTL, **(cache_ttl or {})}
+        self.cache_nonzero_temperature = cache_nonzero_temperature
+        self.enable_hedging = enable_hedging
+        self.hedge_providers = hedge_providers
+        self.max_hedges = max_hedges
+        self.hedge_quantile = hedge_quantile
+        self.hedge_initial_delay = hedge_initial_delay
+        self.hedge_min_delay = hedge_min_delay
 
 
 class LLMRouter:
@@ -118,6 +172,8 @@ class LLMRouter:
         openai_adapter: OpenAIAdapter | None = None,
         openrouter_adapter: OpenRouterAdapter | None = None,
         ollama_adapter: OllamaAdapter | None = None,
+        response_cache: ResponseCache | None = None,
+        metrics: MetricsCollector | None = None,
     ) -> None:
         """Initialize router.
 
@@ -133,6 +189,10 @@ class LLMRouter:
             OpenRouter adapter instance
         ollama_adapter
             Ollama adapter instance
+        response_cache
+            Optional cache for ``chat`` and ``tool_call`` responses
+        metrics
+            Optional collector for cache hit and saved token metrics
         """
         self.config = config
         self.adapters: dict[str, LLMAdapter | None] = {
@@ -141,6 +201,36 @@ class LLMRouter:
             "openrouter": openrouter_adapter,
             "ollama": ollama_adapter,
         }
+        self.response_cache = response_cache
+        self.metrics = metrics
+        self.latency = LatencyTracker()
+        self._hedge_pool: ThreadPoolExecutor | None = None
+        self._hedge_pool_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close pooled HTTP connections of all configured adapters.
+
+        Adapters are shared, so this should be called once on shutdown.
+        The response cache and hedging threads are released as well.
+        """
+        with self._hedge_pool_lock:
+            if self._hedge_pool is not None:
+                self._hedge_pool.shutdown(wait=False, cancel_futures=True)
+                self._hedge_pool = None
+        for adapter in self.adapters.values():
+            close = getattr(adapter, "close", None)
+            if close is not None:
+                close()
+        if self.response_cache is not None:
+            self.response_cache.close()
+
+    def __enter__(self) -> LLMRouter:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
 
     def _get_provider_for_task(self, task_type: TaskType) -> str:
         """Get provider name for task type."""
@@ -154,6 +244,9 @@ class LLMRouter:
     def _get_adapter(self, provider: str) -> LLMAdapter:
         """Get adapter for provider.
 
+        Adapters are long-lived, so every call routed to a provider reuses
+        that adapter's pooled HTTP connections.
+
         Raises
         ------
         LLMErrorEnhanced
@@ -220,7 +313,7 @@ class LLMRouter:
                 max_tokens=max_tokens,
             ) as ctx:
                 adapter = self._get_adapter(provider)
-                response = self._execute_with_retry(
+                response = self._execute_hedged(
                     adapter,
                     "generate",
                     provider,
@@ -265,27 +358,191 @@ class LLMRouter:
                         pass
             raise
 
+    def _cache_key(
+        self,
+        method: str,
+        provider: str,
+        task_type: TaskType,
+        messages: list[Message],
+        tools: list[Tool] | None = None,
+        **kwargs: Any,
+    ) -> str | None:
+        """Get response cache key, or None if the request bypasses the cache.
+
+        Requests bypass the cache when no cache is configured, caching is
+        disabled for the task type, or they are sampled with temperature > 0
+        and ``cache_nonzero_temperature`` is off.
+        """
+        if self.response_cache is None or self.config.cache_ttl.get(task_type, 0) <= 0:
+            return None
+        if kwargs["temperature"] > 0 and not self.config.cache_nonzero_temperature:
+            return None
+        return response_cache_key(method, provider, messages, tools, **kwargs)
+
+    def _cache_get(self, key: str | None, task_type: TaskType) -> LLMResponse | None:
+        """Look up a cached response and record the outcome."""
+        if key is None or self.response_cache is None:
+            return None
+        response = self.response_cache.get(key)
+        if self.metrics is not None:
+            saved_tokens = response.usage.get("total_tokens", 0) if response is not None else 0
+            self.metrics.record_llm_cache(task_type.value, hit=response is not None, saved_tokens=saved_tokens)
+        if response is not None:
+            llm_logger.info("LLM response served from cache", task_type=task_type.value)
+        return response
+
+    def _cache_put(self, key: str | None, task_type: TaskType, response: LLMResponse) -> None:
+        """Cache a provider response."""
+        if key is not None and self.response_cache is not None:
+            self.response_cache.put(key, response, self.config.cache_ttl[task_type])
+
+    def _hedge_candidates(self, provider: str) -> list[str]:
+        """Get configured providers to hedge a request to ``provider`` with."""
+        order = self.config.hedge_providers or list(self.adapters)
+        candidates = [name for name in order if name != provider and self.adapters.get(name) is not None]
+        return candidates[: self.config.max_hedges]
+
+    def _hedge_delay(self, provider: str, timeout: float) -> float:
+        """Get seconds to wait for ``provider`` before hedging.
+
+        The configured quantile of the provider's recent latencies, or
+        ``hedge_initial_delay`` until enough latencies are recorded; never
+        below ``hedge_min_delay`` nor above ``timeout``.
+        """
+        delay = self.latency.quantile(provider, self.config.hedge_quantile)
+        if delay is None:
+            delay = self.config.hedge_initial_delay
+        return min(max(delay, self.config.hedge_min_delay), timeout)
+
+    def _get_hedge_pool(self) -> ThreadPoolExecutor:
+        """Get thread pool running hedged requests."""
+        with self._hedge_pool_lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm-hedge")
+            return self._hedge_pool
+
+    def _execute_hedged(
+        self,
+        adapter: LLMAdapter,
+        method: str,
+        provider: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Execute adapter method, hedging across providers when enabled.
+
+        Without ``RouterConfig.enable_hedging`` (or with a ``model``
+        override, which other providers would not understand) this is
+        ``_execute_with_retry``. Otherwise the request is also sent to the
+        next hedge provider when the primary has not answered within
+        ``_hedge_delay``, or once it has failed after its own retries. The
+        first successful result wins. Hedges not yet started are cancelled; requests already
+        in flight cannot be interrupted and their results are discarded.
+
+        Parameters
+        ----------
+        adapter
+            Adapter of the primary provider
+        method
+            Adapter method name
+        provider
+            Primary provider name
+        *args
+            Method positional arguments
+        **kwargs
+            Method keyword arguments
+
+        Returns
+        -------
+        Any
+            Result of the first successful call
+
+        Raises
+        ------
+        LLMErrorEnhanced
+            The primary provider's error if every provider fails
+        """
+        hedges = self._hedge_candidates(provider) if self.config.enable_hedging else []
+        if not hedges or kwargs.get("model") is not None:
+            return self._execute_with_retry(adapter, method, provider, *args, **kwargs)
+
+        pool = self._get_hedge_pool()
+        pending: dict[Future[Any], str] = {}
+        errors: dict[str, LLMErrorEnhanced] = {}
+
+        def submit(name: str) -> None:
+            target = adapter if name == provider else self._get_adapter(name)
+            pending[pool.submit(self._execute_with_retry, target, method, name, *args, **kwargs)] = name
+
+        submit(provider)
+        delay = self._hedge_delay(provider, kwargs.get("timeout", 30.0))
+        while pending:
+            done, _ = wait(pending, timeout=delay if hedges else None, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    result = future.result()
+                except LLMErrorEnhanced as e:
+                    errors[name] = e
+                    continue
+                for loser in pending:
+                    loser.cancel()
+                if name != provider:
+                    llm_logger.info("Hedged LLM request answered", provider=provider, winner=name)
+                return result
+            if hedges and (not done or not pending):
+                name = hedges.pop(0)
+                llm_logger.info(
+                    "Hedging LLM request",
+                    provider=provider,
+                    hedge_provider=name,
+                    reason="error" if done else "slow",
+                    delay=round(delay, 3),
+                )
+                submit(name)
+
+        raise errors[provider]
+
     def _calculate_backoff(self, attempt: int) -> float:
         """Calculate exponential backoff delay."""
         delay = self.config.initial_backoff * (self.config.backoff_multiplier ** (attempt - 1))
         return min(delay, self.config.max_backoff)
 
+    def _call_adapter(
+        self,
+        adapter: LLMAdapter,
+        method: str | Callable[..., Any],
+        provider: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Call the adapter once, recording the latency of adapter methods."""
+        if callable(method):
+            return method(*args, **kwargs)
+        start = time.perf_counter()
+        result = getattr(adapter, method)(*args, **kwargs)
+        self.latency.record(provider, time.perf_counter() - start)
+        return result
+
     def _execute_with_retry(
         self,
         adapter: LLMAdapter,
-        method: str,
+        method: str | Callable[..., Any],
         provider: str,
         *args: Any,
         **kwargs: Any,
-    ) -> LLMResponse:
+    ) -> Any:
         """Execute adapter method with retry logic.
 
+        The latency of each successful adapter method call is recorded in
+        ``self.latency`` for the provider.
+
         Parameters
         ----------
         adapter
             Adapter instance
         method
-            Method name to call
+            Method name to call, or a callable used instead of an adapter method
         provider
             Provider name for error reporting
         *args
@@ -295,8 +552,8 @@ class LLMRouter:
 
         Returns
         -------
-        LLMResponse
-            Response from adapter
+        Any
+            Result of the call (``LLMResponse`` for adapter methods)
 
         Raises
         ------
@@ -307,8 +564,7 @@ class LLMRouter:
 
         for attempt in range(1, self.config.max_retries + 1):
             try:
-                method_func = getattr(adapter, method)
-                return method_func(*args, **kwargs)
+                return self._call_adapter(adapter, method, provider, *args, **kwargs)
 
             except LLMRateLimitError as e:
                 last_error = LLMErrorEnhanced(
@@ -378,6 +634,9 @@ class LLMRouter:
     ) -> LLMResponse:
         """Route chat request to appropriate provider.
 
+        With a response cache configured, repeated requests are answered
+        from the cache (see ``RouterConfig.cache_ttl``).
+
         Parameters
         ----------
         messages
@@ -404,6 +663,12 @@ class LLMRouter:
             If request fails
         """
         provider = self._get_provider_for_task(task_type)
+        cache_key = self._cache_key(
+            "chat", provider, task_type, messages, model=model, temperature=temperature, max_tokens=max_tokens
+        )
+        cached = self._cache_get(cache_key, task_type)
+        if cached is not None:
+            return cached
 
         # Calculate total message length
         total_message_length = sum(len(msg.get('content', '')) for msg in messages if isinstance(msg, dict))
@@ -419,7 +684,7 @@ class LLMRouter:
                 max_tokens=max_tokens,
             ) as ctx:
                 adapter = self._get_adapter(provider)
-                response = self._execute_with_retry(
+                response = self._execute_hedged(
                     adapter,
                     "chat",
                     provider,
@@ -444,6 +709,7 @@ class LLMRouter:
                     response_length=len(response.content),
                 )
 
+                self._cache_put(cache_key, task_type, response)
                 return response
 
         except LLMErrorEnhanced as e:
@@ -464,6 +730,79 @@ class LLMRouter:
                         pass
             raise
 
+    def chat_stream(
+        self,
+        messages: list[Message],
+        *,
+        task_type: TaskType = TaskType.DEFAULT,
+        model: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        timeout: float = 30.0,
+    ) -> Iterator[str]:
+        """Route streaming chat request to appropriate provider.
+
+        The stream is opened eagerly: retries and the Ollama fallback apply
+        until the first delta arrives. Errors after that are raised while
+        iterating, since partial output cannot be taken back.
+
+        Parameters
+        ----------
+        messages
+            Chat messages
+        task_type
+            Type of task for routing
+        model
+            Optional model override
+        temperature
+            Sampling temperature
+        max_tokens
+            Maximum tokens
+        timeout
+            Maximum seconds to wait for the next chunk
+
+        Returns
+        -------
+        Iterator[str]
+            Text deltas from provider
+
+        Raises
+        ------
+        LLMErrorEnhanced
+            If the stream cannot be started
+        """
+        provider = self._get_provider_for_task(task_type)
+        kwargs: dict[str, Any] = {
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "timeout": timeout,
+        }
+
+        try:
+            with timing_context(
+                "llm_chat_stream_first_token",
+                component="langgraph",
+                provider=provider,
+                task_type=task_type.value,
+                num_messages=len(messages),
+                max_tokens=max_tokens,
+            ):
+                adapter = self._get_adapter(provider)
+                return self._execute_with_retry(adapter, _open_stream, provider, adapter, messages, **kwargs)
+
+        except LLMErrorEnhanced as e:
+            # Try Ollama fallback if enabled and error is retryable
+            if self.config.enable_ollama_fallback and e.retryable:
+                ollama = self.adapters.get("ollama")
+                if ollama:
+                    try:
+                        return _open_stream(ollama, messages, **kwargs)
+                    except Exception:
+                        # Re-raise original error if fallback also fails
+                        pass
+            raise
+
     def tool_call(
         self,
         messages: list[Message],
@@ -477,6 +816,9 @@ class LLMRouter:
     ) -> LLMResponse:
         """Route tool call request to appropriate provider.
 
+        With a response cache configured, repeated requests are answered
+        from the cache (see ``RouterConfig.cache_ttl``).
+
         Parameters
         ----------
         messages
@@ -505,10 +847,23 @@ class LLMRouter:
             If request fails
         """
         provider = self._get_provider_for_task(task_type)
+        cache_key = self._cache_key(
+            "tool_call",
+            provider,
+            task_type,
+            messages,
+            tools,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        cached = self._cache_get(cache_key, task_type)
+        if cached is not None:
+            return cached
 
         try:
             adapter = self._get_adapter(provider)
-            return self._execute_with_retry(
+            response = self._execute_hedged(
                 adapter,
                 "tool_call",
                 provider,
@@ -519,6 +874,8 @@ class LLMRouter:
                 max_tokens=max_tokens,
                 timeout=timeout,
             )
+            self._cache_put(cache_key, task_type, response)
+            return response
 
         except LLMErrorEnhanced as e:
             # Try Ollama fallback if enabled and error is retryable
@@ -538,3 +895,17 @@ class LLMRouter:
                         # Re-raise original error if fallback also fails
                         pass
             raise
+
+
+def _open_stream(adapter: LLMAdapter, messages: list[Message], **kwargs: Any) -> Iterator[str]:
+    """Start a chat stream and wait for its first delta.
+
+    Adapters without ``chat_stream`` yield their whole ``chat`` response
+    as a single delta.
+    """
+    chat_stream = getattr(adapter, "chat_stream", None)
+    if chat_stream is None:
+        return iter([adapter.chat(messages, **kwargs).content])
+    stream = iter(chat_stream(messages, **kwargs))
+    first = next(stream, None)
+    return stream if first is None else itertools.chain([first], stream)
@@ -0,0 +1,174 @@
+"""Parsers for streamed LLM responses.
+
+OpenAI-compatible APIs and Anthropic stream server-sent events; Ollama
+streams newline-delimited JSON. The parsers consume the decoded lines of
+an ``httpx`` streaming response (``response.iter_lines()``). Malformed
+JSON surfaces as ``LLMError`` like any other provider failure.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+from typing import TYPE_CHECKING, Any
+
+from .adapter import LLMError, LLMRateLimitError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    import httpx
+
+__all__ = [
+    "iter_chat_deltas",
+    "iter_ndjson",
+    "iter_sse",
+    "iter_sse_json",
+    "raise_for_stream_status",
+]
+
+
+def raise_for_stream_status(response: httpx.Response, provider: str) -> None:
+    """Raise the adapter error for a failed streaming response.
+
+    Parameters
+    ----------
+    response
+        Open streaming response
+    provider
+        Provider name used in error messages
+
+    Raises
+    ------
+    LLMRateLimitError
+        On HTTP 429
+    LLMError
+        On any other HTTP error status
+    """
+    if response.status_code == 429:
+        raise LLMRateLimitError(f"{provider} rate limit exceeded")
+    if response.status_code < 400:
+        return
+
+    response.read()
+    error_msg = response.text
+    with contextlib.suppress(Exception):
+        error_msg = response.json().get("error", {}).get("message", error_msg)
+    raise LLMError(f"{provider} API error ({response.status_code}): {error_msg}")
+
+
+def _decode(data: str) -> Any:
+    """Decode one JSON payload of a stream."""
+    try:
+        return json.loads(data)
+    except json.JSONDecodeError as e:
+        raise LLMError(f"Malformed JSON in LLM stream: {data[:200]!r}") from e
+
+
+def iter_sse(lines: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """Parse a server-sent event stream.
+
+    Parameters
+    ----------
+    lines
+        Stream lines without line terminators
+
+    Yields
+    ------
+    tuple[str, str]
+        Event name (``"message"`` when unnamed) and data of each event
+    """
+    event = ""
+    data: list[str] = []
+    for line in lines:
+        if not line:
+            if data:
+                yield event or "message", "\n".join(data)
+            event, data = "", []
+            continue
+        if line.startswith(":"):
+            continue  # comment / keep-alive
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "event":
+            event = value
+        elif name == "data":
+            data.append(value)
+    if data:
+        yield event or "message", "\n".join(data)
+
+
+def iter_ndjson(lines: Iterable[str]) -> Iterator[dict[str, Any]]:
+    """Parse a newline-delimited JSON stream.
+
+    Parameters
+    ----------
+    lines
+        Stream lines without line terminators
+
+    Yields
+    ------
+    dict[str, Any]
+        One decoded object per non-empty line
+    """
+    for line in lines:
+        if line.strip():
+            yield _decode(line)
+
+
+def iter_sse_json(lines: Iterable[str]) -> Iterator[tuple[str, Any]]:
+    """Parse a server-sent event stream whose event data is JSON.
+
+    Stops at the OpenAI-style ``[DONE]`` sentinel.
+
+    Parameters
+    ----------
+    lines
+        Stream lines without line terminators
+
+    Yields
+    ------
+    tuple[str, Any]
+        Event name and decoded data of each event
+
+    Raises
+    ------
+    LLMError
+        If event data is not valid JSON
+    """
+    for event, data in iter_sse(lines):
+        if data == "[DONE]":
+            return
+        yield event, _decode(data)
+
+
+def iter_chat_deltas(lines: Iterable[str], provider: str) -> Iterator[str]:
+    """Extract text deltas from an OpenAI-compatible chat completion stream.
+
+    Parameters
+    ----------
+    lines
+        Stream lines without line terminators
+    provider
+        Provider name used in error messages
+
+    Yields
+    ------
+    str
+        Non-empty content deltas
+
+    Raises
+    ------
+    LLMError
+        If the stream reports an error or is malformed
+    """
+    for _, chunk in iter_sse_json(lines):
+        error = chunk.get("error")
+        if error:
+            message = error.get("message", error) if isinstance(error, dict) else error
+            raise LLMError(f"{provider} stream error: {message}")
+        choices = chunk.get("choices") or [{}]
+        delta = choices[0].get("delta", {}).get("content")
+        if delta:
+            yield delta
@@ -124,6 +124,11 @@ class TelegramAdapterConfig:
     daily_briefing_time: str = "09:00"  # HH:MM format
     weekly_briefing_day: int = 1  # Monday = 0
     weekly_briefing_time: str = "09:00"
+    stream_edit_interval: float = 1.0  # Min seconds between streamed response edits
+
+
+# Telegram Bot API limit for message text
+MAX_MESSAGE_LENGTH = 4096
 
 
 class ThinkingIndicator:
@@ -131,7 +136,8 @@ class ThinkingIndicator:
 
     Displays "Думаю." message with animated dots (1-3 dots, cycling every second).
     Automatically deleted when stopped.
-    Can also show specific actions like "Получаю список задач..."
+    Can also show specific actions like "Получаю список задач..." and the
+    response text while it is being generated.
 
     Example
     -------
@@ -139,6 +145,11 @@ class ThinkingIndicator:
     >>> indicator.update_status("Удаляю задачу...")
     >>> # ... processing ...
     >>> indicator.stop()  # Deletes indicator message
+
+    Streaming a response into the indicator message:
+
+    >>> indicator.stream_update("Готово, я удали")
+    >>> indicator.finish("Готово, я удалила задачу.")  # Keeps the message
     """
 
     def __init__(self, adapter: TelegramAdapter, chat_id: int) -> None:
@@ -158,6 +169,9 @@ class ThinkingIndicator:
         self._thread: threading.Thread | None = None
         self._current_text = "Думаю."
         self._custom_text: str | None = None
+        self._shown_text = "Думаю."
+        self._last_edit = 0.0
+        self.streamed = False
         self._start()
 
     def _start(self) -> None:
@@ -208,6 +222,66 @@ class ThinkingIndicator:
                 status=text,
             )
 
+    def stream_update(self, text: str) -> None:
+        """Show the response generated so far in place of the indicator.
+
+        Edits are throttled to one per ``stream_edit_interval`` seconds to
+        stay within Telegram rate limits; ``finish`` shows the final text.
+
+        Parameters
+        ----------
+        text
+            Partial response text
+        """
+        self.streamed = True
+        self._custom_text = text  # Stops the dots animation
+        if not self.message_id or not text.strip():
+            return
+
+        now = time.monotonic()
+        if now - self._last_edit < self.adapter.config.stream_edit_interval:
+            return
+
+        if len(text) > MAX_MESSAGE_LENGTH:
+            text = text[: MAX_MESSAGE_LENGTH - 1] + "…"
+        if text != self._shown_text:
+            self._last_edit = now
+            self._shown_text = text
+            self.adapter.edit_message(self.chat_id, self.message_id, text, parse_mode=None)
+
+    def finish(self, text: str) -> bool:
+        """Turn the indicator message into the final response.
+
+        Parameters
+        ----------
+        text
+            Complete response text
+
+        Returns
+        -------
+        bool
+            True if the message now shows ``text``. False if nothing was
+            streamed, the text is too long for one message or the edit
+            failed; the caller should then ``stop`` and send a new message.
+        """
+        if not self.streamed or not self.message_id or not text.strip() or len(text) > MAX_MESSAGE_LENGTH:
+            return False
+
+        self._stop_animation()
+        if text != self._shown_text:
+            result = self.adapter.edit_message(self.chat_id, self.message_id, text, parse_mode=None)
+            if not (result and result.get("ok")):
+                return False
+
+        telegram_logger.debug(
+            "Streamed response finished",
+            chat_id=self.chat_id,
+            message_id=self.message_id,
+            length=len(text),
+        )
+        self.message_id = None  # Keep the message: stop() must not delete it
+        return True
+
     def _animate(self) -> None:
         """Animate dots in background thread."""
         dot_count = 1
@@ -234,8 +308,7 @@ class ThinkingIndicator:
                     parse_mode=None,
                 )
 
-    def stop(self) -> None:
-        """Stop indicator and delete message."""
+    def _stop_animation(self) -> None:
         # Signal thread to stop
         self._stop_event.set()
 
@@ -243,6 +316,10 @@ class ThinkingIndicator:
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2.0)
 
+    def stop(self) -> None:
+        """Stop indicator and delete message."""
+        self._stop_animation()
+
         # Delete message
         if self.message_id:
             deleted = self.adapter.delete_message(self.chat_id, self.message_id)
@@ -27,6 +27,9 @@ class AgentConfig:
     structuring_provider: str = "openai"  # Best for JSON
     default_provider: str = "openrouter"  # Fallback
     enable_ollama_fallback: bool = True
+    enable_llm_cache: bool = False  # Cache responses in <vault>/.kira/llm_cache.db
+    llm_cache_nonzero_temperature: bool = True  # Agent nodes sample with temperature > 0
+    enable_llm_hedging: bool = False  # Also send slow requests to the next provider
 
     # Legacy field for backwards compatibility
     llm_provider: str = "openrouter"
@@ -102,6 +105,9 @@ class AgentConfig:
             structuring_provider=settings.structuring_provider,
             default_provider=settings.default_provider,
             enable_ollama_fallback=settings.enable_ollama_fallback,
+            enable_llm_cache=getattr(settings, "enable_llm_cache", False),
+            llm_cache_nonzero_temperature=getattr(settings, "llm_cache_nonzero_temperature", True),
+            enable_llm_hedging=getattr(settings, "enable_llm_hedging", False),
             # Legacy
             llm_provider=settings.llm_provider,
             # RAG and Memory
@@ -128,6 +128,8 @@ def should_reflect(state: AgentState) -> bool:
 def build_agent_graph(
     llm_adapter: LLMAdapter,
     tool_registry: ToolRegistry,
+    *,
+    max_parallel_tools: int = 4,
 ) -> AgentGraph:
     """Build the LangGraph state graph for agent execution.
 
@@ -137,6 +139,8 @@ def build_agent_graph(
         LLM adapter for planning and reflection
     tool_registry
         Registry of available tools (used for native function calling)
+    max_parallel_tools
+        Maximum independent tool calls executed concurrently in one tool step
 
     Returns
     -------
@@ -164,7 +168,7 @@ def build_agent_graph(
         return reflect_node(state, llm_adapter)
 
     def _tool_node(state):  # type: ignore[no-untyped-def]
-        return tool_node(state, tool_registry)
+        return tool_node(state, tool_registry, max_workers=max_parallel_tools)
 
     def _verify_node(state):  # type: ignore[no-untyped-def]
         return verify_node(state, tool_registry)
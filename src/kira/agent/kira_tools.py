@@ -277,15 +277,16 @@ class TaskListTool:
             return ToolResult.error("HostAPI not initialized")
 
         try:
-            # List all tasks
-            all_entities = self.host_api.list_entities("task")
-
-            # Apply filters
             filtered = []
             status_filter = args.get("status")
             tags_filter = set(args.get("tags", []))
             limit = args.get("limit", 50)
 
+            # Filters are pushed down to the entity index; re-checked below
+            all_entities = self.host_api.list_entities(
+                "task", status=status_filter, tags=tags_filter or None, limit=limit
+            )
+
             for entity in all_entities:
                 # Status filter
                 if status_filter and entity.metadata.get("status") != status_filter:
@@ -82,6 +82,7 @@ class LangGraphExecutor:
         memory_max_exchanges: int = 10,
         enable_persistent_memory: bool = True,
         memory_db_path: Path | None = None,
+        max_parallel_tools: int = 4,
     ) -> None:
         """Initialize LangGraph executor.
 
@@ -107,6 +108,8 @@ class LangGraphExecutor:
             Use persistent SQLite memory (survives restarts)
         memory_db_path
             Path to SQLite database for persistent memory
+        max_parallel_tools
+            Maximum independent tool calls executed concurrently per step
         """
         self.llm_adapter = llm_adapter
         self.tool_registry = tool_registry
@@ -144,7 +147,7 @@ class LangGraphExecutor:
         # Build graph on initialization
         from .graph import build_agent_graph
 
-        self.graph = build_agent_graph(llm_adapter, tool_registry)
+        self.graph = build_agent_graph(llm_adapter, tool_registry, max_parallel_tools=max_parallel_tools)
 
     def execute(
         self,
@@ -155,6 +158,7 @@ class LangGraphExecutor:
         user: str = "default",
         dry_run: bool = False,
         progress_callback: Any = None,
+        stream_callback: Any = None,
     ) -> ExecutionResult:
         """Execute user request through LangGraph.
 
@@ -174,6 +178,11 @@ class LangGraphExecutor:
             User identifier
         dry_run
             If True, run all tools in dry-run mode
+        progress_callback
+            Optional callback for progress updates: callback(status: str) -> None
+        stream_callback
+            Optional callback receiving the response text generated so far
+            while it streams: callback(partial_response: str) -> None
 
         Returns
         -------
@@ -242,6 +251,7 @@ class LangGraphExecutor:
             user=user,
             messages=messages,  # Include conversation history!
             progress_callback=progress_callback,  # For UI updates
+            stream_callback=stream_callback,  # Partial response text for UI
             # Restore confirmation state from session
             pending_confirmation=session_state["pending_confirmation"],
             pending_plan=session_state["pending_plan"],
@@ -320,6 +330,7 @@ class LangGraphExecutor:
         trace_id: str | None = None,
         user: str = "default",
         dry_run: bool = False,
+        stream_callback: Any = None,
     ) -> Any:
         """Stream execution progress step by step.
 
@@ -333,6 +344,9 @@ class LangGraphExecutor:
             User identifier
         dry_run
             If True, run all tools in dry-run mode
+        stream_callback
+            Optional callback receiving the response text generated so far,
+            called while the respond step is still running
 
         Yields
         ------
@@ -351,6 +365,7 @@ class LangGraphExecutor:
             trace_id=trace_id,
             user=user,
             messages=[{"role": "user", "content": user_request}],
+            stream_callback=stream_callback,
             budget=Budget(
                 max_steps=self.max_steps,
                 max_tokens=self.max_tokens,
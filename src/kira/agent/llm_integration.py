@@ -10,6 +10,8 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from ..adapters.llm import LLMAdapter, LLMRouter, Message
 
 logger = logging.getLogger(__name__)
@@ -133,6 +135,53 @@ class LangGraphLLMBridge:
             timeout=timeout,
         )
 
+    def chat_stream(
+        self,
+        messages: list[Message],
+        *,
+        model: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        timeout: float = 30.0,
+    ) -> Iterator[str]:
+        """Multi-turn chat conversation streamed as text deltas.
+
+        Parameters
+        ----------
+        messages
+            Conversation messages
+        model
+            Optional model override
+        temperature
+            Sampling temperature
+        max_tokens
+            Maximum tokens
+        timeout
+            Maximum seconds to wait for the next chunk
+
+        Returns
+        -------
+        Iterator[str]
+            Text deltas with fallback support until the first delta
+        """
+        from ..adapters.llm import TaskType
+
+        task_type_map = {
+            "planning": TaskType.PLANNING,
+            "structuring": TaskType.STRUCTURING,
+            "default": TaskType.DEFAULT,
+        }
+        task_type_enum = task_type_map.get(self.task_type, TaskType.DEFAULT)
+
+        return self.llm_router.chat_stream(
+            messages=messages,
+            task_type=task_type_enum,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=timeout,
+        )
+
     def tool_call(
         self,
         messages: list[Message],
@@ -84,10 +84,12 @@ class MessageHandler:
         # Start thinking indicator for Telegram
         thinking_indicator = None
         progress_callback = None
+        stream_callback = None
         if source == "telegram" and self.telegram_adapter:
             try:
                 thinking_indicator = self.telegram_adapter.start_thinking_indicator(int(chat_id))
                 progress_callback = thinking_indicator.update_status  # Callback for progress updates
+                stream_callback = thinking_indicator.stream_update  # Partial response in the same message
                 logger.debug(f"Started thinking indicator for {chat_id}")
             except Exception as e:
                 logger.warning(f"Failed to start thinking indicator: {e}")
@@ -100,6 +102,7 @@ class MessageHandler:
                 trace_id=trace_id,
                 session_id=session_id,
                 progress_callback=progress_callback,
+                stream_callback=stream_callback,
             )
             logger.info(f"Agent execution completed, status={getattr(result, 'status', 'unknown')}")
 
@@ -107,12 +110,7 @@ class MessageHandler:
             response_text = self._format_response(result)
             logger.debug(f"Formatted response: {response_text[:200]}...")
 
-            # Send response back via callback
-            if self.response_callback:
-                logger.info(f"Sending response to {source}:{chat_id}")
-                self.response_callback(source, chat_id, response_text)
-            else:
-                logger.warning("No response callback configured, response not sent")
+            self._deliver_response(source, chat_id, response_text, thinking_indicator)
 
         except Exception as e:
             logger.exception(f"Error processing message from {source}:{chat_id}: {e}")
@@ -129,6 +127,16 @@ class MessageHandler:
                 except Exception as e:
                     logger.warning(f"Failed to stop thinking indicator: {e}")
 
+    def _deliver_response(self, source: str, chat_id: str, response_text: str, thinking_indicator: Any) -> None:
+        """Send response back via callback, unless it was streamed into the indicator message."""
+        if thinking_indicator and thinking_indicator.finish(response_text):
+            logger.info(f"Streamed response delivered to {source}:{chat_id}")
+        elif self.response_callback:
+            logger.info(f"Sending response to {source}:{chat_id}")
+            self.response_callback(source, chat_id, response_text)
+        else:
+            logger.warning("No response callback configured, response not sent")
+
     def _format_response(self, result: Any) -> str:
         """Format execution result for user.
 
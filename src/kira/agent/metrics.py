@@ -64,6 +64,8 @@ class MetricsCollector:
     - agent_runtime_seconds: Execution time histogram
     - tool_executions_total: Per-tool execution count
     - tool_latency_seconds: Per-tool latency
+    - llm_cache_hits_total / llm_cache_misses_total: LLM response cache lookups
+    - llm_cache_saved_tokens_total: Tokens not spent thanks to cache hits
     """
 
     def __init__(self) -> None:
@@ -81,6 +83,11 @@ class MetricsCollector:
         self.tool_failures: dict[str, int] = defaultdict(int)
         self.tool_latencies: dict[str, list[float]] = defaultdict(list)
 
+        # LLM response cache metrics (per task type)
+        self.llm_cache_hits: dict[str, int] = defaultdict(int)
+        self.llm_cache_misses: dict[str, int] = defaultdict(int)
+        self.llm_cache_saved_tokens: dict[str, int] = defaultdict(int)
+
         # Runtime histogram buckets (in seconds)
         self.runtime_buckets = {
             0.1: 0,
@@ -132,6 +139,24 @@ class MetricsCollector:
         if not success:
             self.tool_failures[tool_name] += 1
 
+    def record_llm_cache(self, task_type: str, *, hit: bool, saved_tokens: int = 0) -> None:
+        """Record an LLM response cache lookup.
+
+        Parameters
+        ----------
+        task_type
+            Router task type of the request
+        hit
+            Whether the response was served from the cache
+        saved_tokens
+            Provider tokens the cached response would have cost
+        """
+        if hit:
+            self.llm_cache_hits[task_type] += 1
+            self.llm_cache_saved_tokens[task_type] += saved_tokens
+        else:
+            self.llm_cache_misses[task_type] += 1
+
     def record_runtime(self, runtime_seconds: float) -> None:
         """Record a runtime measurement.
 
@@ -252,6 +277,17 @@ class MetricsCollector:
                 avg_latency = sum(latencies) / len(latencies)
                 lines.append(f'tool_latency_seconds{{tool="{tool_name}"}} {avg_latency:.6f}')
 
+        # LLM response cache counters per task type
+        for name, help_text, values in (
+            ("llm_cache_hits_total", "LLM responses served from cache", self.llm_cache_hits),
+            ("llm_cache_misses_total", "LLM cache lookups sent to a provider", self.llm_cache_misses),
+            ("llm_cache_saved_tokens_total", "Provider tokens saved by LLM cache hits", self.llm_cache_saved_tokens),
+        ):
+            lines.append(f"# HELP {name} {help_text} by task type")
+            lines.append(f"# TYPE {name} counter")
+            for task_type, count in values.items():
+                lines.append(f'{name}{{task_type="{task_type}"}} {count}')
+
         return "\n".join(lines) + "\n"
 
     def get_summary(self) -> dict[str, Any]:
@@ -286,6 +322,17 @@ class MetricsCollector:
             }
 
         summary["tools"] = tool_summary
+
+        hits = sum(self.llm_cache_hits.values())
+        lookups = hits + sum(self.llm_cache_misses.values())
+        if lookups > 0:
+            summary["llm_cache"] = {
+                "hits": hits,
+                "misses": lookups - hits,
+                "hit_rate": round(hits / lookups, 3),
+                "saved_tokens": sum(self.llm_cache_saved_tokens.values()),
+            }
+
         return summary
 
 
@@ -7,16 +7,30 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ..adapters.llm import LLMAdapter, Message
     from .state import AgentState
     from .tools import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on tool calls running concurrently within one batch
+MAX_PARALLEL_TOOLS = 4
+
+# Tools that read or write many entities; they always run on their own
+_VAULT_WIDE_TOOLS = frozenset({"task_list", "rollup_daily", "inbox_normalize"})
+
+# Tool arguments that name the entity a step operates on
+_ENTITY_ARGS = ("uid", "entity_id", "id")
+
 __all__ = ["plan_node", "reflect_node", "tool_node", "verify_node", "respond_node", "route_node"]
 
 
@@ -71,6 +85,7 @@ def plan_node(state: AgentState, llm_adapter: LLMAdapter, tool_registry: Any) ->
             logger.info(f"[{state.trace_id}] User confirmed pending operation, restoring plan")
             return {
                 "plan": state.pending_plan,
+                "current_step": 0,
                 "pending_confirmation": False,
                 "pending_plan": [],
                 "confirmation_question": "",
@@ -279,6 +294,7 @@ Step 2: Choose action based on what was found
 
         result = {
             "plan": tool_calls,
+            "current_step": 0,  # new plan: earlier steps were already executed
             "memory": {**state.memory, "reasoning": reasoning},
             "status": "planned",
         }
@@ -440,15 +456,200 @@ def _get_tool_status_text(tool_name: str, args: dict[str, Any]) -> str:  # noqa:
     return status_map.get(tool_name, f"Выполняю {tool_name}...")
 
 
-def tool_node(state: AgentState, tool_registry: ToolRegistry) -> dict[str, Any]:
+class _EntityLocks:
+    """Process-wide per-entity locks held while a tool step runs.
+
+    Steps in one batch always touch different entities, so these only
+    serialize concurrent agent runs (e.g. two chats) working on the same
+    entity.
+    """
+
+    def __init__(self) -> None:
+        self._guard = threading.Lock()
+        self._locks: dict[str, threading.Lock] = {}
+
+    def get(self, key: str) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+
+_entity_locks = _EntityLocks()
+
+
+def _step_entity_key(step: dict[str, Any]) -> str | None:
+    """Return the entity a plan step touches, or None if it may touch any."""
+    tool_name = step.get("tool", "")
+    if tool_name in _VAULT_WIDE_TOOLS:
+        return None
+    args = step.get("args") or {}
+    for name in _ENTITY_ARGS:
+        value = args.get(name)
+        if isinstance(value, str) and value:
+            return value
+    title = args.get("title")
+    if tool_name == "task_create" and isinstance(title, str) and title.strip():
+        # Created IDs derive from the title, so equal titles would collide
+        return f"{tool_name}:{title.strip().lower()}"
+    return None
+
+
+def _referenced_values(value: Any) -> set[str]:
+    """Collect every string in (nested) tool arguments."""
+    if isinstance(value, str):
+        return {value}
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, list | tuple):
+        return set()
+    found: set[str] = set()
+    for item in value:
+        found |= _referenced_values(item)
+    return found
+
+
+def _select_batch(plan: list[dict[str, Any]], start: int, tool_registry: ToolRegistry, limit: int) -> list[int]:
+    """Select consecutive plan steps from ``start`` that can run concurrently.
+
+    Steps are independent when each names a different entity and none
+    refers to an entity touched by another step of the batch. Vault-wide
+    and unknown tools end the batch.
+
+    Parameters
+    ----------
+    plan
+        Execution plan
+    start
+        Index of the first step to run
+    tool_registry
+        Registry of available tools
+    limit
+        Maximum batch size (remaining step budget)
+
+    Returns
+    -------
+    list[int]
+        Plan indices of the batch (at least ``start``)
+    """
+    first_key = _step_entity_key(plan[start])
+    if first_key is None or tool_registry.get(plan[start].get("tool", "")) is None:
+        return [start]
+
+    batch = [start]
+    keys = {first_key}
+    referenced = _referenced_values(plan[start].get("args")) - {first_key}
+    for index in range(start + 1, min(len(plan), start + limit)):
+        step = plan[index]
+        key = _step_entity_key(step)
+        if key is None or key in keys or key in referenced or tool_registry.get(step.get("tool", "")) is None:
+            break
+        step_refs = _referenced_values(step.get("args")) - {key}
+        if step_refs & keys:
+            break
+        batch.append(index)
+        keys.add(key)
+        referenced |= step_refs
+    return batch
+
+
+def _run_tool_step(tool_registry: ToolRegistry, step: dict[str, Any], dry_run: bool) -> tuple[dict[str, Any], float]:
+    """Execute one plan step under its entity lock; never raises."""
+    tool_name = step.get("tool", "")
+    key = _step_entity_key(step)
+    start_time = time.time()
+    try:
+        tool = tool_registry.get(tool_name)
+        if tool is None:
+            result = {"status": "error", "error": f"Tool not found: {tool_name}"}
+        else:
+            with _entity_locks.get(key) if key else nullcontext():
+                result = tool.execute(step.get("args", {}), dry_run=dry_run).to_dict()
+    except Exception as e:
+        logger.error(f"Tool {tool_name} failed: {e}", exc_info=True)
+        result = {"status": "error", "error": f"Tool execution failed: {e}"}
+    return result, time.time() - start_time
+
+
+def _execute_batch(
+    state: AgentState, tool_registry: ToolRegistry, batch: list[int], max_workers: int
+) -> dict[str, Any]:
+    """Run independent plan steps on a thread pool and merge results in plan order.
+
+    The batch shares the remaining wall-time budget. When it runs out,
+    steps that have not started are skipped and reported as errors. Tool
+    calls already running cannot be cancelled and may still write, so the
+    batch waits for them and reports their real results; the overrun is
+    charged to the budget.
+    """
+    steps = [state.plan[index] for index in batch]
+    logger.info(
+        f"[{state.trace_id}] Executing {len(batch)} independent tool calls in parallel "
+        f"(steps {batch[0]}-{batch[-1]}, workers={min(max_workers, len(batch))})"
+    )
+
+    if state.progress_callback:
+        for tool_name in dict.fromkeys(step.get("tool", "") for step in steps):
+            try:
+                state.progress_callback(_get_tool_status_text(tool_name, {}))
+            except Exception as e:
+                logger.warning(f"[{state.trace_id}] Progress callback failed: {e}")
+
+    time_left = max(state.budget.max_wall_time_seconds - state.budget.wall_time_used, 0.0)
+    start_time = time.time()
+    pool = ThreadPoolExecutor(max_workers=min(max_workers, len(batch)), thread_name_prefix="kira-tool")
+    try:
+        futures = [
+            pool.submit(_run_tool_step, tool_registry, step, step.get("dry_run", False) or state.flags.dry_run)
+            for step in steps
+        ]
+        _, pending = wait(futures, timeout=time_left)
+        skipped = {future for future in pending if future.cancel()}
+    finally:
+        # Waits for the steps that were already running
+        pool.shutdown(wait=True, cancel_futures=True)
+    state.budget.wall_time_used += time.time() - start_time
+
+    tool_results = []
+    first_error = None
+    for index, step, future in zip(batch, steps, futures, strict=True):
+        if future in skipped:
+            result, elapsed = {"status": "error", "error": "Wall-time budget exhausted"}, 0.0
+        else:
+            result, elapsed = future.result()
+            state.budget.steps_used += 1
+        tool_results.append(
+            {**result, "tool": step.get("tool", ""), "step": index, "elapsed_ms": int(elapsed * 1000)}
+        )
+        if result["status"] == "ok":
+            logger.info(f"[{state.trace_id}] ✅ Tool {step.get('tool')} completed successfully: elapsed={elapsed:.2f}s")
+        else:
+            logger.error(f"[{state.trace_id}] ❌ Tool {step.get('tool')} FAILED: {result.get('error')}")
+            first_error = first_error or result.get("error")
+
+    return {
+        "tool_results": state.tool_results + tool_results,
+        "current_step": batch[-1] + 1,
+        "status": "executed" if first_error is None else "error",
+        "error": first_error,
+    }
+
+
+def tool_node(
+    state: AgentState, tool_registry: ToolRegistry, *, max_workers: int = MAX_PARALLEL_TOOLS
+) -> dict[str, Any]:
     """Tool execution node - executes the current step.
 
+    Consecutive independent steps (different entities, no references to
+    each other) are executed together on a thread pool, within the
+    remaining step and wall-time budget.
+
     Parameters
     ----------
     state
         Current agent state
     tool_registry
         Registry of available tools
+    max_workers
+        Maximum tool calls running concurrently
 
     Returns
     -------
@@ -462,6 +663,11 @@ def tool_node(state: AgentState, tool_registry: ToolRegistry) -> dict[str, Any]:
         logger.warning(f"[{state.trace_id}] No more steps to execute")
         return {"status": "completed"}
 
+    steps_left = max(state.budget.max_steps - state.budget.steps_used, 1)
+    batch = _select_batch(state.plan, state.current_step, tool_registry, steps_left)
+    if len(batch) > 1:
+        return _execute_batch(state, tool_registry, batch, max_workers)
+
     step = state.plan[state.current_step]
     tool_name = step.get("tool", "")
     args = step.get("args", {})
@@ -491,7 +697,9 @@ def tool_node(state: AgentState, tool_registry: ToolRegistry) -> dict[str, Any]:
             }
 
         # Execute tool
-        result = tool.execute(args, dry_run=dry_run)
+        entity_key = _step_entity_key(step)
+        with _entity_locks.get(entity_key) if entity_key else nullcontext():
+            result = tool.execute(args, dry_run=dry_run)
 
         elapsed = time.time() - start_time
         state.budget.wall_time_used += elapsed
@@ -617,6 +825,40 @@ def _get_respond_node_system_prompt() -> str:
 НО главное - быть ЧЕСТНОЙ и ТОЧНОЙ в описании результатов и ПРЕДОСТАВЛЯТЬ ТЕХНИЧЕСКУЮ ИНФОРМАЦИЮ ПРИ ОШИБКАХ!"""
 
 
+def _stream_response(state: AgentState, deltas: Iterable[str]) -> str:
+    """Collect a streamed response, passing the text so far to ``state.stream_callback``."""
+    parts: list[str] = []
+    callback = state.stream_callback
+    for delta in deltas:
+        parts.append(delta)
+        if callback:
+            try:
+                callback("".join(parts))
+            except Exception as e:
+                logger.warning(f"[{state.trace_id}] Stream callback failed, disabling: {e}")
+                callback = None
+    return "".join(parts).strip()
+
+
+def _generate_response(state: AgentState, llm_adapter: LLMAdapter, messages: list[Message]) -> str:
+    """Generate the natural language response, streaming it when the UI listens."""
+    chat_stream = getattr(llm_adapter, "chat_stream", None)
+    if state.stream_callback and chat_stream:
+        # Stream so the UI can show the answer while it is generated
+        return _stream_response(
+            state,
+            chat_stream(messages, temperature=0.8, max_tokens=500, timeout=15.0),
+        )
+
+    response = llm_adapter.chat(
+        messages,
+        temperature=0.8,  # Slightly higher for more natural responses
+        max_tokens=500,
+        timeout=15.0,
+    )
+    return response.content.strip()
+
+
 def respond_node(state: AgentState, llm_adapter: LLMAdapter) -> dict[str, Any]:
     """Response generation node - creates natural language response.
 
@@ -776,14 +1018,7 @@ def respond_node(state: AgentState, llm_adapter: LLMAdapter) -> dict[str, Any]:
             f"(system + {len(state.messages)} conversation + context)"
         )
 
-        response = llm_adapter.chat(
-            messages,
-            temperature=0.8,  # Slightly higher for more natural responses
-            max_tokens=500,
-            timeout=15.0,
-        )
-
-        nl_response = response.content.strip()
+        nl_response = _generate_response(state, llm_adapter, messages)
         logger.info(f"[{state.trace_id}] Generated natural response: {nl_response[:100]}...")
 
         return {
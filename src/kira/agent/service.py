@@ -22,6 +22,7 @@ except ImportError:
         "FastAPI dependencies not installed. Install with: poetry install --extras agent"
     ) from None
 
+from ..adapters.filesystem.watcher import create_vault_watcher
 from ..adapters.llm import (
     AnthropicAdapter,
     LLMAdapter,
@@ -29,14 +30,17 @@ from ..adapters.llm import (
     OllamaAdapter,
     OpenAIAdapter,
     OpenRouterAdapter,
+    ResponseCache,
     RouterConfig,
     TaskType,
+    create_response_cache,
 )
 from ..core.host import create_host_api
 from .config import AgentConfig
 from .executor import AgentExecutor, ExecutionPlan, ExecutionStep
 from .kira_tools import RollupDailyTool, TaskCreateTool, TaskGetTool, TaskListTool, TaskUpdateTool
 from .memory import ConversationMemory
+from .metrics import create_metrics_collector
 from .rag import RAGStore
 from .telegram_gateway import create_telegram_router
 from .tools import ToolRegistry
@@ -107,6 +111,13 @@ class HealthResponse(BaseModel):
     version: str = "0.1.0"
 
 
+def _create_response_cache(config: AgentConfig) -> ResponseCache | None:
+    """Create the LLM response cache if enabled (stored in the Vault)."""
+    if not config.enable_llm_cache or not config.vault_path:
+        return None
+    return create_response_cache(config.vault_path)
+
+
 def create_agent_app(config: AgentConfig | None = None) -> FastAPI:
     """Create FastAPI app for agent service.
 
@@ -168,15 +179,23 @@ def create_agent_app(config: AgentConfig | None = None) -> FastAPI:
         structuring_provider=config.structuring_provider,
         default_provider=config.default_provider,
         enable_ollama_fallback=config.enable_ollama_fallback,
+        cache_nonzero_temperature=config.llm_cache_nonzero_temperature,
+        enable_hedging=config.enable_llm_hedging,
     )
 
+    metrics_collector = create_metrics_collector()
+
     llm_adapter = LLMRouter(
         router_config,
         anthropic_adapter=anthropic_adapter,
         openai_adapter=openai_adapter,
         openrouter_adapter=openrouter_adapter,
         ollama_adapter=ollama_adapter,
+        response_cache=_create_response_cache(config),
+        metrics=metrics_collector,
     )
+    # Release pooled LLM connections on shutdown
+    app.router.on_shutdown.append(llm_adapter.close)
 
     # Initialize tool registry
     tool_registry = ToolRegistry()
@@ -187,6 +206,11 @@ def create_agent_app(config: AgentConfig | None = None) -> FastAPI:
 
     host_api = create_host_api(config.vault_path)
 
+    # Keep HostAPI caches and indexes in sync with edits made outside Kira
+    vault_watcher = create_vault_watcher(host_api)
+    app.router.on_startup.append(vault_watcher.start)
+    app.router.on_shutdown.append(vault_watcher.stop)
+
     # Register tools
     from .kira_tools import TaskDeleteTool
 
@@ -272,6 +296,7 @@ def create_agent_app(config: AgentConfig | None = None) -> FastAPI:
                 "sum": 0.0,
                 "avg": 0.0,
             },
+            "llm_cache": metrics_collector.get_summary().get("llm_cache", {}),
         }
 
     @app.post("/agent/chat", response_model=ChatResponse)
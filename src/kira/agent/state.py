@@ -90,6 +90,7 @@ class AgentState:
 
     # Progress callback for UI updates
     progress_callback: Any = None  # Optional callback(status: str) -> None
+    stream_callback: Any = None  # Optional callback(partial_response: str) -> None
 
     # Memory and context
     memory: dict[str, Any] = field(default_factory=dict)
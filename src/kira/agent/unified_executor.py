@@ -70,6 +70,7 @@ class UnifiedExecutor:
         trace_id: str | None = None,
         session_id: str | None = None,
         progress_callback: Any = None,
+        stream_callback: Any = None,
     ) -> Any:
         """Execute user request through underlying executor.
 
@@ -83,6 +84,9 @@ class UnifiedExecutor:
             Optional session ID for conversation memory (preferred)
         progress_callback
             Optional callback for progress updates: callback(status: str) -> None
+        stream_callback
+            Optional callback receiving the partial response text while it
+            streams (LangGraph executor only): callback(partial_response: str) -> None
 
         Returns
         -------
@@ -113,6 +117,7 @@ class UnifiedExecutor:
                 trace_id=trace_id,
                 session_id=session_id,
                 progress_callback=progress_callback,
+                stream_callback=stream_callback,
             )  # type: ignore[attr-defined]
             return result
         else:
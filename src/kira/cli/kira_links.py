@@ -9,9 +9,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 import click
-import yaml
 
 from ..core.config import load_config
+from ..core.md_io import read_frontmatter_only
 
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
@@ -270,18 +270,8 @@ def find_entity_file(vault_path: Path, entity_id: str) -> Path | None:
 
 
 def load_metadata(file_path: Path) -> dict:
-    """Загрузить метаданные из файла."""
-    with open(file_path, encoding="utf-8") as f:
-        content = f.read()
-
-    if not content.startswith("---"):
-        return {}
-
-    parts = content.split("---", 2)
-    if len(parts) < 3:
-        return {}
-
-    return yaml.safe_load(parts[1]) or {}
+    """Загрузить метаданные из файла (без чтения тела)."""
+    return read_frontmatter_only(file_path)
 
 
 def find_outgoing_links(file_path: Path) -> list[str]:
@@ -12,6 +12,7 @@ import click
 import yaml
 
 from ..core.config import load_config
+from ..core.host import create_host_api
 
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
@@ -125,8 +126,8 @@ def pending_command(verbose: bool) -> int:
         click.echo("\n⚠️  Задачи, требующие внимания\n")
         click.echo("=" * 60)
 
-        tasks_dir = vault_path / "tasks"
-        if not tasks_dir.exists():
+        tasks = list(create_host_api(vault_path).list_entities("task"))
+        if not tasks:
             click.echo("📋 Задач нет")
             return 0
 
@@ -139,9 +140,9 @@ def pending_command(verbose: bool) -> int:
         long_todo = []
         long_doing = []
 
-        for task_file in tasks_dir.glob("task-*.md"):
+        for task in tasks:
             try:
-                metadata = load_metadata(task_file)
+                metadata = task.metadata
                 status = metadata.get("status", "todo")
                 created = parse_date(metadata.get("created"))
                 due = parse_date(metadata.get("due"))
@@ -268,57 +269,30 @@ def collect_review_data(vault_path: Path, start_date: datetime, end_date: dateti
         },
     }
 
-    # Задачи
-    tasks_dir = vault_path / "tasks"
-    if tasks_dir.exists():
-        for task_file in tasks_dir.glob("task-*.md"):
-            try:
-                metadata = load_metadata(task_file)
-                created = parse_date(metadata.get("created"))
-
-                if created and start_date <= created <= end_date:
-                    data["tasks"]["created"].append(metadata)
-
-                # Завершенные
-                if metadata.get("status") == "done":
-                    updated = parse_date(metadata.get("updated"))
-                    if updated and start_date <= updated <= end_date:
-                        data["tasks"]["completed"].append(metadata)
+    # Выборки по индексам HostAPI (даты, статусы) вместо обхода папок
+    host_api = create_host_api(vault_path)
 
-                # В работе
-                if metadata.get("status") == "doing":
-                    data["tasks"]["in_progress"].append(metadata)
-
-            except Exception:
-                continue
+    # Задачи
+    data["tasks"]["created"] = [
+        task.metadata for task in host_api.list_entities_by_date("task", "created", start=start_date, end=end_date)
+    ]
+    # Завершенные
+    data["tasks"]["completed"] = [
+        task.metadata
+        for task in host_api.list_entities_by_date("task", "updated", start=start_date, end=end_date, status="done")
+    ]
+    # В работе
+    data["tasks"]["in_progress"] = [task.metadata for task in host_api.list_entities("task", status="doing")]
 
     # Заметки
-    notes_dir = vault_path / "notes"
-    if notes_dir.exists():
-        for note_file in notes_dir.glob("note-*.md"):
-            try:
-                metadata = load_metadata(note_file)
-                created = parse_date(metadata.get("created"))
-
-                if created and start_date <= created <= end_date:
-                    data["notes"]["created"].append(metadata)
-
-            except Exception:
-                continue
+    data["notes"]["created"] = [
+        note.metadata for note in host_api.list_entities_by_date("note", "created", start=start_date, end=end_date)
+    ]
 
     # События
-    events_dir = vault_path / "events"
-    if events_dir.exists():
-        for event_file in events_dir.glob("event-*.md"):
-            try:
-                metadata = load_metadata(event_file)
-                start = parse_date(metadata.get("start"))
-
-                if start and start_date <= start <= end_date:
-                    data["events"]["attended"].append(metadata)
-
-            except Exception:
-                continue
+    data["events"]["attended"] = [
+        event.metadata for event in host_api.list_entities_by_date("event", "start", start=start_date, end=end_date)
+    ]
 
     return data
 
@@ -398,10 +372,12 @@ def load_metadata(file_path: Path) -> dict:
     return yaml.safe_load(parts[1]) or {}
 
 
-def parse_date(date_str: str | None) -> datetime | None:
+def parse_date(date_str: str | datetime | None) -> datetime | None:
     """Парсинг даты из строки."""
     if not date_str:
         return None
+    if isinstance(date_str, datetime):
+        return date_str
     try:
         return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
     except Exception:
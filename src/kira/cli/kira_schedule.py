@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 import sys
-from datetime import datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 import click
 
 from ..core.config import load_config
+from ..core.host import HostAPI, create_host_api
 
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
@@ -77,8 +78,9 @@ def view_command(period: str, date: str | None, verbose: bool) -> int:
             end_date = start_date
 
         # Загрузить события и задачи
-        events = load_events(vault_path, start_date, end_date)
-        tasks = load_tasks_with_deadlines(vault_path, start_date, end_date)
+        host_api = create_host_api(vault_path)
+        events = load_events(vault_path, start_date, end_date, host_api)
+        tasks = load_tasks_with_deadlines(vault_path, start_date, end_date, host_api)
 
         # Отобразить расписание
         display_schedule(events, tasks, start_date, end_date, verbose)
@@ -165,8 +167,6 @@ def conflicts_command(period: str, verbose: bool) -> int:
 def quick_command(description: str, date: str | None, time: str | None, duration: int, verbose: bool) -> int:
     """Быстро создать событие."""
     try:
-        from ..core.host import create_host_api
-
         config = load_config()
         vault_path = Path(config.get("vault", {}).get("path", "vault"))
 
@@ -214,115 +214,98 @@ def quick_command(description: str, date: str | None, time: str | None, duration
 # Helper functions
 
 
-def load_events(vault_path: Path, start_date: datetime, end_date: datetime) -> list[dict[str, Any]]:
-    """Загрузить события из Vault за указанный период."""
+def load_events(
+    vault_path: Path, start_date: datetime, end_date: datetime, host_api: HostAPI | None = None
+) -> list[dict[str, Any]]:
+    """Загрузить события из Vault за указанный период (индекс дат)."""
+    host_api = host_api or create_host_api(vault_path)
     events = []
-    events_dir = vault_path / "events"
-
-    if not events_dir.exists():
-        return events
 
-    for event_file in events_dir.glob("event-*.md"):
+    for event in host_api.list_entities_by_date("event", "start", start=start_date.date(), end=end_date.date()):
+        metadata = event.metadata
         try:
-            # Parse frontmatter
-            with open(event_file, encoding="utf-8") as f:
-                content = f.read()
-
-            if not content.startswith("---"):
-                continue
-
-            # Extract frontmatter
-            parts = content.split("---", 2)
-            if len(parts) < 3:
-                continue
-
-            import yaml
-
-            metadata = yaml.safe_load(parts[1])
-
-            # Parse event start/end
-            start_str = metadata.get("start")
-            if not start_str:
-                continue
-
-            event_start = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-
-            # Check if in range
-            if start_date.date() <= event_start.date() <= end_date.date():
-                end_str = metadata.get("end")
-                event_end = datetime.fromisoformat(end_str.replace("Z", "+00:00")) if end_str else event_start
-
-                events.append(
-                    {
-                        "id": metadata.get("id"),
-                        "title": metadata.get("title", "Untitled"),
-                        "start": event_start,
-                        "end": event_end,
-                        "location": metadata.get("location"),
-                        "file": str(event_file),
-                    }
-                )
-        except Exception:
+            event_start = parse_datetime(metadata["start"])
+            end_value = metadata.get("end")
+            event_end = parse_datetime(end_value) if end_value else event_start
+        except (TypeError, ValueError):
             continue
 
+        events.append(
+            {
+                "id": metadata.get("id"),
+                "title": metadata.get("title", "Untitled"),
+                "start": event_start,
+                "end": event_end,
+                "all_day": is_date_only(metadata["start"]),
+                "location": metadata.get("location"),
+                "file": str(event.path),
+            }
+        )
+
     # Sort by start time
     events.sort(key=lambda e: e["start"])
     return events
 
 
-def load_tasks_with_deadlines(vault_path: Path, start_date: datetime, end_date: datetime) -> list[dict[str, Any]]:
-    """Загрузить задачи с дедлайнами за указанный период."""
+def load_tasks_with_deadlines(
+    vault_path: Path, start_date: datetime, end_date: datetime, host_api: HostAPI | None = None
+) -> list[dict[str, Any]]:
+    """Загрузить задачи с дедлайнами за указанный период (индекс дат)."""
+    host_api = host_api or create_host_api(vault_path)
     tasks = []
-    tasks_dir = vault_path / "tasks"
 
-    if not tasks_dir.exists():
-        return tasks
-
-    for task_file in tasks_dir.glob("task-*.md"):
+    for task in host_api.list_entities_by_date("task", "due", start=start_date.date(), end=end_date.date()):
+        metadata = task.metadata
         try:
-            # Parse frontmatter
-            with open(task_file, encoding="utf-8") as f:
-                content = f.read()
-
-            if not content.startswith("---"):
-                continue
-
-            parts = content.split("---", 2)
-            if len(parts) < 3:
-                continue
-
-            import yaml
-
-            metadata = yaml.safe_load(parts[1])
-
-            # Check if has deadline
-            due_str = metadata.get("due")
-            if not due_str:
-                continue
-
-            due_date = datetime.fromisoformat(due_str.replace("Z", "+00:00"))
-
-            # Check if in range
-            if start_date.date() <= due_date.date() <= end_date.date():
-                status = metadata.get("status", "todo")
-
-                tasks.append(
-                    {
-                        "id": metadata.get("id"),
-                        "title": metadata.get("title", "Untitled"),
-                        "due": due_date,
-                        "status": status,
-                        "file": str(task_file),
-                    }
-                )
-        except Exception:
+            due_date = parse_datetime(metadata["due"])
+        except (TypeError, ValueError):
             continue
 
+        tasks.append(
+            {
+                "id": metadata.get("id"),
+                "title": metadata.get("title", "Untitled"),
+                "due": due_date,
+                "all_day": is_date_only(metadata["due"]),
+                "status": metadata.get("status", "todo"),
+                "file": str(task.path),
+            }
+        )
+
     # Sort by due date
     tasks.sort(key=lambda t: t["due"])
     return tasks
 
 
+def parse_datetime(value: str | date | datetime) -> datetime:
+    """Парсинг даты из frontmatter (строка ISO 8601, date или datetime).
+
+    Всегда возвращает aware datetime: даты и наивные значения считаются UTC,
+    как и в индексе дат, чтобы их можно было сравнивать со значениями со
+    смещением.
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, date):
+        parsed = datetime(value.year, value.month, value.day)
+    else:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def is_date_only(value: str | date | datetime) -> bool:
+    """Значение без времени (событие или дедлайн на весь день)."""
+    if isinstance(value, datetime):
+        return False
+    if isinstance(value, date):
+        return True
+    try:
+        date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
 def find_conflicts(events: list[dict[str, Any]]) -> list[tuple[dict[str, Any], dict[str, Any]]]:
     """Найти overlapping события (конфликты)."""
     conflicts = []
@@ -354,7 +337,7 @@ def display_schedule(
     if events:
         click.echo("📆 События:")
         for event in events:
-            time_str = format_time_range(event["start"], event["end"])
+            time_str = "весь день" if event["all_day"] else format_time_range(event["start"], event["end"])
             location_str = f" @ {event['location']}" if event.get("location") else ""
             click.echo(f"  {time_str}: {event['title']}{location_str}")
             if verbose:
@@ -368,7 +351,7 @@ def display_schedule(
         click.echo("✅ Задачи с дедлайнами:")
         for task in tasks:
             status_icon = {"todo": "⏳", "doing": "🔄", "done": "✅", "blocked": "🚫"}.get(task["status"], "❓")
-            time_str = format_time(task["due"])
+            time_str = "весь день" if task["all_day"] else format_time(task["due"])
             click.echo(f"  {status_icon} {time_str}: {task['title']}")
             if verbose:
                 click.echo(f"           {task['file']}")
@@ -9,9 +9,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 import click
-import yaml
 
 from ..core.config import load_config
+from ..core.host import create_host_api
 
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
@@ -70,7 +70,7 @@ def cli(
             click.echo(f"❌ Vault не найден: {vault_path}")
             return 1
 
-        # Выполнить поиск
+        # Выполнить поиск (один лишний результат, чтобы понять, есть ли еще)
         results = search_vault(
             vault_path,
             query,
@@ -78,27 +78,27 @@ def cli(
             tag,
             status,
             case_sensitive,
+            limit=limit + 1,
         )
 
         if not results:
             click.echo(f"🔍 Ничего не найдено по запросу: {query}")
             return 0
 
-        # Ограничить результаты
-        total_results = len(results)
+        has_more = len(results) > limit
         results = results[:limit]
 
         # Вывод результатов
-        click.echo(f"🔍 Найдено: {total_results} результатов\n")
+        click.echo(f"🔍 Найдено: {len(results)}{'+' if has_more else ''} результатов\n")
 
         for i, result in enumerate(results, 1):
             display_search_result(result, query, verbose, case_sensitive)
             if i < len(results):
                 click.echo()
 
-        if total_results > limit:
-            click.echo(f"\n... и еще {total_results - limit} результатов")
-            click.echo(f"Используйте --limit {total_results} для показа всех результатов")
+        if has_more:
+            click.echo("\n... есть еще результаты")
+            click.echo(f"Используйте --limit {limit * 2} для показа большего числа результатов")
 
         return 0
 
@@ -118,88 +118,52 @@ def search_vault(
     tag: str | None,
     status: str | None,
     case_sensitive: bool,
+    *,
+    limit: int | None = None,
 ) -> list[dict]:
-    """Выполнить поиск по Vault."""
-    results = []
+    """Выполнить поиск по Vault.
+
+    Использует полнотекстовый индекс (BM25, префиксы, "фразы в кавычках");
+    без индекса HostAPI откатывается к полному сканированию.
+    Результаты упорядочены по релевантности.
+    """
+    host_api = create_host_api(vault_path)
 
-    # Определить типы для поиска
-    if entity_type == "all":
-        search_types = ["tasks", "notes", "events", "projects"]
-    else:
-        type_to_folder = {
-            "task": "tasks",
-            "note": "notes",
-            "event": "events",
-            "project": "projects",
-        }
-        search_types = [type_to_folder[entity_type]]
-
-    # Подготовить запрос
     flags = 0 if case_sensitive else re.IGNORECASE
     pattern = re.compile(re.escape(query), flags)
 
-    # Поиск по каждому типу
-    for folder_name in search_types:
-        folder_path = vault_path / folder_name
-        if not folder_path.exists():
+    entities = host_api.search_entities(
+        query,
+        None if entity_type == "all" else entity_type,
+        status=status,
+        tags=[tag] if tag else None,
+        limit=None if case_sensitive else limit,
+    )
+
+    results = []
+    for entity in entities:
+        title = str(entity.metadata.get("title", ""))
+        title_matches = list(pattern.finditer(title))
+        body_matches = list(pattern.finditer(entity.content))
+
+        # Индекс регистронезависимый: точное совпадение проверяем отдельно
+        if case_sensitive and not (title_matches or body_matches):
             continue
 
-        # Получить префикс файла
-        file_prefix = folder_name.rstrip("s")  # tasks -> task
-
-        for entity_file in folder_path.glob(f"{file_prefix}-*.md"):
-            try:
-                with open(entity_file, encoding="utf-8") as f:
-                    content = f.read()
-
-                if not content.startswith("---"):
-                    continue
-
-                parts = content.split("---", 2)
-                if len(parts) < 3:
-                    continue
-
-                metadata = yaml.safe_load(parts[1])
-                body = parts[2]
-
-                # Применить фильтры
-                if tag and tag not in metadata.get("tags", []):
-                    continue
-
-                if status and metadata.get("status") != status:
-                    continue
-
-                # Поиск в заголовке
-                title = metadata.get("title", "")
-                title_matches = list(pattern.finditer(title))
-
-                # Поиск в теле
-                body_matches = list(pattern.finditer(body))
-
-                # Если есть совпадения
-                if title_matches or body_matches:
-                    result = {
-                        "file": entity_file,
-                        "type": file_prefix,
-                        "metadata": metadata,
-                        "title_matches": title_matches,
-                        "body_matches": body_matches,
-                        "body": body,
-                    }
-                    results.append(result)
-
-            except Exception:
-                continue
-
-    # Сортировка: сначала с совпадениями в заголовке
-    def sort_key(r):
-        return (
-            -len(r["title_matches"]),  # Больше совпадений в заголовке
-            -len(r["body_matches"]),  # Больше совпадений в теле
-            r["metadata"].get("updated", r["metadata"].get("created", "")),  # Новее
+        results.append(
+            {
+                "file": entity.path,
+                "type": entity.entity_type,
+                "metadata": entity.metadata,
+                "title_matches": title_matches,
+                "body_matches": body_matches,
+                "body": entity.content,
+            }
         )
 
-    results.sort(key=sort_key, reverse=True)
+        if limit and len(results) >= limit:
+            break
+
     return results
 
 
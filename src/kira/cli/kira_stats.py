@@ -10,9 +10,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 import click
-import yaml
 
 from ..core.config import load_config
+from ..core.md_io import read_frontmatter_only
 
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
@@ -253,18 +253,8 @@ def display_statistics(stats: dict, period_name: str, verbose: bool) -> None:
 
 
 def load_metadata(file_path: Path) -> dict:
-    """Загрузить метаданные из файла."""
-    with open(file_path, encoding="utf-8") as f:
-        content = f.read()
-
-    if not content.startswith("---"):
-        return {}
-
-    parts = content.split("---", 2)
-    if len(parts) < 3:
-        return {}
-
-    return yaml.safe_load(parts[1]) or {}
+    """Загрузить метаданные из файла (без чтения тела)."""
+    return read_frontmatter_only(file_path)
 
 
 def parse_date(date_str: str | None) -> datetime | None:
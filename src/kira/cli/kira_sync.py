@@ -10,6 +10,7 @@ import click
 
 from ..core.config import load_config
 from ..core.events import create_event_bus
+from ..core.job_store import create_job_store
 from ..core.scheduler import create_scheduler
 from ..pipelines.sync_pipeline import SyncPipeline, SyncPipelineConfig
 
@@ -158,9 +159,11 @@ def handle_sync_schedule(
         click.echo("   Режим: daemon")
         click.echo(f"   Интервал: {interval} секунд")
 
-    # Create event bus and scheduler
+    # Create event bus and scheduler (job state persists in the vault, if known)
     event_bus = create_event_bus()
-    scheduler = create_scheduler()
+    vault_path = config.get("vault", {}).get("path")
+    job_store = create_job_store(Path(vault_path)) if vault_path else None
+    scheduler = create_scheduler(job_store=job_store)
 
     # Create pipeline config
     pipeline_config = SyncPipelineConfig(
@@ -14,6 +14,7 @@ import click
 from ..core.config import load_config
 from ..core.events import create_event_bus
 from ..core.host import create_host_api
+from ..core.job_store import create_job_store
 from ..core.scheduler import create_scheduler
 
 # Agent and adapter imports moved to command function (lazy loaded)
@@ -162,6 +163,7 @@ def handle_telegram_start(
     """Обработка запуска Telegram бота с интеграцией Agent."""
 
     # Import all required agent and adapter modules
+    from ..adapters.filesystem.watcher import create_vault_watcher
     from ..adapters.llm import (
         AnthropicAdapter,
         LLMAdapter,
@@ -170,6 +172,7 @@ def handle_telegram_start(
         OpenAIAdapter,
         OpenRouterAdapter,
         RouterConfig,
+        create_response_cache,
     )
     from ..adapters.telegram.adapter import TelegramAdapter, TelegramAdapterConfig, create_telegram_adapter
     from ..agent.config import AgentConfig
@@ -225,6 +228,8 @@ def handle_telegram_start(
         structuring_provider="openai",
         default_provider="openrouter",
         enable_ollama_fallback=agent_config.enable_ollama_fallback,
+        cache_nonzero_temperature=agent_config.llm_cache_nonzero_temperature,
+        enable_hedging=agent_config.enable_llm_hedging,
     )
 
     llm_adapter = LLMRouter(
@@ -233,6 +238,7 @@ def handle_telegram_start(
         openai_adapter=openai_adapter,
         openrouter_adapter=openrouter_adapter,
         ollama_adapter=ollama_adapter,
+        response_cache=create_response_cache(vault_path) if agent_config.enable_llm_cache else None,
     )
 
     # Initialize tool registry
@@ -290,9 +296,13 @@ def handle_telegram_start(
 
     # === Setup Telegram Components ===
 
-    # Create event bus and scheduler
+    # Create event bus and scheduler; briefings missed while the bot was
+    # down are sent once on startup, spread over a minute
     event_bus = create_event_bus()
-    scheduler = create_scheduler()
+    scheduler = create_scheduler(job_store=create_job_store(vault_path), catch_up_spread_seconds=60.0)
+
+    # Keep HostAPI caches and indexes in sync with edits made outside Kira
+    vault_watcher = create_vault_watcher(host_api, event_bus=event_bus)
 
     # Get polling timeout for logging
     polling_timeout = telegram_config.get("polling_timeout", 30)
@@ -337,6 +347,10 @@ def handle_telegram_start(
             click.echo("   Режим: long polling + event-driven agent")
             click.echo(f"   Timeout: {polling_timeout}s")
 
+        vault_watcher.start()
+        if verbose:
+            click.echo(f"   Vault watcher: {vault_watcher.backend_name}")
+
         # Start polling (blocks until interrupted)
         adapter.start_polling()
 
@@ -356,6 +370,10 @@ def handle_telegram_start(
             traceback.print_exc()
         return 1
 
+    finally:
+        vault_watcher.stop()
+        llm_adapter.close()
+
 
 def main(args: list[str] | None = None) -> int:
     if args is None:
@@ -2,16 +2,17 @@
 """CLI модуль для просмотра задач и событий на сегодня"""
 
 import sys
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 
 # Добавляем src в путь
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 import click
-import yaml
 
 from ..core.config import load_config
+from ..core.host import HostAPI, create_host_api
+from .kira_schedule import is_date_only
 
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
@@ -38,8 +39,6 @@ def cli(tomorrow: bool, verbose: bool) -> int:
 
         # Определить целевую дату
         now = datetime.now(UTC)
-        from datetime import timedelta
-
         target_date = now.date() if not tomorrow else (now + timedelta(days=1)).date()
 
         # Заголовок
@@ -49,8 +48,11 @@ def cli(tomorrow: bool, verbose: bool) -> int:
         else:
             click.echo(f"📅 Сегодня: {date_str}\n")
 
+        # Все выборки идут через индексы HostAPI
+        host_api = create_host_api(vault_path)
+
         # 1. Активные задачи (в работе)
-        doing_tasks = load_doing_tasks(vault_path)
+        doing_tasks = load_doing_tasks(vault_path, host_api)
         if doing_tasks:
             click.echo("🔄 В работе:")
             for task in doing_tasks:
@@ -62,7 +64,7 @@ def cli(tomorrow: bool, verbose: bool) -> int:
             click.echo()
 
         # 2. Задачи с дедлайном на сегодня/завтра
-        due_tasks = load_tasks_with_due_date(vault_path, target_date)
+        due_tasks = load_tasks_with_due_date(vault_path, target_date, host_api)
         if due_tasks:
             if tomorrow:
                 click.echo("📋 Дедлайны завтра:")
@@ -84,7 +86,7 @@ def cli(tomorrow: bool, verbose: bool) -> int:
             click.echo()
 
         # 3. События на сегодня/завтра
-        events = load_events_for_date(vault_path, target_date)
+        events = load_events_for_date(vault_path, target_date, host_api)
         if events:
             click.echo("📆 События:")
             for event in events:
@@ -103,7 +105,7 @@ def cli(tomorrow: bool, verbose: bool) -> int:
 
         # 4. Просроченные задачи (только для сегодня)
         if not tomorrow:
-            overdue_tasks = load_overdue_tasks(vault_path, target_date)
+            overdue_tasks = load_overdue_tasks(vault_path, target_date, host_api)
             if overdue_tasks:
                 click.echo("🔴 Просроченные задачи:")
                 for task in overdue_tasks:
@@ -121,7 +123,7 @@ def cli(tomorrow: bool, verbose: bool) -> int:
 
         # 5. Следующие задачи (todo без дедлайна)
         if not tomorrow:
-            next_tasks = load_next_tasks(vault_path, limit=5)
+            next_tasks = load_next_tasks(vault_path, limit=5, host_api=host_api)
             if next_tasks:
                 click.echo("⏭️  Следующие задачи:")
                 for task in next_tasks:
@@ -168,65 +170,20 @@ def cli(tomorrow: bool, verbose: bool) -> int:
 # Helper functions
 
 
-def load_doing_tasks(vault_path: Path) -> list[dict]:
-    """Загрузить задачи в статусе doing."""
-    tasks_dir = vault_path / "tasks"
-    if not tasks_dir.exists():
-        return []
-
-    doing_tasks = []
-    for task_file in tasks_dir.glob("task-*.md"):
-        try:
-            with open(task_file, encoding="utf-8") as f:
-                content = f.read()
-
-            if not content.startswith("---"):
-                continue
-
-            parts = content.split("---", 2)
-            if len(parts) < 3:
-                continue
-
-            metadata = yaml.safe_load(parts[1])
-            if metadata.get("status") == "doing":
-                doing_tasks.append(metadata)
-
-        except Exception:
-            continue
-
-    return doing_tasks
-
+def load_doing_tasks(vault_path: Path, host_api: HostAPI | None = None) -> list[dict]:
+    """Загрузить задачи в статусе doing (индекс статусов)."""
+    host_api = host_api or create_host_api(vault_path)
+    return [task.metadata for task in host_api.list_entities("task", status="doing")]
 
-def load_tasks_with_due_date(vault_path: Path, target_date) -> list[dict]:
-    """Загрузить задачи с дедлайном на указанную дату."""
-    tasks_dir = vault_path / "tasks"
-    if not tasks_dir.exists():
-        return []
 
-    due_tasks = []
-    for task_file in tasks_dir.glob("task-*.md"):
-        try:
-            with open(task_file, encoding="utf-8") as f:
-                content = f.read()
-
-            if not content.startswith("---"):
-                continue
-
-            parts = content.split("---", 2)
-            if len(parts) < 3:
-                continue
-
-            metadata = yaml.safe_load(parts[1])
-            due = metadata.get("due")
-            status = metadata.get("status", "todo")
-
-            if due and status not in ["done"]:
-                due_date = parse_date(due).date()
-                if due_date == target_date:
-                    due_tasks.append(metadata)
-
-        except Exception:
-            continue
+def load_tasks_with_due_date(vault_path: Path, target_date, host_api: HostAPI | None = None) -> list[dict]:
+    """Загрузить задачи с дедлайном на указанную дату (индекс дат)."""
+    host_api = host_api or create_host_api(vault_path)
+    due_tasks = [
+        task.metadata
+        for task in host_api.list_entities_by_date("task", "due", start=target_date, end=target_date)
+        if task.metadata.get("status", "todo") != "done"
+    ]
 
     # Сортировка по статусу
     def sort_key(task):
@@ -238,118 +195,49 @@ def load_tasks_with_due_date(vault_path: Path, target_date) -> list[dict]:
     return due_tasks
 
 
-def load_overdue_tasks(vault_path: Path, today) -> list[dict]:
-    """Загрузить просроченные задачи."""
-    tasks_dir = vault_path / "tasks"
-    if not tasks_dir.exists():
-        return []
-
-    overdue_tasks = []
-    for task_file in tasks_dir.glob("task-*.md"):
-        try:
-            with open(task_file, encoding="utf-8") as f:
-                content = f.read()
-
-            if not content.startswith("---"):
-                continue
-
-            parts = content.split("---", 2)
-            if len(parts) < 3:
-                continue
+def load_overdue_tasks(vault_path: Path, today, host_api: HostAPI | None = None) -> list[dict]:
+    """Загрузить просроченные задачи (индекс дат, самые старые первыми)."""
+    host_api = host_api or create_host_api(vault_path)
+    return [
+        task.metadata
+        for task in host_api.list_entities_by_date("task", "due", end=today - timedelta(days=1))
+        if task.metadata.get("status", "todo") != "done"
+    ]
 
-            metadata = yaml.safe_load(parts[1])
-            due = metadata.get("due")
-            status = metadata.get("status", "todo")
 
-            if due and status not in ["done"]:
-                due_date = parse_date(due).date()
-                if due_date < today:
-                    overdue_tasks.append(metadata)
-
-        except Exception:
-            continue
-
-    # Сортировка по дате (самые старые первыми)
-    overdue_tasks.sort(key=lambda t: t.get("due", ""))
-    return overdue_tasks
-
-
-def load_next_tasks(vault_path: Path, limit: int = 5) -> list[dict]:
+def load_next_tasks(vault_path: Path, limit: int = 5, host_api: HostAPI | None = None) -> list[dict]:
     """Загрузить следующие задачи (todo без дедлайна)."""
-    tasks_dir = vault_path / "tasks"
-    if not tasks_dir.exists():
-        return []
-
-    next_tasks = []
-    for task_file in tasks_dir.glob("task-*.md"):
-        try:
-            with open(task_file, encoding="utf-8") as f:
-                content = f.read()
-
-            if not content.startswith("---"):
-                continue
-
-            parts = content.split("---", 2)
-            if len(parts) < 3:
-                continue
-
-            metadata = yaml.safe_load(parts[1])
-            status = metadata.get("status", "todo")
-            due = metadata.get("due")
-
-            if status == "todo" and not due:
-                next_tasks.append(metadata)
-
-        except Exception:
-            continue
+    host_api = host_api or create_host_api(vault_path)
+    next_tasks = [
+        task.metadata for task in host_api.list_entities("task", status="todo") if not task.metadata.get("due")
+    ]
 
     # Сортировка по дате создания
-    next_tasks.sort(key=lambda t: t.get("created", ""))
+    next_tasks.sort(key=lambda t: str(t.get("created", "")))
     return next_tasks[:limit]
 
 
-def load_events_for_date(vault_path: Path, target_date) -> list[dict]:
-    """Загрузить события на указанную дату."""
-    events_dir = vault_path / "events"
-    if not events_dir.exists():
-        return []
-
-    events = []
-    for event_file in events_dir.glob("event-*.md"):
-        try:
-            with open(event_file, encoding="utf-8") as f:
-                content = f.read()
-
-            if not content.startswith("---"):
-                continue
-
-            parts = content.split("---", 2)
-            if len(parts) < 3:
-                continue
-
-            metadata = yaml.safe_load(parts[1])
-            start = metadata.get("start")
-
-            if start:
-                start_date = parse_date(start).date()
-                if start_date == target_date:
-                    events.append(metadata)
-
-        except Exception:
-            continue
-
-    # Сортировка по времени начала
-    events.sort(key=lambda e: e.get("start", ""))
-    return events
+def load_events_for_date(vault_path: Path, target_date, host_api: HostAPI | None = None) -> list[dict]:
+    """Загрузить события на указанную дату (индекс дат, по времени начала)."""
+    host_api = host_api or create_host_api(vault_path)
+    return [
+        event.metadata for event in host_api.list_entities_by_date("event", "start", start=target_date, end=target_date)
+    ]
 
 
-def parse_date(date_str: str) -> datetime:
-    """Парсинг даты из строки."""
-    return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+def parse_date(value: str | date | datetime) -> datetime:
+    """Парсинг даты из строки (YAML может вернуть date/datetime)."""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 
-def format_time_range(start_str: str, end_str: str | None) -> str:
-    """Форматировать диапазон времени."""
+def format_time_range(start_str: str | date | datetime, end_str: str | date | datetime | None) -> str:
+    """Форматировать диапазон времени (события без времени — на весь день)."""
+    if is_date_only(start_str):
+        return "весь день"
     start = parse_date(start_str)
     start_time = start.strftime("%H:%M")
 
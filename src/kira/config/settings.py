@@ -118,6 +118,9 @@ class Settings:
     structuring_provider: str = "openai"
     default_provider: str = "openrouter"
     enable_ollama_fallback: bool = True
+    enable_llm_cache: bool = False
+    llm_cache_nonzero_temperature: bool = True
+    enable_llm_hedging: bool = False
     llm_provider: str = "openrouter"  # Legacy field
 
     # RAG and Memory
@@ -261,6 +264,9 @@ class Settings:
                 structuring_provider=os.environ.get("LLM_STRUCTURING_PROVIDER") or os.environ.get("ROUTER_STRUCTURING_PROVIDER", "openai"),
                 default_provider=os.environ.get("LLM_DEFAULT_PROVIDER") or os.environ.get("ROUTER_DEFAULT_PROVIDER", "openrouter"),
                 enable_ollama_fallback=os.environ.get("ENABLE_OLLAMA_FALLBACK", "true").lower() == "true",
+                enable_llm_cache=os.environ.get("ENABLE_LLM_CACHE", "false").lower() == "true",
+                llm_cache_nonzero_temperature=os.environ.get("LLM_CACHE_NONZERO_TEMPERATURE", "true").lower() == "true",
+                enable_llm_hedging=os.environ.get("ENABLE_LLM_HEDGING", "false").lower() == "true",
                 llm_provider=os.environ.get("LLM_PROVIDER", "openrouter"),
                 # RAG and Memory
                 enable_rag=os.environ.get("ENABLE_RAG", "false").lower() == "true",
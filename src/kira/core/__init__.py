@@ -2,6 +2,8 @@
 
 from .canonical_events import CANONICAL_EVENTS, EventDefinition, get_event_definition, is_canonical_event
 from .config import load_config, save_config
+from .entity_cache import EntityCache
+from .entity_index import EntityIndex
 from .events import Event, EventBus, EventHandler, RetryPolicy, create_event_bus
 from .host import Entity, EntityNotFoundError, HostAPI, VaultError, create_host_api
 from .ids import (
@@ -45,7 +47,10 @@ __all__ = [
     "CollisionDetector",
     # Host API (ADR-006)
     "Entity",
+    # Entity Cache / Index (ADR-006)
+    "EntityCache",
     "EntityId",
+    "EntityIndex",
     "EntityNotFoundError",
     # Events (ADR-005)
     "Event",
@@ -63,6 +63,19 @@ FILE_DROPPED = EventDefinition(
     emitted_by=["filesystem_adapter", "telegram_adapter"],
 )
 
+FILE_CHANGED = EventDefinition(
+    name="file.changed",
+    category="adapter",
+    description="Vault entity file changed outside HostAPI (e.g. edited in Obsidian)",
+    payload_schema={
+        "path": "str - Path to the file (None for a full rescan)",
+        "kind": "str - created, modified, deleted or rescan",
+        "entity_id": "str - Entity now stored in the file (None if deleted)",
+        "previous_entity_id": "str - Entity previously stored in the file",
+    },
+    emitted_by=["filesystem_watcher"],
+)
+
 SYNC_TICK = EventDefinition(
     name="sync.tick",
     category="adapter",
@@ -281,6 +294,7 @@ CANONICAL_EVENTS: dict[str, EventDefinition] = {
     # Adapter events
     "message.received": MESSAGE_RECEIVED,
     "file.dropped": FILE_DROPPED,
+    "file.changed": FILE_CHANGED,
     "sync.tick": SYNC_TICK,
     # Entity events
     "entity.created": ENTITY_CREATED,
@@ -0,0 +1,210 @@
+"""In-process entity cache for HostAPI reads (ADR-006).
+
+Keeps recently read entities in memory so repeated ``read_entity`` calls
+within one request (agent plan → tool → verify, FSM guards) do not re-read
+and re-parse the same file.
+
+Entries are validated against the file's (mtime_ns, size, inode)
+fingerprint on every lookup, so edits made outside HostAPI are never
+served stale. HostAPI invalidates entries for its own writes. Eviction is
+LRU under a byte budget measured by the on-disk size of cached files.
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from .entity_index import FileFingerprint
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .host import Entity
+
+__all__ = [
+    "DEFAULT_CACHE_MAX_BYTES",
+    "DEFAULT_CACHE_MAX_ENTRIES",
+    "EntityCache",
+]
+
+DEFAULT_CACHE_MAX_BYTES = 8 * 1024 * 1024
+DEFAULT_CACHE_MAX_ENTRIES = 2048
+
+
+@dataclasses.dataclass
+class _CacheEntry:
+    path: Path
+    fingerprint: FileFingerprint
+    entity: Entity
+
+
+class EntityCache:
+    """Thread-safe LRU cache of parsed entities validated by ``stat()``.
+
+    Lookups return copies, so callers may mutate the returned entity.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """Initialize entity cache.
+
+        Parameters
+        ----------
+        max_bytes
+            Approximate memory bound, measured as the total on-disk size of
+            cached entity files; 0 disables caching
+        max_entries
+            Maximum number of cached entities
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything."""
+        return self.max_bytes > 0 and self.max_entries > 0
+
+    def get(self, entity_id: str, path: Path) -> Entity | None:
+        """Return a cached entity if its file is unchanged.
+
+        Parameters
+        ----------
+        entity_id
+            Entity identifier
+        path
+            Current entity file path
+
+        Returns
+        -------
+        Entity | None
+            Copy of the cached entity, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(entity_id)
+
+        if entry is not None and entry.path == path:
+            try:
+                current = FileFingerprint.from_stat(path.stat())
+            except OSError:
+                current = None
+
+            if current == entry.fingerprint:
+                with self._lock:
+                    if self._entries.get(entity_id) is entry:
+                        self._entries.move_to_end(entity_id)
+                    self._hits += 1
+                return _copy_entity(entry.entity)
+
+            self.invalidate(entity_id)
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def put(self, entity: Entity, path: Path, fingerprint: FileFingerprint) -> None:
+        """Cache an entity read from ``path``.
+
+        Parameters
+        ----------
+        entity
+            Parsed entity
+        path
+            File the entity was read from
+        fingerprint
+            Fingerprint of the file taken on the descriptor it was read from
+        """
+        if not self.enabled or fingerprint.size > self.max_bytes:
+            return
+
+        entry = _CacheEntry(path=path, fingerprint=fingerprint, entity=_copy_entity(entity))
+        with self._lock:
+            previous = self._entries.pop(entity.id, None)
+            if previous is not None:
+                self._size -= previous.fingerprint.size
+            self._entries[entity.id] = entry
+            self._size += fingerprint.size
+
+            while self._size > self.max_bytes or len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.fingerprint.size
+                self._evictions += 1
+
+    def invalidate(self, entity_id: str) -> None:
+        """Drop an entity from the cache.
+
+        Parameters
+        ----------
+        entity_id
+            Entity identifier
+        """
+        with self._lock:
+            entry = self._entries.pop(entity_id, None)
+            if entry is not None:
+                self._size -= entry.fingerprint.size
+                self._invalidations += 1
+
+    def invalidate_path(self, path: Path) -> list[str]:
+        """Drop entities cached from a file.
+
+        Parameters
+        ----------
+        path
+            Entity file path
+
+        Returns
+        -------
+        list[str]
+            IDs of the dropped entities
+        """
+        with self._lock:
+            entity_ids = [entity_id for entity_id, entry in self._entries.items() if entry.path == path]
+        for entity_id in entity_ids:
+            self.invalidate(entity_id)
+        return entity_ids
+
+    def clear(self) -> None:
+        """Drop all cached entities."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns
+        -------
+        dict[str, Any]
+            Hit/miss counters and current size
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "entries": len(self._entries),
+                "size_bytes": self._size,
+                "max_bytes": self.max_bytes,
+            }
+
+
+def _copy_entity(entity: Entity) -> Entity:
+    """Copy an entity so cached state cannot be mutated by callers."""
+    return dataclasses.replace(entity, metadata=copy.deepcopy(entity.metadata))
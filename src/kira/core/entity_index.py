@@ -0,0 +1,894 @@
+"""Persistent entity metadata index (ADR-006).
+
+Keeps a SQLite index of entity frontmatter under ``.kira/`` so that
+listing and filtering entities does not require re-reading and re-parsing
+every Markdown file in the Vault.
+
+Every indexed file is fingerprinted by (mtime_ns, size, inode). A refresh
+only stats files and re-parses the ones whose fingerprint changed, so the
+cost of an unchanged Vault is one directory scan per folder.
+
+The index also stores each entity's outgoing links (ADR-016), which serves
+as a persistent adjacency snapshot for rebuilding the link graph, and a
+full-text index of titles, bodies and tags (see ``search_index``).
+
+Secondary indexes on ``status``, tags and date fields (``due``, ``start``,
+``created``, ...) answer agenda and review queries without reading entity
+files.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .ids import is_valid_entity_id, parse_entity_id
+from .links import extract_links_from_content, extract_links_from_frontmatter
+from .md_io import MarkdownIOError, read_markdown
+from .search_index import FullTextIndex, SearchHit, SearchResults, build_match_query
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = [
+    "DATE_INDEX_FIELDS",
+    "EntityIndex",
+    "FileFingerprint",
+    "IndexedEntity",
+    "date_index_key",
+    "decode_metadata",
+    "encode_metadata",
+]
+
+# Bump when the stored row format changes; a mismatch rebuilds the index
+INDEX_SCHEMA_VERSION = 4
+
+# Frontmatter fields kept in the sorted date index
+DATE_INDEX_FIELDS = ("created", "updated", "due", "due_date", "start", "end", "start_time", "end_time")
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Cheap change detector for an indexed file.
+
+    Attributes
+    ----------
+    mtime_ns : int
+        Modification time in nanoseconds
+    size : int
+        File size in bytes
+    inode : int
+        Inode number (atomic writes always produce a new inode)
+    """
+
+    mtime_ns: int
+    size: int
+    inode: int
+
+    @classmethod
+    def from_stat(cls, st: os.stat_result) -> FileFingerprint:
+        """Build fingerprint from ``os.stat`` result."""
+        return cls(mtime_ns=st.st_mtime_ns, size=st.st_size, inode=st.st_ino)
+
+
+@dataclass
+class IndexedEntity:
+    """Entity metadata served from the index.
+
+    Attributes
+    ----------
+    entity_id : str
+        Entity identifier
+    entity_type : str
+        Entity type parsed from the ID
+    path : Path
+        Absolute path of the entity file
+    metadata : dict[str, Any]
+        Parsed frontmatter, identical to what ``read_markdown`` returns
+    fingerprint : FileFingerprint
+        Fingerprint of the file when it was indexed
+    """
+
+    entity_id: str
+    entity_type: str
+    path: Path
+    metadata: dict[str, Any]
+    fingerprint: FileFingerprint
+
+
+def _encode_value(value: Any) -> Any:
+    """Encode YAML scalar types that JSON cannot represent."""
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, dict):
+        return {str(k): _encode_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_encode_value(v) for v in value]
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    raise TypeError(f"Unsupported frontmatter value: {type(value).__name__}")
+
+
+def _decode_object(obj: dict[str, Any]) -> Any:
+    """JSON object hook reversing ``_encode_value``."""
+    if len(obj) == 1:
+        if "__datetime__" in obj:
+            return datetime.fromisoformat(obj["__datetime__"])
+        if "__date__" in obj:
+            return date.fromisoformat(obj["__date__"])
+    return obj
+
+
+def encode_metadata(metadata: dict[str, Any]) -> str:
+    """Encode frontmatter as JSON, preserving date and datetime values.
+
+    Parameters
+    ----------
+    metadata
+        Parsed frontmatter
+
+    Returns
+    -------
+    str
+        JSON document
+
+    Raises
+    ------
+    TypeError
+        If frontmatter contains values that cannot be round-tripped
+    """
+    if any(not isinstance(key, str) for key in metadata):
+        raise TypeError("Frontmatter keys must be strings")
+    return json.dumps(_encode_value(metadata), ensure_ascii=False, separators=(",", ":"))
+
+
+def decode_metadata(payload: str) -> dict[str, Any]:
+    """Decode frontmatter encoded with ``encode_metadata``.
+
+    Parameters
+    ----------
+    payload
+        JSON document
+
+    Returns
+    -------
+    dict[str, Any]
+        Frontmatter dictionary
+    """
+    result: dict[str, Any] = json.loads(payload, object_hook=_decode_object)
+    return result
+
+
+def date_index_key(value: Any) -> tuple[str, float] | None:
+    """Compute the date index key of a frontmatter value.
+
+    Parameters
+    ----------
+    value
+        ``date``, ``datetime`` or ISO 8601 string
+
+    Returns
+    -------
+    tuple[str, float] | None
+        (calendar day in the value's own offset, UTC timestamp), or None
+        if the value is not a date. Naive values are taken as UTC.
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+
+    if isinstance(value, datetime):
+        instant = value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+        return value.date().isoformat(), instant.timestamp()
+    if isinstance(value, date):
+        return value.isoformat(), datetime(value.year, value.month, value.day, tzinfo=UTC).timestamp()
+    return None
+
+
+def _date_bound(value: date | datetime) -> tuple[str, str | float]:
+    """Map a range bound to the ``entity_dates`` column it compares against."""
+    if isinstance(value, datetime):
+        instant = value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+        return "ts", instant.timestamp()
+    return "day", value.isoformat()
+
+
+def _normalize_tags(value: Any) -> list[str]:
+    """Extract tag strings from a frontmatter ``tags`` value."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        return [str(tag) for tag in value if tag is not None]
+    return []
+
+
+class EntityIndex:
+    """SQLite-backed index of entity frontmatter (ADR-006).
+
+    Rows are keyed by file path and looked up by entity ID. Files without a
+    valid ``id`` and files that fail to parse are remembered by fingerprint
+    only, so they are not re-parsed until they change.
+
+    The index is safe to share between threads; several processes may also
+    share the same database file.
+    """
+
+    def __init__(self, vault_path: Path, folders: Iterable[str], *, db_path: Path | None = None) -> None:
+        """Initialize entity index.
+
+        Parameters
+        ----------
+        vault_path
+            Path to Vault directory
+        folders
+            Vault folders holding entity files, in listing order
+        db_path
+            Optional database path (default: ``.kira/entity_index.db``)
+        """
+        self.vault_path = Path(vault_path)
+        self.folders = list(folders)
+        self.db_path = db_path or self.vault_path / ".kira" / "entity_index.db"
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        # In-memory mirror of stored fingerprints: relative path -> fingerprint
+        self._fingerprints: dict[str, FileFingerprint] = {}
+        # Folders scanned at least once by this instance
+        self._scanned_folders: set[str] = set()
+        self._full_text: FullTextIndex | None = None
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """Initialize database schema and load stored fingerprints."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = self._get_connection()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != INDEX_SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS entity_fts")
+            conn.execute("DROP TABLE IF EXISTS entity_dates")
+            conn.execute("DROP TABLE IF EXISTS entity_links")
+            conn.execute("DROP TABLE IF EXISTS entity_tags")
+            conn.execute("DROP TABLE IF EXISTS entity_index")
+
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entity_index (
+                path TEXT PRIMARY KEY,
+                folder TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                entity_id TEXT,
+                entity_type TEXT,
+                status TEXT,
+                metadata TEXT
+            )
+        """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entity_tags (
+                path TEXT NOT NULL,
+                tag TEXT NOT NULL,
+                PRIMARY KEY (path, tag)
+            )
+        """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entity_links (
+                path TEXT NOT NULL,
+                link_type TEXT NOT NULL,
+                target_id TEXT NOT NULL,
+                PRIMARY KEY (path, link_type, target_id)
+            )
+        """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entity_dates (
+                path TEXT NOT NULL,
+                field TEXT NOT NULL,
+                day TEXT NOT NULL,
+                ts REAL NOT NULL,
+                PRIMARY KEY (path, field)
+            )
+        """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_entity_index_id ON entity_index(entity_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_entity_index_type ON entity_index(entity_type, status)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_entity_tags_tag ON entity_tags(tag)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_entity_dates_ts ON entity_dates(field, ts)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_entity_dates_day ON entity_dates(field, day)")
+        try:
+            self._full_text = FullTextIndex(conn)
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5: search falls back to scanning
+            self._full_text = None
+        conn.execute(f"PRAGMA user_version = {INDEX_SCHEMA_VERSION}")
+        conn.commit()
+
+        for row in conn.execute("SELECT path, mtime_ns, size, inode FROM entity_index"):
+            self._fingerprints[row["path"]] = FileFingerprint(row["mtime_ns"], row["size"], row["inode"])
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get database connection."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+
+    def refresh(self, folders: Iterable[str] | None = None) -> int:
+        """Bring the index up to date with the filesystem.
+
+        Parameters
+        ----------
+        folders
+            Folders to refresh (default: all indexed folders)
+
+        Returns
+        -------
+        int
+            Number of files that were (re-)parsed or removed
+        """
+        folder_names = list(folders) if folders is not None else self.folders
+
+        with self._lock:
+            changed: list[tuple[str, str, Path, FileFingerprint]] = []
+            seen: set[str] = set()
+
+            for folder_name in folder_names:
+                self._scanned_folders.add(folder_name)
+                folder_path = self.vault_path / folder_name
+                try:
+                    entries = list(os.scandir(folder_path))
+                except (FileNotFoundError, NotADirectoryError):
+                    entries = []
+
+                for entry in entries:
+                    if not entry.name.endswith(".md") or not entry.is_file():
+                        continue
+                    rel_path = f"{folder_name}/{entry.name}"
+                    try:
+                        fingerprint = FileFingerprint.from_stat(entry.stat())
+                    except FileNotFoundError:
+                        continue
+                    seen.add(rel_path)
+                    if self._fingerprints.get(rel_path) != fingerprint:
+                        changed.append((rel_path, folder_name, Path(entry.path), fingerprint))
+
+            prefixes = tuple(f"{name}/" for name in folder_names)
+            removed = [path for path in self._fingerprints if path.startswith(prefixes) and path not in seen]
+
+            if not changed and not removed:
+                return 0
+
+            conn = self._get_connection()
+            with conn:
+                for rel_path in removed:
+                    self._delete_row(conn, rel_path)
+                for rel_path, folder_name, file_path, fingerprint in changed:
+                    self._index_file(conn, rel_path, folder_name, file_path, fingerprint)
+
+            return len(changed) + len(removed)
+
+    def _index_file(
+        self,
+        conn: sqlite3.Connection,
+        rel_path: str,
+        folder_name: str,
+        file_path: Path,
+        fingerprint: FileFingerprint,
+    ) -> str | None:
+        """Parse a single file and store its row; return its entity ID."""
+        entity_id = entity_type = status = payload = None
+        tags: list[str] = []
+        dates: list[tuple[str, str, float]] = []
+        links: list[tuple[str, str]] = []
+
+        try:
+            document = read_markdown(file_path)
+        except MarkdownIOError:
+            document = None
+
+        if document is not None:
+            candidate_id = document.get_metadata("id")
+            if isinstance(candidate_id, str) and is_valid_entity_id(candidate_id):
+                try:
+                    payload = encode_metadata(document.frontmatter)
+                except TypeError:
+                    payload = None
+                if payload is not None:
+                    entity_id = candidate_id
+                    entity_type = parse_entity_id(candidate_id).entity_type
+                    raw_status = document.get_metadata("status")
+                    status = str(raw_status) if raw_status is not None else None
+                    tags = _normalize_tags(document.get_metadata("tags"))
+                    for field in DATE_INDEX_FIELDS:
+                        key = date_index_key(document.get_metadata(field))
+                        if key is not None:
+                            dates.append((field, *key))
+                    links = extract_links_from_frontmatter(document.frontmatter)
+                    links += extract_links_from_content(document.content)
+
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO entity_index
+            (path, folder, mtime_ns, size, inode, entity_id, entity_type, status, metadata)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                rel_path,
+                folder_name,
+                fingerprint.mtime_ns,
+                fingerprint.size,
+                fingerprint.inode,
+                entity_id,
+                entity_type,
+                status,
+                payload,
+            ),
+        )
+        conn.execute("DELETE FROM entity_tags WHERE path = ?", (rel_path,))
+        conn.executemany(
+            "INSERT OR IGNORE INTO entity_tags (path, tag) VALUES (?, ?)",
+            [(rel_path, tag) for tag in tags],
+        )
+        conn.execute("DELETE FROM entity_dates WHERE path = ?", (rel_path,))
+        conn.executemany(
+            "INSERT INTO entity_dates (path, field, day, ts) VALUES (?, ?, ?, ?)",
+            [(rel_path, *row) for row in dates],
+        )
+        conn.execute("DELETE FROM entity_links WHERE path = ?", (rel_path,))
+        conn.executemany(
+            "INSERT OR IGNORE INTO entity_links (path, link_type, target_id) VALUES (?, ?, ?)",
+            [(rel_path, link_type, target_id) for link_type, target_id in links],
+        )
+        if self._full_text is not None:
+            if entity_id is not None and document is not None:
+                self._full_text.index_document(conn, rel_path, document.frontmatter, document.content, tags)
+            else:
+                self._full_text.remove(conn, rel_path)
+        self._fingerprints[rel_path] = fingerprint
+        return entity_id
+
+    def _delete_row(self, conn: sqlite3.Connection, rel_path: str) -> None:
+        """Remove a file from the index."""
+        conn.execute("DELETE FROM entity_index WHERE path = ?", (rel_path,))
+        conn.execute("DELETE FROM entity_tags WHERE path = ?", (rel_path,))
+        conn.execute("DELETE FROM entity_dates WHERE path = ?", (rel_path,))
+        conn.execute("DELETE FROM entity_links WHERE path = ?", (rel_path,))
+        if self._full_text is not None:
+            self._full_text.remove(conn, rel_path)
+        self._fingerprints.pop(rel_path, None)
+
+    def update_file(self, file_path: Path) -> None:
+        """Re-index a single file right after it was written or deleted.
+
+        Parameters
+        ----------
+        file_path
+            Absolute path of an entity file
+        """
+        self.update_files([file_path])
+
+    def update_files(
+        self, file_paths: Iterable[Path], *, skip_unchanged: bool = False
+    ) -> list[tuple[Path, str | None, str | None]]:
+        """Re-index several written or deleted files in one transaction.
+
+        Parameters
+        ----------
+        file_paths
+            Absolute paths of entity files
+        skip_unchanged
+            Skip files whose fingerprint matches the index (e.g. changes
+            reported by a filesystem watcher for HostAPI's own writes)
+
+        Returns
+        -------
+        list[tuple[Path, str | None, str | None]]
+            (path, previous entity ID, current entity ID) for each file
+            that was re-indexed or removed; IDs are None for files without
+            a valid entity
+        """
+        changes: list[tuple[Path, str | None, str | None]] = []
+
+        with self._lock:
+            conn = self._get_connection()
+            with conn:
+                for file_path in file_paths:
+                    rel_path = self._relative_path(file_path)
+                    if rel_path is None:
+                        continue
+                    folder_name, _, file_name = rel_path.partition("/")
+                    if folder_name not in self.folders or not file_name or "/" in file_name:
+                        continue
+
+                    try:
+                        fingerprint: FileFingerprint | None = FileFingerprint.from_stat(Path(file_path).stat())
+                    except FileNotFoundError:
+                        fingerprint = None
+
+                    if skip_unchanged and self._fingerprints.get(rel_path) == fingerprint:
+                        continue
+
+                    row = conn.execute("SELECT entity_id FROM entity_index WHERE path = ?", (rel_path,)).fetchone()
+                    previous_id = row["entity_id"] if row is not None else None
+
+                    if fingerprint is None:
+                        self._delete_row(conn, rel_path)
+                        if row is None:
+                            continue
+                        current_id = None
+                    else:
+                        current_id = self._index_file(conn, rel_path, folder_name, Path(file_path), fingerprint)
+                    changes.append((Path(file_path), previous_id, current_id))
+
+        return changes
+
+    def get(self, entity_id: str, *, folder: str | None = None) -> IndexedEntity | None:
+        """Look up an entity by ID.
+
+        The stored row is only returned if the file still matches its
+        fingerprint; stale rows are re-indexed first.
+
+        Parameters
+        ----------
+        entity_id
+            Entity identifier
+        folder
+            Folder expected to hold the entity; scanned first if this
+            instance has not scanned it yet
+
+        Returns
+        -------
+        IndexedEntity | None
+            Indexed entity or None if unknown
+        """
+        with self._lock:
+            if folder is not None and folder not in self._scanned_folders:
+                self.refresh([folder])
+
+            conn = self._get_connection()
+            rows = conn.execute(
+                "SELECT * FROM entity_index WHERE entity_id = ? ORDER BY path",
+                (entity_id,),
+            ).fetchall()
+
+            for row in rows:
+                file_path = self.vault_path / row["path"]
+                try:
+                    fingerprint = FileFingerprint.from_stat(file_path.stat())
+                except FileNotFoundError:
+                    with conn:
+                        self._delete_row(conn, row["path"])
+                    continue
+
+                if fingerprint != FileFingerprint(row["mtime_ns"], row["size"], row["inode"]):
+                    with conn:
+                        self._index_file(conn, row["path"], row["folder"], file_path, fingerprint)
+                    return self.get(entity_id, folder=folder)
+
+                return self._row_to_entity(row)
+
+            return None
+
+    def query(
+        self,
+        *,
+        entity_type: str | None = None,
+        folders: Iterable[str] | None = None,
+        status: str | None = None,
+        tags: Iterable[str] | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[IndexedEntity]:
+        """Query indexed entities.
+
+        Call ``refresh`` first to pick up filesystem changes.
+
+        Parameters
+        ----------
+        entity_type
+            Optional entity type filter
+        folders
+            Optional folder restriction
+        status
+            Optional ``status`` filter
+        tags
+            Optional tags; an entity matches if it has any of them
+        limit
+            Optional result limit
+        offset
+            Result offset for pagination
+
+        Returns
+        -------
+        list[IndexedEntity]
+            Matching entities in folder order, then by file name
+        """
+        folder_names = list(folders) if folders is not None else self.folders
+        if not folder_names:
+            return []
+
+        clauses, params = self._filter_clauses(entity_type, folder_names, status, tags)
+
+        # Preserve folder listing order
+        order_cases = " ".join(f"WHEN ? THEN {rank}" for rank in range(len(folder_names)))
+        params.extend(folder_names)
+
+        sql = f"SELECT * FROM entity_index WHERE {' AND '.join(clauses)} ORDER BY CASE folder {order_cases} END, path"
+        if limit:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+        elif offset:
+            sql += " LIMIT -1 OFFSET ?"
+            params.append(offset)
+
+        with self._lock:
+            rows = self._get_connection().execute(sql, params).fetchall()
+
+        return [self._row_to_entity(row) for row in rows]
+
+    def query_dates(
+        self,
+        field: str,
+        *,
+        start: date | datetime | None = None,
+        end: date | datetime | None = None,
+        entity_type: str | None = None,
+        folders: Iterable[str] | None = None,
+        status: str | None = None,
+        tags: Iterable[str] | None = None,
+        limit: int | None = None,
+    ) -> list[IndexedEntity]:
+        """Range query over a date field, ordered by that field.
+
+        Call ``refresh`` first to pick up filesystem changes.
+
+        Parameters
+        ----------
+        field
+            Frontmatter field from ``DATE_INDEX_FIELDS``
+        start
+            Optional inclusive lower bound; a ``date`` compares calendar
+            days, a ``datetime`` compares instants
+        end
+            Optional inclusive upper bound (same rules as ``start``)
+        entity_type
+            Optional entity type filter
+        folders
+            Optional folder restriction
+        status
+            Optional ``status`` filter
+        tags
+            Optional tags; an entity matches if it has any of them
+        limit
+            Optional result limit
+
+        Returns
+        -------
+        list[IndexedEntity]
+            Entities having ``field`` within the range, earliest first
+
+        Raises
+        ------
+        ValueError
+            If ``field`` is not date-indexed
+        """
+        if field not in DATE_INDEX_FIELDS:
+            raise ValueError(f"Field is not date-indexed: {field}")
+
+        folder_names = list(folders) if folders is not None else self.folders
+        if not folder_names:
+            return []
+
+        clauses, params = self._filter_clauses(entity_type, folder_names, status, tags, alias="e.")
+        clauses.append("d.field = ?")
+        params.append(field)
+        for bound, operator in ((start, ">="), (end, "<=")):
+            if bound is not None:
+                column, value = _date_bound(bound)
+                clauses.append(f"d.{column} {operator} ?")
+                params.append(value)
+
+        sql = f"""
+            SELECT e.* FROM entity_dates d JOIN entity_index e ON e.path = d.path
+            WHERE {' AND '.join(clauses)}
+            ORDER BY d.ts, e.path
+        """
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._get_connection().execute(sql, params).fetchall()
+
+        return [self._row_to_entity(row) for row in rows]
+
+    @property
+    def full_text_available(self) -> bool:
+        """Whether full-text search is supported by this SQLite build."""
+        return self._full_text is not None
+
+    def search(
+        self,
+        query: str,
+        *,
+        entity_type: str | None = None,
+        folders: Iterable[str] | None = None,
+        status: str | None = None,
+        tags: Iterable[str] | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> SearchResults:
+        """Ranked full-text search over titles, bodies and tags.
+
+        Call ``refresh`` first to pick up filesystem changes.
+
+        Parameters
+        ----------
+        query
+            Search query (see ``search_index`` for syntax)
+        entity_type
+            Optional entity type filter
+        folders
+            Optional folder restriction
+        status
+            Optional ``status`` filter
+        tags
+            Optional tags; an entity matches if it has any of them
+        limit
+            Optional result limit
+        offset
+            Result offset for pagination
+
+        Returns
+        -------
+        SearchResults
+            Hits ordered by BM25 relevance
+
+        Raises
+        ------
+        RuntimeError
+            If full-text search is unavailable
+        """
+        if self._full_text is None:
+            raise RuntimeError("Full-text search requires SQLite with FTS5")
+
+        match_query = build_match_query(query)
+        folder_names = list(folders) if folders is not None else self.folders
+        if match_query is None or not folder_names:
+            return SearchResults(hits=[], total=0)
+
+        clauses, params = self._filter_clauses(entity_type, folder_names, status, tags, alias="e.")
+
+        with self._lock:
+            rows, total = self._full_text.search(
+                self._get_connection(),
+                match_query,
+                clauses=clauses,
+                params=params,
+                limit=limit,
+                offset=offset,
+            )
+
+        return SearchResults(
+            hits=[SearchHit(entity=self._row_to_entity(row), score=score) for row, score in rows],
+            total=total,
+        )
+
+    def get_links(self) -> dict[str, list[tuple[str, str]]]:
+        """Get the outgoing-link snapshot of all indexed entities.
+
+        Call ``refresh`` first to pick up filesystem changes. When several
+        files carry the same entity ID, the last one in listing order wins,
+        mirroring how the link graph is built from ``list_entities``.
+
+        Returns
+        -------
+        dict[str, list[tuple[str, str]]]
+            Entity ID -> list of (link_type, target_id)
+        """
+        if not self.folders:
+            return {}
+
+        order_cases = " ".join(f"WHEN ? THEN {rank}" for rank in range(len(self.folders)))
+        sql = f"""
+            SELECT e.path, e.entity_id, l.link_type, l.target_id
+            FROM entity_index e LEFT JOIN entity_links l ON l.path = e.path
+            WHERE e.entity_id IS NOT NULL
+            ORDER BY CASE e.folder {order_cases} ELSE {len(self.folders)} END, e.path
+        """
+
+        with self._lock:
+            rows = self._get_connection().execute(sql, self.folders).fetchall()
+
+        snapshot: dict[str, list[tuple[str, str]]] = {}
+        owners: dict[str, str] = {}
+        for row in rows:
+            entity_id = row["entity_id"]
+            if owners.get(entity_id) != row["path"]:
+                owners[entity_id] = row["path"]
+                snapshot[entity_id] = []
+            if row["link_type"] is not None:
+                snapshot[entity_id].append((row["link_type"], row["target_id"]))
+
+        return snapshot
+
+    @staticmethod
+    def _filter_clauses(
+        entity_type: str | None,
+        folder_names: list[str],
+        status: str | None,
+        tags: Iterable[str] | None,
+        *,
+        alias: str = "",
+    ) -> tuple[list[str], list[Any]]:
+        """Build WHERE clauses shared by ``query`` and ``search``."""
+        clauses = [
+            f"{alias}entity_id IS NOT NULL",
+            f"{alias}folder IN ({', '.join('?' * len(folder_names))})",
+        ]
+        params: list[Any] = list(folder_names)
+
+        if entity_type:
+            clauses.append(f"{alias}entity_type = ?")
+            params.append(entity_type)
+        if status:
+            clauses.append(f"{alias}status = ?")
+            params.append(status)
+
+        tag_list = list(tags) if tags else []
+        if tag_list:
+            clauses.append(
+                f"{alias}path IN (SELECT path FROM entity_tags WHERE tag IN ({', '.join('?' * len(tag_list))}))"
+            )
+            params.extend(tag_list)
+
+        return clauses, params
+
+    def _row_to_entity(self, row: sqlite3.Row) -> IndexedEntity:
+        """Convert database row to IndexedEntity."""
+        return IndexedEntity(
+            entity_id=row["entity_id"],
+            entity_type=row["entity_type"],
+            path=self.vault_path / row["path"],
+            metadata=decode_metadata(row["metadata"]),
+            fingerprint=FileFingerprint(row["mtime_ns"], row["size"], row["inode"]),
+        )
+
+    def _relative_path(self, file_path: Path) -> str | None:
+        """Convert absolute file path to index key."""
+        try:
+            return Path(file_path).relative_to(self.vault_path).as_posix()
+        except ValueError:
+            return None
+
+    def close(self) -> None:
+        """Close database connection."""
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> EntityIndex:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
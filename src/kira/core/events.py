@@ -2,27 +2,67 @@
 
 Provides lightweight in-process pub/sub with retry policies, filtering,
 correlation IDs, and structured logging.
+
+Subscriptions may use topic wildcards: ``*`` matches exactly one
+dot-separated segment and ``**`` matches any number of segments, so
+``task.*`` receives ``task.created`` and ``sync.**`` receives every
+``sync.`` event. Patterns are compiled into a topic trie when
+subscriptions change; ``publish`` only looks up a cached, immutable
+match snapshot.
+
+Delivery is synchronous by default. With ``async_mode=True`` each
+subscriber gets a bounded FIFO queue drained by a shared worker pool, so a
+slow or flaky handler no longer blocks the publisher; retries are scheduled
+on a timer instead of sleeping on a worker.
 """
 
 from __future__ import annotations
 
+import heapq
+import itertools
+import math
+import pickle
+import random
+import tempfile
+import threading
 import time
 import traceback
 import uuid
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from pathlib import Path
+from typing import Any, Literal
 
 __all__ = [
+    "BACKPRESSURE_MODES",
+    "LATENCY_BUCKETS_MS",
+    "BackpressureMode",
     "Event",
     "EventBus",
     "EventHandler",
     "HandlerResult",
+    "LatencyHistogram",
     "RetryPolicy",
     "SubscriptionHandle",
+    "topic_matches",
 ]
 
+BackpressureMode = Literal["block", "drop", "spill"]
+"""What ``publish`` does when a subscriber queue is full (async mode)."""
+
+BACKPRESSURE_MODES: tuple[str, ...] = ("block", "drop", "spill")
+
+LATENCY_BUCKETS_MS: tuple[float, ...] = (1.0, 5.0, 10.0, 50.0, 100.0, 500.0, 1000.0, 5000.0, math.inf)
+"""Upper bounds of handler latency histogram buckets in milliseconds."""
+
+# Deliveries a worker drains from one subscriber before yielding to others
+_DRAIN_BATCH = 32
+
+# Distinct event names whose resolved subscriber lists are cached per snapshot
+_MATCH_CACHE_SIZE = 1024
+
 
 @dataclass
 class RetryPolicy:
@@ -97,6 +137,7 @@ class SubscriptionHandle:
     once: bool = False
     retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
     _triggered: bool = field(default=False, init=False)
+    _sequence: int = field(default=0, init=False, repr=False)
 
     def should_handle(self, event: Event) -> bool:
         """Check if this subscription should handle the event."""
@@ -110,16 +151,296 @@ class SubscriptionHandle:
         self._triggered = True
 
 
+def _split_pattern(pattern: str) -> tuple[str, ...]:
+    """Split and validate a subscription pattern."""
+    segments = tuple(pattern.split("."))
+    for segment in segments:
+        if not segment or ("*" in segment and segment not in ("*", "**")):
+            raise ValueError(f"Invalid event pattern: {pattern!r}")
+    return segments
+
+
+def topic_matches(pattern: str, event_name: str) -> bool:
+    """Check whether an event name matches a subscription pattern.
+
+    Parameters
+    ----------
+    pattern
+        Event name or wildcard pattern ("task.*", "sync.**")
+    event_name
+        Dot-separated event name
+
+    Returns
+    -------
+    bool
+        True if a subscription to ``pattern`` receives ``event_name``
+    """
+    trie = _TopicTrie()
+    trie.add(_split_pattern(pattern), pattern)
+    return bool(trie.match(event_name))
+
+
+class _TopicTrie:
+    """Trie of subscription patterns keyed by event name segments.
+
+    Matching walks one node per segment (plus alternatives for ``*`` and
+    ``**``), so its cost depends on name depth, not subscription count.
+    """
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TopicTrie] = {}
+        self.values: list[Any] = []
+
+    def add(self, segments: tuple[str, ...], value: Any) -> None:
+        node = self
+        for segment in segments:
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _TopicTrie()
+            node = child
+        node.values.append(value)
+
+    def match(self, event_name: str) -> list[Any]:
+        found: list[Any] = []
+        self._collect(event_name.split("."), 0, found)
+        return found
+
+    def _collect(self, segments: list[str], index: int, found: list[Any]) -> None:
+        globstar = self.children.get("**")
+        if globstar is not None:
+            for end in range(index, len(segments) + 1):
+                globstar._collect(segments, end, found)
+
+        if index == len(segments):
+            found.extend(self.values)
+            return
+
+        for key in (segments[index], "*"):
+            child = self.children.get(key)
+            if child is not None:
+                child._collect(segments, index + 1, found)
+
+
+class _SubscriptionSnapshot:
+    """Immutable view of subscriptions used by ``publish``.
+
+    Rebuilt on every subscribe/unsubscribe; resolved subscriber tuples are
+    memoized per event name, so publishing never copies subscriber lists.
+    """
+
+    __slots__ = ("_cache", "_exact", "_trie")
+
+    def __init__(self, subscriptions: dict[str, list[SubscriptionHandle]]) -> None:
+        self._exact: dict[str, tuple[SubscriptionHandle, ...]] = {}
+        self._trie: _TopicTrie | None = None
+        self._cache: dict[str, tuple[SubscriptionHandle, ...]] = {}
+
+        for pattern, handles in subscriptions.items():
+            if not handles:
+                continue
+            if "*" in pattern:
+                if self._trie is None:
+                    self._trie = _TopicTrie()
+                for handle in handles:
+                    self._trie.add(_split_pattern(pattern), handle)
+            else:
+                self._exact[pattern] = tuple(handles)
+
+    def match(self, event_name: str) -> tuple[SubscriptionHandle, ...]:
+        cached = self._cache.get(event_name)
+        if cached is not None:
+            return cached
+
+        exact = self._exact.get(event_name, ())
+        if self._trie is None:
+            return exact
+
+        handles = {handle.subscription_id: handle for handle in (*exact, *self._trie.match(event_name))}
+        matched = tuple(sorted(handles.values(), key=lambda handle: handle._sequence))
+        if len(self._cache) >= _MATCH_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[event_name] = matched
+        return matched
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of handler execution times.
+
+    Bucket bounds are upper limits in milliseconds (Prometheus ``le``
+    semantics); the last bound should be ``math.inf``.
+    """
+
+    __slots__ = ("bounds", "count", "counts", "max_ms", "total_ms")
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, duration_ms: float) -> None:
+        """Record one handler execution.
+
+        Parameters
+        ----------
+        duration_ms
+            Execution time in milliseconds
+        """
+        for index, bound in enumerate(self.bounds):
+            if duration_ms <= bound:
+                self.counts[index] += 1
+                break
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of its bucket.
+
+        Parameters
+        ----------
+        q
+            Quantile in [0, 1]
+
+        Returns
+        -------
+        float
+            Bucket upper bound in milliseconds (observed maximum for the
+            unbounded bucket, 0.0 when empty)
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts, strict=True):
+            cumulative += count
+            if cumulative >= rank and count:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export histogram as a JSON-friendly dict."""
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": {
+                ("+Inf" if math.isinf(bound) else f"{bound:g}"): count
+                for bound, count in zip(self.bounds, self.counts, strict=True)
+            },
+        }
+
+
+class _Completion:
+    """Countdown latch used by ``publish_and_wait`` in async mode."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._remaining = 0
+        self.succeeded = 0
+
+    def expect(self, count: int) -> None:
+        with self._cond:
+            self._remaining += count
+
+    def done(self, success: bool) -> None:
+        with self._cond:
+            self._remaining -= 1
+            if success:
+                self.succeeded += 1
+            if self._remaining <= 0:
+                self._cond.notify_all()
+
+    def wait(self, timeout: float | None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: self._remaining <= 0, timeout)
+
+
+@dataclass
+class _Delivery:
+    """One event queued for one subscriber (async mode)."""
+
+    event: Event
+    attempts: int = 0
+    completion: _Completion | None = None
+
+
+class _SpillFile:
+    """Disk overflow for a full subscriber queue (``backpressure="spill"``).
+
+    Events are appended as length-prefixed pickles to an anonymous temporary
+    file and read back in FIFO order once the in-memory queue drains.
+    """
+
+    def __init__(self, directory: Path | None) -> None:
+        self._file = tempfile.TemporaryFile(dir=directory, prefix="kira-events-")  # noqa: SIM115
+        self._read_offset = 0
+        self.count = 0
+
+    def append(self, event: Event) -> None:
+        data = pickle.dumps(event, protocol=pickle.HIGHEST_PROTOCOL)
+        self._file.seek(0, 2)
+        self._file.write(len(data).to_bytes(4, "big") + data)
+        self.count += 1
+
+    def pop(self, limit: int) -> list[Event]:
+        self._file.seek(self._read_offset)
+        events = []
+        for _ in range(min(limit, self.count)):
+            size = int.from_bytes(self._file.read(4), "big")
+            # Only reads back pickles this process wrote to its own temp file
+            events.append(pickle.loads(self._file.read(size)))
+        self._read_offset = self._file.tell()
+        self.count -= len(events)
+
+        if self.count == 0:
+            self._file.seek(0)
+            self._file.truncate()
+            self._read_offset = 0
+        return events
+
+    def close(self) -> None:
+        self._file.close()
+
+
+@dataclass
+class _SubscriberQueue:
+    """Bounded FIFO of pending deliveries for one subscription."""
+
+    subscription: SubscriptionHandle
+    items: deque[_Delivery] = field(default_factory=deque)
+    spill: _SpillFile | None = None
+    active: bool = False  # a worker is draining (or scheduled to drain) it
+
+    @property
+    def spilled(self) -> int:
+        return self.spill.count if self.spill else 0
+
+
 class EventBus:
     """Lightweight in-process event bus with pub/sub (ADR-005).
 
     Features:
     - Synchronous delivery by default for determinism
+    - Opt-in async delivery: bounded per-subscriber queues, worker pool,
+      non-blocking retries and configurable backpressure
     - Retry policies with exponential backoff and jitter
     - Filter predicates for selective handling
     - Correlation IDs for request tracing
+    - Per-handler latency histograms in ``get_stats``
     - Structured logging (when logger provided)
 
+    In async mode each subscriber receives events in publish order (retries
+    excepted) while different subscribers run concurrently. Deliveries that
+    are already queued still run after ``unsubscribe``.
+
     Example:
         >>> bus = EventBus()
         >>> def handler(event):
@@ -129,19 +450,71 @@ class EventBus:
         Received: task.created
     """
 
-    def __init__(self, logger: Any = None) -> None:
+    def __init__(
+        self,
+        logger: Any = None,
+        *,
+        async_mode: bool = False,
+        max_workers: int = 4,
+        queue_size: int = 1000,
+        backpressure: BackpressureMode = "block",
+        spill_dir: Path | str | None = None,
+    ) -> None:
         """Initialize event bus.
 
         Parameters
         ----------
         logger
             Optional logger for structured logging
+        async_mode
+            Deliver events on a worker pool instead of the publisher's thread
+        max_workers
+            Worker threads used in async mode
+        queue_size
+            Maximum queued deliveries per subscriber in async mode
+        backpressure
+            Behaviour when a subscriber queue is full: "block" waits for
+            space (handlers publishing from a bus worker never wait, the
+            queue grows past ``queue_size`` instead), "drop" discards the
+            event for that subscriber, "spill" overflows to a temporary file
+        spill_dir
+            Directory for spill files (system temp dir by default)
         """
-        self._subscriptions: dict[str, list[SubscriptionHandle]] = defaultdict(list)
+        if backpressure not in BACKPRESSURE_MODES:
+            raise ValueError(f"Unknown backpressure mode: {backpressure!r}")
+        if queue_size < 1:
+            raise ValueError("queue_size must be positive")
+
+        self._subscriptions: dict[str, list[SubscriptionHandle]] = {}
+        self._snapshot = _SubscriptionSnapshot({})
+        self._sequence = itertools.count()
         self._logger = logger
         self._delivery_stats: dict[str, dict[str, int]] = defaultdict(
-            lambda: {"published": 0, "delivered": 0, "failed": 0}
+            lambda: {"published": 0, "delivered": 0, "failed": 0, "dropped": 0, "spilled": 0}
         )
+        self._latency: dict[tuple[str, str], tuple[str, LatencyHistogram]] = {}
+        self._lock = threading.RLock()
+        self._cond = threading.Condition(self._lock)
+
+        # Async mode state
+        self._async = async_mode
+        self._max_workers = max_workers
+        self._queue_size = queue_size
+        self._backpressure = backpressure
+        self._spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self._queues: dict[str, _SubscriberQueue] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._retry_heap: list[tuple[float, int, _SubscriberQueue, _Delivery]] = []
+        self._retry_seq = itertools.count()
+        self._retry_thread: threading.Thread | None = None
+        self._outstanding = 0
+        self._closed = False
+        self._local = threading.local()
+
+    @property
+    def async_mode(self) -> bool:
+        """Whether events are delivered on the worker pool."""
+        return self._async and not self._closed
 
     def publish(
         self,
@@ -167,51 +540,119 @@ class EventBus:
         Returns
         -------
         int
-            Number of handlers that received the event
+            Number of handlers that received the event (async mode: number
+            of handlers the event was queued for)
         """
-        # Create event
-        event = Event(
-            name=event_name,
-            payload=payload or {},
-            headers=headers or {},
-            correlation_id=correlation_id or str(uuid.uuid4()),
-            timestamp=time.time(),
-        )
+        event = self._new_event(event_name, payload, headers, correlation_id)
 
-        # Log publication
-        if self._logger:
-            self._logger.info(
-                f"Event published: {event_name}",
-                extra={
-                    "event_name": event_name,
-                    "correlation_id": event.correlation_id,
-                    "payload_keys": list(event.payload.keys()) if event.payload else [],
-                },
-            )
+        if self.async_mode:
+            return self._dispatch_async(event, None)
+        return self._dispatch_sync(event)
 
-        self._delivery_stats[event_name]["published"] += 1
+    def publish_and_wait(
+        self,
+        event_name: str,
+        payload: dict[str, Any] | None = None,
+        *,
+        headers: dict[str, Any] | None = None,
+        correlation_id: str | None = None,
+        timeout: float | None = None,
+    ) -> int:
+        """Publish event and wait until every handler has finished.
 
-        # Deliver to subscribers
-        handlers_triggered = 0
-        subscriptions = self._subscriptions.get(event_name, [])
+        Gives synchronous semantics in async mode: the call returns after all
+        matching handlers succeeded or exhausted their retries. Full queues
+        always block (never drop or spill). Called from a bus worker, the
+        event is delivered inline to avoid exhausting the pool. In sync mode
+        this is the same as ``publish``.
 
-        for subscription in subscriptions[:]:  # Copy to allow modification during iteration
-            if not subscription.should_handle(event):
-                continue
+        Parameters
+        ----------
+        event_name
+            Dot-separated event name
+        payload
+            Event payload data
+        headers
+            Optional metadata headers
+        correlation_id
+            Optional correlation ID for tracing
+        timeout
+            Maximum seconds to wait (None waits indefinitely)
 
-            result = self._deliver_to_handler(subscription, event)
+        Returns
+        -------
+        int
+            Number of handlers that processed the event successfully
 
-            if result.success:
-                self._delivery_stats[event_name]["delivered"] += 1
-                handlers_triggered += 1
+        Raises
+        ------
+        TimeoutError
+            If handlers did not finish within ``timeout``
+        """
+        event = self._new_event(event_name, payload, headers, correlation_id)
 
-                if subscription.once:
-                    subscription.mark_triggered()
-                    self._subscriptions[event_name].remove(subscription)
-            else:
-                self._delivery_stats[event_name]["failed"] += 1
+        if not self.async_mode or getattr(self._local, "worker", False):
+            return self._dispatch_sync(event)
 
-        return handlers_triggered
+        completion = _Completion()
+        self._dispatch_async(event, completion)
+        if not completion.wait(timeout):
+            raise TimeoutError(f"Handlers for {event_name} did not finish within {timeout}s")
+        return completion.succeeded
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until all queued deliveries and pending retries are done.
+
+        Parameters
+        ----------
+        timeout
+            Maximum seconds to wait (None waits indefinitely)
+
+        Returns
+        -------
+        bool
+            True if the bus drained within the timeout
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self._outstanding == 0, timeout)
+
+    def shutdown(self, *, wait: bool = True, timeout: float | None = None) -> None:
+        """Stop async delivery.
+
+        Later publishes are delivered synchronously. Deliveries still queued
+        or waiting for a retry when the bus closes are abandoned and count
+        as failed, so ``publish_and_wait`` callers are released.
+
+        Parameters
+        ----------
+        wait
+            Drain queued deliveries and pending retries first
+        timeout
+            Maximum seconds to wait for draining
+        """
+        if wait:
+            self.flush(timeout)
+
+        with self._cond:
+            self._closed = True
+            abandoned = self._take_pending()
+            self._cond.notify_all()
+            executor, self._executor = self._executor, None
+            retry_thread, self._retry_thread = self._retry_thread, None
+
+        for delivery in abandoned:
+            self._finish(delivery, success=False)
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+        if retry_thread is not None and retry_thread is not threading.current_thread():
+            retry_thread.join(timeout)
+
+        with self._lock:
+            for queue in self._queues.values():
+                if queue.spill is not None:
+                    queue.spill.close()
+                    queue.spill = None
 
     def subscribe(
         self,
@@ -227,7 +668,7 @@ class EventBus:
         Parameters
         ----------
         event_name
-            Event name pattern to subscribe to
+            Event name or wildcard pattern ("task.*", "sync.**")
         handler
             Handler function (takes Event, returns Any)
         filter_predicate
@@ -241,7 +682,13 @@ class EventBus:
         -------
         SubscriptionHandle
             Handle for managing the subscription
+
+        Raises
+        ------
+        ValueError
+            If the pattern has empty segments or partial-segment wildcards
         """
+        _split_pattern(event_name)
         subscription = SubscriptionHandle(
             subscription_id=str(uuid.uuid4()),
             event_name=event_name,
@@ -251,7 +698,10 @@ class EventBus:
             retry_policy=retry_policy or RetryPolicy(),
         )
 
-        self._subscriptions[event_name].append(subscription)
+        with self._lock:
+            subscription._sequence = next(self._sequence)
+            self._subscriptions[event_name] = [*self._subscriptions.get(event_name, []), subscription]
+            self._rebuild_snapshot()
 
         if self._logger:
             self._logger.debug(
@@ -278,15 +728,19 @@ class EventBus:
         bool
             True if subscription was found and removed
         """
-        subscriptions = self._subscriptions.get(handle.event_name, [])
+        with self._lock:
+            subscriptions = self._subscriptions.get(handle.event_name, [])
 
-        # Find and remove the subscription (filter out matching subscription)
-        initial_count = len(subscriptions)
-        self._subscriptions[handle.event_name] = [
-            sub for sub in subscriptions if sub.subscription_id != handle.subscription_id
-        ]
+            # Find and remove the subscription (filter out matching subscription)
+            remaining = [sub for sub in subscriptions if sub.subscription_id != handle.subscription_id]
+            removed = len(remaining) < len(subscriptions)
 
-        removed = len(self._subscriptions[handle.event_name]) < initial_count
+            if removed:
+                if remaining:
+                    self._subscriptions[handle.event_name] = remaining
+                else:
+                    del self._subscriptions[handle.event_name]
+                self._rebuild_snapshot()
 
         if removed and self._logger:
             self._logger.debug(
@@ -309,9 +763,10 @@ class EventBus:
         int
             Number of subscriptions removed
         """
-        count = len(self._subscriptions.get(event_name, []))
-        if event_name in self._subscriptions:
-            del self._subscriptions[event_name]
+        with self._lock:
+            count = len(self._subscriptions.pop(event_name, []))
+            if count:
+                self._rebuild_snapshot()
 
         if self._logger and count > 0:
             self._logger.debug(
@@ -323,18 +778,56 @@ class EventBus:
 
     def clear(self) -> None:
         """Remove all subscriptions."""
-        self._subscriptions.clear()
-        self._delivery_stats.clear()
+        with self._lock:
+            self._subscriptions.clear()
+            self._rebuild_snapshot()
+            self._delivery_stats.clear()
+            self._latency.clear()
 
-    def get_stats(self) -> dict[str, dict[str, int]]:
+    def get_stats(self) -> dict[str, dict[str, Any]]:
         """Get delivery statistics.
 
         Returns
         -------
         dict
-            Statistics by event name
+            Statistics by event name. Each entry has delivery counters and a
+            ``handlers`` mapping of subscription ID to handler name and
+            latency histogram (see ``LatencyHistogram.to_dict``).
         """
-        return dict(self._delivery_stats)
+        with self._lock:
+            stats: dict[str, dict[str, Any]] = {}
+            for event_name, counters in self._delivery_stats.items():
+                stats[event_name] = {**counters, "handlers": {}}
+
+            for (event_name, subscription_id), (handler_name, histogram) in self._latency.items():
+                if event_name in stats:
+                    stats[event_name]["handlers"][subscription_id] = {
+                        "handler": handler_name,
+                        **histogram.to_dict(),
+                    }
+            return stats
+
+    def get_queue_stats(self) -> dict[str, Any]:
+        """Get async delivery queue statistics.
+
+        Returns
+        -------
+        dict
+            Outstanding deliveries, pending retries and per-subscriber
+            queue depths (including spilled events)
+        """
+        with self._lock:
+            return {
+                "async_mode": self.async_mode,
+                "backpressure": self._backpressure,
+                "outstanding": self._outstanding,
+                "pending_retries": len(self._retry_heap),
+                "queues": {
+                    subscription_id: {"queued": len(queue.items), "spilled": queue.spilled}
+                    for subscription_id, queue in self._queues.items()
+                    if queue.items or queue.spilled
+                },
+            }
 
     def get_subscriptions(self, event_name: str | None = None) -> list[SubscriptionHandle]:
         """Get current subscriptions.
@@ -342,21 +835,328 @@ class EventBus:
         Parameters
         ----------
         event_name
-            Optional event name to filter by
+            Optional event name or pattern the subscriptions were made with
 
         Returns
         -------
         list[SubscriptionHandle]
             List of subscription handles
         """
-        if event_name:
-            return self._subscriptions.get(event_name, [])[:]
+        with self._lock:
+            if event_name:
+                return self._subscriptions.get(event_name, [])[:]
 
-        # Return all subscriptions
-        result: list[SubscriptionHandle] = []
-        for subscriptions in self._subscriptions.values():
-            result.extend(subscriptions)
-        return result
+            # Return all subscriptions
+            result: list[SubscriptionHandle] = []
+            for subscriptions in self._subscriptions.values():
+                result.extend(subscriptions)
+            return result
+
+    def _rebuild_snapshot(self) -> None:
+        """Recompile the topic trie after a subscription change (caller holds the lock)."""
+        self._snapshot = _SubscriptionSnapshot(self._subscriptions)
+
+    def _new_event(
+        self,
+        event_name: str,
+        payload: dict[str, Any] | None,
+        headers: dict[str, Any] | None,
+        correlation_id: str | None,
+    ) -> Event:
+        """Create an event, log it and count the publication."""
+        event = Event(
+            name=event_name,
+            payload=payload or {},
+            headers=headers or {},
+            correlation_id=correlation_id or str(uuid.uuid4()),
+            timestamp=time.time(),
+        )
+
+        # Log publication
+        if self._logger:
+            self._logger.info(
+                f"Event published: {event_name}",
+                extra={
+                    "event_name": event_name,
+                    "correlation_id": event.correlation_id,
+                    "payload_keys": list(event.payload.keys()) if event.payload else [],
+                },
+            )
+
+        with self._lock:
+            self._delivery_stats[event_name]["published"] += 1
+        return event
+
+    def _count(self, event_name: str, counter: str) -> None:
+        with self._lock:
+            self._delivery_stats[event_name][counter] += 1
+
+    def _dispatch_sync(self, event: Event) -> int:
+        """Deliver event on the caller's thread."""
+        handlers_triggered = 0
+
+        for subscription in self._snapshot.match(event.name):
+            if not subscription.should_handle(event):
+                continue
+
+            result = self._deliver_to_handler(subscription, event)
+
+            if result.success:
+                self._count(event.name, "delivered")
+                handlers_triggered += 1
+
+                if subscription.once:
+                    subscription.mark_triggered()
+                    self.unsubscribe(subscription)
+            else:
+                self._count(event.name, "failed")
+
+        return handlers_triggered
+
+    def _dispatch_async(self, event: Event, completion: _Completion | None) -> int:
+        """Queue event for every matching subscriber."""
+        targets = []
+        for subscription in self._snapshot.match(event.name):
+            if not subscription.should_handle(event):
+                continue
+            if subscription.once:
+                with self._lock:
+                    if subscription._triggered:
+                        continue
+                    subscription.mark_triggered()
+                self.unsubscribe(subscription)
+            targets.append(subscription)
+
+        if completion is not None:
+            completion.expect(len(targets))
+
+        queued = 0
+        for subscription in targets:
+            delivery = _Delivery(event=event, completion=completion)
+            if self._enqueue(subscription, delivery):
+                queued += 1
+            elif completion is not None:
+                completion.done(False)
+        return queued
+
+    def _enqueue(self, subscription: SubscriptionHandle, delivery: _Delivery) -> bool:
+        """Add a new delivery to a subscriber queue, applying backpressure."""
+        event = delivery.event
+        with self._cond:
+            queue = self._queues.get(subscription.subscription_id)
+            if queue is None:
+                queue = _SubscriberQueue(subscription=subscription)
+                self._queues[subscription.subscription_id] = queue
+
+            mode = "block" if delivery.completion is not None else self._backpressure
+            # Keep FIFO order: once events spill, later ones follow them to disk
+            full = len(queue.items) >= self._queue_size or (mode == "spill" and queue.spilled > 0)
+
+            if full and mode == "block":
+                # Only workers free queue space, so a publishing worker would
+                # wait on itself: it enqueues past the bound instead
+                if not getattr(self._local, "worker", False):
+                    self._cond.wait_for(lambda: len(queue.items) < self._queue_size or self._closed)
+                    if self._closed:
+                        return False
+            elif full and mode == "spill" and self._spill(queue, event):
+                self._outstanding += 1
+                self._schedule_drain(queue)
+                return True
+            elif full:
+                self._delivery_stats[event.name]["dropped"] += 1
+                if self._logger:
+                    self._logger.warning(
+                        f"Subscriber queue full, event dropped: {event.name}",
+                        extra={
+                            "event_name": event.name,
+                            "correlation_id": event.correlation_id,
+                            "subscription_id": subscription.subscription_id,
+                        },
+                    )
+                return False
+
+            queue.items.append(delivery)
+            self._outstanding += 1
+            self._schedule_drain(queue)
+            return True
+
+    def _spill(self, queue: _SubscriberQueue, event: Event) -> bool:
+        """Write event to the queue's spill file (caller holds the lock)."""
+        try:
+            if queue.spill is None:
+                queue.spill = _SpillFile(self._spill_dir)
+            queue.spill.append(event)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as exc:
+            if self._logger:
+                self._logger.error(
+                    f"Failed to spill event {event.name}: {exc}",
+                    extra={"event_name": event.name, "correlation_id": event.correlation_id},
+                )
+            return False
+
+        self._delivery_stats[event.name]["spilled"] += 1
+        return True
+
+    def _schedule_drain(self, queue: _SubscriberQueue) -> None:
+        """Submit a drain task for the queue unless one is pending (caller holds the lock)."""
+        if queue.active:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="kira-events")
+        queue.active = True
+        self._executor.submit(self._drain, queue)
+
+    def _drain(self, queue: _SubscriberQueue) -> None:
+        """Worker task: deliver a batch from one subscriber queue."""
+        self._local.worker = True
+        for _ in range(_DRAIN_BATCH):
+            with self._cond:
+                if not queue.items and queue.spill is not None and queue.spill.count:
+                    queue.items.extend(_Delivery(event=event) for event in queue.spill.pop(self._queue_size))
+                if not queue.items:
+                    queue.active = False
+                    return
+                delivery = queue.items.popleft()
+                self._cond.notify_all()  # wake publishers blocked on a full queue
+
+            self._attempt(queue, delivery)
+
+        # Yield the worker so other subscribers are not starved
+        with self._cond:
+            queue.active = False
+            if queue.items or queue.spilled:
+                self._schedule_drain(queue)
+
+    def _attempt(self, queue: _SubscriberQueue, delivery: _Delivery) -> None:
+        """Run one delivery attempt and schedule a retry on failure."""
+        subscription = queue.subscription
+        event = delivery.event
+        policy = subscription.retry_policy
+        delivery.attempts += 1
+
+        try:
+            self._call_handler(subscription, event)
+        except Exception as exc:
+            if delivery.attempts < policy.max_attempts:
+                delay = self._retry_delay(policy, delivery.attempts - 1)
+                self._log_retry(event, delivery.attempts, policy, delay, exc)
+                self._schedule_retry(queue, delivery, delay)
+                return
+
+            if self._logger:
+                self._logger.error(
+                    f"Handler failed after {delivery.attempts} attempts: {event.name}",
+                    extra={
+                        "event_name": event.name,
+                        "correlation_id": event.correlation_id,
+                        "attempts": delivery.attempts,
+                        "error": str(exc),
+                        "traceback": traceback.format_exc(),
+                    },
+                )
+            self._finish(delivery, success=False)
+            return
+
+        self._finish(delivery, success=True)
+
+    def _finish(self, delivery: _Delivery, *, success: bool) -> None:
+        """Account for a completed delivery."""
+        with self._cond:
+            self._delivery_stats[delivery.event.name]["delivered" if success else "failed"] += 1
+            self._outstanding -= 1
+            self._cond.notify_all()
+
+        if delivery.completion is not None:
+            delivery.completion.done(success)
+
+    def _schedule_retry(self, queue: _SubscriberQueue, delivery: _Delivery, delay: float) -> None:
+        """Re-queue a failed delivery after ``delay`` without holding a worker."""
+        with self._cond:
+            if not self._closed:
+                heapq.heappush(self._retry_heap, (time.monotonic() + delay, next(self._retry_seq), queue, delivery))
+                if self._retry_thread is None:
+                    self._retry_thread = threading.Thread(
+                        target=self._run_retries, name="kira-events-retry", daemon=True
+                    )
+                    self._retry_thread.start()
+                self._cond.notify_all()
+                return
+
+        # The bus closed while the handler ran; nothing will retry it
+        self._finish(delivery, success=False)
+
+    def _take_pending(self) -> list[_Delivery]:
+        """Remove queued, spilled and retrying deliveries (caller holds the lock)."""
+        pending = [delivery for _, _, _, delivery in self._retry_heap]
+        self._retry_heap.clear()
+        for queue in self._queues.values():
+            pending.extend(queue.items)
+            queue.items.clear()
+            if queue.spill is not None and queue.spill.count:
+                pending.extend(_Delivery(event=event) for event in queue.spill.pop(queue.spill.count))
+        return pending
+
+    def _run_retries(self) -> None:
+        """Timer thread: move due retries back onto their subscriber queues."""
+        with self._cond:
+            while not self._closed:
+                if not self._retry_heap:
+                    self._cond.wait()
+                    continue
+
+                due, _, queue, delivery = self._retry_heap[0]
+                remaining = due - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+
+                heapq.heappop(self._retry_heap)
+                queue.items.append(delivery)
+                self._schedule_drain(queue)
+
+    def _call_handler(self, subscription: SubscriptionHandle, event: Event) -> None:
+        """Invoke handler once, recording its latency."""
+        start = time.perf_counter()
+        try:
+            subscription.handler(event)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            key = (event.name, subscription.subscription_id)
+            with self._lock:
+                entry = self._latency.get(key)
+                if entry is None:
+                    handler_name = getattr(subscription.handler, "__qualname__", repr(subscription.handler))
+                    entry = self._latency[key] = (handler_name, LatencyHistogram())
+                entry[1].observe(duration_ms)
+
+    @staticmethod
+    def _retry_delay(policy: RetryPolicy, attempt: int) -> float:
+        """Backoff delay before retry number ``attempt + 1``."""
+        # Calculate delay with exponential backoff
+        delay = min(
+            policy.initial_delay * (policy.backoff_multiplier**attempt),
+            policy.max_delay,
+        )
+
+        # Add jitter if enabled
+        if policy.jitter:
+            delay *= random.uniform(0.5, 1.5)
+        return delay
+
+    def _log_retry(self, event: Event, attempts: int, policy: RetryPolicy, delay: float, exc: Exception) -> None:
+        if self._logger:
+            self._logger.warning(
+                f"Handler failed (attempt {attempts}/{policy.max_attempts}), retrying in {delay:.2f}s",
+                extra={
+                    "event_name": event.name,
+                    "correlation_id": event.correlation_id,
+                    "attempt": attempts,
+                    "max_attempts": policy.max_attempts,
+                    "delay_seconds": delay,
+                    "error": str(exc),
+                },
+            )
 
     def _deliver_to_handler(self, subscription: SubscriptionHandle, event: Event) -> HandlerResult:
         """Deliver event to handler with retry logic.
@@ -383,7 +1183,7 @@ class EventBus:
 
             try:
                 # Call handler
-                subscription.handler(event)
+                self._call_handler(subscription, event)
 
                 duration_ms = (time.time() - start_time) * 1000
 
@@ -404,31 +1204,8 @@ class EventBus:
                 last_error = exc
 
                 if attempt < policy.max_attempts - 1:
-                    # Calculate delay with exponential backoff
-                    delay = min(
-                        policy.initial_delay * (policy.backoff_multiplier**attempt),
-                        policy.max_delay,
-                    )
-
-                    # Add jitter if enabled
-                    if policy.jitter:
-                        import random
-
-                        delay *= random.uniform(0.5, 1.5)
-
-                    if self._logger:
-                        self._logger.warning(
-                            f"Handler failed (attempt {attempts}/{policy.max_attempts}), retrying in {delay:.2f}s",
-                            extra={
-                                "event_name": event.name,
-                                "correlation_id": event.correlation_id,
-                                "attempt": attempts,
-                                "max_attempts": policy.max_attempts,
-                                "delay_seconds": delay,
-                                "error": str(exc),
-                            },
-                        )
-
+                    delay = self._retry_delay(policy, attempt)
+                    self._log_retry(event, attempts, policy, delay, exc)
                     time.sleep(delay)
                 else:
                     # All retries exhausted
@@ -451,17 +1228,42 @@ class EventBus:
         return HandlerResult(success=False, duration_ms=duration_ms, error=last_error, attempts=attempts)
 
 
-def create_event_bus(logger: Any = None) -> EventBus:
+def create_event_bus(
+    logger: Any = None,
+    *,
+    async_mode: bool = False,
+    max_workers: int = 4,
+    queue_size: int = 1000,
+    backpressure: BackpressureMode = "block",
+    spill_dir: Path | str | None = None,
+) -> EventBus:
     """Factory function to create event bus.
 
     Parameters
     ----------
     logger
         Optional logger instance
+    async_mode
+        Deliver events on a worker pool (see ``EventBus``)
+    max_workers
+        Worker threads used in async mode
+    queue_size
+        Maximum queued deliveries per subscriber in async mode
+    backpressure
+        Full-queue behaviour: "block", "drop" or "spill"
+    spill_dir
+        Directory for spill files
 
     Returns
     -------
     EventBus
         Configured event bus
     """
-    return EventBus(logger=logger)
+    return EventBus(
+        logger=logger,
+        async_mode=async_mode,
+        max_workers=max_workers,
+        queue_size=queue_size,
+        backpressure=backpressure,
+        spill_dir=spill_dir,
+    )
@@ -10,32 +10,49 @@ Invalid entities never touch disk; errors are surfaced to callers.
 from __future__ import annotations
 
 import contextlib
+import sqlite3
+import threading
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from .entity_cache import DEFAULT_CACHE_MAX_BYTES, EntityCache
+from .entity_index import DATE_INDEX_FIELDS, EntityIndex, FileFingerprint, IndexedEntity, date_index_key
 from .ids import generate_entity_id, is_valid_entity_id, parse_entity_id
-from .links import LinkGraph, update_entity_links
-from .md_io import MarkdownDocument, MarkdownIOError, read_markdown, write_markdown
+from .links import LinkGraph, set_entity_links, update_entity_links
+from .md_io import (
+    MarkdownDocument,
+    MarkdownIOError,
+    read_frontmatter_only,
+    read_markdown,
+    split_markdown,
+    write_markdown,
+    write_markdown_batch,
+)
 from .quarantine import quarantine_invalid_entity
 from .schemas import SchemaCache, get_schema_cache
 from .validation import ValidationError, validate_entity
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
     from .events import EventBus
 
 __all__ = [
+    "BulkUpsertResult",
     "Entity",
     "EntityNotFoundError",
+    "FileChange",
     "HostAPI",
     "ValidationError",
     "VaultError",
     "create_host_api",
 ]
 
+# Folders holding entity files, in listing order (ADR-007)
+ENTITY_FOLDERS = ["tasks", "notes", "events", "projects", "contacts", "meetings", "processed"]
+
 
 class VaultError(Exception):
     """Base exception for Vault operations."""
@@ -49,14 +66,57 @@ class EntityNotFoundError(VaultError):
     pass
 
 
+class _LazyContent:
+    """``Entity.content`` descriptor that can defer reading the body.
+
+    Entities built from frontmatter alone carry a loader instead of the
+    body; it runs on first access and the result is cached.
+    """
+
+    def __get__(self, obj: Entity | None, objtype: type | None = None) -> str:
+        if obj is None:
+            # Dataclass default
+            return ""
+        loader = obj.__dict__.get("_content_loader")
+        if loader is not None:
+            obj.__dict__["_content"] = loader()
+            obj.__dict__.pop("_content_loader", None)
+        return str(obj.__dict__.get("_content", ""))
+
+    def __set__(self, obj: Entity, value: str) -> None:
+        obj.__dict__.pop("_content_loader", None)
+        obj.__dict__["_content"] = value
+
+
+def _date_key_before(key: tuple[str, float], bound: tuple[str, float], *, instant: bool) -> bool:
+    """Whether a ``date_index_key`` falls strictly before another.
+
+    Compares UTC timestamps when ``instant`` is set, calendar days otherwise.
+    """
+    if instant:
+        return key[1] < bound[1]
+    return key[0] < bound[0]
+
+
+def _read_body(file_path: Path) -> str:
+    """Read the Markdown body of an entity file ("" if it is gone)."""
+    try:
+        return split_markdown(file_path.read_text(encoding="utf-8"))[1]
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+
 @dataclass
 class Entity:
-    """Vault entity with metadata and content."""
+    """Vault entity with metadata and content.
+
+    ``content`` may be loaded lazily (see ``from_frontmatter``).
+    """
 
     id: str
     entity_type: str
     metadata: dict[str, Any]
-    content: str
+    content: str = _LazyContent()  # type: ignore[assignment]
     path: Path | None = None
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
@@ -79,33 +139,57 @@ class Entity:
         Entity
             Created entity
         """
+        entity = cls.from_frontmatter(entity_id, document.frontmatter, file_path)
+        entity.content = document.content
+        return entity
+
+    @classmethod
+    def from_frontmatter(cls, entity_id: str, metadata: dict[str, Any], file_path: Path | None = None) -> Entity:
+        """Create entity from frontmatter, reading the body on first access.
+
+        Parameters
+        ----------
+        entity_id
+            Entity identifier
+        metadata
+            Entity frontmatter
+        file_path
+            File to load ``content`` from; without it content is empty
+
+        Returns
+        -------
+        Entity
+            Entity with lazily loaded content
+        """
         # Parse entity type from ID
         parsed_id = parse_entity_id(entity_id)
 
         # Extract timestamps
-        created_str = document.get_metadata("created")
-        updated_str = document.get_metadata("updated")
+        created_str = metadata.get("created")
+        updated_str = metadata.get("updated")
 
         created_at = datetime.now(UTC)
         updated_at = datetime.now(UTC)
 
         if created_str:
-            with contextlib.suppress(ValueError):
+            with contextlib.suppress(ValueError, AttributeError):
                 created_at = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
 
         if updated_str:
-            with contextlib.suppress(ValueError):
+            with contextlib.suppress(ValueError, AttributeError):
                 updated_at = datetime.fromisoformat(updated_str.replace("Z", "+00:00"))
 
-        return cls(
+        entity = cls(
             id=entity_id,
             entity_type=parsed_id.entity_type,
-            metadata=document.frontmatter.copy(),
-            content=document.content,
+            metadata=metadata.copy(),
             path=file_path,
             created_at=created_at,
             updated_at=updated_at,
         )
+        if file_path is not None:
+            entity.__dict__["_content_loader"] = lambda: _read_body(file_path)
+        return entity
 
     def to_markdown(self) -> MarkdownDocument:
         """Convert entity to Markdown document.
@@ -146,6 +230,58 @@ class Entity:
         return self.id
 
 
+@dataclass
+class BulkUpsertResult:
+    """Outcome of one entity in ``HostAPI.bulk_upsert``.
+
+    Attributes
+    ----------
+    index : int
+        Position of the item in the request
+    entity_id : str | None
+        Entity identifier (None if it could not be determined)
+    operation : str
+        "create" or "update"
+    entity : Entity | None
+        Written entity on success
+    error : str | None
+        Error message on failure
+    """
+
+    index: int
+    entity_id: str | None
+    operation: str
+    entity: Entity | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the entity was written."""
+        return self.error is None
+
+
+@dataclass
+class FileChange:
+    """Entity file changed outside HostAPI (see ``HostAPI.apply_file_changes``).
+
+    Attributes
+    ----------
+    path : Path
+        Entity file path
+    kind : str
+        "created", "modified" or "deleted"
+    entity_id : str | None
+        Entity now stored in the file (None if deleted or invalid)
+    previous_entity_id : str | None
+        Entity previously known at this path, if any
+    """
+
+    path: Path
+    kind: str
+    entity_id: str | None
+    previous_entity_id: str | None = None
+
+
 class HostAPI:
     """Host API for Vault operations (ADR-006).
 
@@ -164,6 +300,8 @@ class HostAPI:
         event_bus: EventBus | None = None,
         schema_cache: SchemaCache | None = None,
         logger: Any = None,
+        use_entity_index: bool = True,
+        entity_cache_bytes: int = DEFAULT_CACHE_MAX_BYTES,
     ) -> None:
         """Initialize Host API.
 
@@ -177,18 +315,35 @@ class HostAPI:
             Optional schema cache for validation
         logger
             Optional logger for structured logging
+        use_entity_index
+            Serve listings from the persistent metadata index in ``.kira/``
+        entity_cache_bytes
+            Memory budget of the ``read_entity`` cache (on-disk bytes of
+            cached files); 0 disables it
         """
         self.vault_path = Path(vault_path)
         self.event_bus = event_bus
         self.schema_cache = schema_cache or get_schema_cache(self.vault_path / ".kira" / "schemas")
         self.logger = logger
-        self.link_graph = LinkGraph()
+
+        # Parsed entities for repeated reads, validated by stat()
+        self.entity_cache = EntityCache(max_bytes=entity_cache_bytes)
+
+        # Link graph is built on first use (see ``link_graph``)
+        self._link_graph: LinkGraph | None = None
+        self._link_graph_lock = threading.Lock()
 
         # Ensure Vault structure
         self._ensure_vault_structure()
 
-        # Load existing entities into link graph
-        self._load_link_graph()
+        # Persistent metadata index; falls back to scanning if unavailable
+        self.entity_index: EntityIndex | None = None
+        if use_entity_index:
+            try:
+                self.entity_index = EntityIndex(self.vault_path, ENTITY_FOLDERS)
+            except (sqlite3.Error, OSError) as exc:
+                if self.logger:
+                    self.logger.warning(f"Entity index unavailable, falling back to scanning: {exc}")
 
     def _ensure_vault_structure(self) -> None:
         """Ensure Vault has required directory structure."""
@@ -203,15 +358,37 @@ class HostAPI:
         for dir_path in required_dirs:
             dir_path.mkdir(parents=True, exist_ok=True)
 
-    def _load_link_graph(self) -> None:
-        """Load existing entities into link graph."""
+    @property
+    def link_graph(self) -> LinkGraph:
+        """Link graph of all Vault entities (ADR-016).
+
+        Loaded lazily on first access so that constructing a HostAPI does not
+        read the whole Vault. With the entity index, only files changed since
+        the last snapshot are re-parsed.
+        """
+        if self._link_graph is None:
+            with self._link_graph_lock:
+                if self._link_graph is None:
+                    self._link_graph = self._load_link_graph()
+        return self._link_graph
+
+    def _load_link_graph(self) -> LinkGraph:
+        """Load existing entities into a new link graph."""
+        link_graph = LinkGraph()
         try:
-            for entity in self.list_entities():
-                self.link_graph.add_entity(entity.id)
-                update_entity_links(self.link_graph, entity.id, entity.metadata, entity.content)
+            if self.entity_index is not None:
+                self.entity_index.refresh()
+                for entity_id, links in self.entity_index.get_links().items():
+                    link_graph.add_entity(entity_id)
+                    set_entity_links(link_graph, entity_id, links)
+            else:
+                for entity in self.list_entities():
+                    link_graph.add_entity(entity.id)
+                    update_entity_links(link_graph, entity.id, entity.metadata, entity.content)
         except Exception as exc:
             if self.logger:
                 self.logger.warning(f"Failed to load link graph: {exc}")
+        return link_graph
 
     def create_entity(self, entity_type: str, data: dict[str, Any], *, content: str = "") -> Entity:
         """Create new entity in Vault.
@@ -235,6 +412,26 @@ class HostAPI:
         VaultError
             If creation fails
         """
+        entity = self._prepare_create(entity_type, data, content)
+
+        # Write to filesystem
+        file_path = self._get_entity_path(entity.id)
+        document = entity.to_markdown()
+
+        try:
+            write_markdown(file_path, document, atomic=True, create_dirs=True)
+            entity.path = file_path
+        except MarkdownIOError as exc:
+            raise VaultError(f"Failed to write entity {entity.id}: {exc}") from exc
+        finally:
+            self.entity_cache.invalidate(entity.id)
+            self._update_index(file_path)
+
+        self._finish_create(entity)
+        return entity
+
+    def _prepare_create(self, entity_type: str, data: dict[str, Any], content: str) -> Entity:
+        """Validate a new entity and build it without touching disk."""
         # Generate ID if not provided
         entity_id = data.get("id")
         if not entity_id:
@@ -317,7 +514,7 @@ class HostAPI:
             raise VaultError(f"Folder contract violations: {'; '.join(contract_violations)}")
 
         # Phase 5, Point 17: Log validation success (import locally to avoid circular dependency)
-        from ..observability.logging import log_upsert, log_validation_success
+        from ..observability.logging import log_validation_success
 
         log_validation_success(
             entity_id=entity_id,
@@ -326,7 +523,7 @@ class HostAPI:
         )
 
         # Create entity
-        entity = Entity(
+        return Entity(
             id=entity_id,
             entity_type=entity_type,
             metadata=data,
@@ -335,19 +532,19 @@ class HostAPI:
             updated_at=now,
         )
 
-        # Write to filesystem
-        file_path = self._get_entity_path(entity_id)
-        document = entity.to_markdown()
+    def _finish_create(self, entity: Entity) -> None:
+        """Update link graph, emit event and log after a created entity is on disk."""
+        from ..observability.logging import log_upsert
 
-        try:
-            write_markdown(file_path, document, atomic=True, create_dirs=True)
-            entity.path = file_path
-        except MarkdownIOError as exc:
-            raise VaultError(f"Failed to write entity {entity_id}: {exc}") from exc
+        entity_id = entity.id
+        entity_type = entity.entity_type
+        data = entity.metadata
+        file_path = entity.path
 
-        # Update link graph
-        self.link_graph.add_entity(entity_id)
-        update_entity_links(self.link_graph, entity_id, entity.metadata, entity.content)
+        # Update link graph (if not loaded yet, it will be built from disk)
+        if self._link_graph is not None:
+            self._link_graph.add_entity(entity_id)
+            update_entity_links(self._link_graph, entity_id, entity.metadata, entity.content)
 
         # Emit event
         if self.event_bus:
@@ -361,7 +558,7 @@ class HostAPI:
                 },
             )
 
-        # Phase 5, Point 17: Log upsert (already imported above)
+        # Phase 5, Point 17: Log upsert
         log_upsert(
             entity_id=entity_id,
             entity_type=entity_type,
@@ -380,8 +577,6 @@ class HostAPI:
                 },
             )
 
-        return entity
-
     def read_entity(self, entity_id: str) -> Entity:
         """Read entity by ID.
 
@@ -403,17 +598,27 @@ class HostAPI:
         if not is_valid_entity_id(entity_id):
             raise VaultError(f"Invalid entity ID: {entity_id}")
 
-        file_path = self._get_entity_path(entity_id)
+        file_path = self._resolve_entity_path(entity_id)
 
-        if not file_path.exists():
+        if file_path is None:
             raise EntityNotFoundError(f"Entity not found: {entity_id}")
 
+        cached = self.entity_cache.get(entity_id, file_path)
+        if cached is not None:
+            return cached
+
         try:
+            # Fingerprint before reading: a concurrent replace can only make
+            # the cached entry look stale, never serve old content as new
+            fingerprint = FileFingerprint.from_stat(file_path.stat())
             document = read_markdown(file_path)
-            return Entity.from_markdown(entity_id, document, file_path)
-        except MarkdownIOError as exc:
+            entity = Entity.from_markdown(entity_id, document, file_path)
+        except (MarkdownIOError, OSError) as exc:
             raise VaultError(f"Failed to read entity {entity_id}: {exc}") from exc
 
+        self.entity_cache.put(entity, file_path, fingerprint)
+        return entity
+
     def update_entity(self, entity_id: str, updates: dict[str, Any], *, content: str | None = None) -> Entity:
         """Update existing entity.
 
@@ -438,6 +643,25 @@ class HostAPI:
         VaultError
             If update fails
         """
+        entity = self._prepare_update(entity_id, updates, content)
+
+        # Write to filesystem
+        document = entity.to_markdown()
+        if entity.path is None:
+            raise VaultError(f"Entity {entity_id} has no file path")
+        try:
+            write_markdown(entity.path, document, atomic=True)
+        except MarkdownIOError as exc:
+            raise VaultError(f"Failed to update entity {entity_id}: {exc}") from exc
+        finally:
+            self.entity_cache.invalidate(entity_id)
+            self._update_index(entity.path)
+
+        self._finish_update(entity, updates)
+        return entity
+
+    def _prepare_update(self, entity_id: str, updates: dict[str, Any], content: str | None) -> Entity:
+        """Read an entity and apply validated updates in memory."""
         # Read current entity
         entity = self.read_entity(entity_id)
 
@@ -482,18 +706,15 @@ class HostAPI:
         entity.metadata = new_metadata
         entity.content = new_content
         entity.updated_at = datetime.now(UTC)
+        return entity
 
-        # Write to filesystem
-        document = entity.to_markdown()
-        if entity.path is None:
-            raise VaultError(f"Entity {entity_id} has no file path")
-        try:
-            write_markdown(entity.path, document, atomic=True)
-        except MarkdownIOError as exc:
-            raise VaultError(f"Failed to update entity {entity_id}: {exc}") from exc
+    def _finish_update(self, entity: Entity, updates: dict[str, Any]) -> None:
+        """Update link graph, emit event and log after an updated entity is on disk."""
+        entity_id = entity.id
 
-        # Update link graph
-        update_entity_links(self.link_graph, entity_id, entity.metadata, entity.content)
+        # Update link graph (if not loaded yet, it will be built from disk)
+        if self._link_graph is not None:
+            update_entity_links(self._link_graph, entity_id, entity.metadata, entity.content)
 
         # Emit event
         if self.event_bus:
@@ -517,8 +738,6 @@ class HostAPI:
                 },
             )
 
-        return entity
-
     def delete_entity(self, entity_id: str) -> None:
         """Delete entity from Vault.
 
@@ -537,8 +756,8 @@ class HostAPI:
         # Read entity first
         entity = self.read_entity(entity_id)
 
-        # Remove from link graph
-        removed_links = self.link_graph.remove_entity(entity_id)
+        # Remove from link graph (if not loaded yet, it will be built from disk)
+        removed_links = self._link_graph.remove_entity(entity_id) if self._link_graph is not None else []
 
         # Delete file
         try:
@@ -546,6 +765,10 @@ class HostAPI:
                 entity.path.unlink()
         except OSError as exc:
             raise VaultError(f"Failed to delete entity file {entity_id}: {exc}") from exc
+        finally:
+            self.entity_cache.invalidate(entity_id)
+            if entity.path:
+                self._update_index(entity.path)
 
         # Emit event
         if self.event_bus:
@@ -574,9 +797,15 @@ class HostAPI:
         *,
         limit: int | None = None,
         offset: int = 0,
+        status: str | None = None,
+        tags: Iterable[str] | None = None,
     ) -> Iterator[Entity]:
         """List entities in Vault.
 
+        Served from the persistent entity index when available: only files
+        changed since the last call are re-parsed, and filtering and
+        pagination happen before any entity file is read.
+
         Parameters
         ----------
         entity_type
@@ -585,22 +814,165 @@ class HostAPI:
             Optional result limit
         offset
             Result offset for pagination
+        status
+            Optional ``status`` filter
+        tags
+            Optional tags filter; entities having any of the tags match
 
         Yields
         ------
         Entity
             Vault entities
         """
-        count = 0
-        skipped = 0
-
         # Determine which folders to search
         if entity_type:
             # Search specific folder for this entity type
             folders = [self._get_folder_for_entity_type(entity_type)]
         else:
             # Search all known folders
-            folders = ["tasks", "notes", "events", "projects", "contacts", "meetings", "processed"]
+            folders = ENTITY_FOLDERS
+
+        tag_filter = set(tags) if tags else None
+
+        if self.entity_index is None:
+            yield from self._scan_entities(
+                folders, entity_type, limit=limit, offset=offset, status=status, tags=tag_filter
+            )
+            return
+
+        self.entity_index.refresh(folders)
+        indexed_entities = self.entity_index.query(
+            entity_type=entity_type,
+            folders=folders,
+            status=status,
+            tags=tag_filter,
+            limit=limit,
+            offset=offset,
+        )
+
+        for indexed in indexed_entities:
+            entity = self._entity_from_index(indexed)
+            if entity is None or not self._matches_filters(entity.metadata, status, tag_filter):
+                continue
+            yield entity
+
+    def list_entities_by_date(
+        self,
+        entity_type: str | None,
+        field: str,
+        *,
+        start: date | datetime | None = None,
+        end: date | datetime | None = None,
+        status: str | None = None,
+        tags: Iterable[str] | None = None,
+        limit: int | None = None,
+    ) -> list[Entity]:
+        """List entities whose date field falls in a range.
+
+        Served from the date index when available, so agenda views read
+        only the matching entity files.
+
+        Parameters
+        ----------
+        entity_type
+            Optional entity type filter
+        field
+            Date field from ``DATE_INDEX_FIELDS`` (``due``, ``start``, ...)
+        start
+            Optional inclusive lower bound; a ``date`` compares calendar
+            days in the value's own offset, a ``datetime`` compares instants
+            (naive values are taken as UTC)
+        end
+            Optional inclusive upper bound (same rules as ``start``)
+        status
+            Optional ``status`` filter
+        tags
+            Optional tags filter; entities having any of the tags match
+        limit
+            Optional result limit
+
+        Returns
+        -------
+        list[Entity]
+            Matching entities ordered by ``field``, earliest first
+
+        Raises
+        ------
+        ValueError
+            If ``field`` is not date-indexed
+        """
+        if field not in DATE_INDEX_FIELDS:
+            raise ValueError(f"Field is not date-indexed: {field}")
+
+        if self.entity_index is None:
+            return self._scan_by_date(entity_type, field, start=start, end=end, status=status, tags=tags, limit=limit)
+
+        folders = [self._get_folder_for_entity_type(entity_type)] if entity_type else ENTITY_FOLDERS
+        tag_filter = set(tags) if tags else None
+        self.entity_index.refresh(folders)
+        indexed_entities = self.entity_index.query_dates(
+            field,
+            start=start,
+            end=end,
+            entity_type=entity_type,
+            folders=folders,
+            status=status,
+            tags=tag_filter,
+            limit=limit,
+        )
+
+        entities = []
+        for indexed in indexed_entities:
+            entity = self._entity_from_index(indexed)
+            if entity is not None and self._matches_filters(entity.metadata, status, tag_filter):
+                entities.append(entity)
+        return entities
+
+    def _scan_by_date(
+        self,
+        entity_type: str | None,
+        field: str,
+        *,
+        start: date | datetime | None,
+        end: date | datetime | None,
+        status: str | None,
+        tags: Iterable[str] | None,
+        limit: int | None,
+    ) -> list[Entity]:
+        """Date range query over listed entities (used without entity index)."""
+        start_key = date_index_key(start) if start is not None else None
+        end_key = date_index_key(end) if end is not None else None
+        # datetime bounds compare instants, date bounds compare calendar days
+        start_instant = isinstance(start, datetime)
+        end_instant = isinstance(end, datetime)
+
+        matches: list[tuple[float, str, Entity]] = []
+        for entity in self.list_entities(entity_type, status=status, tags=tags):
+            key = date_index_key(entity.metadata.get(field))
+            if key is None:
+                continue
+            if start_key is not None and _date_key_before(key, start_key, instant=start_instant):
+                continue
+            if end_key is not None and _date_key_before(end_key, key, instant=end_instant):
+                continue
+            matches.append((key[1], str(entity.path), entity))
+
+        matches.sort(key=lambda match: match[:2])
+        return [entity for _, _, entity in matches[:limit]]
+
+    def _scan_entities(
+        self,
+        folders: list[str],
+        entity_type: str | None,
+        *,
+        limit: int | None,
+        offset: int,
+        status: str | None,
+        tags: set[str] | None,
+    ) -> Iterator[Entity]:
+        """List entities by reading every file (used without entity index)."""
+        count = 0
+        skipped = 0
 
         for folder_name in folders:
             folder_path = self.vault_path / folder_name
@@ -609,9 +981,9 @@ class HostAPI:
 
             for md_file in folder_path.glob("*.md"):
                 try:
-                    # Read the file to get the actual ID
-                    document = read_markdown(md_file)
-                    entity_id = document.get_metadata("id")
+                    # Read only the frontmatter to get the actual ID
+                    metadata = read_frontmatter_only(md_file)
+                    entity_id = metadata.get("id")
 
                     if not entity_id or not is_valid_entity_id(entity_id):
                         continue
@@ -622,14 +994,16 @@ class HostAPI:
                         if parsed_id.entity_type != entity_type:
                             continue
 
+                    if not self._matches_filters(metadata, status, tags):
+                        continue
+
                     # Handle pagination
                     if skipped < offset:
                         skipped += 1
                         continue
 
-                    # Create entity
-                    entity = Entity.from_markdown(entity_id, document, md_file)
-                    yield entity
+                    # Create entity (body is read on first access)
+                    yield Entity.from_frontmatter(entity_id, metadata, md_file)
 
                     count += 1
                     if limit and count >= limit:
@@ -639,6 +1013,256 @@ class HostAPI:
                     # Skip malformed files
                     continue
 
+    def _entity_from_index(self, indexed: IndexedEntity) -> Entity | None:
+        """Build entity from index metadata; the body is read on first access."""
+        try:
+            fingerprint = FileFingerprint.from_stat(indexed.path.stat())
+
+            if fingerprint == indexed.fingerprint:
+                return Entity.from_frontmatter(indexed.entity_id, indexed.metadata, indexed.path)
+
+            # File changed after the index was refreshed
+            document = read_markdown(indexed.path)
+            if document.get_metadata("id") != indexed.entity_id:
+                return None
+            return Entity.from_markdown(indexed.entity_id, document, indexed.path)
+        except Exception:
+            # Skip unreadable or malformed files
+            return None
+
+    @staticmethod
+    def _matches_filters(metadata: dict[str, Any], status: str | None, tags: set[str] | None) -> bool:
+        """Check entity metadata against status and tags filters."""
+        if status:
+            value = metadata.get("status")
+            if value is None or str(value) != status:
+                return False
+
+        if tags:
+            entity_tags = metadata.get("tags") or []
+            if isinstance(entity_tags, str):
+                entity_tags = [entity_tags]
+            if not tags.intersection(str(tag) for tag in entity_tags if tag is not None):
+                return False
+
+        return True
+
+    def _update_index(self, *file_paths: Path) -> None:
+        """Re-index entity files after HostAPI wrote or deleted them."""
+        if self.entity_index is None or not file_paths:
+            return
+        try:
+            self.entity_index.update_files(file_paths)
+        except sqlite3.Error as exc:
+            if self.logger:
+                self.logger.warning(f"Failed to update entity index for {len(file_paths)} file(s): {exc}")
+
+    def apply_file_changes(self, file_paths: Iterable[Path]) -> list[FileChange]:
+        """Bring caches and indexes up to date with files edited outside HostAPI.
+
+        Used by the filesystem watcher so long-running services see edits
+        made in other tools (e.g. Obsidian) without rescanning the Vault.
+        Updates the entity index (metadata, secondary and full-text
+        indexes), the entity cache and the link graph for the given files.
+
+        Parameters
+        ----------
+        file_paths
+            Changed, created or deleted files; files outside entity
+            folders are ignored
+
+        Returns
+        -------
+        list[FileChange]
+            Changes applied; with the entity index, files already up to
+            date (e.g. HostAPI's own writes) are omitted
+        """
+        paths = list(dict.fromkeys(Path(path) for path in file_paths))
+        if not paths:
+            return []
+
+        if self.entity_index is not None:
+            try:
+                indexed = self.entity_index.update_files(paths, skip_unchanged=True)
+            except sqlite3.Error as exc:
+                if self.logger:
+                    self.logger.warning(f"Failed to apply {len(paths)} file change(s) to entity index: {exc}")
+                indexed = self._identify_files(paths)
+        else:
+            indexed = self._identify_files(paths)
+
+        # Deletions first, so a file renamed within a batch keeps its entity
+        indexed.sort(key=lambda item: item[0].exists())
+
+        changes: list[FileChange] = []
+        for file_path, previous_id, entity_id in indexed:
+            cached_ids = self.entity_cache.invalidate_path(file_path)
+            previous_id = previous_id or next(iter(cached_ids), None)
+            if entity_id is not None:
+                self.entity_cache.invalidate(entity_id)
+
+            if not file_path.exists():
+                kind = "deleted"
+            elif previous_id is None:
+                kind = "created"
+            else:
+                kind = "modified"
+
+            self._apply_link_change(file_path, previous_id, entity_id)
+            changes.append(FileChange(path=file_path, kind=kind, entity_id=entity_id, previous_entity_id=previous_id))
+
+        return changes
+
+    def _identify_files(self, file_paths: list[Path]) -> list[tuple[Path, str | None, str | None]]:
+        """Read entity IDs of changed files (used without entity index)."""
+        result: list[tuple[Path, str | None, str | None]] = []
+        for file_path in file_paths:
+            try:
+                relative = file_path.relative_to(self.vault_path)
+            except ValueError:
+                continue
+            if len(relative.parts) != 2 or relative.parts[0] not in ENTITY_FOLDERS or file_path.suffix != ".md":
+                continue
+
+            entity_id = None
+            if file_path.exists():
+                try:
+                    candidate = read_frontmatter_only(file_path).get("id")
+                except (MarkdownIOError, OSError):
+                    candidate = None
+                if isinstance(candidate, str) and is_valid_entity_id(candidate):
+                    entity_id = candidate
+            result.append((file_path, None, entity_id))
+        return result
+
+    def _apply_link_change(self, file_path: Path, previous_id: str | None, entity_id: str | None) -> None:
+        """Update the loaded link graph for one externally changed file."""
+        if self._link_graph is None:
+            # Built from disk on first use
+            return
+
+        if previous_id is not None and previous_id != entity_id:
+            self._link_graph.remove_entity(previous_id)
+
+        if entity_id is not None:
+            try:
+                document = read_markdown(file_path)
+            except MarkdownIOError as exc:
+                if self.logger:
+                    self.logger.warning(f"Failed to update links for {entity_id}: {exc}")
+                return
+            self._link_graph.add_entity(entity_id)
+            update_entity_links(self._link_graph, entity_id, document.frontmatter, document.content)
+
+    def reload_from_disk(self) -> None:
+        """Drop cached state after changes that were not tracked file by file.
+
+        The entity index is refreshed from disk and the link graph is
+        rebuilt on next use.
+        """
+        self.entity_cache.clear()
+        if self.entity_index is not None:
+            try:
+                self.entity_index.refresh()
+            except sqlite3.Error as exc:
+                if self.logger:
+                    self.logger.warning(f"Failed to refresh entity index: {exc}")
+        with self._link_graph_lock:
+            self._link_graph = None
+
+    def search_entities(
+        self,
+        query: str,
+        entity_type: str | None = None,
+        *,
+        status: str | None = None,
+        tags: Iterable[str] | None = None,
+        limit: int | None = 50,
+        offset: int = 0,
+    ) -> list[Entity]:
+        """Search entities by title, content and tags.
+
+        Uses the ranked full-text index when available (see
+        ``search_index`` for query syntax); otherwise falls back to a
+        case-insensitive substring scan over titles and content.
+
+        Parameters
+        ----------
+        query
+            Search query
+        entity_type
+            Optional entity type filter
+        status
+            Optional ``status`` filter
+        tags
+            Optional tags filter; entities having any of the tags match
+        limit
+            Maximum results to return (None for all)
+        offset
+            Result offset for pagination
+
+        Returns
+        -------
+        list[Entity]
+            Matching entities, most relevant first
+        """
+        if not query.strip():
+            return []
+
+        tag_filter = set(tags) if tags else None
+
+        if self.entity_index is None or not self.entity_index.full_text_available:
+            return self._scan_search(query, entity_type, status=status, tags=tag_filter, limit=limit, offset=offset)
+
+        folders = [self._get_folder_for_entity_type(entity_type)] if entity_type else ENTITY_FOLDERS
+        self.entity_index.refresh(folders)
+        results = self.entity_index.search(
+            query,
+            entity_type=entity_type,
+            folders=folders,
+            status=status,
+            tags=tag_filter,
+            limit=limit,
+            offset=offset,
+        )
+
+        entities = []
+        for hit in results.hits:
+            entity = self._entity_from_index(hit.entity)
+            if entity is not None:
+                entities.append(entity)
+        return entities
+
+    def _scan_search(
+        self,
+        query: str,
+        entity_type: str | None,
+        *,
+        status: str | None,
+        tags: set[str] | None,
+        limit: int | None,
+        offset: int,
+    ) -> list[Entity]:
+        """Substring search over listed entities (used without full-text index)."""
+        results: list[Entity] = []
+        skipped = 0
+        query_lower = query.lower()
+
+        for entity in self.list_entities(entity_type, status=status, tags=tags):
+            title = str(entity.metadata.get("title", "")).lower()
+            if query_lower not in title and query_lower not in entity.content.lower():
+                continue
+
+            if skipped < offset:
+                skipped += 1
+                continue
+
+            results.append(entity)
+            if limit and len(results) >= limit:
+                break
+
+        return results
+
     def upsert_entity(self, entity_type: str, data: dict[str, Any], *, content: str = "") -> Entity:
         """Create or update entity.
 
@@ -665,6 +1289,87 @@ class HostAPI:
         # Create new
         return self.create_entity(entity_type, data, content=content)
 
+    def bulk_upsert(self, items: Iterable[dict[str, Any]]) -> list[BulkUpsertResult]:
+        """Create or update many entities with one group commit.
+
+        Every item is validated like ``upsert_entity``; valid entities are
+        then written together via ``write_markdown_batch`` so the whole batch
+        costs one directory fsync per folder instead of one per entity. Each
+        file is still replaced atomically. Link graph updates, events and
+        index updates happen only after the batch is on disk.
+
+        Parameters
+        ----------
+        items
+            Dicts with ``entity_type``, ``data`` and optional ``content``
+
+        Returns
+        -------
+        list[BulkUpsertResult]
+            One result per item, in request order
+        """
+        results: list[BulkUpsertResult] = []
+        staged: list[tuple[BulkUpsertResult, Entity, Path, dict[str, Any] | None]] = []
+        seen_ids: set[str] = set()
+
+        for index, item in enumerate(items):
+            entity_type = item.get("entity_type", "")
+            data = item.get("data") or {}
+            content = item.get("content", "")
+            entity_id = data.get("id")
+            existing_id: str | None = str(entity_id) if entity_id and self._entity_exists(entity_id) else None
+            operation = "create" if existing_id is None else "update"
+            result = BulkUpsertResult(index=index, entity_id=entity_id, operation=operation)
+            results.append(result)
+
+            try:
+                if entity_id in seen_ids:
+                    raise VaultError(f"Duplicate entity in batch: {entity_id}")
+                if existing_id is not None:
+                    updates = {k: v for k, v in data.items() if k != "id"}
+                    entity = self._prepare_update(existing_id, updates, content)
+                    if entity.path is None:
+                        raise VaultError(f"Entity {entity_id} has no file path")
+                    staged.append((result, entity, entity.path, updates))
+                else:
+                    entity = self._prepare_create(entity_type, data, content)
+                    if entity.id in seen_ids:
+                        raise VaultError(f"Duplicate entity in batch: {entity.id}")
+                    staged.append((result, entity, self._get_entity_path(entity.id), None))
+                result.entity_id = entity.id
+                seen_ids.add(entity.id)
+            except Exception as exc:
+                result.error = str(exc)
+
+        if not staged:
+            return results
+
+        try:
+            errors = write_markdown_batch((file_path, entity.to_markdown()) for _, entity, file_path, _ in staged)
+        finally:
+            for _, entity, _, _ in staged:
+                self.entity_cache.invalidate(entity.id)
+            self._update_index(*(file_path for _, _, file_path, _ in staged))
+
+        for result, entity, file_path, applied in staged:
+            if file_path in errors:
+                result.error = f"Failed to write entity {entity.id}: {errors[file_path]}"
+                continue
+            entity.path = file_path
+            result.entity = entity
+            if applied is None:
+                self._finish_create(entity)
+            else:
+                self._finish_update(entity, applied)
+
+        if self.logger:
+            self.logger.info(
+                f"Bulk upsert committed: {len(staged) - len(errors)}/{len(results)} entities",
+                extra={"failed": [r.entity_id for r in results if not r.ok]},
+            )
+
+        return results
+
     def get_entity_links(self, entity_id: str) -> dict[str, Any]:
         """Get entity link information.
 
@@ -699,8 +1404,34 @@ class HostAPI:
         bool
             True if entity exists
         """
+        return self._resolve_entity_path(entity_id) is not None
+
+    def _resolve_entity_path(self, entity_id: str) -> Path | None:
+        """Find the file holding an entity.
+
+        Checks the folder-contract path first, then the entity index for
+        files whose name does not match their ID.
+
+        Parameters
+        ----------
+        entity_id
+            Entity identifier
+
+        Returns
+        -------
+        Path | None
+            Entity file path, or None if entity does not exist
+        """
         file_path = self._get_entity_path(entity_id)
-        return file_path.exists()
+        if file_path.exists():
+            return file_path
+
+        if self.entity_index is not None:
+            indexed = self.entity_index.get(entity_id, folder=file_path.parent.name)
+            if indexed is not None:
+                return indexed.path
+
+        return None
 
     def _get_entity_path(self, entity_id: str) -> Path:
         """Get file path for entity following folder contracts.
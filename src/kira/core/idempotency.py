@@ -1,23 +1,37 @@
 """Event idempotency and deduplication (Phase 2, Point 7).
 
 Ensures re-publishing the same logical event is a no-op.
-Tracks seen events in SQLite with TTL cleanup.
+Tracks seen events in SQLite (WAL mode) with TTL cleanup.
 
 event_id = sha256(source, external_id, normalized_payload)
+
+Duplicate checks are answered from memory where possible: an LRU of
+recently seen IDs short-circuits repeats, and a bloom filter of every
+stored ID short-circuits new events. Other processes sharing the database
+are detected via ``PRAGMA data_version``; their inserts are folded into the
+bloom filter before it is trusted.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import math
 import sqlite3
+import threading
+from collections import OrderedDict
 from datetime import timedelta
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .time import format_utc_iso8601, get_current_utc
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 __all__ = [
+    "DEFAULT_BLOOM_CAPACITY",
+    "DEFAULT_RECENT_SIZE",
     "EventDedupeStore",
     "create_dedupe_store",
     "generate_event_id",
@@ -100,25 +114,89 @@ def generate_event_id(
     return hash_obj.hexdigest()
 
 
+DEFAULT_BLOOM_CAPACITY = 100_000
+DEFAULT_RECENT_SIZE = 10_000
+
+# Upserts per transaction in mark_seen_many
+_BATCH_SIZE = 500
+
+_UPSERT_SQL = """
+    INSERT INTO seen_events
+    (event_id, first_seen_ts, last_seen_ts, seen_count, source, external_id, metadata)
+    VALUES (?, ?, ?, 1, ?, ?, ?)
+    ON CONFLICT(event_id) DO UPDATE SET
+        last_seen_ts = excluded.last_seen_ts,
+        seen_count = seen_count + 1
+    RETURNING seen_count, rowid
+"""
+
+
+class _BloomFilter:
+    """Bloom filter over event IDs (double hashing of a BLAKE2b digest)."""
+
+    __slots__ = ("_bits", "_hashes", "_size", "capacity", "count")
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        self.capacity = max(capacity, 1)
+        self._size = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self._hashes = max(1, round(self._size / self.capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self._size for i in range(self._hashes)]
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
 class EventDedupeStore:
     """Dedupe store for tracking seen events (Phase 2, Point 7).
 
     Tracks seen_events(event_id, first_seen_ts) in SQLite.
     Provides TTL-based cleanup.
 
-    Re-publishing the same logical event is a no-op.
+    Re-publishing the same logical event is a no-op. Several processes (each
+    with its own store) may share the same database file.
     """
 
-    def __init__(self, db_path: Path | str) -> None:
+    def __init__(
+        self,
+        db_path: Path | str,
+        *,
+        bloom_capacity: int = DEFAULT_BLOOM_CAPACITY,
+        recent_size: int = DEFAULT_RECENT_SIZE,
+    ) -> None:
         """Initialize dedupe store.
 
         Parameters
         ----------
         db_path
             Path to SQLite database file
+        bloom_capacity
+            Initial number of IDs the bloom filter is sized for (it is
+            rebuilt larger when the store outgrows it)
+        recent_size
+            Number of recently seen IDs kept in the LRU
         """
         self.db_path = Path(db_path)
         self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+        self._bloom_capacity = bloom_capacity
+        self._recent_size = recent_size
+        self._recent: OrderedDict[str, None] = OrderedDict()
+        self._bloom: _BloomFilter | None = None
+        self._data_version: int | None = None
+        self._max_rowid = 0
+        self._counters = {"recent_hits": 0, "bloom_misses": 0, "db_lookups": 0}
         self._init_database()
 
     def _init_database(self) -> None:
@@ -157,10 +235,51 @@ class EventDedupeStore:
     def _get_connection(self) -> sqlite3.Connection:
         """Get database connection."""
         if self._conn is None:
-            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn = sqlite3.connect(str(self.db_path), timeout=30.0)
             self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
         return self._conn
 
+    def _sync_front(self, conn: sqlite3.Connection) -> None:
+        """Bring the in-memory bloom filter and LRU up to date with the database.
+
+        ``PRAGMA data_version`` changes only when another connection commits,
+        so in the common single-writer case this is one cheap pragma.
+        """
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if version == self._data_version and self._bloom is not None:
+            return
+
+        outgrown = self._bloom is not None and self._bloom.count > self._bloom.capacity
+        max_rowid = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM seen_events").fetchone()[0]
+
+        if self._bloom is None or outgrown or max_rowid < self._max_rowid:
+            # Initial load, resize, or rows were deleted past our watermark
+            total = conn.execute("SELECT COUNT(*) FROM seen_events").fetchone()[0]
+            self._bloom = _BloomFilter(max(self._bloom_capacity, total * 2))
+            self._max_rowid = 0
+
+        # Another process may have deleted rows: positive cache entries are stale
+        self._recent.clear()
+
+        for row in conn.execute(
+            "SELECT rowid, event_id FROM seen_events WHERE rowid > ? ORDER BY rowid", (self._max_rowid,)
+        ):
+            self._bloom.add(row["event_id"])
+            self._max_rowid = row["rowid"]
+
+        self._data_version = version
+
+    def _remember(self, event_id: str, rowid: int | None = None) -> None:
+        """Record an ID known to be stored (caller holds the lock)."""
+        if self._bloom is not None and rowid is not None and rowid > self._max_rowid:
+            self._bloom.add(event_id)
+        self._recent[event_id] = None
+        self._recent.move_to_end(event_id)
+        while len(self._recent) > self._recent_size:
+            self._recent.popitem(last=False)
+
     def is_duplicate(self, event_id: str) -> bool:
         """Check if event has been seen before.
 
@@ -174,12 +293,26 @@ class EventDedupeStore:
         bool
             True if event was already seen
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._lock:
+            conn = self._get_connection()
+            self._sync_front(conn)
+
+            if event_id in self._recent:
+                self._recent.move_to_end(event_id)
+                self._counters["recent_hits"] += 1
+                return True
 
-        cursor.execute("SELECT event_id FROM seen_events WHERE event_id = ?", (event_id,))
+            if self._bloom is not None and event_id not in self._bloom:
+                self._counters["bloom_misses"] += 1
+                return False
 
-        return cursor.fetchone() is not None
+            self._counters["db_lookups"] += 1
+            row = conn.execute("SELECT rowid FROM seen_events WHERE event_id = ?", (event_id,)).fetchone()
+            if row is None:
+                return False
+
+            self._remember(event_id)
+            return True
 
     def mark_seen(
         self,
@@ -209,40 +342,66 @@ class EventDedupeStore:
         bool
             True if this is first time seeing event (not duplicate)
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return self.mark_seen_many([event_id], source=source, external_id=external_id, metadata=metadata)[0]
 
-        now = format_utc_iso8601(get_current_utc())
-        metadata_json = json.dumps(metadata) if metadata else None
+    def mark_seen_many(
+        self,
+        event_ids: Iterable[str],
+        *,
+        source: str | None = None,
+        external_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> list[bool]:
+        """Mark a batch of events as seen with one commit per chunk.
 
-        # Check if already exists
-        cursor.execute("SELECT seen_count FROM seen_events WHERE event_id = ?", (event_id,))
-        row = cursor.fetchone()
+        Each event is a single atomic upsert, so concurrent writers in other
+        processes agree on which of them saw an event first.
 
-        if row is not None:
-            # Update existing
-            cursor.execute(
-                """
-                UPDATE seen_events
-                SET last_seen_ts = ?,
-                    seen_count = seen_count + 1
-                WHERE event_id = ?
-            """,
-                (now, event_id),
-            )
-            conn.commit()
-            return False  # Duplicate
-        # Insert new
-        cursor.execute(
-            """
-                INSERT INTO seen_events
-                (event_id, first_seen_ts, last_seen_ts, seen_count, source, external_id, metadata)
-                VALUES (?, ?, ?, 1, ?, ?, ?)
-            """,
-            (event_id, now, now, source, external_id, metadata_json),
-        )
-        conn.commit()
-        return True  # First time
+        Parameters
+        ----------
+        event_ids
+            Event IDs in processing order
+        source
+            Event source applied to every event
+        external_id
+            External ID applied to every event
+        metadata
+            Optional metadata applied to every event
+
+        Returns
+        -------
+        list[bool]
+            Per event (in input order): True if seen for the first time.
+            Repeats within the batch count as duplicates.
+        """
+        event_ids = list(event_ids)
+        now = format_utc_iso8601(get_current_utc())
+        metadata_json = json.dumps(metadata) if metadata else None
+        results: list[bool] = []
+
+        with self._lock:
+            conn = self._get_connection()
+            self._sync_front(conn)
+
+            for start in range(0, len(event_ids), _BATCH_SIZE):
+                chunk = event_ids[start : start + _BATCH_SIZE]
+                stored: list[tuple[str, int]] = []
+                try:
+                    for event_id in chunk:
+                        row = conn.execute(
+                            _UPSERT_SQL, (event_id, now, now, source, external_id, metadata_json)
+                        ).fetchone()
+                        results.append(row["seen_count"] == 1)
+                        stored.append((event_id, row["rowid"]))
+                    conn.commit()
+                except sqlite3.Error:
+                    conn.rollback()
+                    raise
+
+                for event_id, rowid in stored:
+                    self._remember(event_id, rowid)
+
+        return results
 
     def get_event_info(self, event_id: str) -> dict[str, Any] | None:
         """Get information about a seen event.
@@ -289,19 +448,23 @@ class EventDedupeStore:
         int
             Number of events deleted
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
         # Calculate cutoff time
         now = get_current_utc()
         cutoff = now - timedelta(days=ttl_days)
         cutoff_str = format_utc_iso8601(cutoff)
 
-        # Delete old events
-        cursor.execute("DELETE FROM seen_events WHERE first_seen_ts < ?", (cutoff_str,))
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
 
-        deleted_count = cursor.rowcount
-        conn.commit()
+            # Delete old events
+            cursor.execute("DELETE FROM seen_events WHERE first_seen_ts < ?", (cutoff_str,))
+
+            deleted_count = cursor.rowcount
+            conn.commit()
+
+            # Deleted IDs may be in the LRU; stale bloom bits only cost a lookup
+            self._recent.clear()
 
         return deleted_count
 
@@ -345,13 +508,18 @@ class EventDedupeStore:
             "total_seen_count": total_seen,
             "duplicate_rate": duplicates / total if total > 0 else 0.0,
             "by_source": by_source,
+            "cache": {**self._counters, "recent_size": len(self._recent)},
         }
 
     def close(self) -> None:
         """Close database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+            self._bloom = None
+            self._data_version = None
+            self._recent.clear()
 
     def __enter__(self) -> EventDedupeStore:
         """Context manager entry."""
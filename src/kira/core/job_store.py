@@ -0,0 +1,252 @@
+"""Persistent scheduler job state (ADR-005).
+
+Job callables cannot be persisted, so jobs are still registered by code at
+startup with stable job IDs. The store remembers when each job last ran,
+when it is next due and how its last run ended. A restarted ``Scheduler``
+resumes that schedule instead of treating every job as new (which would
+fire all interval jobs at once), and applies a catch-up policy to runs
+missed while the daemon was down.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from .scheduler import Trigger
+
+__all__ = [
+    "CATCH_UP_POLICIES",
+    "CatchUpPolicy",
+    "JobRecord",
+    "JobStore",
+    "create_job_store",
+    "trigger_key",
+]
+
+CatchUpPolicy = Literal["run_once", "skip", "run_all"]
+"""What a restarted scheduler does with runs missed during downtime."""
+
+CATCH_UP_POLICIES: tuple[str, ...] = ("run_once", "skip", "run_all")
+
+
+def trigger_key(trigger: Trigger) -> str:
+    """Serialize a trigger so stored state is only reused for the same schedule.
+
+    Parameters
+    ----------
+    trigger
+        Job trigger
+
+    Returns
+    -------
+    str
+        Stable key such as ``"interval:60.0"`` or ``"cron:0 9 * * *"``
+    """
+    if trigger.interval_seconds is not None:
+        value = str(float(trigger.interval_seconds))
+    elif trigger.target_datetime is not None:
+        value = trigger.target_datetime.isoformat()
+    else:
+        value = trigger.cron_expression or ""
+    return f"{trigger.type.value}:{value}"
+
+
+@dataclass
+class JobRecord:
+    """Persisted state of one scheduled job."""
+
+    job_id: str
+    name: str
+    trigger_key: str
+    status: str
+    next_run_at: float | None = None
+    last_run_at: float | None = None
+    run_count: int = 0
+    error_count: int = 0
+    last_error: str | None = None
+    updated_at: float = 0.0
+
+
+class JobStore:
+    """SQLite-backed store of scheduler job state.
+
+    Thread-safe; the scheduler writes from its loop and worker threads.
+    """
+
+    def __init__(self, db_path: Path | str) -> None:
+        """Initialize job store.
+
+        Parameters
+        ----------
+        db_path
+            Path to SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """Initialize database schema."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = self._get_connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scheduler_jobs (
+                job_id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                trigger_key TEXT NOT NULL,
+                status TEXT NOT NULL,
+                next_run_at REAL,
+                last_run_at REAL,
+                run_count INTEGER NOT NULL DEFAULT 0,
+                error_count INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                updated_at REAL NOT NULL
+            )
+        """
+        )
+        conn.commit()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get database connection."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+
+    def load(self, job_id: str) -> JobRecord | None:
+        """Load stored state for a job.
+
+        Parameters
+        ----------
+        job_id
+            Job identifier
+
+        Returns
+        -------
+        JobRecord | None
+            Stored state, or None if the job was never persisted
+        """
+        with self._lock:
+            row = self._get_connection().execute("SELECT * FROM scheduler_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return _to_record(row) if row is not None else None
+
+    def load_all(self) -> list[JobRecord]:
+        """Load stored state for all jobs.
+
+        Returns
+        -------
+        list[JobRecord]
+            Records ordered by job ID
+        """
+        with self._lock:
+            rows = self._get_connection().execute("SELECT * FROM scheduler_jobs ORDER BY job_id").fetchall()
+        return [_to_record(row) for row in rows]
+
+    def save(self, record: JobRecord) -> None:
+        """Insert or replace stored state for a job.
+
+        Parameters
+        ----------
+        record
+            Job state; ``updated_at`` is set to the current time
+        """
+        record.updated_at = time.time()
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO scheduler_jobs
+                (job_id, name, trigger_key, status, next_run_at, last_run_at,
+                 run_count, error_count, last_error, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    record.job_id,
+                    record.name,
+                    record.trigger_key,
+                    record.status,
+                    record.next_run_at,
+                    record.last_run_at,
+                    record.run_count,
+                    record.error_count,
+                    record.last_error,
+                    record.updated_at,
+                ),
+            )
+            conn.commit()
+
+    def delete(self, job_id: str) -> bool:
+        """Forget a job.
+
+        Parameters
+        ----------
+        job_id
+            Job identifier
+
+        Returns
+        -------
+        bool
+            True if a record was deleted
+        """
+        with self._lock:
+            conn = self._get_connection()
+            deleted = conn.execute("DELETE FROM scheduler_jobs WHERE job_id = ?", (job_id,)).rowcount
+            conn.commit()
+        return deleted > 0
+
+    def close(self) -> None:
+        """Close database connection."""
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> JobStore:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+def _to_record(row: sqlite3.Row) -> JobRecord:
+    return JobRecord(
+        job_id=row["job_id"],
+        name=row["name"],
+        trigger_key=row["trigger_key"],
+        status=row["status"],
+        next_run_at=row["next_run_at"],
+        last_run_at=row["last_run_at"],
+        run_count=row["run_count"],
+        error_count=row["error_count"],
+        last_error=row["last_error"],
+        updated_at=row["updated_at"],
+    )
+
+
+def create_job_store(vault_path: Path) -> JobStore:
+    """Create job store for a vault.
+
+    Parameters
+    ----------
+    vault_path
+        Path to vault
+
+    Returns
+    -------
+    JobStore
+        Store at ``.kira/scheduler.db`` inside the vault
+    """
+    return JobStore(vault_path / ".kira" / "scheduler.db")
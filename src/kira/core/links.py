@@ -18,6 +18,8 @@ __all__ = [
     "extract_links_from_content",
     "extract_links_from_frontmatter",
     "find_broken_links",
+    "set_entity_links",
+    "update_entity_links",
 ]
 
 
@@ -578,16 +580,29 @@ def update_entity_links(
     content
         Entity content
     """
-    # Remove existing outgoing links
-    existing_links = link_graph.get_outgoing_links(entity_id)
-    for link in existing_links:
-        link_graph.remove_link(link.source_id, link.target_id, link.link_type)
-
     # Extract and add new links
     fm_links = extract_links_from_frontmatter(frontmatter)
     content_links = extract_links_from_content(content)
 
-    all_links = fm_links + content_links
+    set_entity_links(link_graph, entity_id, fm_links + content_links)
+
+
+def set_entity_links(link_graph: LinkGraph, entity_id: str, links: list[tuple[str, str]]) -> None:
+    """Replace outgoing links of an entity in graph.
+
+    Parameters
+    ----------
+    link_graph
+        Link graph to update
+    entity_id
+        Entity ID
+    links
+        List of (link_type, target_id) tuples
+    """
+    # Remove existing outgoing links
+    existing_links = link_graph.get_outgoing_links(entity_id)
+    for link in existing_links:
+        link_graph.remove_link(link.source_id, link.target_id, link.link_type)
 
-    for link_type, target_id in all_links:
+    for link_type, target_id in links:
         link_graph.add_link(entity_id, target_id, link_type)
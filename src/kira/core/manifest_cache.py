@@ -0,0 +1,224 @@
+"""Cache of parsed and validated plugin manifests (ADR-004).
+
+Validating ``kira-plugin.json`` against the JSON schema dominates plugin
+cold start. Results are keyed on the SHA-256 of the manifest bytes and a
+fingerprint of the schema, so an unchanged manifest is never parsed or
+validated twice, in-process or (with a database path) across restarts.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = [
+    "CachedManifest",
+    "ManifestCache",
+    "create_manifest_cache",
+]
+
+
+@dataclass(frozen=True)
+class CachedManifest:
+    """Parsed manifest and its validation errors.
+
+    Attributes
+    ----------
+    manifest : dict[str, Any]
+        Parsed manifest
+    errors : tuple[str, ...]
+        Schema validation errors (empty when valid)
+    content_hash : str
+        SHA-256 of the manifest bytes
+    """
+
+    manifest: dict[str, Any]
+    errors: tuple[str, ...]
+    content_hash: str
+
+
+def _detached(cached: CachedManifest) -> CachedManifest:
+    """Copy of a cache entry whose manifest does not alias the cached one."""
+    return replace(cached, manifest=copy.deepcopy(cached.manifest))
+
+
+class ManifestCache:
+    """Content-addressed cache of manifest validation results.
+
+    Always keeps an in-memory layer; with ``db_path`` results are also
+    persisted to SQLite. Thread-safe.
+    """
+
+    def __init__(self, db_path: Path | str | None = None) -> None:
+        """Initialize manifest cache.
+
+        Parameters
+        ----------
+        db_path
+            Optional SQLite database file for persistence across restarts
+        """
+        self.db_path = Path(db_path) if db_path is not None else None
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._memory: dict[tuple[str, str], CachedManifest] = {}
+        self.hits = 0
+        self.misses = 0
+        if self.db_path is not None:
+            self._init_database()
+
+    def _init_database(self) -> None:
+        """Initialize database schema."""
+        assert self.db_path is not None
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = self._get_connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS plugin_manifests (
+                content_hash TEXT NOT NULL,
+                schema_key TEXT NOT NULL,
+                manifest TEXT NOT NULL,
+                errors TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (content_hash, schema_key)
+            )
+        """
+        )
+        conn.commit()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get database connection."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+
+    def load(
+        self,
+        manifest_path: Path,
+        validate: Callable[[dict[str, Any]], list[str]],
+        schema_key: str,
+    ) -> CachedManifest:
+        """Parse and validate a manifest, reusing a cached result when possible.
+
+        Parameters
+        ----------
+        manifest_path
+            Path to ``kira-plugin.json``
+        validate
+            Returns validation errors for a parsed manifest; only called on
+            a cache miss
+        schema_key
+            Fingerprint of the schema ``validate`` checks against
+
+        Returns
+        -------
+        CachedManifest
+            Manifest (a copy callers may modify) and validation errors
+
+        Raises
+        ------
+        OSError
+            If the manifest cannot be read
+        ValueError
+            If the manifest is not valid JSON (``json.JSONDecodeError``)
+        """
+        data = manifest_path.read_bytes()
+        content_hash = hashlib.sha256(data).hexdigest()
+        key = (content_hash, schema_key)
+
+        with self._lock:
+            cached = self._memory.get(key) or self._load_persisted(key)
+            if cached is not None:
+                self.hits += 1
+                self._memory[key] = cached
+                return _detached(cached)
+            self.misses += 1
+
+        manifest = json.loads(data)
+        cached = CachedManifest(manifest=manifest, errors=tuple(validate(manifest)), content_hash=content_hash)
+
+        with self._lock:
+            self._memory[key] = cached
+            self._persist(key, cached)
+        return _detached(cached)
+
+    def _load_persisted(self, key: tuple[str, str]) -> CachedManifest | None:
+        if self.db_path is None:
+            return None
+        row = (
+            self._get_connection()
+            .execute(
+                "SELECT manifest, errors FROM plugin_manifests WHERE content_hash = ? AND schema_key = ?",
+                key,
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return CachedManifest(manifest=json.loads(row[0]), errors=tuple(json.loads(row[1])), content_hash=key[0])
+
+    def _persist(self, key: tuple[str, str], cached: CachedManifest) -> None:
+        if self.db_path is None:
+            return
+        conn = self._get_connection()
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO plugin_manifests
+            (content_hash, schema_key, manifest, errors, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+        """,
+            (*key, json.dumps(cached.manifest), json.dumps(list(cached.errors)), time.time()),
+        )
+        conn.commit()
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._memory.clear()
+            if self.db_path is not None:
+                conn = self._get_connection()
+                conn.execute("DELETE FROM plugin_manifests")
+                conn.commit()
+
+    def close(self) -> None:
+        """Close database connection."""
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> ManifestCache:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+def create_manifest_cache(vault_path: Path) -> ManifestCache:
+    """Create persistent manifest cache for a vault.
+
+    Parameters
+    ----------
+    vault_path
+        Path to vault
+
+    Returns
+    -------
+    ManifestCache
+        Cache at ``.kira/plugin_cache.db`` inside the vault
+    """
+    return ManifestCache(vault_path / ".kira" / "plugin_cache.db")
@@ -14,18 +14,27 @@ import re
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .yaml_serializer import parse_frontmatter, serialize_frontmatter
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 __all__ = [
     "MarkdownDocument",
     "MarkdownIOError",
     "parse_markdown",
+    "read_frontmatter_only",
     "read_markdown",
+    "split_markdown",
     "write_markdown",
+    "write_markdown_batch",
 ]
 
+# Characters read per chunk by ``read_frontmatter_only``
+FRONTMATTER_CHUNK_SIZE = 4096
+
 
 class MarkdownIOError(Exception):
     """Raised when Markdown I/O operations fail."""
@@ -120,6 +129,38 @@ class MarkdownDocument:
         return "\n".join(parts)
 
 
+def split_markdown(content: str) -> tuple[str | None, str]:
+    """Split raw Markdown into frontmatter source and body.
+
+    Parameters
+    ----------
+    content
+        Raw Markdown content
+
+    Returns
+    -------
+    tuple[str | None, str]
+        Stripped frontmatter YAML (None if the document has no frontmatter)
+        and the Markdown body
+    """
+    if not content.strip():
+        return None, ""
+
+    # Check for frontmatter
+    if not content.startswith("---"):
+        # No frontmatter, just content
+        return None, content
+
+    # Split frontmatter and content
+    parts = content.split("---", 2)
+
+    if len(parts) < 3:
+        # Malformed frontmatter, treat as regular content
+        return None, content
+
+    return parts[1].strip(), parts[2].lstrip("\n")
+
+
 def parse_markdown(content: str) -> MarkdownDocument:
     """Parse Markdown content with optional frontmatter.
 
@@ -138,24 +179,8 @@ def parse_markdown(content: str) -> MarkdownDocument:
     MarkdownIOError
         If parsing fails
     """
-    if not content.strip():
-        return MarkdownDocument(frontmatter={}, content="")
-
-    # Check for frontmatter
-    if not content.startswith("---"):
-        # No frontmatter, just content
-        return MarkdownDocument(frontmatter={}, content=content)
-
     try:
-        # Split frontmatter and content
-        parts = content.split("---", 2)
-
-        if len(parts) < 3:
-            # Malformed frontmatter, treat as regular content
-            return MarkdownDocument(frontmatter={}, content=content)
-
-        frontmatter_raw = parts[1].strip()
-        markdown_content = parts[2].lstrip("\n") if len(parts) > 2 else ""
+        frontmatter_raw, markdown_content = split_markdown(content)
 
         # Parse YAML frontmatter using deterministic parser (Phase 0, Point 2)
         if frontmatter_raw:
@@ -205,6 +230,90 @@ def read_markdown(file_path: Path | str) -> MarkdownDocument:
         raise MarkdownIOError(f"Failed to read {path}: {exc}") from exc
 
 
+def read_frontmatter_only(file_path: Path | str, *, chunk_size: int = FRONTMATTER_CHUNK_SIZE) -> dict[str, Any]:
+    """Read only the frontmatter of a Markdown file.
+
+    The file is read in ``chunk_size`` pieces and reading stops at the
+    closing ``---``, so the body is never loaded. Frontmatter boundaries
+    match ``split_markdown``.
+
+    Parameters
+    ----------
+    file_path
+        Path to Markdown file
+    chunk_size
+        Number of characters read per chunk
+
+    Returns
+    -------
+    dict[str, Any]
+        Frontmatter (empty if the file has none)
+
+    Raises
+    ------
+    MarkdownIOError
+        If read or parsing fails
+    """
+    path = Path(file_path)
+
+    try:
+        with path.open(encoding="utf-8") as handle:
+            head = handle.read(max(chunk_size, 3))
+            if not head.startswith("---"):
+                return {}
+
+            search_from = 3
+            while (end := head.find("---", search_from)) == -1:
+                chunk = handle.read(chunk_size)
+                if not chunk:
+                    # Unterminated frontmatter is treated as plain content
+                    return {}
+                search_from = max(3, len(head) - 2)
+                head += chunk
+
+        frontmatter_raw = head[3:end].strip()
+        return parse_frontmatter(frontmatter_raw) if frontmatter_raw else {}
+    except FileNotFoundError as exc:
+        raise MarkdownIOError(f"File not found: {path}") from exc
+    except UnicodeDecodeError as exc:
+        raise MarkdownIOError(f"File encoding error: {path} - {exc}") from exc
+    except ValueError as exc:
+        raise MarkdownIOError(str(exc)) from exc
+    except Exception as exc:
+        raise MarkdownIOError(f"Failed to read {path}: {exc}") from exc
+
+
+def _write_temp_file(path: Path, content: str, *, fsync: bool) -> Path:
+    """Write content to a temp file next to ``path`` (same filesystem)."""
+    with tempfile.NamedTemporaryFile(
+        mode="w",
+        encoding="utf-8",
+        dir=path.parent,
+        prefix=f".{path.name}.tmp",
+        delete=False,
+    ) as tmp_file:
+        tmp_path = Path(tmp_file.name)
+        try:
+            tmp_file.write(content)
+            tmp_file.flush()
+            if fsync:
+                os.fsync(tmp_file.fileno())
+        except Exception:
+            tmp_file.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+    return tmp_path
+
+
+def _fsync_directory(dir_path: Path) -> None:
+    """Flush directory metadata (renames) to disk."""
+    dir_fd = os.open(str(dir_path), os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
 def write_markdown(
     file_path: Path | str,
     document: MarkdownDocument,
@@ -254,43 +363,19 @@ def write_markdown(
 
         if atomic:
             # Phase 3, Point 11: Full atomic write protocol
-            tmp_fd = None
-            tmp_path = None
+            # 1-2. Write to *.tmp on same filesystem and fsync(tmp)
+            tmp_path = _write_temp_file(path, content, fsync=fsync)
 
+            # 3. atomic rename(tmp→real) - atomically replace target
             try:
-                # 1. Write to *.tmp on same filesystem (important for atomic rename)
-                with tempfile.NamedTemporaryFile(
-                    mode="w",
-                    encoding="utf-8",
-                    dir=path.parent,
-                    prefix=f".{path.name}.tmp",
-                    delete=False,
-                ) as tmp_file:
-                    tmp_file.write(content)
-                    tmp_file.flush()
-                    tmp_fd = tmp_file.fileno()
-                    tmp_path = Path(tmp_file.name)
-
-                    # 2. fsync(tmp) - flush file data to disk
-                    if fsync:
-                        os.fsync(tmp_fd)
-
-                # 3. atomic rename(tmp→real) - atomically replace target
                 tmp_path.rename(path)
-
-                # 4. fsync(dir) - flush directory metadata to disk
-                if fsync:
-                    dir_fd = os.open(str(path.parent), os.O_RDONLY)
-                    try:
-                        os.fsync(dir_fd)
-                    finally:
-                        os.close(dir_fd)
-
             except Exception:
-                # Clean up temp file on error
-                if tmp_path and tmp_path.exists():
-                    tmp_path.unlink()
+                tmp_path.unlink(missing_ok=True)
                 raise
+
+            # 4. fsync(dir) - flush directory metadata to disk
+            if fsync:
+                _fsync_directory(path.parent)
         else:
             # Direct write (not crash-safe)
             path.write_text(content, encoding="utf-8")
@@ -299,6 +384,71 @@ def write_markdown(
         raise MarkdownIOError(f"Failed to write {path}: {exc}") from exc
 
 
+def write_markdown_batch(
+    documents: Iterable[tuple[Path | str, MarkdownDocument]],
+    *,
+    create_dirs: bool = True,
+    fsync: bool = True,
+) -> dict[Path, MarkdownIOError]:
+    """Atomically write many documents with a single group commit.
+
+    Same per-file guarantee as ``write_markdown(atomic=True)``: after a
+    crash every target holds either its old or its new content. The
+    protocol is amortized across the batch:
+
+    1. Write every document to *.tmp and fsync it
+    2. rename(tmp→real) for every document
+    3. fsync each affected directory once
+
+    Parameters
+    ----------
+    documents
+        (target path, document) pairs; later entries for the same path win
+    create_dirs
+        Create parent directories if needed
+    fsync
+        Use fsync for crash-safety (Phase 3, Point 11)
+
+    Returns
+    -------
+    dict[Path, MarkdownIOError]
+        Errors for files that were not written; empty if all succeeded
+    """
+    staged = {Path(file_path): document for file_path, document in documents}
+    errors: dict[Path, MarkdownIOError] = {}
+    tmp_paths: dict[Path, Path] = {}
+
+    # 1. Stage temp files (file data durable before any rename)
+    for path, document in staged.items():
+        try:
+            if create_dirs and not path.parent.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_paths[path] = _write_temp_file(path, document.to_markdown_string(), fsync=fsync)
+        except Exception as exc:
+            errors[path] = MarkdownIOError(f"Failed to write {path}: {exc}")
+
+    # 2. Atomic renames
+    renamed: dict[Path, list[Path]] = {}
+    for path, tmp_path in tmp_paths.items():
+        try:
+            tmp_path.rename(path)
+            renamed.setdefault(path.parent, []).append(path)
+        except Exception as exc:
+            tmp_path.unlink(missing_ok=True)
+            errors[path] = MarkdownIOError(f"Failed to write {path}: {exc}")
+
+    # 3. One directory fsync per folder
+    if fsync:
+        for dir_path, paths in renamed.items():
+            try:
+                _fsync_directory(dir_path)
+            except Exception as exc:
+                for path in paths:
+                    errors[path] = MarkdownIOError(f"Failed to sync {path}: {exc}")
+
+    return errors
+
+
 def update_frontmatter(
     file_path: Path | str,
     updates: dict[str, Any],
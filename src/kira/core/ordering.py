@@ -6,8 +6,11 @@ Handles "edit before create" and replays deterministically.
 
 from __future__ import annotations
 
+import bisect
+import heapq
+import itertools
 import time
-from collections import defaultdict, deque
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -17,12 +20,15 @@ if TYPE_CHECKING:
     from .event_envelope import EventEnvelope
 
 __all__ = [
+    "DEFAULT_PROCESSED_WINDOW",
     "EventBuffer",
     "EventReducer",
     "ReducerRegistry",
     "create_event_buffer",
 ]
 
+DEFAULT_PROCESSED_WINDOW = 10_000
+
 
 @dataclass
 class BufferedEvent:
@@ -31,6 +37,8 @@ class BufferedEvent:
     envelope: EventEnvelope
     received_at: float  # Unix timestamp when received
     attempts: int = 0
+    entity_id: str = ""
+    sort_key: tuple[float, int, str] = (0.0, 0, "")
 
     @property
     def age_seconds(self) -> float:
@@ -38,6 +46,10 @@ class BufferedEvent:
         return time.time() - self.received_at
 
 
+def _by_sort_key(buffered: BufferedEvent) -> tuple[float, int, str]:
+    return buffered.sort_key
+
+
 class EventReducer:
     """Base class for commutative idempotent reducers (Phase 2, Point 10).
 
@@ -106,6 +118,10 @@ class ReducerRegistry:
         """
         self._reducers[event_type] = reducer
 
+    def has_reducers(self) -> bool:
+        """Check whether any reducer is registered."""
+        return bool(self._reducers)
+
     def get_reducer(self, event_type: str) -> EventReducer | None:
         """Get reducer for event type.
 
@@ -143,12 +159,21 @@ class EventBuffer:
     3. Buffer is flushed
 
     Supports "edit before create" and deterministic replays.
+
+    Buffered events are indexed by event ID and kept sorted per entity on
+    insert; a heap of grace deadlines lets ``process_ready_events`` touch
+    only expired events. Processed IDs are remembered in a bounded window
+    (by count and optionally by age) so long-running daemons do not grow
+    without limit.
     """
 
     def __init__(
         self,
         grace_period_seconds: float = 5.0,
         max_buffer_size: int = 1000,
+        *,
+        processed_window: int = DEFAULT_PROCESSED_WINDOW,
+        processed_ttl_seconds: float | None = None,
     ) -> None:
         """Initialize event buffer.
 
@@ -158,15 +183,27 @@ class EventBuffer:
             Grace period for buffering (default 5s)
         max_buffer_size
             Maximum events to buffer
+        processed_window
+            Maximum number of processed event IDs remembered for idempotency
+        processed_ttl_seconds
+            Optional age after which processed IDs are forgotten
         """
         self.grace_period_seconds = grace_period_seconds
         self.max_buffer_size = max_buffer_size
+        self.processed_window = processed_window
+        self.processed_ttl_seconds = processed_ttl_seconds
 
-        # Buffer events by entity_id for ordering
-        self._buffers: dict[str, deque[BufferedEvent]] = defaultdict(deque)
+        # Buffer events by entity_id, each list sorted by BufferedEvent.sort_key
+        self._buffers: dict[str, list[BufferedEvent]] = {}
+        # Buffered events by event_id
+        self._index: dict[str, BufferedEvent] = {}
+        self._size = 0
+        # (deadline, tiebreak, event_id); entries of already removed events are skipped lazily
+        self._deadlines: list[tuple[float, int, str]] = []
+        self._sequence = itertools.count()
 
-        # Track processed event IDs (for idempotency)
-        self._processed_ids: set[str] = set()
+        # Recently processed event IDs -> processed_at (for idempotency)
+        self._processed_ids: OrderedDict[str, float] = OrderedDict()
 
         # Reducer registry
         self._reducers = ReducerRegistry()
@@ -207,31 +244,37 @@ class EventBuffer:
         self._total_received += 1
 
         # Check for duplicate (idempotency)
-        if envelope.event_id in self._processed_ids:
+        if self._was_processed(envelope.event_id):
             return False  # Already processed
 
         # Check if already in buffer
-        for buffer in self._buffers.values():
-            for buffered in buffer:
-                if buffered.envelope.event_id == envelope.event_id:
-                    return False  # Already buffered
+        if envelope.event_id in self._index:
+            return False  # Already buffered
 
         # Extract entity ID from payload
         entity_id = self._extract_entity_id(envelope)
 
         # Add to buffer
+        received_at = time.time()
         buffered = BufferedEvent(
             envelope=envelope,
-            received_at=time.time(),
+            received_at=received_at,
+            entity_id=entity_id,
+            sort_key=self._sort_key(envelope, received_at),
+        )
+        bisect.insort(self._buffers.setdefault(entity_id, []), buffered, key=_by_sort_key)
+        self._index[envelope.event_id] = buffered
+        self._size += 1
+        heapq.heappush(
+            self._deadlines,
+            (received_at + self.grace_period_seconds, next(self._sequence), envelope.event_id),
         )
-        self._buffers[entity_id].append(buffered)
 
         # Update stats
-        total_buffered = sum(len(buf) for buf in self._buffers.values())
-        self._total_buffered_peak = max(self._total_buffered_peak, total_buffered)
+        self._total_buffered_peak = max(self._total_buffered_peak, self._size)
 
         # Check buffer size limit
-        if total_buffered > self.max_buffer_size:
+        if self._size > self.max_buffer_size:
             # Force flush oldest
             self._flush_oldest()
 
@@ -257,36 +300,28 @@ class EventBuffer:
         tuple[dict[str, Any], list[EventEnvelope]]
             (updated_state, processed_envelopes)
         """
-        processed = []
+        processed: list[EventEnvelope] = []
         current_state = state.copy()
 
-        # Check all buffers
-        for entity_id, buffer in list(self._buffers.items()):
-            if not buffer:
-                continue
+        candidates = self._pop_expired()
+        if self._can_process_early():
+            # Readiness depends on state: every buffered event is a candidate
+            candidates = {entity_id: list(buffer) for entity_id, buffer in self._buffers.items()}
 
-            # Sort buffer by timestamp and seq for deterministic processing
-            sorted_events = self._sort_events(buffer)
-
-            # Process events that are ready
-            remaining = deque()
-            for buffered in sorted_events:
+        for entity_id, events in candidates.items():
+            done: set[str] = set()
+            for buffered in events:
                 # Check if grace period expired or can apply immediately
                 if self._should_process(buffered, current_state):
                     # Apply event
                     current_state = self._apply_event(current_state, buffered.envelope)
                     processed.append(buffered.envelope)
-                    self._processed_ids.add(buffered.envelope.event_id)
+                    self._mark_processed(buffered.envelope.event_id)
                     self._total_processed += 1
-                else:
-                    # Keep in buffer
-                    remaining.append(buffered)
+                    done.add(buffered.envelope.event_id)
 
-            # Update buffer
-            if remaining:
-                self._buffers[entity_id] = remaining
-            else:
-                del self._buffers[entity_id]
+            if done:
+                self._remove(entity_id, done)
 
         return current_state, processed
 
@@ -308,27 +343,82 @@ class EventBuffer:
         processed = []
         current_state = state.copy()
 
-        # Collect all events
-        all_events = []
-        for buffer in self._buffers.values():
-            all_events.extend(buffer)
-
         # Sort globally by timestamp/seq
-        sorted_events = self._sort_events(all_events)
+        sorted_events = sorted(self._index.values(), key=_by_sort_key)
 
         # Process all
         for buffered in sorted_events:
-            if buffered.envelope.event_id not in self._processed_ids:
+            if not self._was_processed(buffered.envelope.event_id):
                 current_state = self._apply_event(current_state, buffered.envelope)
                 processed.append(buffered.envelope)
-                self._processed_ids.add(buffered.envelope.event_id)
+                self._mark_processed(buffered.envelope.event_id)
                 self._total_processed += 1
 
         # Clear buffers
         self._buffers.clear()
+        self._index.clear()
+        self._deadlines.clear()
+        self._size = 0
 
         return current_state, processed
 
+    def _can_process_early(self) -> bool:
+        """Whether reducers may release events before their grace period ends."""
+        return self.grace_period_seconds > 1.0 and self._reducers.has_reducers()
+
+    def _pop_expired(self) -> dict[str, list[BufferedEvent]]:
+        """Pop expired deadlines, grouped by entity in buffer order and sorted per entity."""
+        now = time.time()
+        expired: dict[str, list[BufferedEvent]] = {}
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, event_id = heapq.heappop(self._deadlines)
+            buffered = self._index.get(event_id)
+            if buffered is not None:
+                expired.setdefault(buffered.entity_id, []).append(buffered)
+
+        # Keep the entity order of a full scan (buffer insertion order)
+        ordered = {entity_id: expired[entity_id] for entity_id in self._buffers if entity_id in expired}
+        for events in ordered.values():
+            events.sort(key=_by_sort_key)
+        return ordered
+
+    def _remove(self, entity_id: str, event_ids: set[str]) -> None:
+        """Drop processed events from an entity buffer."""
+        remaining = [buffered for buffered in self._buffers[entity_id] if buffered.envelope.event_id not in event_ids]
+        if remaining:
+            self._buffers[entity_id] = remaining
+        else:
+            del self._buffers[entity_id]
+
+        for event_id in event_ids:
+            del self._index[event_id]
+        self._size -= len(event_ids)
+
+    def _was_processed(self, event_id: str) -> bool:
+        """Check the processed-ID window."""
+        processed_at = self._processed_ids.get(event_id)
+        if processed_at is None:
+            return False
+        ttl = self.processed_ttl_seconds
+        return ttl is None or time.time() - processed_at < ttl
+
+    def _mark_processed(self, event_id: str) -> None:
+        """Remember a processed event ID, evicting the oldest beyond the window."""
+        now = time.time()
+        self._processed_ids[event_id] = now
+        self._processed_ids.move_to_end(event_id)
+
+        while len(self._processed_ids) > self.processed_window:
+            self._processed_ids.popitem(last=False)
+
+        ttl = self.processed_ttl_seconds
+        if ttl is not None:
+            while self._processed_ids:
+                oldest_id, processed_at = next(iter(self._processed_ids.items()))
+                if now - processed_at < ttl:
+                    break
+                del self._processed_ids[oldest_id]
+
     def _extract_entity_id(self, envelope: EventEnvelope) -> str:
         """Extract entity ID from envelope for buffer grouping."""
         payload = envelope.payload
@@ -368,52 +458,36 @@ class EventBuffer:
         # No reducer: just track that we processed it
         return state
 
-    def _sort_events(self, events: list[BufferedEvent] | deque[BufferedEvent]) -> list[BufferedEvent]:
-        """Sort events for deterministic processing.
+    @staticmethod
+    def _sort_key(envelope: EventEnvelope, received_at: float) -> tuple[float, int, str]:
+        """Deterministic processing order.
 
         Sort by:
         1. event_ts (timestamp from event)
         2. seq (sequence number, if present)
         3. event_id (for tie-breaking)
         """
+        # Parse timestamp
+        try:
+            dt = parse_utc_iso8601(envelope.event_ts)
+            ts = dt.timestamp()
+        except (ValueError, AttributeError):
+            ts = received_at
 
-        def sort_key(buffered: BufferedEvent) -> tuple:
-            envelope = buffered.envelope
-
-            # Parse timestamp
-            try:
-                dt = parse_utc_iso8601(envelope.event_ts)
-                ts = dt.timestamp()
-            except (ValueError, AttributeError):
-                ts = buffered.received_at
+        # Get sequence number
+        seq = envelope.seq if envelope.seq is not None else 0
 
-            # Get sequence number
-            seq = envelope.seq if envelope.seq is not None else 0
-
-            return (ts, seq, envelope.event_id)
-
-        return sorted(events, key=sort_key)
+        return (ts, seq, envelope.event_id)
 
     def _flush_oldest(self) -> None:
         """Flush oldest event to stay within buffer size limit."""
-        # Find oldest event across all buffers
-        oldest_buffered = None
-        oldest_entity_id = None
-        oldest_age = -1.0
-
-        for entity_id, buffer in self._buffers.items():
-            if buffer:
-                buffered = buffer[0]
-                if oldest_buffered is None or buffered.age_seconds > oldest_age:
-                    oldest_buffered = buffered
-                    oldest_entity_id = entity_id
-                    oldest_age = buffered.age_seconds
-
-        # Remove oldest
-        if oldest_entity_id and oldest_buffered:
-            self._buffers[oldest_entity_id].popleft()
-            if not self._buffers[oldest_entity_id]:
-                del self._buffers[oldest_entity_id]
+        # The earliest deadline belongs to the oldest buffered event
+        while self._deadlines:
+            _, _, event_id = heapq.heappop(self._deadlines)
+            buffered = self._index.get(event_id)
+            if buffered is not None:
+                self._remove(buffered.entity_id, {event_id})
+                return
 
     def get_stats(self) -> dict[str, Any]:
         """Get buffer statistics.
@@ -423,15 +497,14 @@ class EventBuffer:
         dict[str, Any]
             Statistics
         """
-        total_buffered = sum(len(buf) for buf in self._buffers.values())
-
         return {
             "total_received": self._total_received,
             "total_processed": self._total_processed,
             "total_reordered": self._total_reordered,
-            "currently_buffered": total_buffered,
+            "currently_buffered": self._size,
             "buffered_peak": self._total_buffered_peak,
             "unique_entities": len(self._buffers),
+            "processed_ids_tracked": len(self._processed_ids),
             "processing_rate": (self._total_processed / self._total_received if self._total_received > 0 else 0.0),
         }
 
@@ -439,6 +512,9 @@ class EventBuffer:
 def create_event_buffer(
     grace_period_seconds: float = 5.0,
     max_buffer_size: int = 1000,
+    *,
+    processed_window: int = DEFAULT_PROCESSED_WINDOW,
+    processed_ttl_seconds: float | None = None,
 ) -> EventBuffer:
     """Create event buffer with grace period.
 
@@ -448,6 +524,10 @@ def create_event_buffer(
         Grace period for buffering (default 5s, range 3-10s recommended)
     max_buffer_size
         Maximum events to buffer
+    processed_window
+        Maximum number of processed event IDs remembered
+    processed_ttl_seconds
+        Optional age after which processed IDs are forgotten
 
     Returns
     -------
@@ -457,4 +537,6 @@ def create_event_buffer(
     return EventBuffer(
         grace_period_seconds=grace_period_seconds,
         max_buffer_size=max_buffer_size,
+        processed_window=processed_window,
+        processed_ttl_seconds=processed_ttl_seconds,
     )
@@ -1,22 +1,41 @@
-"""Plugin loading and activation system with version checking."""
+"""Plugin loading and activation system with version checking.
+
+Manifests are parsed and validated through a :class:`ManifestCache`, so an
+unchanged manifest costs one file hash on later loads. Plugins loaded with
+``lazy=True`` are only registered: their module is imported and activated
+when one of the events or commands listed under ``contributes`` first
+fires.
+
+Plugins loaded with :meth:`PluginLoader.load_plugin_in_sandbox` run in a
+warm :class:`~kira.core.sandbox.PluginWorkerPool`; the events they
+contribute are forwarded to the pool's workers.
+"""
 
 from __future__ import annotations
 
 import importlib
 import json
 import sys
+import threading
+from dataclasses import dataclass, field
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from packaging import version
 
 from ..plugin_sdk.context import PluginContext, VaultProtocol
-from ..plugin_sdk.manifest import PluginManifestValidator
+from ..plugin_sdk.manifest import PluginManifestValidator, get_schema_fingerprint
+from .events import topic_matches
+from .manifest_cache import ManifestCache
 from .policy import Policy
 from .sandbox import Sandbox
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
+    from .sandbox import PluginWorkerPool
+
 
 class PluginLoadError(Exception):
     """Raised when plugin loading fails."""
@@ -30,6 +49,30 @@ class PluginVersionError(PluginLoadError):
     pass
 
 
+@dataclass
+class _LazyPlugin:
+    """Registered plugin waiting for its first event or command."""
+
+    path: Path
+    manifest: dict[str, Any]
+    triggers: list[Any] = field(default_factory=list)
+
+
+class _RecordingEventBus:
+    """Forwards to the real event bus and remembers subscriptions made through it."""
+
+    def __init__(self, events: Any) -> None:
+        self._events = events
+        self.subscriptions: list[tuple[str, Callable[..., Any], Callable[..., bool] | None]] = []
+
+    def subscribe(self, event_name: str, handler: Callable[..., Any], **kwargs: Any) -> Any:
+        self.subscriptions.append((event_name, handler, kwargs.get("filter_predicate")))
+        return self._events.subscribe(event_name, handler, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._events, name)
+
+
 class PluginLoader:
     """Loads and activates plugins with version checking and sandbox support."""
 
@@ -40,6 +83,7 @@ class PluginLoader:
         vault_path: Path | None = None,
         vault: VaultProtocol | None = None,
         use_sandbox: bool = True,
+        manifest_cache: ManifestCache | None = None,
     ) -> None:
         """Initialize the plugin loader.
 
@@ -59,30 +103,50 @@ class PluginLoader:
             If None, plugins won't have vault access.
         use_sandbox
             Whether to use sandbox for subprocess strategy plugins.
+        manifest_cache
+            Cache of manifest validation results. If None, an in-memory
+            cache is used; pass ``create_manifest_cache(vault_path)`` to
+            keep results across restarts.
         """
         # Create context with vault access if provided
         if context is None:
             context = PluginContext(vault=vault) if vault else PluginContext()
 
         self.context = context
-        self.manifest_validator = PluginManifestValidator()
+        self.manifest_cache = manifest_cache if manifest_cache is not None else ManifestCache()
         self.vault_path = vault_path
         self.use_sandbox = use_sandbox
         self.sandbox = sandbox if sandbox is not None else (Sandbox() if use_sandbox else None)
+        self._manifest_validator: PluginManifestValidator | None = None
         self._loaded_plugins: dict[str, dict[str, Any]] = {}
-
-    def load_plugin(self, plugin_path: Path) -> dict[str, Any]:
+        self._lazy: dict[str, _LazyPlugin] = {}
+        self._commands: dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def manifest_validator(self) -> PluginManifestValidator:
+        """Schema validator, created on the first manifest cache miss."""
+        if self._manifest_validator is None:
+            self._manifest_validator = PluginManifestValidator()
+        return self._manifest_validator
+
+    def load_plugin(self, plugin_path: Path, *, lazy: bool = False) -> dict[str, Any]:
         """Load a plugin from the specified path.
 
         Parameters
         ----------
         plugin_path
             Path to the plugin directory containing kira-plugin.json
+        lazy
+            Defer importing and activating the plugin until one of the
+            events or commands in its manifest ``contributes`` first fires.
+            Plugins that contribute neither are activated immediately.
 
         Returns
         -------
         dict[str, Any]
-            Plugin metadata and activation result
+            Plugin metadata and activation result (``result`` is None and
+            ``activated`` False while a lazy plugin waits for a trigger)
 
         Raises
         ------
@@ -91,26 +155,47 @@ class PluginLoader:
         PluginVersionError
             If plugin version is incompatible
         """
+        manifest = self._read_manifest(plugin_path)
+
+        # Check engine compatibility
+        self._check_engine_compatibility(manifest)
+
+        contributes = manifest.get("contributes", {})
+        events = contributes.get("events", [])
+        commands = contributes.get("commands", [])
+
+        with self._lock:
+            for command in commands:
+                self._commands[command] = manifest["name"]
+            if lazy and (events or commands):
+                return self._register_lazy(plugin_path, manifest, events)
+            return self._activate(plugin_path, manifest, self.context)
+
+    def _read_manifest(self, plugin_path: Path) -> dict[str, Any]:
+        """Load and validate a manifest through the manifest cache."""
         manifest_path = plugin_path / "kira-plugin.json"
         if not manifest_path.exists():
             raise PluginLoadError(f"Plugin manifest not found: {manifest_path}")
 
         # Load and validate manifest
         try:
-            with open(manifest_path, encoding="utf-8") as f:
-                manifest = json.load(f)
+            cached = self.manifest_cache.load(
+                manifest_path,
+                lambda manifest: self.manifest_validator.validate_manifest(manifest),
+                get_schema_fingerprint(),
+            )
         except (json.JSONDecodeError, OSError) as e:
             raise PluginLoadError(f"Failed to load manifest: {e}") from e
 
         # Validate manifest structure
-        errors = self.manifest_validator.validate_manifest(manifest)
-        if errors:
-            error_msg = "; ".join(errors)
+        if cached.errors:
+            error_msg = "; ".join(cached.errors)
             raise PluginLoadError(f"Invalid plugin manifest: {error_msg}")
 
-        # Check engine compatibility
-        self._check_engine_compatibility(manifest)
+        return cached.manifest
 
+    def _activate(self, plugin_path: Path, manifest: dict[str, Any], context: PluginContext) -> dict[str, Any]:
+        """Import the plugin entry point and call it."""
         # Load plugin module
         plugin_name = manifest["name"]
         entry_point = manifest.get("entry", f"{plugin_name}.plugin:activate")
@@ -124,7 +209,7 @@ class PluginLoader:
 
         # Activate plugin
         try:
-            result = activate_func(self.context)
+            result = activate_func(context)
         except Exception as e:
             raise PluginLoadError(f"Plugin activation failed: {e}") from e
 
@@ -135,11 +220,115 @@ class PluginLoader:
             "path": str(plugin_path),
             "manifest": manifest,
             "result": result,
+            "activated": True,
+        }
+        self._loaded_plugins[plugin_name] = plugin_info
+
+        return plugin_info
+
+    def _register_lazy(self, plugin_path: Path, manifest: dict[str, Any], events: list[str]) -> dict[str, Any]:
+        """Register activation triggers instead of importing the plugin."""
+        plugin_name = manifest["name"]
+        lazy = _LazyPlugin(path=plugin_path, manifest=manifest)
+        for event_name in events:
+            trigger = partial(self._on_trigger, plugin_name, event_name)
+            lazy.triggers.append(self.context.events.subscribe(event_name, trigger))
+        self._lazy[plugin_name] = lazy
+
+        plugin_info = {
+            "name": plugin_name,
+            "version": manifest.get("version", "unknown"),
+            "path": str(plugin_path),
+            "manifest": manifest,
+            "result": None,
+            "activated": False,
         }
         self._loaded_plugins[plugin_name] = plugin_info
 
         return plugin_info
 
+    def _on_trigger(self, plugin_name: str, event_name: str, *args: Any) -> None:
+        """Activate a lazy plugin and hand it the event that woke it up.
+
+        The plugin subscribes its own handlers during activation; they
+        missed this event, so it is replayed to the matching ones.
+        """
+        with self._lock:
+            if plugin_name not in self._lazy:
+                return  # already activated; the plugin's own handlers get the event
+            subscriptions = self._activate_lazy(plugin_name)
+
+        for pattern, handler, filter_predicate in subscriptions:
+            if not topic_matches(pattern, event_name):
+                continue
+            if filter_predicate is not None and not filter_predicate(*args):
+                continue
+            handler(*args)
+
+    def _activate_lazy(self, plugin_name: str) -> list[tuple[str, Callable[..., Any], Callable[..., bool] | None]]:
+        lazy = self._lazy[plugin_name]
+        recorder = _RecordingEventBus(self.context.events)
+        self._activate(lazy.path, lazy.manifest, self.context.with_overrides(events=recorder))
+        del self._lazy[plugin_name]
+
+        # Buses without unsubscribe keep calling the trigger, which is a no-op now
+        unsubscribe = getattr(self.context.events, "unsubscribe", None)
+        if callable(unsubscribe):
+            for handle in lazy.triggers:
+                if handle is not None:
+                    unsubscribe(handle)
+
+        return recorder.subscriptions
+
+    def activate_plugin(self, plugin_name: str) -> dict[str, Any]:
+        """Activate a lazily loaded plugin now.
+
+        Parameters
+        ----------
+        plugin_name
+            Name of a loaded plugin
+
+        Returns
+        -------
+        dict[str, Any]
+            Plugin metadata and activation result
+
+        Raises
+        ------
+        PluginLoadError
+            If the plugin is not loaded or fails to activate
+        """
+        with self._lock:
+            if plugin_name in self._lazy:
+                self._activate_lazy(plugin_name)
+            if plugin_name not in self._loaded_plugins:
+                raise PluginLoadError(f"Plugin not loaded: {plugin_name}")
+            return self._loaded_plugins[plugin_name].copy()
+
+    def activate_command(self, command: str) -> dict[str, Any]:
+        """Activate the plugin contributing a command before running it.
+
+        Parameters
+        ----------
+        command
+            Command name from a manifest's ``contributes.commands``
+
+        Returns
+        -------
+        dict[str, Any]
+            Metadata of the plugin providing the command
+
+        Raises
+        ------
+        PluginLoadError
+            If no loaded plugin contributes the command, or activation fails
+        """
+        with self._lock:
+            plugin_name = self._commands.get(command)
+        if plugin_name is None:
+            raise PluginLoadError(f"No loaded plugin contributes command: {command}")
+        return self.activate_plugin(plugin_name)
+
     def _check_engine_compatibility(self, manifest: dict[str, Any]) -> None:
         """Check if plugin is compatible with current engine version.
 
@@ -270,6 +459,22 @@ class PluginLoader:
         """
         return plugin_name in self._loaded_plugins
 
+    def is_plugin_activated(self, plugin_name: str) -> bool:
+        """Check if a loaded plugin has been imported and activated.
+
+        Parameters
+        ----------
+        plugin_name
+            Name of the plugin to check
+
+        Returns
+        -------
+        bool
+            True once the plugin's entry point has run
+        """
+        with self._lock:
+            return plugin_name in self._loaded_plugins and plugin_name not in self._lazy
+
     def load_plugin_in_sandbox(
         self,
         plugin_path: Path,
@@ -277,6 +482,10 @@ class PluginLoader:
     ) -> dict[str, Any]:
         """Load a plugin in subprocess sandbox (ADR-004).
 
+        The plugin is activated in a pool of warm worker processes, and the
+        events listed under ``contributes.events`` are delivered to it
+        through the pool.
+
         Parameters
         ----------
         plugin_path
@@ -309,9 +518,9 @@ class PluginLoader:
             for violation in violations:
                 print(f"Warning: Policy violation in {plugin_name}: " f"{violation.permission} - {violation.reason}")
 
-        # Launch in sandbox
+        # Launch warm workers in sandbox
         try:
-            plugin_process = self.sandbox.launch(
+            pool = self.sandbox.launch_pool(
                 plugin_name=plugin_name,
                 entry_point=entry_point,
                 plugin_path=plugin_path,
@@ -321,6 +530,11 @@ class PluginLoader:
         except Exception as exc:
             raise PluginLoadError(f"Failed to launch {plugin_name} in sandbox: {exc}") from exc
 
+        subscriptions = [
+            self.context.events.subscribe(event_name, partial(self._forward_to_pool, pool, event_name))
+            for event_name in manifest.get("contributes", {}).get("events", [])
+        ]
+
         # Store plugin info
         plugin_info = {
             "name": plugin_name,
@@ -328,13 +542,28 @@ class PluginLoader:
             "path": str(plugin_path),
             "manifest": manifest,
             "sandbox": True,
-            "process": plugin_process,
+            "pool": pool,
+            "subscriptions": subscriptions,
             "policy": policy,
         }
         self._loaded_plugins[plugin_name] = plugin_info
 
         return plugin_info
 
+    @staticmethod
+    def _forward_to_pool(pool: PluginWorkerPool, event_name: str, *args: Any) -> None:
+        """Deliver a host event to a sandboxed plugin's workers.
+
+        The core ``EventBus`` passes an ``Event``; the SDK bus passes
+        ``(context, payload)`` and the subscribed name is used.
+        """
+        if len(args) == 1:
+            event_name = getattr(args[0], "name", event_name)
+            payload = getattr(args[0], "payload", None)
+        else:
+            payload = args[-1] if args else None
+        pool.publish(event_name, payload)
+
     def should_use_sandbox(self, manifest: dict[str, Any]) -> bool:
         """Determine if plugin should be loaded in sandbox.
 
@@ -361,5 +590,12 @@ class PluginLoader:
 
         Should be called when loader is no longer needed.
         """
+        unsubscribe = getattr(self.context.events, "unsubscribe", None)
+        if callable(unsubscribe):
+            for plugin_info in self._loaded_plugins.values():
+                for handle in plugin_info.get("subscriptions", []):
+                    if handle is not None:
+                        unsubscribe(handle)
+
         if self.sandbox:
             self.sandbox.stop_all()
@@ -2,15 +2,25 @@
 
 Implements ADR-004: subprocess isolation with JSON-RPC 2.0 over stdio,
 permission enforcement, resource limits, and lifecycle management.
+
+Each plugin process has one dedicated reader thread that routes responses
+to pending calls by JSON-RPC id, so requests can be pipelined. A
+``PluginWorkerPool`` keeps warm processes per plugin, health-checks them
+and recycles them after a number of requests or above a memory watermark.
 """
 
 from __future__ import annotations
 
+import functools
+import itertools
 import os
+import queue
 import subprocess
 import sys
 import threading
 import time
+from collections import deque
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -19,10 +29,18 @@ if TYPE_CHECKING:
 
     from .policy import Policy
 
-from ..plugin_sdk.rpc import JSONRPCError, JSONRPCMessage, parse_jsonrpc_message, serialize_jsonrpc_message
+from ..plugin_sdk.rpc import (
+    NEGOTIATE_METHOD,
+    TRANSPORT_MODES,
+    JSONRPCError,
+    JSONRPCMessage,
+    RPCError,
+    StdioTransport,
+)
 
 __all__ = [
     "PluginProcess",
+    "PluginWorkerPool",
     "Sandbox",
     "SandboxConfig",
     "SandboxError",
@@ -47,6 +65,12 @@ class SandboxConfig:
     restart_window_seconds: int = 300
     grace_period_seconds: float = 5.0
     env_whitelist: list[str] = field(default_factory=lambda: ["PATH", "HOME", "USER"])
+    # Worker pools: recycle a worker after this many requests / above this RSS
+    max_requests_per_worker: int | None = 1000
+    max_worker_memory_mb: float | None = None
+    health_check_interval_seconds: float = 30.0
+    # JSON-RPC framing: "text" (Content-Length + JSON) or "binary" (negotiated)
+    rpc_mode: str = "text"
 
 
 @dataclass
@@ -61,11 +85,41 @@ class PluginProcess:
     started_at: float = field(default_factory=time.time)
     restart_count: int = 0
     is_stopping: bool = False
+    requests_served: int = 0
+
+    _transport: StdioTransport | None = field(default=None, init=False, repr=False)
+    _reader: threading.Thread | None = field(default=None, init=False, repr=False)
+    _pending: dict[int, Future[Any]] = field(default_factory=dict, init=False, repr=False)
+    _inbox: queue.Queue[JSONRPCMessage | Exception] = field(default_factory=queue.Queue, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _write_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _ids: itertools.count[int] = field(default_factory=lambda: itertools.count(1), init=False, repr=False)
+    _stderr_tail: deque[str] = field(default_factory=lambda: deque(maxlen=50), init=False, repr=False)
+    _negotiate_id: int | None = field(default=None, init=False, repr=False)
 
     def is_alive(self) -> bool:
         """Check if process is still running."""
         return self.process.poll() is None
 
+    @property
+    def pending_count(self) -> int:
+        """Number of requests awaiting a response."""
+        with self._lock:
+            return len(self._pending)
+
+    def stderr_tail(self) -> list[str]:
+        """Last lines the plugin wrote to stderr (once the reader is running)."""
+        return list(self._stderr_tail)
+
+    def memory_mb(self) -> float | None:
+        """Resident memory of the process in MB (None where unavailable)."""
+        try:
+            with open(f"/proc/{self.process.pid}/statm", encoding="ascii") as statm:
+                resident_pages = int(statm.read().split()[1])
+        except (OSError, ValueError, IndexError):
+            return None
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
     def send_message(self, message: JSONRPCMessage) -> None:
         """Send JSON-RPC message to plugin process.
 
@@ -86,15 +140,17 @@ class PluginProcess:
             raise SandboxError(f"Plugin process {self.plugin_name} has no stdin")
 
         try:
-            data = serialize_jsonrpc_message(message)
-            self.process.stdin.write(data)
-            self.process.stdin.flush()
-        except (BrokenPipeError, OSError) as exc:
+            with self._write_lock:
+                self._get_transport().send(message)
+        except (BrokenPipeError, OSError, ValueError) as exc:
             raise SandboxError(f"Failed to send message to {self.plugin_name}: {exc}") from exc
 
     def receive_message(self, timeout: float | None = None) -> JSONRPCMessage:
         """Receive JSON-RPC message from plugin process.
 
+        Returns messages that are not responses to ``request()`` calls
+        (plugin-initiated requests and notifications, unmatched responses).
+
         Parameters
         ----------
         timeout
@@ -112,76 +168,257 @@ class PluginProcess:
         TimeoutError
             If timeout expires
         """
-        if not self.is_alive():
+        if self._inbox.empty() and not self.is_alive():
             raise SandboxError(f"Plugin process {self.plugin_name} is not running")
 
-        if self.process.stdout is None:
-            raise SandboxError(f"Plugin process {self.plugin_name} has no stdout")
+        self._ensure_reader()
+        try:
+            item = self._inbox.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"Timeout reading from {self.plugin_name} (timeout={timeout}s)") from None
 
-        # Read with timeout
-        result: list[JSONRPCMessage | Exception] = []
+        if isinstance(item, Exception):
+            self._inbox.put(item)  # the stream is finished for every later reader too
+            raise item
+        return item
 
-        def read_worker() -> None:
-            try:
-                # Read Content-Length header
-                header = self.process.stdout.readline()  # type: ignore
-                if not header:
-                    result.append(SandboxError("Process stdout closed"))
-                    return
-
-                # Parse Content-Length
-                if not header.startswith(b"Content-Length:"):
-                    result.append(
-                        JSONRPCError(
-                            f"Expected Content-Length, got: {header!r}",
-                            JSONRPCError.PARSE_ERROR,
-                        )
-                    )
-                    return
-
-                content_length = int(header.decode("ascii").split(":")[1].strip())
-
-                # Read empty line
-                empty = self.process.stdout.readline()  # type: ignore
-                if empty != b"\r\n":
-                    result.append(
-                        JSONRPCError(
-                            f"Expected empty line, got: {empty!r}",
-                            JSONRPCError.PARSE_ERROR,
-                        )
-                    )
-                    return
-
-                # Read content
-                content = self.process.stdout.read(content_length)  # type: ignore
-                if len(content) != content_length:
-                    result.append(
-                        JSONRPCError(
-                            f"Expected {content_length} bytes, got {len(content)}",
-                            JSONRPCError.PARSE_ERROR,
-                        )
-                    )
-                    return
-
-                message = parse_jsonrpc_message(content)
-                result.append(message)
-            except Exception as exc:
-                result.append(exc)
+    def request_async(self, method: str, params: dict[str, Any] | None = None) -> Future[Any]:
+        """Send a JSON-RPC request without waiting for its response.
+
+        Parameters
+        ----------
+        method
+            RPC method name
+        params
+            Method parameters
 
-        thread = threading.Thread(target=read_worker, daemon=True)
-        thread.start()
-        thread.join(timeout=timeout)
+        Returns
+        -------
+        Future
+            Resolves to the result, or raises ``RPCError`` / ``SandboxError``
+        """
+        self._ensure_reader()
+        future: Future[Any] = Future()
+        with self._lock:
+            request_id = next(self._ids)
+            self._pending[request_id] = future
+
+        try:
+            self.send_message(JSONRPCMessage(id=request_id, method=method, params=params))
+        except SandboxError:
+            with self._lock:
+                self._pending.pop(request_id, None)
+            raise
+        return future
+
+    def request_batch(self, calls: list[tuple[str, dict[str, Any] | None]]) -> list[Future[Any]]:
+        """Send several requests as one JSON-RPC batch frame.
+
+        Parameters
+        ----------
+        calls
+            (method, params) pairs
+
+        Returns
+        -------
+        list[Future]
+            One future per call, in order
+        """
+        self._ensure_reader()
+        futures: list[Future[Any]] = [Future() for _ in calls]
+        with self._lock:
+            request_ids = [next(self._ids) for _ in calls]
+            self._pending.update(zip(request_ids, futures, strict=True))
+
+        messages = [
+            JSONRPCMessage(id=request_id, method=method, params=params)
+            for request_id, (method, params) in zip(request_ids, calls, strict=True)
+        ]
+        try:
+            with self._write_lock:
+                self._get_transport().send_batch(messages)
+        except (BrokenPipeError, OSError, ValueError) as exc:
+            with self._lock:
+                for request_id in request_ids:
+                    self._pending.pop(request_id, None)
+            raise SandboxError(f"Failed to send batch to {self.plugin_name}: {exc}") from exc
+        return futures
 
-        if thread.is_alive():
-            raise TimeoutError(f"Timeout reading from {self.plugin_name} (timeout={timeout}s)")
+    def negotiate(self, modes: tuple[str, ...] = ("binary", "text"), *, timeout: float | None = None) -> str:
+        """Agree on a transport mode with the plugin and switch to it.
 
-        if not result:
-            raise SandboxError(f"No response from {self.plugin_name}")
+        Other writers are held back until the switch is complete. Plugins
+        that do not know ``rpc.negotiate`` stay in text mode.
 
-        if isinstance(result[0], Exception):
-            raise result[0]
+        Parameters
+        ----------
+        modes
+            Acceptable modes in order of preference
+        timeout
+            Timeout in seconds (default: ``config.timeout_ms``)
+
+        Returns
+        -------
+        str
+            Mode in use
+
+        Raises
+        ------
+        SandboxError
+            If the process dies or cannot be written to
+        TimeoutError
+            If the plugin does not answer in time
+        """
+        if timeout is None:
+            timeout = self.config.timeout_ms / 1000.0
+        self._ensure_reader()
+        transport = self._get_transport()
+        future: Future[Any] = Future()
+
+        with self._write_lock:
+            with self._lock:
+                request_id = next(self._ids)
+                self._pending[request_id] = future
+                self._negotiate_id = request_id
+            try:
+                transport.send(JSONRPCMessage(id=request_id, method=NEGOTIATE_METHOD, params={"modes": list(modes)}))
+                future.result(timeout=timeout)  # the reader switches modes before resolving
+            except RPCError:
+                pass  # older plugin: keep text mode
+            except TimeoutError:
+                raise TimeoutError(f"Timeout negotiating transport with {self.plugin_name}") from None
+            except (BrokenPipeError, OSError, ValueError) as exc:
+                raise SandboxError(f"Failed to negotiate transport with {self.plugin_name}: {exc}") from exc
+            finally:
+                with self._lock:
+                    self._pending.pop(request_id, None)
+                    self._negotiate_id = None
+
+        return transport.mode
+
+    def request(self, method: str, params: dict[str, Any] | None = None, *, timeout: float | None = None) -> Any:
+        """Send a JSON-RPC request and wait for its result.
+
+        Parameters
+        ----------
+        method
+            RPC method name
+        params
+            Method parameters
+        timeout
+            Timeout in seconds (default: ``config.timeout_ms``)
+
+        Returns
+        -------
+        Any
+            Method result
+
+        Raises
+        ------
+        RPCError
+            If the plugin returns an error
+        SandboxError
+            If the process dies or cannot be written to
+        TimeoutError
+            If no response arrives in time
+        """
+        future = self.request_async(method, params)
+        if timeout is None:
+            timeout = self.config.timeout_ms / 1000.0
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            with self._lock:
+                for request_id, pending in list(self._pending.items()):
+                    if pending is future:
+                        del self._pending[request_id]
+            raise TimeoutError(f"Timeout waiting for {method} from {self.plugin_name} (timeout={timeout}s)") from None
+
+    def _get_transport(self) -> StdioTransport:
+        if self._transport is None:
+            if self.process.stdin is None or self.process.stdout is None:
+                raise SandboxError(f"Plugin process {self.plugin_name} has no stdio pipes")
+            self._transport = StdioTransport(input_stream=self.process.stdout, output_stream=self.process.stdin)
+        return self._transport
+
+    def _ensure_reader(self) -> None:
+        """Start the dedicated reader thread on first use."""
+        with self._lock:
+            if self._reader is not None:
+                return
+            transport = self._get_transport()
+            self._reader = threading.Thread(
+                target=self._read_loop,
+                args=(transport,),
+                name=f"kira-plugin-reader-{self.plugin_name}",
+                daemon=True,
+            )
+            self._reader.start()
+
+            if self.process.stderr is not None:
+                # Long-lived plugins must not block on a full stderr pipe
+                threading.Thread(
+                    target=self._drain_stderr,
+                    name=f"kira-plugin-stderr-{self.plugin_name}",
+                    daemon=True,
+                ).start()
+
+    def _drain_stderr(self) -> None:
+        for line in iter(self.process.stderr.readline, b""):  # type: ignore[union-attr]
+            self._stderr_tail.append(line.decode("utf-8", "replace").rstrip())
+
+    def _read_loop(self, transport: StdioTransport) -> None:
+        """Route responses to pending requests; queue everything else."""
+        while True:
+            try:
+                messages = transport.receive_batch()
+            except EOFError:
+                self._fail_pending(SandboxError(f"Plugin process {self.plugin_name} closed stdout"))
+                return
+            except (JSONRPCError, OSError, ValueError) as exc:
+                self._fail_pending(exc)
+                return
+
+            for message in messages:
+                self._route(transport, message)
+
+    def _route(self, transport: StdioTransport, message: JSONRPCMessage) -> None:
+        """Resolve the pending request a response belongs to."""
+        future = None
+        if message.method is None and isinstance(message.id, int):
+            with self._lock:
+                future = self._pending.pop(message.id, None)
+                if message.id == self._negotiate_id and not message.error:
+                    # Plugin switched after this response; switch before the next read
+                    mode = (message.result or {}).get("mode", "text")
+                    transport.set_mode(mode if mode in TRANSPORT_MODES else "text")
+
+        if future is None:
+            self._inbox.put(message)
+            return
 
-        return result[0]
+        with self._lock:
+            self.requests_served += 1
+        if message.error:
+            future.set_exception(
+                RPCError(
+                    message.error.get("message", "Unknown error"),
+                    code=message.error.get("code", -1),
+                    data=message.error.get("data"),
+                )
+            )
+        else:
+            future.set_result(message.result)
+
+    def _fail_pending(self, exc: Exception) -> None:
+        """Fail outstanding requests once the stream is unusable."""
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for future in pending:
+            if not future.done():
+                future.set_exception(exc)
+        self._inbox.put(exc)
 
     def terminate(self, force: bool = False) -> None:
         """Terminate plugin process.
@@ -225,6 +462,7 @@ class Sandbox:
         """
         self.config = config or SandboxConfig()
         self._processes: dict[str, PluginProcess] = {}
+        self._pools: dict[str, PluginWorkerPool] = {}
         self._restart_times: dict[str, list[float]] = {}
 
     def launch(
@@ -268,6 +506,76 @@ class Sandbox:
                 f"{self.config.restart_window_seconds}s)"
             )
 
+        plugin_process = self._spawn(plugin_name, entry_point, plugin_path, policy, context_config)
+        self._processes[plugin_name] = plugin_process
+        self._record_restart(plugin_name)
+
+        return plugin_process
+
+    def launch_pool(
+        self,
+        plugin_name: str,
+        entry_point: str,
+        plugin_path: Path,
+        policy: Policy,
+        context_config: dict[str, Any] | None = None,
+        *,
+        size: int = 2,
+        logger: Any = None,
+    ) -> PluginWorkerPool:
+        """Launch a pool of warm worker processes for a plugin.
+
+        Parameters
+        ----------
+        plugin_name
+            Plugin identifier
+        entry_point
+            Entry point in format "module:function"
+        plugin_path
+            Path to plugin directory
+        policy
+            Permission policy for the plugin
+        context_config
+            Configuration to pass to plugin context
+        size
+            Number of worker processes
+        logger
+            Optional logger for worker lifecycle events
+
+        Returns
+        -------
+        PluginWorkerPool
+            Started pool; stopped together with the sandbox
+
+        Raises
+        ------
+        SandboxError
+            If workers cannot be launched
+        """
+        self.stop(plugin_name)
+        pool = PluginWorkerPool(
+            self,
+            plugin_name,
+            entry_point,
+            plugin_path,
+            policy,
+            context_config=context_config,
+            size=size,
+            logger=logger,
+        )
+        pool.start()
+        self._pools[plugin_name] = pool
+        return pool
+
+    def _spawn(
+        self,
+        plugin_name: str,
+        entry_point: str,
+        plugin_path: Path,
+        policy: Policy,
+        context_config: dict[str, Any] | None,
+    ) -> PluginProcess:
+        """Start a plugin process serving JSON-RPC on its stdio."""
         # Prepare environment
         env = self._prepare_environment(policy)
 
@@ -290,12 +598,17 @@ except (ImportError, AttributeError) as exc:
     sys.exit(1)
 
 # Import SDK components
+import os
 from kira.plugin_sdk.context import PluginContext
-from kira.plugin_sdk.rpc import StdioTransport, HostRPCClient
+from kira.plugin_sdk.rpc import RPCServer, StdioTransport
+
+# Keep stdout for JSON-RPC only; plugin output goes to stderr
+transport = StdioTransport(sys.stdin.buffer, os.fdopen(os.dup(1), "wb"))
+os.dup2(2, 1)
+sys.stdout = sys.stderr
 
 # Create context
 config = {context_config!r}
-transport = StdioTransport()
 context = PluginContext(
     config=config,
     # RPC client would be injected here for real host API calls
@@ -309,11 +622,13 @@ except Exception as exc:
     print(f"ERROR: Plugin activation failed: {{exc}}", file=sys.stderr)
     sys.exit(1)
 
-# Keep alive for RPC communication
-# In real implementation, this would enter RPC serve loop
-import time
+def publish(params):
+    context.events.publish(params["event"], params.get("payload"))
+    return {{"delivered": True}}
+
+# Serve host requests until stdin closes
 print("Plugin running...", file=sys.stderr)
-time.sleep({self.config.timeout_ms / 1000.0})
+RPCServer({{"event.publish": publish}}, transport).serve_forever()
 """
 
         # Launch subprocess
@@ -342,8 +657,12 @@ time.sleep({self.config.timeout_ms / 1000.0})
             restart_count=self._get_restart_count(plugin_name),
         )
 
-        self._processes[plugin_name] = plugin_process
-        self._record_restart(plugin_name)
+        if self.config.rpc_mode != "text":
+            try:
+                plugin_process.negotiate((self.config.rpc_mode, "text"))
+            except (SandboxError, TimeoutError) as exc:
+                plugin_process.terminate(force=True)
+                raise SandboxError(f"Failed to start {plugin_name}: {exc}") from exc
 
         return plugin_process
 
@@ -454,6 +773,21 @@ time.sleep({self.config.timeout_ms / 1000.0})
         """
         return self._processes.get(plugin_name)
 
+    def get_pool(self, plugin_name: str) -> PluginWorkerPool | None:
+        """Get worker pool for plugin.
+
+        Parameters
+        ----------
+        plugin_name
+            Plugin identifier
+
+        Returns
+        -------
+        PluginWorkerPool or None
+            Pool if launched, None otherwise
+        """
+        return self._pools.get(plugin_name)
+
     def stop(self, plugin_name: str, force: bool = False) -> None:
         """Stop plugin process.
 
@@ -469,6 +803,10 @@ time.sleep({self.config.timeout_ms / 1000.0})
             process.terminate(force=force)
             del self._processes[plugin_name]
 
+        pool = self._pools.pop(plugin_name, None)
+        if pool:
+            pool.close(force=force)
+
     def stop_all(self, force: bool = False) -> None:
         """Stop all running plugin processes.
 
@@ -477,7 +815,7 @@ time.sleep({self.config.timeout_ms / 1000.0})
         force
             If True, use SIGKILL immediately
         """
-        for plugin_name in list(self._processes.keys()):
+        for plugin_name in list(self._processes.keys()) + list(self._pools.keys()):
             self.stop(plugin_name, force=force)
 
     def __enter__(self) -> Sandbox:
@@ -489,6 +827,469 @@ time.sleep({self.config.timeout_ms / 1000.0})
         self.stop_all(force=True)
 
 
+class PluginWorkerPool:
+    """Supervised pool of warm worker processes for one plugin.
+
+    Requests go to the worker with the fewest outstanding calls and are
+    pipelined over its JSON-RPC channel. Workers are pinged every
+    ``health_check_interval_seconds``; dead or unresponsive workers are
+    replaced (subject to the sandbox restart limit), and workers are
+    recycled after ``max_requests_per_worker`` requests or once their RSS
+    exceeds ``max_worker_memory_mb``. A recycled worker keeps serving until
+    its replacement is up and finishes its in-flight requests before it is
+    stopped. Workers are spawned and stopped only on the supervisor thread,
+    outside the pool lock.
+    """
+
+    def __init__(
+        self,
+        sandbox: Sandbox,
+        plugin_name: str,
+        entry_point: str,
+        plugin_path: Path,
+        policy: Policy,
+        *,
+        context_config: dict[str, Any] | None = None,
+        size: int = 2,
+        logger: Any = None,
+    ) -> None:
+        """Initialize worker pool.
+
+        Parameters
+        ----------
+        sandbox
+            Sandbox that spawns the worker processes
+        plugin_name
+            Plugin identifier
+        entry_point
+            Entry point in format "module:function"
+        plugin_path
+            Path to plugin directory
+        policy
+            Permission policy for the plugin
+        context_config
+            Configuration to pass to plugin context
+        size
+            Number of worker processes
+        logger
+            Optional logger for worker lifecycle events
+        """
+        if size < 1:
+            raise ValueError("Worker pool size must be at least 1")
+
+        self.plugin_name = plugin_name
+        self.size = size
+        self.config = sandbox.config
+        self._sandbox = sandbox
+        self._spawn_args = (plugin_name, entry_point, plugin_path, policy, context_config)
+        self._logger = logger
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._workers: list[PluginProcess] = []
+        self._draining: list[PluginProcess] = []
+        # Work for the supervisor thread, the only place workers are spawned or stopped
+        self._retiring: list[tuple[PluginProcess, bool]] = []
+        self._recycle_due: list[tuple[PluginProcess, str]] = []
+        self._restarts_due = 0
+        self._maintenance_due = False
+        self._maintain_lock = threading.Lock()
+        self._closed = False
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._supervisor: threading.Thread | None = None
+        self._stats = {"requests": 0, "failures": 0, "recycled": 0, "replaced": 0, "health_checks": 0}
+
+    def start(self) -> None:
+        """Spawn the workers and start the supervisor thread.
+
+        Raises
+        ------
+        SandboxError
+            If a worker cannot be launched
+        """
+        spawned: list[PluginProcess] = []
+        try:
+            while len(spawned) < self.size:
+                spawned.append(self._spawn_worker())
+        except SandboxError:
+            for worker in spawned:
+                worker.terminate(force=True)
+            raise
+        with self._lock:
+            self._workers.extend(spawned)
+
+        if self._supervisor is None:
+            self._supervisor = threading.Thread(
+                target=self._supervise,
+                name=f"kira-plugin-pool-{self.plugin_name}",
+                daemon=True,
+            )
+            self._supervisor.start()
+
+    def call(self, method: str, params: dict[str, Any] | None = None, *, timeout: float | None = None) -> Any:
+        """Call a plugin method on one of the workers.
+
+        Parameters
+        ----------
+        method
+            RPC method name
+        params
+            Method parameters
+        timeout
+            Timeout in seconds (default: ``config.timeout_ms``)
+
+        Returns
+        -------
+        Any
+            Method result
+
+        Raises
+        ------
+        RPCError
+            If the plugin returns an error
+        SandboxError
+            If no worker is available or the worker dies
+        TimeoutError
+            If no response arrives in time; the worker is replaced
+        """
+        worker, future = self._submit(method, params)
+        if timeout is None:
+            timeout = self.config.timeout_ms / 1000.0
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            self._replace(worker, "timeout")
+            raise TimeoutError(f"Timeout waiting for {method} from {self.plugin_name} (timeout={timeout}s)") from None
+
+    def call_async(self, method: str, params: dict[str, Any] | None = None) -> Future[Any]:
+        """Call a plugin method without waiting for the result.
+
+        Parameters
+        ----------
+        method
+            RPC method name
+        params
+            Method parameters
+
+        Returns
+        -------
+        Future
+            Resolves to the method result
+        """
+        return self._submit(method, params)[1]
+
+    def publish(self, event_name: str, payload: dict[str, Any] | None = None, *, timeout: float | None = None) -> Any:
+        """Deliver an event to the plugin's subscribers in a worker.
+
+        Parameters
+        ----------
+        event_name
+            Event name
+        payload
+            Event payload
+        timeout
+            Timeout in seconds
+
+        Returns
+        -------
+        Any
+            Delivery acknowledgement
+        """
+        return self.call("event.publish", {"event": event_name, "payload": payload}, timeout=timeout)
+
+    def _submit(self, method: str, params: dict[str, Any] | None) -> tuple[PluginProcess, Future[Any]]:
+        for _ in range(2):
+            worker = self._acquire()
+            try:
+                future = worker.request_async(method, params)
+            except SandboxError:
+                self._replace(worker, "write failed")
+                continue
+            future.add_done_callback(functools.partial(self._on_done, worker))
+            return worker, future
+        raise SandboxError(f"No healthy worker for {self.plugin_name}")
+
+    def _acquire(self) -> PluginProcess:
+        """Pick the least busy live worker, waiting for a pending replacement."""
+        deadline = time.monotonic() + self.config.timeout_ms / 1000.0
+        with self._changed:
+            while True:
+                if self._closed:
+                    raise SandboxError(f"Worker pool for {self.plugin_name} is closed")
+                for worker in [w for w in self._workers if not w.is_alive()]:
+                    self._replace_locked(worker, "exited")
+                if self._workers:
+                    return min(self._workers, key=lambda w: w.pending_count)
+
+                remaining = deadline - time.monotonic()
+                if not self._maintenance_due or remaining <= 0:
+                    raise SandboxError(f"No workers available for {self.plugin_name}")
+                self._changed.wait(remaining)
+
+    def _on_done(self, worker: PluginProcess, future: Future[Any]) -> None:
+        """Account for a finished request and flag the worker for recycling if due."""
+        with self._lock:
+            self._stats["requests"] += 1
+            if future.exception() is not None:
+                self._stats["failures"] += 1
+
+            if worker in self._draining:
+                if worker.pending_count == 0:
+                    self._draining.remove(worker)
+                    self._retiring.append((worker, False))
+                    self._schedule_maintenance_locked()
+            elif worker in self._workers and not self._closed and all(w is not worker for w, _ in self._recycle_due):
+                reason = self._recycle_reason(worker)
+                if reason is not None:
+                    self._recycle_due.append((worker, reason))
+                    self._schedule_maintenance_locked()
+
+    def _recycle_reason(self, worker: PluginProcess) -> str | None:
+        max_requests = self.config.max_requests_per_worker
+        if max_requests and worker.requests_served >= max_requests:
+            return "max requests"
+
+        max_memory = self.config.max_worker_memory_mb
+        if max_memory:
+            memory = worker.memory_mb()
+            if memory is not None and memory > max_memory:
+                return "memory watermark"
+        return None
+
+    def _replace(self, worker: PluginProcess, reason: str) -> None:
+        with self._lock:
+            if worker in self._workers:
+                self._replace_locked(worker, reason)
+
+    def _replace_locked(self, worker: PluginProcess, reason: str) -> None:
+        """Take a failed worker out of rotation; the supervisor kills and replaces it."""
+        self._workers.remove(worker)
+        self._retiring.append((worker, True))
+        self._restarts_due += 1
+        self._stats["replaced"] += 1
+        self._log("warning", "Replacing plugin worker", worker, reason)
+        self._schedule_maintenance_locked()
+
+    def _schedule_maintenance_locked(self) -> None:
+        self._maintenance_due = True
+        self._wake.set()
+
+    def _maintain(self) -> None:
+        """Stop retired workers, recycle due ones and spawn replacements.
+
+        Runs on the supervisor thread (or in ``check_health``) and never
+        holds the pool lock while a process starts or stops, so a slow
+        spawn does not stall requests to the other workers.
+        """
+        with self._maintain_lock:
+            while True:
+                with self._lock:
+                    retiring, self._retiring = self._retiring, []
+                    due = [(worker, reason) for worker, reason in self._recycle_due if worker in self._workers]
+                    self._recycle_due = []
+                    missing = 0 if self._closed else self.size - len(self._workers)
+                    if not retiring and not due and missing <= 0:
+                        break
+
+                for worker, force in retiring:
+                    worker.terminate(force=force)
+                for worker, reason in due:
+                    self._recycle(worker, reason)
+                if missing > 0 and not self._refill(missing):
+                    break
+
+            with self._lock:
+                self._maintenance_due = bool(self._retiring or self._recycle_due)
+                self._changed.notify_all()
+
+    def _recycle(self, worker: PluginProcess, reason: str) -> None:
+        """Swap a worker for a fresh one; it finishes in-flight requests first."""
+        try:
+            fresh = self._spawn_worker()
+        except SandboxError as exc:
+            # Keep the old worker serving; it is flagged again on its next request
+            self._log("error", f"Failed to spawn plugin worker: {exc}", worker, reason)
+            return
+
+        stop = None
+        with self._lock:
+            if worker in self._workers and not self._closed:
+                self._workers[self._workers.index(worker)] = fresh
+                self._stats["recycled"] += 1
+                self._log("info", "Recycling plugin worker", worker, reason)
+                if worker.pending_count == 0:
+                    stop = worker
+                else:
+                    self._draining.append(worker)
+            elif len(self._workers) < self.size and not self._closed:
+                self._workers.append(fresh)
+            else:
+                stop = fresh
+            self._changed.notify_all()
+
+        if stop is not None:
+            stop.terminate()
+
+    def _refill(self, missing: int) -> bool:
+        """Spawn workers up to the pool size; replacements count as restarts."""
+        for _ in range(missing):
+            with self._lock:
+                restart = self._restarts_due > 0
+            if restart and not self._sandbox._check_restart_allowed(self.plugin_name):
+                self._log("error", "Plugin worker restart limit exceeded", None, "restart limit")
+                return False
+            try:
+                worker = self._spawn_worker()
+            except SandboxError as exc:
+                self._log("error", f"Failed to spawn plugin worker: {exc}", None, "spawn failed")
+                return False
+
+            with self._lock:
+                closed = self._closed
+                if not closed:
+                    self._workers.append(worker)
+                    if restart:
+                        self._restarts_due -= 1
+                        self._sandbox._record_restart(self.plugin_name)
+                    self._changed.notify_all()
+            if closed:
+                worker.terminate(force=True)
+                return False
+        return True
+
+    def _spawn_worker(self) -> PluginProcess:
+        worker = self._sandbox._spawn(*self._spawn_args)
+        worker._ensure_reader()
+        return worker
+
+    def check_health(self, timeout: float = 5.0) -> int:
+        """Ping every worker and replace those that do not answer.
+
+        Parameters
+        ----------
+        timeout
+            Seconds to wait for all pings
+
+        Returns
+        -------
+        int
+            Number of workers replaced
+        """
+        with self._lock:
+            self._stats["health_checks"] += 1
+            workers = list(self._workers)
+
+        pings: list[tuple[PluginProcess, Future[Any] | None]] = []
+        for worker in workers:
+            try:
+                pings.append((worker, worker.request_async("ping")))
+            except SandboxError:
+                pings.append((worker, None))
+
+        deadline = time.monotonic() + timeout
+        unhealthy = []
+        for worker, ping in pings:
+            try:
+                if ping is None:
+                    raise SandboxError("ping failed")
+                ping.result(timeout=max(0.0, deadline - time.monotonic()))
+            except Exception:
+                unhealthy.append(worker)
+
+        with self._lock:
+            for worker in unhealthy:
+                if worker in self._workers:
+                    self._replace_locked(worker, "health check failed")
+            for worker in [] if self._closed else self._workers:
+                reason = self._recycle_reason(worker)
+                if reason is not None and all(w is not worker for w, _ in self._recycle_due):
+                    self._recycle_due.append((worker, reason))
+
+        self._maintain()
+        return len(unhealthy)
+
+    def _supervise(self) -> None:
+        interval = self.config.health_check_interval_seconds
+        next_check = time.monotonic() + interval
+        while not self._stop.is_set():
+            self._wake.wait(max(0.0, next_check - time.monotonic()) if interval > 0 else None)
+            self._wake.clear()
+            if self._stop.is_set():
+                return
+            try:
+                if interval > 0 and time.monotonic() >= next_check:
+                    next_check = time.monotonic() + interval
+                    self.check_health()
+                else:
+                    self._maintain()
+            except Exception as exc:
+                if self._logger:
+                    self._logger.error(f"Plugin pool maintenance failed: {exc}", extra={"plugin": self.plugin_name})
+
+    def _log(self, level: str, message: str, worker: PluginProcess | None, reason: str) -> None:
+        if self._logger:
+            getattr(self._logger, level)(
+                message,
+                extra={
+                    "plugin": self.plugin_name,
+                    "pid": worker.process.pid if worker else None,
+                    "requests_served": worker.requests_served if worker else None,
+                    "reason": reason,
+                },
+            )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get pool statistics.
+
+        Returns
+        -------
+        dict[str, Any]
+            Request counters and per-worker state
+        """
+        with self._lock:
+            workers = [
+                {
+                    "pid": worker.process.pid,
+                    "alive": worker.is_alive(),
+                    "pending": worker.pending_count,
+                    "requests_served": worker.requests_served,
+                    "memory_mb": worker.memory_mb(),
+                }
+                for worker in self._workers
+            ]
+            return {**self._stats, "size": self.size, "draining": len(self._draining), "workers": workers}
+
+    def close(self, force: bool = False) -> None:
+        """Stop health checks and all workers.
+
+        Parameters
+        ----------
+        force
+            If True, use SIGKILL immediately
+        """
+        with self._lock:
+            self._closed = True
+            workers = self._workers + self._draining + [worker for worker, _ in self._retiring]
+            self._workers = []
+            self._draining = []
+            self._retiring = []
+            self._recycle_due = []
+            self._changed.notify_all()
+        self._stop.set()
+        self._wake.set()
+        for worker in workers:
+            worker.terminate(force=force)
+
+    def __enter__(self) -> PluginWorkerPool:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit - stop all workers."""
+        self.close(force=True)
+
+
 def create_sandbox(
     strategy: str = "subprocess",
     timeout_ms: int = 30000,
@@ -2,21 +2,35 @@
 
 Supports interval, at (datetime), and cron triggers with fault handling,
 cancellation, and idempotent scheduling.
+
+The scheduler thread keeps a min-heap of next-run times and sleeps until
+the earliest deadline or until a job is added or cancelled. Due jobs run
+on a bounded worker pool; a job never overlaps with itself, and late runs
+follow per-job misfire and coalescing policies.
 """
 
 from __future__ import annotations
 
+import hashlib
+import heapq
+import itertools
 import threading
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+from .events import LatencyHistogram
+from .job_store import CATCH_UP_POLICIES, JobRecord, trigger_key
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from .job_store import CatchUpPolicy, JobStore
+
 __all__ = [
     "Job",
     "JobStatus",
@@ -26,6 +40,11 @@ __all__ = [
     "create_scheduler",
 ]
 
+# Upper bound on one scheduler sleep, so wall-clock jumps are noticed
+_MAX_SLEEP_SECONDS = 60.0
+# Upper bound on catch-up runs when coalescing is disabled
+_MAX_CATCH_UP_RUNS = 100
+
 
 class TriggerType(Enum):
     """Type of scheduling trigger."""
@@ -105,6 +124,11 @@ class Job:
     error_count: int = 0
     last_error: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    misfire_grace_seconds: float | None = None  # None: late runs always execute
+    coalesce: bool = True  # run once for several missed occurrences
+    misfire_count: int = 0
+    last_lag_seconds: float | None = None
+    last_duration_seconds: float | None = None
 
     def should_run_now(self) -> bool:
         """Check if job should run now."""
@@ -142,6 +166,69 @@ class Job:
         # Cron scheduling (simplified)
         return self._calculate_cron_next_run()
 
+    def missed_runs(self, scheduled_at: float, now: float) -> int:
+        """Count occurrences after ``scheduled_at`` that were also due by ``now``.
+
+        Parameters
+        ----------
+        scheduled_at
+            Run time the scheduler is late for
+        now
+            Current Unix timestamp
+
+        Returns
+        -------
+        int
+            Number of additional missed occurrences (capped)
+        """
+        if self.trigger.type == TriggerType.INTERVAL and self.trigger.interval_seconds:
+            return min(int((now - scheduled_at) // self.trigger.interval_seconds), _MAX_CATCH_UP_RUNS)
+
+        if self.trigger.type == TriggerType.CRON:
+            saved = self.last_run_at
+            missed = 0
+            try:
+                self.last_run_at = scheduled_at
+                next_run = self._calculate_cron_next_run()
+                while next_run is not None and next_run <= now and missed < _MAX_CATCH_UP_RUNS:
+                    missed += 1
+                    self.last_run_at = next_run
+                    next_run = self._calculate_cron_next_run()
+            finally:
+                self.last_run_at = saved
+            return missed
+
+        return 0
+
+    def next_run_after(self, scheduled_at: float, now: float) -> float | None:
+        """First occurrence strictly after ``now``, keeping the job's cadence.
+
+        Parameters
+        ----------
+        scheduled_at
+            Missed run time
+        now
+            Current Unix timestamp
+
+        Returns
+        -------
+        float or None
+            Next run time, or None for one-time jobs
+        """
+        if self.trigger.type == TriggerType.INTERVAL and self.trigger.interval_seconds:
+            step = self.trigger.interval_seconds
+            return scheduled_at + (int((now - scheduled_at) // step) + 1) * step
+
+        if self.trigger.type == TriggerType.CRON:
+            saved = self.last_run_at
+            try:
+                self.last_run_at = now
+                return self._calculate_cron_next_run()
+            finally:
+                self.last_run_at = saved
+
+        return None
+
     def _calculate_cron_next_run(self) -> float | None:
         """Calculate next run for cron trigger.
 
@@ -174,7 +261,9 @@ class Scheduler:
     - Cron triggers (run on cron schedule)
     - Idempotent scheduling (duplicate job_ids update existing)
     - Cancellation support
-    - Missed run handling
+    - Missed run handling (misfire grace and coalescing)
+    - Bounded worker pool; runs of one job never overlap
+    - Lag and run-duration metrics
 
     Example:
         >>> scheduler = Scheduler()
@@ -187,20 +276,76 @@ class Scheduler:
         >>> scheduler.stop()
     """
 
-    def __init__(self, logger: Any = None) -> None:
+    def __init__(
+        self,
+        logger: Any = None,
+        *,
+        max_workers: int = 4,
+        misfire_grace_seconds: float | None = None,
+        coalesce: bool = True,
+        job_store: JobStore | None = None,
+        catch_up: CatchUpPolicy = "run_once",
+        catch_up_spread_seconds: float = 0.0,
+    ) -> None:
         """Initialize scheduler.
 
         Parameters
         ----------
         logger
             Optional logger for structured logging
+        max_workers
+            Worker threads executing jobs
+        misfire_grace_seconds
+            Default for jobs: a run later than this is skipped (None runs
+            late jobs regardless of lag)
+        coalesce
+            Default for jobs: run once for several missed occurrences
+            instead of catching up on each
+        job_store
+            Optional persistent store; registering a job with a known ID
+            and unchanged trigger resumes its stored schedule
+        catch_up
+            Runs missed while the scheduler was down (restored from the
+            store): "run_once" runs each overdue job once, "skip" moves it
+            to its next regular occurrence, "run_all" replays every missed
+            occurrence (capped)
+        catch_up_spread_seconds
+            Spread catch-up runs over this window (stable per job ID) so a
+            restart does not start every overdue job at the same instant
         """
+        if catch_up not in CATCH_UP_POLICIES:
+            raise ValueError(f"Unknown catch-up policy: {catch_up!r}")
+
         self._jobs: dict[str, Job] = {}
         self._logger = logger
         self._running = False
         self._thread: threading.Thread | None = None
         self._lock = threading.Lock()
-        self._stop_event = threading.Event()
+        self._wakeup = threading.Condition(self._lock)
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._misfire_grace_seconds = misfire_grace_seconds
+        self._coalesce = coalesce
+
+        # (next_run_at, tiebreak, job_id, token); stale tokens are skipped
+        self._heap: list[tuple[float, int, str, int]] = []
+        self._tokens: dict[str, int] = {}
+        self._sequence = itertools.count()
+        # Jobs submitted to the pool (job_id -> (future, runs)), and due
+        # times that arrived during a run
+        self._active: dict[str, tuple[Future[None], int]] = {}
+        self._deferred: dict[str, float] = {}
+        self._cancelled_active: set[str] = set()
+
+        self._lag = LatencyHistogram()
+        self._durations: dict[str, LatencyHistogram] = {}
+        self._counters = {"runs": 0, "failures": 0, "misfires": 0, "deferred": 0, "restored": 0}
+
+        self._job_store = job_store
+        self._catch_up_policy = catch_up
+        self._catch_up_spread_seconds = catch_up_spread_seconds
+        # Restored overdue jobs: job_id -> runs for their first dispatch
+        self._catch_up: dict[str, int] = {}
 
     def schedule_interval(
         self,
@@ -210,6 +355,8 @@ class Scheduler:
         *,
         job_id: str | None = None,
         metadata: dict[str, Any] | None = None,
+        misfire_grace_seconds: float | None = None,
+        coalesce: bool | None = None,
     ) -> str:
         """Schedule job to run at regular intervals.
 
@@ -225,6 +372,10 @@ class Scheduler:
             Optional stable job ID (generated if not provided)
         metadata
             Optional metadata dictionary
+        misfire_grace_seconds
+            Skip runs later than this (default: scheduler setting)
+        coalesce
+            Collapse missed runs into one (default: scheduler setting)
 
         Returns
         -------
@@ -237,7 +388,7 @@ class Scheduler:
         job_id = job_id or str(uuid.uuid4())
         trigger = Trigger.interval(interval_seconds)
 
-        return self._add_job(job_id, name, trigger, callable, metadata)
+        return self._add_job(job_id, name, trigger, callable, metadata, misfire_grace_seconds, coalesce)
 
     def schedule_at(
         self,
@@ -247,6 +398,7 @@ class Scheduler:
         *,
         job_id: str | None = None,
         metadata: dict[str, Any] | None = None,
+        misfire_grace_seconds: float | None = None,
     ) -> str:
         """Schedule job to run once at specific datetime.
 
@@ -262,6 +414,9 @@ class Scheduler:
             Optional stable job ID (generated if not provided)
         metadata
             Optional metadata dictionary
+        misfire_grace_seconds
+            Skip the run if it starts later than this (default: scheduler
+            setting)
 
         Returns
         -------
@@ -271,7 +426,7 @@ class Scheduler:
         job_id = job_id or str(uuid.uuid4())
         trigger = Trigger.at(target)
 
-        return self._add_job(job_id, name, trigger, callable, metadata)
+        return self._add_job(job_id, name, trigger, callable, metadata, misfire_grace_seconds, None)
 
     def schedule_cron(
         self,
@@ -281,6 +436,8 @@ class Scheduler:
         *,
         job_id: str | None = None,
         metadata: dict[str, Any] | None = None,
+        misfire_grace_seconds: float | None = None,
+        coalesce: bool | None = None,
     ) -> str:
         """Schedule job using cron expression.
 
@@ -296,6 +453,10 @@ class Scheduler:
             Optional stable job ID (generated if not provided)
         metadata
             Optional metadata dictionary
+        misfire_grace_seconds
+            Skip runs later than this (default: scheduler setting)
+        coalesce
+            Collapse missed runs into one (default: scheduler setting)
 
         Returns
         -------
@@ -305,7 +466,7 @@ class Scheduler:
         job_id = job_id or str(uuid.uuid4())
         trigger = Trigger.cron(cron_expression)
 
-        return self._add_job(job_id, name, trigger, callable, metadata)
+        return self._add_job(job_id, name, trigger, callable, metadata, misfire_grace_seconds, coalesce)
 
     def _add_job(
         self,
@@ -314,6 +475,8 @@ class Scheduler:
         trigger: Trigger,
         callable: Callable[[], Any],
         metadata: dict[str, Any] | None,
+        misfire_grace_seconds: float | None = None,
+        coalesce: bool | None = None,
     ) -> str:
         """Add or update job (idempotent).
 
@@ -329,6 +492,10 @@ class Scheduler:
             Callable to execute
         metadata
             Optional metadata
+        misfire_grace_seconds
+            Per-job misfire grace (None: scheduler default)
+        coalesce
+            Per-job coalescing (None: scheduler default)
 
         Returns
         -------
@@ -342,12 +509,23 @@ class Scheduler:
                 trigger=trigger,
                 callable=callable,
                 metadata=metadata or {},
+                misfire_grace_seconds=(
+                    misfire_grace_seconds if misfire_grace_seconds is not None else self._misfire_grace_seconds
+                ),
+                coalesce=coalesce if coalesce is not None else self._coalesce,
             )
 
             # Calculate first run
             job.next_run_at = job.calculate_next_run()
+            self._catch_up.pop(job_id, None)
+            if self._job_store is not None:
+                self._restore(job)
 
             self._jobs[job_id] = job
+            self._deferred.pop(job_id, None)
+            self._cancelled_active.discard(job_id)
+            self._push(job)
+            self._persist(job)
 
             if self._logger:
                 self._logger.info(
@@ -381,6 +559,12 @@ class Scheduler:
                 return False
 
             job.status = JobStatus.CANCELLED
+            self._tokens.pop(job_id, None)
+            self._deferred.pop(job_id, None)
+            self._catch_up.pop(job_id, None)
+            if job_id in self._active:
+                self._cancelled_active.add(job_id)
+            self._persist(job)
 
             if self._logger:
                 self._logger.info(
@@ -426,13 +610,31 @@ class Scheduler:
 
         return jobs
 
+    def get_stats(self) -> dict[str, Any]:
+        """Get scheduling metrics.
+
+        Returns
+        -------
+        dict[str, Any]
+            Run/failure/misfire counters, dispatch lag histogram (time from
+            scheduled run to start, in ms) and per-job run durations
+        """
+        with self._lock:
+            return {
+                **self._counters,
+                "jobs": len(self._jobs),
+                "active": len(self._active),
+                "lag": self._lag.to_dict(),
+                "durations": {job_id: histogram.to_dict() for job_id, histogram in self._durations.items()},
+            }
+
     def start(self) -> None:
         """Start scheduler thread."""
         if self._running:
             return
 
         self._running = True
-        self._stop_event.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="kira-scheduler")
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
 
@@ -442,6 +644,9 @@ class Scheduler:
     def stop(self, timeout: float = 5.0) -> None:
         """Stop scheduler thread.
 
+        Jobs already running finish in the background; queued runs are
+        discarded.
+
         Parameters
         ----------
         timeout
@@ -450,18 +655,53 @@ class Scheduler:
         if not self._running:
             return
 
-        self._running = False
-        self._stop_event.set()
+        with self._wakeup:
+            self._running = False
+            self._wakeup.notify_all()
 
         if self._thread:
             self._thread.join(timeout=timeout)
             self._thread = None
 
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._requeue_cancelled()
+
         if self._logger:
             self._logger.info("Scheduler stopped")
 
+    def _requeue_cancelled(self) -> None:
+        """Return runs discarded by ``stop()`` to the heap for the next start."""
+        with self._lock:
+            for job_id, (future, runs) in list(self._active.items()):
+                if not future.cancelled():
+                    continue
+                del self._active[job_id]
+                self._deferred.pop(job_id, None)
+                job = self._jobs[job_id]
+                if job_id in self._cancelled_active:
+                    self._cancelled_active.discard(job_id)
+                    continue
+                job.status = JobStatus.PENDING
+                if runs > 1:
+                    # Keep catch-up runs owed to the job
+                    self._catch_up[job_id] = runs
+                self._push(job)
+
+    def _push(self, job: Job) -> None:
+        """Queue the job's next run and wake the loop (caller holds the lock)."""
+        if job.next_run_at is None or job.status in (JobStatus.CANCELLED, JobStatus.COMPLETED):
+            self._tokens.pop(job.job_id, None)
+            return
+
+        token = next(self._sequence)
+        self._tokens[job.job_id] = token
+        heapq.heappush(self._heap, (job.next_run_at, token, job.job_id, token))
+        self._wakeup.notify_all()
+
     def _run_loop(self) -> None:
-        """Main scheduler loop."""
+        """Main scheduler loop: sleep until the earliest deadline or a wakeup."""
         while self._running:
             try:
                 self._tick()
@@ -469,43 +709,111 @@ class Scheduler:
                 if self._logger:
                     self._logger.error(f"Scheduler tick error: {exc}")
 
-            # Sleep with interruptible wait
-            self._stop_event.wait(timeout=0.1)
+            with self._wakeup:
+                if self._running:
+                    timeout = self._seconds_until_next_run()
+                    if timeout > 0:
+                        self._wakeup.wait(timeout=timeout)
+
+    def _seconds_until_next_run(self) -> float:
+        """Sleep time until the heap head is due, capped (caller holds the lock)."""
+        if not self._heap:
+            return _MAX_SLEEP_SECONDS
+        return min(self._heap[0][0] - time.time(), _MAX_SLEEP_SECONDS)
 
     def _tick(self) -> None:
-        """Process one scheduler tick."""
-        time.time()
+        """Dispatch due jobs."""
+        now = time.time()
+        due: list[tuple[Job, float]] = []
 
-        # Find jobs ready to run
-        jobs_to_run: list[Job] = []
         with self._lock:
-            for job in self._jobs.values():
-                if job.should_run_now():
-                    jobs_to_run.append(job)
+            while self._heap and self._heap[0][0] <= now:
+                scheduled_at, _, job_id, token = heapq.heappop(self._heap)
+                if self._tokens.get(job_id) != token:
+                    continue  # rescheduled or cancelled since queued
+                del self._tokens[job_id]
+
+                job = self._jobs[job_id]
+                if job_id in self._active:
+                    # Never overlap runs of one job: run again once it finishes
+                    self._deferred.setdefault(job_id, scheduled_at)
+                    self._counters["deferred"] += 1
+                    continue
+                due.append((job, scheduled_at))
+
+            for job, scheduled_at in due:
+                self._dispatch(job, scheduled_at, now)
+
+    def _dispatch(self, job: Job, scheduled_at: float, now: float) -> None:
+        """Apply misfire policy and submit a due job (caller holds the lock)."""
+        lag = max(now - scheduled_at, 0.0)
+        job.last_lag_seconds = lag
+
+        runs = self._catch_up.pop(job.job_id, None)
+        if runs is None:
+            if job.misfire_grace_seconds is not None and lag > job.misfire_grace_seconds:
+                self._misfire(job, lag, now)
+                return
+            runs = 1 if job.coalesce else 1 + job.missed_runs(scheduled_at, now)
+
+        if self._executor is None:
+            # Stopped mid-tick: keep the run for the next start()
+            self._push(job)
+            return
+
+        self._lag.observe(lag * 1000)
+        job.status = JobStatus.RUNNING
+        self._active[job.job_id] = (self._executor.submit(self._execute_job, job, runs), runs)
+
+    def _misfire(self, job: Job, lag: float, now: float) -> None:
+        """Skip a run that is later than the job's misfire grace (caller holds the lock)."""
+        job.misfire_count += 1
+        self._counters["misfires"] += 1
+
+        if job.trigger.type == TriggerType.AT:
+            job.status = JobStatus.FAILED
+            job.last_error = f"Missed run by {lag:.1f}s"
+            job.next_run_at = None
+        else:
+            # Resume the schedule from now without running the missed occurrence
+            job.last_run_at = now
+            job.next_run_at = job.calculate_next_run()
+            self._push(job)
+        self._persist(job)
 
-        # Execute jobs
-        for job in jobs_to_run:
-            self._execute_job(job)
+        if self._logger:
+            self._logger.warning(
+                f"Job misfired: {job.name}",
+                extra={
+                    "job_id": job.job_id,
+                    "name": job.name,
+                    "lag_seconds": lag,
+                    "misfire_grace_seconds": job.misfire_grace_seconds,
+                },
+            )
 
-    def _execute_job(self, job: Job) -> None:
+    def _execute_job(self, job: Job, runs: int = 1) -> None:
         """Execute a single job.
 
         Parameters
         ----------
         job
             Job to execute
+        runs
+            Number of consecutive runs (catch-up when coalescing is off)
         """
         job.status = JobStatus.RUNNING
         start_time = time.time()
 
         try:
             # Call the job callable
-            job.callable()
+            for _ in range(runs):
+                job.callable()
+                job.run_count += 1
 
             # Update job state
             job.status = JobStatus.PENDING  # Ready for next run
             job.last_run_at = start_time
-            job.run_count += 1
             job.last_error = None
 
             # Calculate next run
@@ -553,6 +861,134 @@ class Scheduler:
                     },
                 )
 
+        self._finish_job(job, time.time() - start_time)
+
+    def _finish_job(self, job: Job, duration: float) -> None:
+        """Record metrics and queue the next run after an execution."""
+        with self._lock:
+            job.last_duration_seconds = duration
+            self._durations.setdefault(job.job_id, LatencyHistogram()).observe(duration * 1000)
+            self._counters["runs"] += 1
+            if job.last_error is not None and job.status != JobStatus.COMPLETED:
+                self._counters["failures"] += 1
+            self._active.pop(job.job_id, None)
+            deferred = self._deferred.pop(job.job_id, None)
+
+            if job.job_id in self._cancelled_active:
+                self._cancelled_active.discard(job.job_id)
+                job.status = JobStatus.CANCELLED
+                return
+
+            current = self._jobs.get(job.job_id)
+            if current is not job:
+                # Replaced while running: release the replacement's deferred run
+                if current is not None and deferred is not None:
+                    self._push(current)
+                return
+
+            if deferred is not None and job.next_run_at is not None:
+                # A run came due while this one was executing
+                job.next_run_at = min(job.next_run_at, deferred)
+            self._push(job)
+            self._persist(job)
+
+    def _restore(self, job: Job) -> None:
+        """Resume a job from the job store (caller holds the lock)."""
+        assert self._job_store is not None
+        try:
+            record = self._job_store.load(job.job_id)
+        except Exception as exc:
+            self._log_store_error("load", job, exc)
+            return
+        if record is None or record.trigger_key != trigger_key(job.trigger):
+            return  # new job, or its schedule changed: start fresh
+
+        self._counters["restored"] += 1
+        job.last_run_at = record.last_run_at
+        job.run_count = record.run_count
+        job.error_count = record.error_count
+        job.last_error = record.last_error
+
+        if record.status == JobStatus.COMPLETED.value:
+            job.status = JobStatus.COMPLETED
+            job.next_run_at = None
+            return
+        if record.status == JobStatus.FAILED.value and record.next_run_at is None:
+            job.status = JobStatus.FAILED  # one-time job that already missed
+            job.next_run_at = None
+            return
+
+        # A cancelled or failed job that is registered again is active again
+        next_run = record.next_run_at if record.next_run_at is not None else job.calculate_next_run()
+        now = time.time()
+        if next_run is None or next_run > now:
+            job.next_run_at = next_run
+            return
+
+        self._apply_catch_up(job, next_run, now)
+
+    def _apply_catch_up(self, job: Job, missed_at: float, now: float) -> None:
+        """Schedule a run missed during downtime per the catch-up policy."""
+        if self._catch_up_policy == "skip":
+            job.misfire_count += 1
+            self._counters["misfires"] += 1
+            job.next_run_at = job.next_run_after(missed_at, now)
+            if job.next_run_at is None:
+                job.status = JobStatus.FAILED
+                job.last_error = f"Missed run by {now - missed_at:.1f}s while stopped"
+            return
+
+        runs = 1 if self._catch_up_policy == "run_once" else 1 + job.missed_runs(missed_at, now)
+        self._catch_up[job.job_id] = runs
+        job.next_run_at = now + self._catch_up_offset(job.job_id)
+
+        if self._logger:
+            self._logger.info(
+                f"Job catching up after downtime: {job.name}",
+                extra={
+                    "job_id": job.job_id,
+                    "missed_at": missed_at,
+                    "runs": runs,
+                    "policy": self._catch_up_policy,
+                },
+            )
+
+    def _catch_up_offset(self, job_id: str) -> float:
+        """Stable per-job delay within the catch-up spread window."""
+        if self._catch_up_spread_seconds <= 0:
+            return 0.0
+        digest = hashlib.sha1(job_id.encode("utf-8"), usedforsecurity=False).hexdigest()
+        return int(digest[:8], 16) / 0xFFFFFFFF * self._catch_up_spread_seconds
+
+    def _persist(self, job: Job) -> None:
+        """Write job state to the job store, if configured."""
+        if self._job_store is None:
+            return
+
+        record = JobRecord(
+            job_id=job.job_id,
+            name=job.name,
+            trigger_key=trigger_key(job.trigger),
+            status=job.status.value,
+            next_run_at=job.next_run_at,
+            last_run_at=job.last_run_at,
+            run_count=job.run_count,
+            error_count=job.error_count,
+            last_error=job.last_error,
+        )
+        try:
+            self._job_store.save(record)
+        except Exception as exc:
+            self._log_store_error("save", job, exc)
+
+    def _log_store_error(self, action: str, job: Job, exc: Exception) -> None:
+        """Job store failures degrade to in-memory scheduling."""
+        if self._logger:
+            self._logger.error(
+                f"Job store {action} failed: {job.name}",
+                extra={"job_id": job.job_id, "error": str(exc)},
+            )
+
     def is_running(self) -> bool:
         """Check if scheduler is running.
 
@@ -573,17 +1009,46 @@ class Scheduler:
         self.stop()
 
 
-def create_scheduler(logger: Any = None) -> Scheduler:
+def create_scheduler(
+    logger: Any = None,
+    *,
+    max_workers: int = 4,
+    misfire_grace_seconds: float | None = None,
+    coalesce: bool = True,
+    job_store: JobStore | None = None,
+    catch_up: CatchUpPolicy = "run_once",
+    catch_up_spread_seconds: float = 0.0,
+) -> Scheduler:
     """Factory function to create scheduler.
 
     Parameters
     ----------
     logger
         Optional logger instance
+    max_workers
+        Worker threads executing jobs
+    misfire_grace_seconds
+        Default misfire grace for jobs (None: always run late jobs)
+    coalesce
+        Default coalescing of missed runs
+    job_store
+        Optional persistent store for job state across restarts
+    catch_up
+        Policy for runs missed while stopped: "run_once", "skip" or "run_all"
+    catch_up_spread_seconds
+        Window over which catch-up runs are spread
 
     Returns
     -------
     Scheduler
         Configured scheduler
     """
-    return Scheduler(logger=logger)
+    return Scheduler(
+        logger=logger,
+        max_workers=max_workers,
+        misfire_grace_seconds=misfire_grace_seconds,
+        coalesce=coalesce,
+        job_store=job_store,
+        catch_up=catch_up,
+        catch_up_spread_seconds=catch_up_spread_seconds,
+    )
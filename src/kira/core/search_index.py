@@ -0,0 +1,273 @@
+"""Full-text search over Vault entities (ADR-006).
+
+Inverted index built on SQLite FTS5 and stored next to the entity
+metadata index. Ranking uses BM25 with titles weighted above tags and
+tags above bodies.
+
+Text is normalized before indexing and querying (NFKC, case folding,
+``ё`` → ``е``) so mixed Russian/English notes match regardless of case
+or spelling variant.
+
+Query syntax:
+- bare words are prefix-matched (``купи`` finds ``купить``, ``купил``)
+- ``"quoted phrases"`` must appear as consecutive words
+- all words and phrases must match
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    from .entity_index import IndexedEntity
+
+__all__ = [
+    "FullTextIndex",
+    "SearchHit",
+    "SearchResults",
+    "build_match_query",
+    "normalize_search_text",
+    "tokenize",
+]
+
+# BM25 column weights: title, body, tags
+BM25_WEIGHTS = (10.0, 1.0, 5.0)
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+_QUERY_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def normalize_search_text(text: str) -> str:
+    """Normalize text for indexing and querying.
+
+    Parameters
+    ----------
+    text
+        Raw text
+
+    Returns
+    -------
+    str
+        Case-folded NFKC text with ``ё`` folded to ``е``
+    """
+    return unicodedata.normalize("NFKC", text).casefold().replace("ё", "е")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into normalized word tokens.
+
+    Parameters
+    ----------
+    text
+        Raw text
+
+    Returns
+    -------
+    list[str]
+        Tokens (same word boundaries as the FTS5 ``unicode61`` tokenizer)
+    """
+    return _TOKEN_PATTERN.findall(normalize_search_text(text).replace("_", " "))
+
+
+def build_match_query(query: str) -> str | None:
+    """Translate a user query into an FTS5 MATCH expression.
+
+    Parameters
+    ----------
+    query
+        User query
+
+    Returns
+    -------
+    str | None
+        MATCH expression, or None if the query has no searchable words
+    """
+    clauses: list[str] = []
+
+    for match in _QUERY_PATTERN.finditer(query):
+        phrase, word = match.groups()
+        if phrase is not None:
+            tokens = tokenize(phrase)
+            if tokens:
+                clauses.append('"' + " ".join(tokens) + '"')
+        else:
+            clauses.extend(f'"{token}"*' for token in tokenize(word))
+
+    return " AND ".join(clauses) if clauses else None
+
+
+@dataclass
+class SearchHit:
+    """Single full-text search result.
+
+    Attributes
+    ----------
+    entity : IndexedEntity
+        Matching entity
+    score : float
+        BM25 relevance (higher is better)
+    """
+
+    entity: IndexedEntity
+    score: float
+
+
+@dataclass
+class SearchResults:
+    """Page of full-text search results.
+
+    Attributes
+    ----------
+    hits : list[SearchHit]
+        Results ordered by relevance
+    total : int
+        Total number of matches ignoring limit/offset
+    """
+
+    hits: list[SearchHit]
+    total: int
+
+
+class FullTextIndex:
+    """FTS5 table maintained alongside the entity index.
+
+    Operates on a connection owned by ``EntityIndex``; rows are keyed by
+    the same relative file path.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        """Create FTS5 table if needed.
+
+        Parameters
+        ----------
+        conn
+            Entity index connection
+
+        Raises
+        ------
+        sqlite3.OperationalError
+            If SQLite was built without FTS5
+        """
+        conn.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS entity_fts USING fts5(
+                title, body, tags, path UNINDEXED,
+                tokenize = 'unicode61'
+            )
+        """
+        )
+
+    def index_document(
+        self,
+        conn: sqlite3.Connection,
+        path: str,
+        metadata: dict[str, Any],
+        body: str,
+        tags: list[str],
+    ) -> None:
+        """Index (or re-index) the text of one entity file.
+
+        Parameters
+        ----------
+        conn
+            Entity index connection
+        path
+            Relative file path
+        metadata
+            Entity frontmatter
+        body
+            Markdown body
+        tags
+            Entity tags
+        """
+        self.remove(conn, path)
+        title = metadata.get("title")
+        conn.execute(
+            "INSERT INTO entity_fts (title, body, tags, path) VALUES (?, ?, ?, ?)",
+            (
+                normalize_search_text(str(title)) if title is not None else "",
+                normalize_search_text(body),
+                normalize_search_text(" ".join(tags)),
+                path,
+            ),
+        )
+
+    def remove(self, conn: sqlite3.Connection, path: str) -> None:
+        """Remove a file from the full-text index.
+
+        Parameters
+        ----------
+        conn
+            Entity index connection
+        path
+            Relative file path
+        """
+        conn.execute("DELETE FROM entity_fts WHERE path = ?", (path,))
+
+    def search(
+        self,
+        conn: sqlite3.Connection,
+        match_query: str,
+        *,
+        clauses: list[str],
+        params: list[Any],
+        limit: int | None,
+        offset: int,
+    ) -> tuple[list[tuple[sqlite3.Row, float]], int]:
+        """Run a ranked query joined with entity index rows.
+
+        Parameters
+        ----------
+        conn
+            Entity index connection
+        match_query
+            FTS5 MATCH expression
+        clauses
+            Additional WHERE clauses on ``entity_index`` (aliased ``e``)
+        params
+            Parameters for ``clauses``
+        limit
+            Optional result limit
+        offset
+            Result offset
+
+        Returns
+        -------
+        tuple[list[tuple[sqlite3.Row, float]], int]
+            (entity index row, score) pairs and total number of matches
+        """
+        weights = ", ".join(str(weight) for weight in BM25_WEIGHTS)
+        # bm25() only works in a plain FTS scan, so rank in a subquery
+        source = f"""
+            (SELECT path, -bm25(entity_fts, {weights}) AS score FROM entity_fts WHERE entity_fts MATCH ?) m
+            JOIN entity_index e ON e.path = m.path
+        """
+        where = " AND ".join(clauses) if clauses else "1"
+        sql = f"""
+            SELECT e.*, m.score AS score, COUNT(*) OVER () AS total
+            FROM {source}
+            WHERE {where}
+            ORDER BY m.score DESC, e.path
+        """
+        query_params: list[Any] = [match_query, *params]
+        if limit:
+            sql += " LIMIT ? OFFSET ?"
+            query_params.extend([limit, offset])
+        elif offset:
+            sql += " LIMIT -1 OFFSET ?"
+            query_params.append(offset)
+
+        rows = conn.execute(sql, query_params).fetchall()
+        if not rows:
+            total = 0
+            if offset:
+                count_sql = f"SELECT COUNT(*) FROM {source} WHERE {where}"
+                total = conn.execute(count_sql, [match_query, *params]).fetchone()[0]
+            return [], total
+
+        return [(row, row["score"]) for row in rows], rows[0]["total"]
@@ -224,7 +224,7 @@ class VaultFacade:
         Parameters
         ----------
         query
-            Search query (searches title and content)
+            Search query (searches title, content and tags)
         entity_type
             Optional filter by entity type
         limit
@@ -238,21 +238,7 @@ class VaultFacade:
         Example:
             >>> results = vault.search_entities("urgent", entity_type="task")
         """
-        # Simple implementation - search in title and content
-        results = []
-        query_lower = query.lower()
-
-        for entity in self._host.list_entities(entity_type):
-            title = entity.metadata.get("title", "").lower()
-            content_lower = entity.content.lower()
-
-            if query_lower in title or query_lower in content_lower:
-                results.append(entity)
-
-            if len(results) >= limit:
-                break
-
-        return results
+        return self._host.search_entities(query, entity_type, limit=limit)
 
 
 def create_vault_facade(host_api: HostAPI) -> VaultFacade:
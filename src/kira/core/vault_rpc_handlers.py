@@ -2,20 +2,49 @@
 
 This module provides RPC method handlers that the host uses to service
 Vault operation requests from plugins running in sandboxed subprocesses.
+
+``vault.list`` and ``vault.search`` return one page at a time together
+with an opaque ``next_cursor`` continuation token, and can project entities
+down to selected frontmatter fields. Paging is opt-in for ``vault.list``:
+without ``limit`` or ``cursor`` it returns every matching entity. The ``*.stream`` variants push pages
+to the plugin as ``vault.stream.chunk`` notifications instead, so neither
+side ever holds more than one page regardless of vault size.
 """
 
 from __future__ import annotations
 
+import base64
+import binascii
+import hashlib
+import json
+import uuid
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from .host import HostAPI
+    from collections.abc import Callable, Iterable, Iterator
+
+    from .host import Entity, HostAPI
 
 __all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "MAX_PAGE_SIZE",
+    "STREAM_CHUNK_METHOD",
     "VaultRPCHandlers",
     "register_vault_rpc_handlers",
 ]
 
+DEFAULT_PAGE_SIZE = 100
+"""Page size for a ``vault.list`` cursor or stream given no ``limit``."""
+
+MAX_PAGE_SIZE = 1000
+"""Upper bound on ``limit`` for paginated and streamed calls."""
+
+STREAM_CHUNK_METHOD = "vault.stream.chunk"
+"""Notification carrying one page of a ``*.stream`` call."""
+
+_CURSOR_VERSION = 1
+
 
 class VaultRPCHandlers:
     """RPC method handlers for Vault operations.
@@ -183,38 +212,32 @@ class VaultRPCHandlers:
         params
             RPC parameters with keys:
             - entity_type (str, optional): Filter by type
-            - limit (int, optional): Maximum results
-            - offset (int, optional): Skip first N results
+            - status (str, optional): Filter by ``status``
+            - tags (list[str], optional): Entities having any of the tags
+            - limit (int, optional): Page size; without ``limit`` and
+              ``cursor`` all matching entities are returned in one result
+            - cursor (str, optional): ``next_cursor`` of the previous page
+              (page size ``DEFAULT_PAGE_SIZE`` unless ``limit`` is given)
+            - offset (int, optional): Skip first N results (without cursor)
+            - fields (list[str], optional): Frontmatter keys to return
+            - include_content (bool, optional): Return bodies (default True)
 
         Returns
         -------
         dict
-            List of entities and pagination info
+            Page of entities, pagination info and ``next_cursor``
+            (None on the last page)
+
+        Raises
+        ------
+        ValueError
+            If the cursor is malformed or belongs to a different query
 
         Example RPC call:
             method: "vault.list"
-            params: {"entity_type": "task", "limit": 10}
+            params: {"entity_type": "task", "limit": 10, "fields": ["title"]}
         """
-        entity_type = params.get("entity_type")
-        limit = params.get("limit")
-        offset = params.get("offset", 0)
-
-        entities = list(self.host_api.list_entities(entity_type, limit=limit, offset=offset))
-
-        return {
-            "entities": [
-                {
-                    "id": e.id,
-                    "entity_type": e.entity_type,
-                    "metadata": e.metadata,
-                    "content": e.content,
-                    "path": str(e.path) if e.path else None,
-                }
-                for e in entities
-            ],
-            "count": len(entities),
-            "offset": offset,
-        }
+        return self._page("list", params)
 
     def handle_vault_upsert(self, params: dict[str, Any]) -> dict[str, Any]:
         """Handle vault.upsert RPC call.
@@ -290,59 +313,249 @@ class VaultRPCHandlers:
             RPC parameters with keys:
             - query (str): Search query
             - entity_type (str, optional): Filter by type
-            - limit (int, optional): Maximum results
+            - status (str, optional): Filter by ``status``
+            - tags (list[str], optional): Entities having any of the tags
+            - limit (int, optional): Page size (default 50)
+            - cursor (str, optional): ``next_cursor`` of the previous page
+            - fields (list[str], optional): Frontmatter keys to return
+            - include_content (bool, optional): Return bodies (default True)
 
         Returns
         -------
         dict
-            Search results
+            Page of search results and ``next_cursor``
+
+        Raises
+        ------
+        ValueError
+            If the cursor is malformed or belongs to a different query
 
         Example RPC call:
             method: "vault.search"
             params: {"query": "urgent", "entity_type": "task"}
         """
-        query = params.get("query", "")
+        if not params.get("query"):
+            return {"entities": [], "count": 0, "next_cursor": None}
+
+        return self._page("search", params)
+
+    def handle_vault_list_stream(
+        self, params: dict[str, Any], notify: Callable[[str, dict[str, Any]], None]
+    ) -> dict[str, Any]:
+        """Handle vault.list.stream RPC call.
+
+        Pushes every page of ``vault.list`` as a ``vault.stream.chunk``
+        notification before responding. Pages are fetched lazily, and a
+        plugin that stops reading blocks the pipe, which in turn pauses
+        the host.
+
+        Parameters
+        ----------
+        params
+            ``vault.list`` parameters (``limit`` sets the chunk size), plus
+            optional ``stream_id`` echoed in every chunk
+        notify
+            Sends a notification to the calling plugin
+
+        Returns
+        -------
+        dict
+            Summary with keys: stream_id, chunks, count
+
+        Example RPC call:
+            method: "vault.list.stream"
+            params: {"entity_type": "task", "fields": ["title", "status"]}
+        """
+        return self._stream("list", params, notify)
+
+    def handle_vault_search_stream(
+        self, params: dict[str, Any], notify: Callable[[str, dict[str, Any]], None]
+    ) -> dict[str, Any]:
+        """Handle vault.search.stream RPC call.
+
+        Streaming counterpart of ``vault.search``; see
+        ``handle_vault_list_stream``.
+
+        Parameters
+        ----------
+        params
+            ``vault.search`` parameters plus optional ``stream_id``
+        notify
+            Sends a notification to the calling plugin
+
+        Returns
+        -------
+        dict
+            Summary with keys: stream_id, chunks, count
+        """
+        if not params.get("query"):
+            stream_id = params.get("stream_id") or uuid.uuid4().hex
+            return {"stream_id": stream_id, "chunks": 0, "count": 0}
+
+        return self._stream("search", params, notify)
+
+    def iter_pages(self, kind: str, params: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """Iterate over all pages of a ``vault.list`` or ``vault.search`` call.
+
+        Each page is fetched only when the previous one has been consumed.
+
+        Parameters
+        ----------
+        kind
+            ``"list"`` or ``"search"``
+        params
+            RPC parameters; an initial ``cursor`` resumes an earlier walk
+
+        Yields
+        ------
+        dict
+            Page results as returned by the corresponding handler
+        """
+        page_params = dict(params)
+        page_params.setdefault("limit", DEFAULT_PAGE_SIZE)
+        while True:
+            page = self._page(kind, page_params)
+            yield page
+            if page["next_cursor"] is None:
+                return
+            page_params["cursor"] = page["next_cursor"]
+
+    def _stream(
+        self, kind: str, params: dict[str, Any], notify: Callable[[str, dict[str, Any]], None]
+    ) -> dict[str, Any]:
+        stream_id = params.get("stream_id") or uuid.uuid4().hex
+        chunks = 0
+        count = 0
+        for page in self.iter_pages(kind, params):
+            notify(
+                STREAM_CHUNK_METHOD,
+                {
+                    "stream_id": stream_id,
+                    "seq": chunks,
+                    "entities": page["entities"],
+                    "last": page["next_cursor"] is None,
+                },
+            )
+            chunks += 1
+            count += page["count"]
+        return {"stream_id": stream_id, "chunks": chunks, "count": count}
+
+    def _page(self, kind: str, params: dict[str, Any]) -> dict[str, Any]:
         entity_type = params.get("entity_type")
-        limit = params.get("limit", 50)
-
-        if not query:
-            return {"entities": [], "count": 0}
-
-        # Simple search implementation
-        results = []
-        query_lower = query.lower()
-
-        for entity in self.host_api.list_entities(entity_type):
-            title = entity.metadata.get("title", "").lower()
-            content_lower = entity.content.lower()
-
-            if query_lower in title or query_lower in content_lower:
-                results.append(
-                    {
-                        "id": entity.id,
-                        "entity_type": entity.entity_type,
-                        "metadata": entity.metadata,
-                        "content": entity.content,
-                        "path": str(entity.path) if entity.path else None,
-                    }
-                )
-
-            if len(results) >= limit:
+        status = params.get("status")
+        tags = params.get("tags")
+        query = params.get("query", "") if kind == "search" else None
+        query_key = _query_key(kind, query, entity_type, status, tags)
+        cursor = params.get("cursor")
+        offset = _decode_cursor(cursor, query_key) if cursor else int(params.get("offset") or 0)
+
+        fields = params.get("fields")
+        include_content = params.get("include_content", True)
+        if kind == "list" and params.get("limit") is None and not cursor:
+            # Unpaged call, as before cursors existed
+            found_all = self.host_api.list_entities(entity_type, offset=offset, status=status, tags=tags)
+            listed = [_serialize_entity(entity, fields, include_content) for entity in found_all]
+            return {"entities": listed, "count": len(listed), "next_cursor": None, "offset": offset}
+
+        limit = _page_size(params.get("limit"), DEFAULT_PAGE_SIZE if kind == "list" else 50)
+
+        # One extra entity tells whether another page exists
+        found: Iterable[Entity]
+        if kind == "search":
+            # Ranked full-text search (falls back to scanning without index)
+            found = self.host_api.search_entities(
+                query or "", entity_type, status=status, tags=tags, limit=limit + 1, offset=offset
+            )
+        else:
+            found = self.host_api.list_entities(entity_type, limit=limit + 1, offset=offset, status=status, tags=tags)
+
+        entities: list[dict[str, Any]] = []
+        has_more = False
+        for entity in found:
+            if len(entities) == limit:
+                has_more = True
                 break
+            entities.append(_serialize_entity(entity, fields, include_content))
 
-        return {
-            "entities": results,
-            "count": len(results),
+        result: dict[str, Any] = {
+            "entities": entities,
+            "count": len(entities),
+            "next_cursor": _encode_cursor(offset + limit, query_key) if has_more else None,
         }
-
-
-def register_vault_rpc_handlers(host_api: HostAPI) -> dict[str, Any]:
+        if kind == "list":
+            result["offset"] = offset
+        return result
+
+
+def _page_size(value: Any, default: int) -> int:
+    if value is None:
+        return default
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError(f"limit must be a positive integer, got {value!r}")
+    return min(value, MAX_PAGE_SIZE)
+
+
+def _serialize_entity(entity: Entity, fields: list[str] | None, include_content: bool) -> dict[str, Any]:
+    """Entity as an RPC dict, projected to ``fields`` when given."""
+    metadata = entity.metadata
+    if fields is not None:
+        metadata = {key: metadata[key] for key in fields if key in metadata}
+
+    data: dict[str, Any] = {
+        "id": entity.id,
+        "entity_type": entity.entity_type,
+        "metadata": metadata,
+        "path": str(entity.path) if entity.path else None,
+    }
+    if include_content:
+        # Bodies are loaded lazily, so skipping them avoids reading the file
+        data["content"] = entity.content
+    return data
+
+
+def _query_key(kind: str, query: str | None, entity_type: str | None, status: str | None, tags: Any) -> str:
+    """Fingerprint of the filters a cursor is valid for."""
+    canonical = json.dumps(
+        [kind, query, entity_type, status, sorted(tags) if tags else None],
+        ensure_ascii=False,
+    )
+    return hashlib.sha1(canonical.encode("utf-8"), usedforsecurity=False).hexdigest()[:16]
+
+
+def _encode_cursor(offset: int, query_key: str) -> str:
+    payload = json.dumps({"v": _CURSOR_VERSION, "o": offset, "q": query_key}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("ascii")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: Any, query_key: str) -> int:
+    """Offset stored in a cursor issued for the same query."""
+    try:
+        padded = str(cursor) + "=" * (-len(str(cursor)) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        offset = state["o"]
+        valid = state["v"] == _CURSOR_VERSION and isinstance(offset, int) and offset >= 0
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+    if not valid:
+        raise ValueError("Invalid cursor")
+    if state.get("q") != query_key:
+        raise ValueError("Cursor does not match the query parameters")
+    return int(offset)
+
+
+def register_vault_rpc_handlers(
+    host_api: HostAPI, *, notify: Callable[[str, dict[str, Any]], None] | None = None
+) -> dict[str, Any]:
     """Register Vault RPC handlers and return method dispatch table.
 
     Parameters
     ----------
     host_api
         Host API instance
+    notify
+        Optional callable sending a notification (method, params) to the
+        plugin; enables ``vault.list.stream`` and ``vault.search.stream``
 
     Returns
     -------
@@ -358,7 +571,7 @@ def register_vault_rpc_handlers(host_api: HostAPI) -> dict[str, Any]:
     """
     vault_rpc = VaultRPCHandlers(host_api)
 
-    return {
+    handlers: dict[str, Any] = {
         "vault.create": vault_rpc.handle_vault_create,
         "vault.read": vault_rpc.handle_vault_read,
         "vault.update": vault_rpc.handle_vault_update,
@@ -368,3 +581,8 @@ def register_vault_rpc_handlers(host_api: HostAPI) -> dict[str, Any]:
         "vault.get_links": vault_rpc.handle_vault_get_links,
         "vault.search": vault_rpc.handle_vault_search,
     }
+    if notify is not None:
+        handlers["vault.list.stream"] = partial(vault_rpc.handle_vault_list_stream, notify=notify)
+        handlers["vault.search.stream"] = partial(vault_rpc.handle_vault_search_stream, notify=notify)
+
+    return handlers
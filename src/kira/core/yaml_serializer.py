@@ -9,7 +9,9 @@ This module provides deterministic serialization with:
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import re
+from datetime import UTC, date, datetime
+from types import SimpleNamespace
 from typing import Any
 
 import yaml
@@ -96,6 +98,48 @@ def get_canonical_key_order(keys: list[str]) -> list[str]:
     return known_keys + unknown_keys
 
 
+# Timestamp fields that should be normalized (including nested ones like last_write_ts)
+_TIMESTAMP_FIELDS = frozenset(
+    {
+        "created",
+        "updated",
+        "due_date",
+        "start_time",
+        "end_time",
+        "done_ts",
+        "start_ts",
+        "created_ts",
+        "updated_ts",
+        "due_ts",
+        "last_write_ts",  # For x-kira metadata
+    }
+)
+
+
+def _normalize_timestamp(value: Any) -> Any:
+    """Normalize a single timestamp value to an ISO-8601 UTC string."""
+    if isinstance(value, datetime):
+        # Convert datetime to ISO-8601 UTC
+        if value.tzinfo is None:
+            # Naive datetime - assume UTC
+            value = value.replace(tzinfo=UTC)
+        else:
+            # Convert to UTC
+            value = value.astimezone(UTC)
+
+        return value.isoformat()
+    if isinstance(value, str):
+        # Ensure string timestamps are in ISO-8601 UTC format
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            dt = dt.replace(tzinfo=UTC) if dt.tzinfo is None else dt.astimezone(UTC)
+            return dt.isoformat()
+        except (ValueError, AttributeError):
+            # Keep as-is if can't parse
+            return value
+    return value
+
+
 def normalize_timestamps_to_utc(data: dict[str, Any]) -> dict[str, Any]:
     """Normalize timestamp fields to ISO-8601 UTC format.
 
@@ -114,44 +158,9 @@ def normalize_timestamps_to_utc(data: dict[str, Any]) -> dict[str, Any]:
     """
     result = {}
 
-    # Timestamp fields that should be normalized (including nested ones like last_write_ts)
-    timestamp_fields = {
-        "created",
-        "updated",
-        "due_date",
-        "start_time",
-        "end_time",
-        "done_ts",
-        "start_ts",
-        "created_ts",
-        "updated_ts",
-        "due_ts",
-        "last_write_ts",  # For x-kira metadata
-    }
-
     for key, value in data.items():
-        if key in timestamp_fields and value is not None:
-            if isinstance(value, datetime):
-                # Convert datetime to ISO-8601 UTC
-                if value.tzinfo is None:
-                    # Naive datetime - assume UTC
-                    value = value.replace(tzinfo=UTC)
-                else:
-                    # Convert to UTC
-                    value = value.astimezone(UTC)
-
-                result[key] = value.isoformat()
-            elif isinstance(value, str):
-                # Ensure string timestamps are in ISO-8601 UTC format
-                try:
-                    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
-                    dt = dt.replace(tzinfo=UTC) if dt.tzinfo is None else dt.astimezone(UTC)
-                    result[key] = dt.isoformat()
-                except (ValueError, AttributeError):
-                    # Keep as-is if can't parse
-                    result[key] = value
-            else:
-                result[key] = value
+        if key in _TIMESTAMP_FIELDS and value is not None:
+            result[key] = _normalize_timestamp(value)
         # Recursively handle nested dicts (like x-kira)
         elif isinstance(value, dict):
             result[key] = normalize_timestamps_to_utc(value)
@@ -172,6 +181,10 @@ def serialize_frontmatter(data: dict[str, Any], *, normalize_timestamps: bool =
     - ISO-8601 UTC timestamps
     - Consistent quoting and formatting
 
+    Values are emitted by a purpose-built emitter in a single pass; data it
+    cannot reproduce byte-for-byte (e.g. strings PyYAML would double-quote
+    or fold) is serialized with PyYAML instead.
+
     Parameters
     ----------
     data
@@ -184,17 +197,211 @@ def serialize_frontmatter(data: dict[str, Any], *, normalize_timestamps: bool =
     str
         YAML string
     """
-    # Normalize timestamps to UTC
-    if normalize_timestamps:
-        data = normalize_timestamps_to_utc(data)
-
-    # Order keys canonically
-    # Use OrderedDict to preserve order during iteration, then convert to dict
-    # for YAML serialization (avoids Python-specific tags)
     key_order = get_canonical_key_order(list(data.keys()))
 
-    # Build ordered dict as regular dict to avoid Python-specific YAML tags
-    # We'll write keys in order manually
+    try:
+        return _emit_frontmatter(data, key_order, normalize_timestamps=normalize_timestamps)
+    except _NeedsPyYAML:
+        if normalize_timestamps:
+            data = normalize_timestamps_to_utc(data)
+        return _serialize_frontmatter_pyyaml(data, key_order)
+
+
+# Fast emitter for ``serialize_frontmatter`` (see ``_emit_frontmatter``)
+_SCALAR_ANALYZER = SimpleNamespace(allow_unicode=True)
+_ASCII_SCALAR_ANALYZER = SimpleNamespace(allow_unicode=False)
+_STR_TAG = "tag:yaml.org,2002:str"
+# PyYAML's default line width; longer lines with spaces may be folded
+_BEST_WIDTH = 80
+# PyYAML only emits keys shorter than this as simple keys
+_MAX_SIMPLE_KEY_LENGTH = 128
+_QUOTE_TRIGGERS = (":", "#", "|", ">", "&", "*", "!", "%", "@")
+# Text PyYAML's ``analyze_scalar`` allows as a plain or single-quoted block
+# scalar: starts with a word character, no trailing ``:`` or space, no
+# ``": "``, ``" #"`` or non-printable characters. Anything else is analyzed.
+_SIMPLE_TEXT_PATTERN = (
+    r"""\w(?::*[\w./+\-,()'"!?&*%@=;~])*(?:\ +:*[\w./+\-,()'"!?&*%@=;~](?::*[\w./+\-,()'"!?&*%@=;~])*)*"""
+)
+_SIMPLE_TEXT = re.compile(_SIMPLE_TEXT_PATTERN)
+_ASCII_SIMPLE_TEXT = re.compile(_SIMPLE_TEXT_PATTERN, re.ASCII)
+
+
+class _NeedsPyYAML(Exception):
+    """Value is outside what the fast emitter reproduces exactly."""
+
+
+def _needs_quoting(value: str) -> bool:
+    """Serializer heuristic for strings routed through the YAML emitter."""
+    return (
+        any(c in value for c in _QUOTE_TRIGGERS)
+        or "\n" in value
+        or value.startswith((" ", "-", "[", "{"))
+        or value.startswith("[[")  # Wiki-style links need quoting
+    )
+
+
+def _strip_markers(dumped: str) -> str:
+    """Apply the document marker clean-up used on ``yaml.dump`` output."""
+    return dumped.replace("...", "").replace("---", "").strip()
+
+
+def _represent(value: Any) -> tuple[str, str]:
+    """Return (tag, text) as PyYAML's representer would."""
+    value_type = type(value)
+    if value_type is str:
+        return _STR_TAG, value
+    if value is None:
+        return "tag:yaml.org,2002:null", "null"
+    if value_type is bool:
+        return "tag:yaml.org,2002:bool", "true" if value else "false"
+    if value_type is int:
+        return "tag:yaml.org,2002:int", str(value)
+    if value_type is float:
+        if value != value:
+            text = ".nan"
+        elif value in (float("inf"), float("-inf")):
+            text = ".inf" if value > 0 else "-.inf"
+        else:
+            text = repr(value).lower()
+            if "." not in text and "e" in text:
+                text = text.replace("e", ".0e", 1)
+        return "tag:yaml.org,2002:float", text
+    if value_type is datetime:
+        return "tag:yaml.org,2002:timestamp", value.isoformat(" ")
+    if value_type is date:
+        return "tag:yaml.org,2002:timestamp", value.isoformat()
+    raise _NeedsPyYAML
+
+
+def _emit_scalar(value: Any, *, allow_unicode: bool = True, column: int = 0) -> str:
+    """Render a block-context scalar exactly like PyYAML's emitter.
+
+    Parameters
+    ----------
+    value
+        Scalar value
+    allow_unicode
+        Emitter ``allow_unicode`` setting
+    column
+        Column the scalar starts at (for line folding)
+    """
+    tag, text = _represent(value)
+    if not text:
+        raise _NeedsPyYAML
+
+    if (_SIMPLE_TEXT if allow_unicode else _ASCII_SIMPLE_TEXT).fullmatch(text):
+        allow_plain = allow_quoted = True
+    else:
+        analyzer = _SCALAR_ANALYZER if allow_unicode else _ASCII_SCALAR_ANALYZER
+        analysis = yaml.emitter.Emitter.analyze_scalar(analyzer, text)  # type: ignore[arg-type]
+        allow_plain = analysis.allow_block_plain
+        allow_quoted = analysis.allow_single_quoted and not analysis.multiline
+    implicit = _RESOLVER.resolve(yaml.ScalarNode, text, (True, False)) == tag
+
+    if implicit and allow_plain:
+        rendered = text
+    elif tag == _STR_TAG and allow_quoted:
+        rendered = "'" + text.replace("'", "''") + "'"
+    else:
+        # Double-quoted style, explicit tags
+        raise _NeedsPyYAML
+
+    if column + len(rendered) > _BEST_WIDTH and " " in text:
+        # PyYAML would fold the line
+        raise _NeedsPyYAML
+    return rendered
+
+
+def _emit_block_mapping(mapping: dict[Any, Any], indent: int, lines: list[str]) -> None:
+    """Emit ``yaml.dump(mapping, default_flow_style=False, sort_keys=False)``."""
+    prefix = " " * indent
+    for key, value in mapping.items():
+        if type(key) is not str or len(key) >= _MAX_SIMPLE_KEY_LENGTH:
+            raise _NeedsPyYAML
+        key_text = _emit_scalar(key)
+        if key_text != key:
+            raise _NeedsPyYAML
+
+        if isinstance(value, dict):
+            if not value:
+                lines.append(f"{prefix}{key}: {{}}")
+            else:
+                lines.append(f"{prefix}{key}:")
+                _emit_block_mapping(value, indent + 2, lines)
+        elif isinstance(value, list):
+            if not value:
+                lines.append(f"{prefix}{key}: []")
+            else:
+                lines.append(f"{prefix}{key}:")
+                for item in value:
+                    if isinstance(item, dict | list):
+                        raise _NeedsPyYAML
+                    lines.append(f"{prefix}- {_emit_scalar(item, column=indent + 2)}")
+        else:
+            lines.append(f"{prefix}{key}: {_emit_scalar(value, column=indent + len(key) + 2)}")
+
+
+def _emit_frontmatter(data: dict[str, Any], key_order: list[str], *, normalize_timestamps: bool) -> str:
+    """Emit frontmatter in one pass, normalizing timestamps on the way.
+
+    Raises
+    ------
+    _NeedsPyYAML
+        If some value must be serialized by PyYAML
+    """
+    result_lines: list[str] = []
+
+    for key in key_order:
+        value = data[key]
+        if normalize_timestamps:
+            if key in _TIMESTAMP_FIELDS and value is not None:
+                value = _normalize_timestamp(value)
+            elif isinstance(value, dict):
+                value = normalize_timestamps_to_utc(value)
+
+        if isinstance(value, dict):
+            # Nested dict (like x-kira)
+            result_lines.append(f"{key}:")
+            if not value:
+                result_lines.append("  {}")
+            else:
+                nested_lines: list[str] = []
+                _emit_block_mapping(value, 0, nested_lines)
+                result_lines.extend(f"  {line}" for line in nested_lines)
+        elif isinstance(value, list):
+            if not value:
+                result_lines.append(f"{key}: []")
+            else:
+                result_lines.append(f"{key}:")
+                for item in value:
+                    if isinstance(item, str) and not _needs_quoting(item):
+                        result_lines.append(f"  - {item}")
+                    elif isinstance(item, dict | list):
+                        raise _NeedsPyYAML
+                    else:
+                        result_lines.append(f"  - {_strip_markers(_emit_scalar(item, allow_unicode=False))}")
+        elif value is None:
+            result_lines.append(f"{key}: null")
+        elif isinstance(value, bool):
+            result_lines.append(f"{key}: {str(value).lower()}")
+        elif isinstance(value, int | float):
+            result_lines.append(f"{key}: {value}")
+        elif isinstance(value, str):
+            if _needs_quoting(value):
+                result_lines.append(f"{key}: {_strip_markers(_emit_scalar(value))}")
+            else:
+                result_lines.append(f"{key}: {value}")
+        else:
+            result_lines.append(f"{key}: {_strip_markers(_emit_scalar(value))}")
+
+    return "\n".join(result_lines)
+
+
+def _serialize_frontmatter_pyyaml(data: dict[str, Any], key_order: list[str]) -> str:
+    """Serialize frontmatter with per-value ``yaml.dump`` calls.
+
+    Reference implementation and fallback for ``serialize_frontmatter``.
+    """
     result_lines = []
 
     for key in key_order:
@@ -269,9 +476,172 @@ def serialize_frontmatter(data: dict[str, Any], *, normalize_timestamps: bool =
     return "\n".join(result_lines)
 
 
+# Fast path for canonical frontmatter (see ``_parse_canonical_frontmatter``)
+_RESOLVER = yaml.resolver.Resolver()
+_CONSTRUCTOR = yaml.constructor.SafeConstructor()
+_CANONICAL_TAGS = {
+    "tag:yaml.org,2002:null",
+    "tag:yaml.org,2002:bool",
+    "tag:yaml.org,2002:int",
+    "tag:yaml.org,2002:float",
+    "tag:yaml.org,2002:timestamp",
+}
+_PLAIN_INDICATORS = frozenset("-?:,[]{}#&*!|>'\"%@`")
+_UNSUPPORTED_CHARS = ("\t", "\r", "\x85", "\u2028", "\u2029", "\ufeff")
+
+# libyaml-backed loader when PyYAML was built with it
+_C_SAFE_LOADER = getattr(yaml, "CSafeLoader", None)
+
+
+class _NotCanonical(Exception):
+    """Frontmatter uses YAML features outside the canonical subset."""
+
+
+def _plain_scalar(text: str) -> Any:
+    """Resolve and construct a plain scalar exactly like ``yaml.safe_load``."""
+    if text[0] in _PLAIN_INDICATORS and not (text[0] in "-?:" and len(text) > 1 and text[1] != " "):
+        raise _NotCanonical
+    if ": " in text or " #" in text or text.endswith(":"):
+        raise _NotCanonical
+
+    tag = _RESOLVER.resolve(yaml.ScalarNode, text, (True, False))
+    if tag == "tag:yaml.org,2002:str":
+        return text
+    if tag not in _CANONICAL_TAGS:
+        raise _NotCanonical
+    return _CONSTRUCTOR.yaml_constructors[tag](_CONSTRUCTOR, yaml.ScalarNode(tag, text))
+
+
+def _scalar(text: str) -> Any:
+    """Parse a single-line scalar value (plain, quoted or empty collection)."""
+    if text == "[]":
+        return []
+    if text == "{}":
+        return {}
+    if text[0] == "'":
+        inner = text[1:-1]
+        if len(text) < 2 or text[-1] != "'" or "'" in inner.replace("''", ""):
+            raise _NotCanonical
+        return inner.replace("''", "'")
+    if text[0] == '"':
+        inner = text[1:-1]
+        if len(text) < 2 or text[-1] != '"' or '"' in inner or "\\" in inner:
+            raise _NotCanonical
+        return inner
+    return _plain_scalar(text)
+
+
+def _indent_of(line: str) -> int:
+    return len(line) - len(line.lstrip(" "))
+
+
+def _next_content_line(lines: list[str], pos: int) -> int:
+    while pos < len(lines) and not lines[pos].strip():
+        pos += 1
+    return pos
+
+
+def _parse_sequence(lines: list[str], pos: int, indent: int) -> tuple[list[Any], int]:
+    """Parse ``- item`` lines at ``indent`` (scalar items only)."""
+    items: list[Any] = []
+    while (pos := _next_content_line(lines, pos)) < len(lines):
+        line = lines[pos]
+        current = _indent_of(line)
+        if current < indent:
+            break
+        if current > indent:
+            raise _NotCanonical
+        text = line[indent:].rstrip(" ")
+        if text == "-":
+            items.append(None)
+        elif text.startswith("- "):
+            items.append(_scalar(text[2:].strip(" ")))
+        else:
+            break
+        pos += 1
+    return items, pos
+
+
+def _parse_mapping(lines: list[str], pos: int, indent: int) -> tuple[dict[str, Any], int]:
+    """Parse ``key: value`` lines at ``indent`` with nested blocks."""
+    result: dict[str, Any] = {}
+    while (pos := _next_content_line(lines, pos)) < len(lines):
+        line = lines[pos]
+        current = _indent_of(line)
+        if current < indent:
+            break
+        if current > indent:
+            raise _NotCanonical
+
+        text = line[indent:].rstrip(" ")
+        separator = text.find(": ")
+        if separator == -1:
+            if not text.endswith(":"):
+                raise _NotCanonical
+            separator = len(text) - 1
+        raw_key, rest = text[:separator], text[separator + 1 :].strip(" ")
+        if not raw_key or ":" in raw_key or raw_key != raw_key.strip(" "):
+            raise _NotCanonical
+        key = _plain_scalar(raw_key)
+        if not isinstance(key, str):
+            raise _NotCanonical
+        pos += 1
+
+        if rest:
+            result[key] = _scalar(rest)
+            continue
+
+        # Block value: sequence, nested mapping or null
+        child = _next_content_line(lines, pos)
+        child_indent = _indent_of(lines[child]) if child < len(lines) else -1
+        child_text = lines[child][child_indent:] if child < len(lines) else ""
+        if child_indent >= indent and (child_text == "-" or child_text.startswith("- ")):
+            result[key], pos = _parse_sequence(lines, child, child_indent)
+        elif child_indent > indent:
+            result[key], pos = _parse_mapping(lines, child, child_indent)
+        else:
+            result[key] = None
+    return result, pos
+
+
+def _parse_canonical_frontmatter(yaml_str: str) -> dict[str, Any] | None:
+    """Parse frontmatter in the subset emitted by ``serialize_frontmatter``.
+
+    Handles block mappings (including nested ones like ``x-kira``), lists
+    of scalars, plain and quoted single-line scalars. Scalars are resolved
+    with PyYAML's own resolver and constructors, so results are identical
+    to ``yaml.safe_load``.
+
+    Parameters
+    ----------
+    yaml_str
+        YAML string
+
+    Returns
+    -------
+    dict[str, Any] | None
+        Parsed data, or None if the input is outside the canonical subset
+    """
+    if any(char in yaml_str for char in _UNSUPPORTED_CHARS) or yaml.reader.Reader.NON_PRINTABLE.search(yaml_str):
+        return None
+
+    lines = yaml_str.split("\n")
+    try:
+        data, pos = _parse_mapping(lines, 0, 0)
+    except _NotCanonical:
+        return None
+    if _next_content_line(lines, pos) < len(lines):
+        return None
+    return data
+
+
 def parse_frontmatter(yaml_str: str) -> dict[str, Any]:
     """Parse YAML frontmatter.
 
+    Tries the canonical fast path first, then the libyaml ``CSafeLoader``,
+    then the pure-Python ``yaml.safe_load``. All three produce identical
+    results for canonical input.
+
     Parameters
     ----------
     yaml_str
@@ -287,8 +657,15 @@ def parse_frontmatter(yaml_str: str) -> dict[str, Any]:
     ValueError
         If parsing fails
     """
+    data = _parse_canonical_frontmatter(yaml_str)
+    if data is not None:
+        return data
+
     try:
-        data = yaml.safe_load(yaml_str)
+        if _C_SAFE_LOADER is not None:
+            data = yaml.load(yaml_str, Loader=_C_SAFE_LOADER)
+        else:
+            data = yaml.safe_load(yaml_str)
 
         if data is None:
             return {}
@@ -120,6 +120,7 @@ class SyncPipeline:
             name="sync_pipeline_periodic",
             interval_seconds=self.config.sync_interval_seconds,
             callable=lambda: self.run(),
+            job_id="sync_pipeline_periodic",
         )
 
         self._job_id = job_id
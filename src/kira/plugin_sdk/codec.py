@@ -0,0 +1,286 @@
+"""Compact binary encoding for the plugin JSON-RPC transport (ADR-004).
+
+A dependency-free subset of MessagePack covering the JSON data model plus
+``bytes``: nil, booleans, integers up to 64 bits, float64, str, bin, array
+and map. Frames produced by :func:`pack` can be read by any MessagePack
+implementation, and vice versa for the supported types.
+
+Payloads are about 20% smaller than JSON and carry ``bytes`` without
+escaping, but this pure-Python codec costs more CPU than the C-accelerated
+``json`` module (see ``scripts/bench_rpc_transport.py``), so text framing
+remains the default.
+
+Input is treated as untrusted: container lengths are checked against the
+remaining buffer and nesting is capped at ``MAX_DEPTH``.
+
+Example:
+    >>> from kira.plugin_sdk.codec import pack, unpack
+    >>> unpack(pack({"id": 1, "tags": ["a", "b"]}))
+    {'id': 1, 'tags': ['a', 'b']}
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Any
+
+__all__ = [
+    "MAX_DEPTH",
+    "CodecError",
+    "pack",
+    "unpack",
+]
+
+# Deepest array/map nesting accepted from a peer
+MAX_DEPTH = 100
+
+_PACK_F64 = struct.Struct(">Bd").pack
+_UNPACK_F64 = struct.Struct(">d").unpack_from
+
+# Fixed-width headers: (format, marker) by size class
+_STR_HEADERS = ((0xFF, ">BB", 0xD9), (0xFFFF, ">BH", 0xDA), (0xFFFFFFFF, ">BI", 0xDB))
+_BIN_HEADERS = ((0xFF, ">BB", 0xC4), (0xFFFF, ">BH", 0xC5), (0xFFFFFFFF, ">BI", 0xC6))
+_ARRAY_HEADERS = ((0xFFFF, ">BH", 0xDC), (0xFFFFFFFF, ">BI", 0xDD))
+_MAP_HEADERS = ((0xFFFF, ">BH", 0xDE), (0xFFFFFFFF, ">BI", 0xDF))
+
+# marker -> (struct format, byte width) for fixed-size scalars
+_INTS = {
+    0xCC: (">B", 1),
+    0xCD: (">H", 2),
+    0xCE: (">I", 4),
+    0xCF: (">Q", 8),
+    0xD0: (">b", 1),
+    0xD1: (">h", 2),
+    0xD2: (">i", 4),
+    0xD3: (">q", 8),
+}
+# marker -> (struct format, byte width) for variable-size lengths
+_LENGTHS = {
+    0xC4: (">B", 1),
+    0xC5: (">H", 2),
+    0xC6: (">I", 4),
+    0xD9: (">B", 1),
+    0xDA: (">H", 2),
+    0xDB: (">I", 4),
+    0xDC: (">H", 2),
+    0xDD: (">I", 4),
+    0xDE: (">H", 2),
+    0xDF: (">I", 4),
+}
+
+
+class CodecError(ValueError):
+    """Raised for values that cannot be encoded or malformed input."""
+
+
+def pack(obj: Any) -> bytes:
+    """Encode a value.
+
+    Parameters
+    ----------
+    obj
+        JSON-compatible value; ``bytes`` and tuples are also accepted
+
+    Returns
+    -------
+    bytes
+        Encoded value
+
+    Raises
+    ------
+    CodecError
+        If the value (or a nested value) is not supported
+    """
+    out = bytearray()
+    _pack_into(obj, out)
+    return bytes(out)
+
+
+def _header(out: bytearray, size: int, headers: tuple[tuple[int, str, int], ...]) -> None:
+    for limit, fmt, marker in headers:
+        if size <= limit:
+            out += struct.pack(fmt, marker, size)
+            return
+    raise CodecError(f"Value too large to encode ({size} items)")
+
+
+def _pack_into(obj: Any, out: bytearray) -> None:  # noqa: C901
+    # Most frequent types first; bool before int because bool is an int
+    if isinstance(obj, str):
+        data = obj.encode("utf-8")
+        size = len(data)
+        if size < 32:
+            out.append(0xA0 | size)
+        else:
+            _header(out, size, _STR_HEADERS)
+        out += data
+    elif obj is None:
+        out.append(0xC0)
+    elif obj is True:
+        out.append(0xC3)
+    elif obj is False:
+        out.append(0xC2)
+    elif isinstance(obj, int):
+        _pack_int(obj, out)
+    elif isinstance(obj, dict):
+        size = len(obj)
+        if size < 16:
+            out.append(0x80 | size)
+        else:
+            _header(out, size, _MAP_HEADERS)
+        for key, value in obj.items():
+            if not isinstance(key, str):
+                raise CodecError(f"Map keys must be strings, got {type(key).__name__}")
+            _pack_into(key, out)
+            _pack_into(value, out)
+    elif isinstance(obj, list | tuple):
+        size = len(obj)
+        if size < 16:
+            out.append(0x90 | size)
+        else:
+            _header(out, size, _ARRAY_HEADERS)
+        for item in obj:
+            _pack_into(item, out)
+    elif isinstance(obj, float):
+        out += _PACK_F64(0xCB, obj)
+    elif isinstance(obj, bytes | bytearray | memoryview):
+        data = bytes(obj)
+        _header(out, len(data), _BIN_HEADERS)
+        out += data
+    else:
+        raise CodecError(f"Cannot encode {type(obj).__name__}")
+
+
+def _pack_int(value: int, out: bytearray) -> None:
+    if 0 <= value < 0x80:
+        out.append(value)
+    elif -32 <= value < 0:
+        out.append(value & 0xFF)
+    elif value >= 0:
+        for marker in (0xCC, 0xCD, 0xCE, 0xCF):
+            fmt, width = _INTS[marker]
+            if value < 1 << (8 * width):
+                out += struct.pack(">B" + fmt[1], marker, value)
+                return
+        raise CodecError(f"Integer too large to encode: {value}")
+    else:
+        for marker in (0xD0, 0xD1, 0xD2, 0xD3):
+            fmt, width = _INTS[marker]
+            if value >= -(1 << (8 * width - 1)):
+                out += struct.pack(">B" + fmt[1], marker, value)
+                return
+        raise CodecError(f"Integer too small to encode: {value}")
+
+
+def unpack(data: bytes) -> Any:
+    """Decode a value.
+
+    Parameters
+    ----------
+    data
+        Encoded value
+
+    Returns
+    -------
+    Any
+        Decoded value (arrays decode to lists)
+
+    Raises
+    ------
+    CodecError
+        If the data is truncated, has trailing bytes, uses an unsupported
+        type, declares more container items than it holds or nests deeper
+        than ``MAX_DEPTH``
+    """
+    try:
+        value, offset = _unpack_from(data, 0, 0)
+    except (IndexError, struct.error) as exc:
+        raise CodecError("Truncated data") from exc
+    if offset != len(data):
+        raise CodecError(f"{len(data) - offset} trailing bytes")
+    return value
+
+
+def _unpack_from(data: bytes, offset: int, depth: int) -> tuple[Any, int]:  # noqa: C901
+    marker = data[offset]
+    offset += 1
+
+    if marker <= 0x7F:
+        return marker, offset
+    if marker >= 0xE0:
+        return marker - 0x100, offset
+    if 0xA0 <= marker <= 0xBF:
+        end = offset + (marker & 0x1F)
+        return _decode_str(data, offset, end), end
+    if 0x80 <= marker <= 0x8F:
+        return _unpack_map(data, offset, marker & 0x0F, depth)
+    if 0x90 <= marker <= 0x9F:
+        return _unpack_array(data, offset, marker & 0x0F, depth)
+    if marker == 0xC0:
+        return None, offset
+    if marker == 0xC2:
+        return False, offset
+    if marker == 0xC3:
+        return True, offset
+    if marker == 0xCB:
+        return _UNPACK_F64(data, offset)[0], offset + 8
+
+    if marker in _INTS:
+        fmt, width = _INTS[marker]
+        return struct.unpack_from(fmt, data, offset)[0], offset + width
+
+    if marker in _LENGTHS:
+        fmt, width = _LENGTHS[marker]
+        size = struct.unpack_from(fmt, data, offset)[0]
+        offset += width
+        if marker >= 0xDE:
+            return _unpack_map(data, offset, size, depth)
+        if marker >= 0xDC:
+            return _unpack_array(data, offset, size, depth)
+        end = offset + size
+        if end > len(data):
+            raise CodecError("Truncated data")
+        if marker >= 0xD9:
+            return _decode_str(data, offset, end), end
+        return bytes(data[offset:end]), end
+
+    raise CodecError(f"Unsupported type marker 0x{marker:02x}")
+
+
+def _decode_str(data: bytes, start: int, end: int) -> str:
+    if end > len(data):
+        raise CodecError("Truncated data")
+    try:
+        return data[start:end].decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise CodecError(f"Invalid UTF-8 string: {exc}") from exc
+
+
+def _check_container(data: bytes, offset: int, min_bytes: int, depth: int) -> None:
+    """Reject lengths the remaining buffer cannot hold and runaway nesting."""
+    if depth >= MAX_DEPTH:
+        raise CodecError(f"Nesting deeper than {MAX_DEPTH} levels")
+    if min_bytes > len(data) - offset:
+        raise CodecError("Truncated data")
+
+
+def _unpack_array(data: bytes, offset: int, size: int, depth: int) -> tuple[list[Any], int]:
+    # Every item takes at least one byte
+    _check_container(data, offset, size, depth)
+    items = []
+    for _ in range(size):
+        item, offset = _unpack_from(data, offset, depth + 1)
+        items.append(item)
+    return items, offset
+
+
+def _unpack_map(data: bytes, offset: int, size: int, depth: int) -> tuple[dict[str, Any], int]:
+    # Every entry takes at least two bytes (key and value)
+    _check_container(data, offset, 2 * size, depth)
+    result = {}
+    for _ in range(size):
+        key, offset = _unpack_from(data, offset, depth + 1)
+        if not isinstance(key, str):
+            raise CodecError(f"Map keys must be strings, got {type(key).__name__}")
+        result[key], offset = _unpack_from(data, offset, depth + 1)
+    return result, offset
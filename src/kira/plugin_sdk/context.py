@@ -136,7 +136,8 @@ class EventBus:
         """Deliver ``data`` to every subscriber registered for ``event_name``."""
 
         context = PluginContext(config={"event": event_name}, events=self)
-        for handler in self._subscribers.get(event_name, []):
+        # Handlers subscribed during delivery start with the next event
+        for handler in list(self._subscribers.get(event_name, [])):
             result = handler(context, data)
             if hasattr(result, "__await__"):
                 raise RuntimeError("Async handlers are not supported by the default EventBus mock.")
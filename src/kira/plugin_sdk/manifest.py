@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import copy
+import hashlib
 import json
+from functools import cache
 from typing import Any
 
-from jsonschema import Draft7Validator
-
 PLUGIN_MANIFEST_SCHEMA: dict[str, Any] = {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "type": "object",
@@ -282,6 +282,9 @@ class PluginManifestValidator:
     """
 
     def __init__(self) -> None:
+        # Imported here so hosts that only read cached results never load jsonschema
+        from jsonschema import Draft7Validator
+
         self.validator = Draft7Validator(PLUGIN_MANIFEST_SCHEMA)
 
     def validate_manifest(self, manifest_data: dict[str, Any]) -> list[str]:
@@ -331,9 +334,22 @@ def get_manifest_schema() -> dict[str, Any]:
     return copy.deepcopy(PLUGIN_MANIFEST_SCHEMA)
 
 
+@cache
+def get_schema_fingerprint() -> str:
+    """Return a short hash of :data:`PLUGIN_MANIFEST_SCHEMA`.
+
+    Cached validation results are only reused for the schema they were
+    checked against.
+    """
+
+    canonical = json.dumps(PLUGIN_MANIFEST_SCHEMA, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
 __all__ = [
     "PLUGIN_MANIFEST_SCHEMA",
     "PluginManifestValidator",
     "get_manifest_schema",
+    "get_schema_fingerprint",
     "validate_plugin_manifest",
 ]
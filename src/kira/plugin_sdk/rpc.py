@@ -3,33 +3,53 @@
 This module implements JSON-RPC 2.0 over stdio with Content-Length framing
 as specified in ADR-004. Plugins use this to communicate with the host process
 when running in subprocess sandbox mode.
+
+Both sides start in "text" mode (Content-Length header + JSON). The host
+may negotiate "binary" mode with an ``rpc.negotiate`` request: frames are
+then a 4-byte big-endian length followed by a compact MessagePack-style
+payload (see :mod:`kira.plugin_sdk.codec`). Batches (JSON-RPC arrays) are
+supported in both modes.
 """
 
 from __future__ import annotations
 
 import json
+import os
+import struct
 import sys
 import uuid
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass
 from typing import Any
 
+from .codec import CodecError, pack, unpack
 from .types import RPCRequest, RPCResponse
 
 Transport = Callable[[RPCRequest], RPCResponse]
 """Type alias for RPC transports supplied by the host."""
 
 __all__ = [
+    "NEGOTIATE_METHOD",
+    "TRANSPORT_MODES",
     "HostRPCClient",
     "JSONRPCError",
     "JSONRPCMessage",
     "RPCError",
+    "RPCServer",
     "StdioTransport",
     "Transport",
     "parse_jsonrpc_message",
     "serialize_jsonrpc_message",
 ]
 
+TRANSPORT_MODES: tuple[str, ...] = ("text", "binary")
+"""Supported framing modes, in order of introduction."""
+
+NEGOTIATE_METHOD = "rpc.negotiate"
+"""Request that switches both sides to a mode both support."""
+
+_FRAME_HEADER = struct.Struct(">I")
+
 
 class RPCError(RuntimeError):
     """Raised when the host returns an error response."""
@@ -156,6 +176,10 @@ def parse_jsonrpc_message(data: bytes) -> JSONRPCMessage:
     except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise JSONRPCError(f"Invalid JSON: {exc}", JSONRPCError.PARSE_ERROR) from exc
 
+    return _message_from_obj(obj)
+
+
+def _message_from_obj(obj: Any) -> JSONRPCMessage:
     if not isinstance(obj, dict):
         raise JSONRPCError("Message must be an object", JSONRPCError.INVALID_REQUEST)
 
@@ -176,10 +200,11 @@ class StdioTransport:
     """JSON-RPC transport over stdin/stdout.
 
     Used by plugins running in subprocess sandbox to communicate with the host.
-    Messages are framed with Content-Length headers as per Language Server Protocol.
+    Messages are framed with Content-Length headers as per Language Server Protocol,
+    or length-prefixed binary frames once "binary" mode is negotiated.
     """
 
-    def __init__(self, input_stream: Any = None, output_stream: Any = None) -> None:
+    def __init__(self, input_stream: Any = None, output_stream: Any = None, *, mode: str = "text") -> None:
         """Initialize stdio transport.
 
         Parameters
@@ -188,9 +213,25 @@ class StdioTransport:
             Input stream (default: sys.stdin.buffer)
         output_stream
             Output stream (default: sys.stdout.buffer)
+        mode
+            Framing mode, one of ``TRANSPORT_MODES``
         """
         self.input = input_stream or sys.stdin.buffer
         self.output = output_stream or sys.stdout.buffer
+        self.mode = "text"
+        self.set_mode(mode)
+
+    def set_mode(self, mode: str) -> None:
+        """Switch framing mode for subsequent frames in both directions.
+
+        Parameters
+        ----------
+        mode
+            One of ``TRANSPORT_MODES``
+        """
+        if mode not in TRANSPORT_MODES:
+            raise ValueError(f"Unknown transport mode: {mode!r}")
+        self.mode = mode
 
     def send(self, message: JSONRPCMessage) -> None:
         """Send a JSON-RPC message.
@@ -200,10 +241,38 @@ class StdioTransport:
         message
             Message to send
         """
-        data = serialize_jsonrpc_message(message)
+        if self.mode == "text":
+            data = serialize_jsonrpc_message(message)
+        else:
+            data = self._encode_binary(message.to_dict())
+        self.output.write(data)
+        self.output.flush()
+
+    def send_batch(self, messages: list[JSONRPCMessage]) -> None:
+        """Send several messages as one JSON-RPC batch frame.
+
+        Parameters
+        ----------
+        messages
+            Messages to send
+        """
+        batch = [message.to_dict() for message in messages]
+        if self.mode == "text":
+            content = json.dumps(batch, ensure_ascii=False).encode("utf-8")
+            data = f"Content-Length: {len(content)}\r\n\r\n".encode("ascii") + content
+        else:
+            data = self._encode_binary(batch)
         self.output.write(data)
         self.output.flush()
 
+    @staticmethod
+    def _encode_binary(obj: Any) -> bytes:
+        try:
+            payload = pack(obj)
+        except CodecError as exc:
+            raise JSONRPCError(f"Cannot encode message: {exc}", JSONRPCError.INTERNAL_ERROR) from exc
+        return _FRAME_HEADER.pack(len(payload)) + payload
+
     def receive(self) -> JSONRPCMessage:
         """Receive a JSON-RPC message.
 
@@ -215,10 +284,71 @@ class StdioTransport:
         Raises
         ------
         JSONRPCError
-            If message is malformed
+            If message is malformed or is a batch
+        EOFError
+            If stream is closed
+        """
+        frame = self.receive_frame()
+        if isinstance(frame, list):
+            raise JSONRPCError("Unexpected batch; use receive_batch()", JSONRPCError.INVALID_REQUEST)
+        return frame
+
+    def receive_batch(self) -> list[JSONRPCMessage]:
+        """Receive a single message or a batch.
+
+        Returns
+        -------
+        list[JSONRPCMessage]
+            Messages in the frame (one for a non-batch frame)
+
+        Raises
+        ------
+        JSONRPCError
+            If a message is malformed or the batch is empty
+        EOFError
+            If stream is closed
+        """
+        frame = self.receive_frame()
+        return frame if isinstance(frame, list) else [frame]
+
+    def receive_frame(self) -> JSONRPCMessage | list[JSONRPCMessage]:
+        """Receive one frame: a message, or a list of messages for a batch.
+
+        Returns
+        -------
+        JSONRPCMessage or list[JSONRPCMessage]
+            Received message or batch
+
+        Raises
+        ------
+        JSONRPCError
+            If a message is malformed or the batch is empty
         EOFError
             If stream is closed
         """
+        obj = self._read_frame()
+        if not isinstance(obj, list):
+            return _message_from_obj(obj)
+        if not obj:
+            raise JSONRPCError("Empty batch", JSONRPCError.INVALID_REQUEST)
+        return [_message_from_obj(item) for item in obj]
+
+    def _read_frame(self) -> Any:
+        """Read one frame and decode its payload."""
+        if self.mode == "binary":
+            header = self.input.read(_FRAME_HEADER.size)
+            if not header:
+                raise EOFError("Input stream closed")
+            if len(header) != _FRAME_HEADER.size:
+                raise JSONRPCError(f"Truncated frame header: {header!r}", JSONRPCError.PARSE_ERROR)
+
+            (content_length,) = _FRAME_HEADER.unpack(header)
+            content = self._read_exactly(content_length)
+            try:
+                return unpack(content)
+            except CodecError as exc:
+                raise JSONRPCError(f"Invalid frame: {exc}", JSONRPCError.PARSE_ERROR) from exc
+
         # Read Content-Length header
         header_line = self.input.readline()
         if not header_line:
@@ -243,15 +373,20 @@ class StdioTransport:
                 JSONRPCError.PARSE_ERROR,
             )
 
-        # Read content
+        content = self._read_exactly(content_length)
+        try:
+            return json.loads(content.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+            raise JSONRPCError(f"Invalid JSON: {exc}", JSONRPCError.PARSE_ERROR) from exc
+
+    def _read_exactly(self, content_length: int) -> bytes:
         content = self.input.read(content_length)
         if len(content) != content_length:
             raise JSONRPCError(
                 f"Expected {content_length} bytes, got {len(content)}",
                 JSONRPCError.PARSE_ERROR,
             )
-
-        return parse_jsonrpc_message(content)
+        return content
 
     def call(self, request: RPCRequest) -> RPCResponse:
         """Send request and receive response.
@@ -266,39 +401,112 @@ class StdioTransport:
         RPCResponse
             Response from host
         """
-        # Generate request ID
-        request_id = str(uuid.uuid4())
+        return self.call_batch([request])[0]
+
+    def call_batch(self, requests: list[RPCRequest]) -> list[RPCResponse]:
+        """Send requests as one batch and receive all responses.
+
+        Parameters
+        ----------
+        requests
+            RPC requests
+
+        Returns
+        -------
+        list[RPCResponse]
+            Responses in request order
+
+        Raises
+        ------
+        RPCError
+            If the host returns an error for any request
+        """
+        messages = [
+            JSONRPCMessage(
+                jsonrpc="2.0",
+                id=str(uuid.uuid4()),
+                method=request.method,
+                params=dict(request.payload) if request.payload else None,
+            )
+            for request in requests
+        ]
+
+        if len(messages) == 1:
+            self.send(messages[0])
+        else:
+            self.send_batch(messages)
+
+        expected = {message.id for message in messages}
+        responses: dict[Any, JSONRPCMessage] = {}
+        while len(responses) < len(messages):
+            for response in self.receive_batch():
+                if response.id not in expected:
+                    raise JSONRPCError(
+                        f"Response ID mismatch: expected one of {sorted(map(str, expected))}, got {response.id}",
+                        JSONRPCError.INTERNAL_ERROR,
+                    )
+                responses[response.id] = response
+
+        results = []
+        for message in messages:
+            response = responses[message.id]
+            if response.error:
+                error_data = response.error
+                raise RPCError(
+                    error_data.get("message", "Unknown error"),
+                    code=error_data.get("code", -1),
+                    data=error_data.get("data"),
+                )
+            results.append(RPCResponse(result=response.result, status="ok"))
+
+        return results
+
+    def stream(self, request: RPCRequest) -> Iterator[JSONRPCMessage]:
+        """Send a request and yield the notifications that precede its response.
+
+        Used for server-push calls such as ``vault.list.stream``, where the
+        host sends results as notifications and responds once done.
 
-        # Create JSON-RPC request
+        Parameters
+        ----------
+        request
+            RPC request
+
+        Yields
+        ------
+        JSONRPCMessage
+            Notifications received before the response
+
+        Raises
+        ------
+        RPCError
+            If the host returns an error
+        """
         message = JSONRPCMessage(
             jsonrpc="2.0",
-            id=request_id,
+            id=str(uuid.uuid4()),
             method=request.method,
             params=dict(request.payload) if request.payload else None,
         )
-
-        # Send request
         self.send(message)
 
-        # Receive response
-        response = self.receive()
-
-        # Validate response
-        if response.id != request_id:
-            raise JSONRPCError(
-                f"Response ID mismatch: expected {request_id}, got {response.id}",
-                JSONRPCError.INTERNAL_ERROR,
-            )
-
-        if response.error:
-            error_data = response.error
-            raise RPCError(
-                error_data.get("message", "Unknown error"),
-                code=error_data.get("code", -1),
-                data=error_data.get("data"),
-            )
-
-        return RPCResponse(result=response.result, status="ok")
+        while True:
+            for received in self.receive_batch():
+                if received.is_notification():
+                    yield received
+                    continue
+                if received.id != message.id:
+                    raise JSONRPCError(
+                        f"Response ID mismatch: expected {message.id}, got {received.id}",
+                        JSONRPCError.INTERNAL_ERROR,
+                    )
+                if received.error:
+                    raise RPCError(
+                        received.error.get("message", "Unknown error"),
+                        code=received.error.get("code", -1),
+                        data=received.error.get("data"),
+                    )
+                return
 
 
 class HostRPCClient:
@@ -364,3 +572,198 @@ class HostRPCClient:
             raise RPCError(f"Host RPC failed with status '{response.status}'")
 
         return response.result
+
+    def paginate(
+        self,
+        method: str,
+        payload: Mapping[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> Iterator[Mapping[str, Any]]:
+        """Call a paginated method (e.g. ``vault.list``) page by page.
+
+        The ``next_cursor`` of each page is passed back as ``cursor`` until
+        the host returns none, so only one page is held at a time.
+
+        Cursor contract: paging is opt-in, so ``payload`` should carry a
+        ``limit`` (``vault.list`` without ``limit`` or ``cursor`` returns
+        every entity in one result). A cursor is opaque and only valid with
+        the filters it was issued for; resending it with a different
+        ``entity_type``, ``status``, ``tags`` or ``query`` is rejected.
+        Cursors are offset-based, so entities created or deleted during a
+        walk may shift later pages. ``next_cursor`` is None on the last page.
+
+        Parameters
+        ----------
+        method
+            RPC method name
+        payload
+            Method parameters for the first page
+        timeout
+            Optional timeout in seconds per page
+
+        Yields
+        ------
+        dict
+            Page results
+        """
+        params = dict(payload or {})
+        while True:
+            page = self.call(method, params, timeout=timeout) or {}
+            yield page
+            cursor = page.get("next_cursor")
+            if not cursor:
+                return
+            params["cursor"] = cursor
+
+    def stream(
+        self,
+        method: str,
+        payload: Mapping[str, Any] | None = None,
+    ) -> Iterator[Mapping[str, Any]]:
+        """Call a server-push method (e.g. ``vault.list.stream``).
+
+        Requires a ``StdioTransport``.
+
+        Parameters
+        ----------
+        method
+            RPC method name
+        payload
+            Method parameters; a ``stream_id`` is added if missing
+
+        Yields
+        ------
+        dict
+            Params of each chunk notification tagged with the stream ID
+
+        Raises
+        ------
+        RPCError
+            If the host returns an error
+        TypeError
+            If the transport cannot receive notifications
+        """
+        if not isinstance(self._transport, StdioTransport):
+            raise TypeError("Streaming calls require a StdioTransport")
+
+        params = dict(payload or {})
+        stream_id = params.setdefault("stream_id", uuid.uuid4().hex)
+        for notification in self._transport.stream(RPCRequest(method=method, payload=params)):
+            chunk = notification.params
+            if isinstance(chunk, dict) and chunk.get("stream_id") == stream_id:
+                yield chunk
+
+
+RPCHandler = Callable[[dict[str, Any]], Any]
+"""Handler for one RPC method; receives the request params."""
+
+
+class RPCServer:
+    """Serves JSON-RPC requests from the host inside a plugin process.
+
+    Requests are answered in arrival order, so the host may pipeline
+    several requests without waiting for each response; a batch is
+    answered with one batch frame. Built-in methods: ``ping`` (health
+    check), ``shutdown`` (stop serving) and ``rpc.negotiate`` (switch the
+    transport mode).
+
+    Example:
+        >>> server = RPCServer({"event.publish": handle_event})
+        >>> server.serve_forever()  # until stdin closes or "shutdown"
+    """
+
+    def __init__(self, handlers: Mapping[str, RPCHandler], transport: StdioTransport | None = None) -> None:
+        """Initialize RPC server.
+
+        Parameters
+        ----------
+        handlers
+            Method name to handler mapping
+        transport
+            Transport to serve on (default: StdioTransport())
+        """
+        self._handlers = dict(handlers)
+        self._transport = transport or StdioTransport()
+        self._running = False
+        self._next_mode: str | None = None
+        self.requests_served = 0
+
+    def handle(self, message: JSONRPCMessage) -> JSONRPCMessage | None:
+        """Dispatch a request to its handler.
+
+        Parameters
+        ----------
+        message
+            Incoming request or notification
+
+        Returns
+        -------
+        JSONRPCMessage or None
+            Response, or None for notifications
+        """
+        try:
+            result = self._invoke(message.method or "", message.params)
+            if result is None:
+                result = {}  # a null result would serialize as an empty response
+            response = JSONRPCMessage(id=message.id, result=result)
+        except JSONRPCError as exc:
+            response = JSONRPCMessage(id=message.id, error=exc.to_dict())
+        except Exception as exc:
+            response = JSONRPCMessage(
+                id=message.id,
+                error=JSONRPCError(str(exc), JSONRPCError.INTERNAL_ERROR, data=type(exc).__name__).to_dict(),
+            )
+
+        self.requests_served += 1
+        return None if message.is_notification() else response
+
+    def _invoke(self, method: str, params: dict[str, Any] | list[Any] | None) -> Any:
+        if method == "ping":
+            return {"status": "ok", "pid": os.getpid(), "requests_served": self.requests_served}
+        if method == "shutdown":
+            self._running = False
+            return {"status": "ok"}
+        if method == NEGOTIATE_METHOD:
+            # First mode in the client's preference order that we support
+            offered = params.get("modes", []) if isinstance(params, dict) else []
+            mode = next((m for m in offered if m in TRANSPORT_MODES), "text")
+            self._next_mode = mode
+            return {"mode": mode}
+
+        handler = self._handlers.get(method)
+        if handler is None:
+            raise JSONRPCError(f"Method not found: {method}", JSONRPCError.METHOD_NOT_FOUND)
+        if params is not None and not isinstance(params, dict):
+            raise JSONRPCError("Params must be an object", JSONRPCError.INVALID_PARAMS)
+        return handler(params or {})
+
+    def serve_forever(self) -> None:
+        """Serve requests until the input stream closes or ``shutdown`` is called."""
+        self._running = True
+        while self._running:
+            try:
+                frame = self._transport.receive_frame()
+            except EOFError:
+                break
+            except JSONRPCError as exc:
+                self._transport.send(JSONRPCMessage(error=exc.to_dict()))
+                continue
+
+            # Stray responses have no pending call here
+            is_batch = isinstance(frame, list)
+            messages = frame if isinstance(frame, list) else [frame]
+            responses: list[JSONRPCMessage] = [
+                response
+                for message in messages
+                if message.is_request() and (response := self.handle(message)) is not None
+            ]
+            if is_batch and responses:
+                self._transport.send_batch(responses)
+            elif responses:
+                self._transport.send(responses[0])
+
+            if self._next_mode is not None:
+                # The negotiate response went out in the old mode
+                self._transport.set_mode(self._next_mode)
+                self._next_mode = None
@@ -5,7 +5,7 @@
 from pathlib import Path
 from typing import Any
 
-import yaml
+from ._yaml_cache import load_yaml
 
 
 class PluginRegistry:
@@ -30,9 +30,8 @@ class PluginRegistry:
             return
 
         try:
-            with open(self.registry_file, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                self._plugins = data.get("plugins", [])
+            data = load_yaml(self.registry_file)
+            self._plugins = data.get("plugins", [])
         except Exception as e:
             print(f"Ошибка загрузки реестра плагинов: {e}")
             self._plugins = []
@@ -44,12 +43,11 @@ class PluginRegistry:
             return
 
         try:
-            with open(self.config_file, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                if data and "plugins" in data and "enabled" in data["plugins"]:
-                    self._enabled_plugins = data["plugins"]["enabled"]
-                else:
-                    self._enabled_plugins = []
+            data = load_yaml(self.config_file)
+            if data and "plugins" in data and "enabled" in data["plugins"]:
+                self._enabled_plugins = data["plugins"]["enabled"]
+            else:
+                self._enabled_plugins = []
         except Exception as e:
             print(f"Ошибка загрузки конфигурации плагинов: {e}")
             self._enabled_plugins = []
@@ -120,9 +118,8 @@ class AdapterRegistry:
             return
 
         try:
-            with open(self.registry_file, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                self._adapters = data.get("adapters", [])
+            data = load_yaml(self.registry_file)
+            self._adapters = data.get("adapters", [])
         except Exception as e:
             print(f"Ошибка загрузки реестра адаптеров: {e}")
             self._adapters = []
@@ -134,18 +131,17 @@ class AdapterRegistry:
             return
 
         try:
-            with open(self.config_file, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                if data and "adapters" in data:
-                    adapters_config = data["adapters"]
-                    # Проверяем telegram, gcal и другие адаптеры
-                    for adapter_name, adapter_config in adapters_config.items():
-                        if isinstance(adapter_config, dict) and "enabled" in adapter_config:
-                            # Маппинг имен: telegram -> kira-telegram, gcal -> kira-gcal
-                            full_name = f"kira-{adapter_name}"
-                            self._enabled_adapters[full_name] = adapter_config["enabled"]
-                else:
-                    self._enabled_adapters = {}
+            data = load_yaml(self.config_file)
+            if data and "adapters" in data:
+                adapters_config = data["adapters"]
+                # Проверяем telegram, gcal и другие адаптеры
+                for adapter_name, adapter_config in adapters_config.items():
+                    if isinstance(adapter_config, dict) and "enabled" in adapter_config:
+                        # Маппинг имен: telegram -> kira-telegram, gcal -> kira-gcal
+                        full_name = f"kira-{adapter_name}"
+                        self._enabled_adapters[full_name] = adapter_config["enabled"]
+            else:
+                self._enabled_adapters = {}
         except Exception as e:
             print(f"Ошибка загрузки конфигурации адаптеров: {e}")
             self._enabled_adapters = {}
@@ -0,0 +1,35 @@
+"""
+Кэш разобранных YAML файлов реестров
+"""
+
+import copy
+import threading
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+__all__ = ["load_yaml"]
+
+# Разобранные YAML файлы по (mtime_ns, size): реестры создаются на каждый
+# вызов CLI-команды, а файл перечитывается только после изменения
+_cache: dict[Path, tuple[tuple[int, int], Any]] = {}
+_cache_lock = threading.Lock()
+
+
+def load_yaml(path: Path) -> Any:
+    """Загружает YAML файл, используя кэш до изменения файла"""
+    resolved = path.resolve()
+    stat = resolved.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _cache_lock:
+        cached = _cache.get(resolved)
+    if cached is None or cached[0] != signature:
+        with open(resolved, encoding="utf-8") as f:
+            cached = (signature, yaml.safe_load(f))
+        with _cache_lock:
+            _cache[resolved] = cached
+
+    # Копия, чтобы изменения реестра не портили кэш
+    return copy.deepcopy(cached[1])
@@ -1,9 +1,10 @@
 """Storage layer for Vault operations with file locking (Phase 0, Point 1)."""
 
-from .vault import Vault, VaultConfig, get_vault
+from .vault import Vault, VaultBatch, VaultConfig, get_vault
 
 __all__ = [
     "Vault",
+    "VaultBatch",
     "VaultConfig",
     "get_vault",
 ]
@@ -25,21 +25,26 @@ Acceptable file writes OUTSIDE this module:
 
 from __future__ import annotations
 
+import contextlib
 import fcntl
 import os
 import tempfile
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from ..core.host import Entity, VaultError, create_host_api
+from ..core.host import BulkUpsertResult, Entity, VaultError, create_host_api
 from ..observability.loguru_config import get_logger, log_process_end, log_process_start, timing_context
 
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
 # Loguru logger for Vault operations
 vault_logger = get_logger("vault")
 
 __all__ = [
     "Vault",
+    "VaultBatch",
     "VaultConfig",
     "get_vault",
 ]
@@ -52,6 +57,40 @@ class VaultConfig:
     vault_path: Path
     enable_file_locks: bool = True
     lock_timeout: float = 10.0  # seconds
+    bulk_lock_chunk_size: int = 64  # entity locks (open fds) held at once by bulk_upsert
+
+
+@dataclass
+class VaultBatch:
+    """Entity writes staged by ``Vault.batch()`` and committed together.
+
+    Attributes
+    ----------
+    items : list[dict[str, Any]]
+        Staged upserts (``entity_type``, ``data``, ``content``)
+    results : list[BulkUpsertResult]
+        Per-entity results, filled in when the batch is committed
+    """
+
+    items: list[dict[str, Any]] = field(default_factory=list)
+    results: list[BulkUpsertResult] = field(default_factory=list)
+
+    def upsert(self, entity_type: str, data: dict[str, Any], *, content: str = "") -> None:
+        """Stage an entity create or update.
+
+        Parameters
+        ----------
+        entity_type
+            Type of entity (task, note, event, etc.)
+        data
+            Entity metadata
+        content
+            Markdown content body
+        """
+        self.items.append({"entity_type": entity_type, "data": data, "content": content})
+
+    def __len__(self) -> int:
+        return len(self.items)
 
 
 class Vault:
@@ -178,6 +217,102 @@ class Vault:
                 entity_type=entity_type,
             )
 
+    def bulk_upsert(self, items: Iterable[dict[str, Any]]) -> list[BulkUpsertResult]:
+        """Create or update many entities with group commits.
+
+        Items are committed in chunks of ``config.bulk_lock_chunk_size``, so
+        the number of entity locks (and open lock files) stays bounded
+        however large the batch is. Each chunk locks its entities with a
+        known ID and delegates to ``HostAPI.bulk_upsert``: one directory
+        fsync per folder per chunk, each file still replaced atomically.
+
+        Parameters
+        ----------
+        items
+            Dicts with ``entity_type``, ``data`` and optional ``content``
+
+        Returns
+        -------
+        list[BulkUpsertResult]
+            One result per item, in request order
+        """
+        items = list(items)
+        chunk_size = max(1, self.config.bulk_lock_chunk_size)
+
+        start_ns = log_process_start(
+            "vault_bulk_upsert",
+            component="vault",
+            item_count=len(items),
+        )
+
+        try:
+            results: list[BulkUpsertResult] = []
+            for offset in range(0, len(items), chunk_size):
+                chunk_results = self._bulk_upsert_chunk(items[offset : offset + chunk_size])
+                for result in chunk_results:
+                    result.index += offset
+                results.extend(chunk_results)
+
+            failed = [result for result in results if not result.ok]
+            vault_logger.info(
+                "Batch upserted to vault",
+                item_count=len(items),
+                failed_count=len(failed),
+            )
+            for result in failed:
+                vault_logger.warning(
+                    "Batch entity failed",
+                    entity_id=result.entity_id,
+                    index=result.index,
+                    error=result.error,
+                )
+
+            return results
+        finally:
+            log_process_end(
+                "vault_bulk_upsert",
+                start_ns,
+                component="vault",
+                item_count=len(items),
+            )
+
+    def _bulk_upsert_chunk(self, items: list[dict[str, Any]]) -> list[BulkUpsertResult]:
+        """Commit one chunk of ``bulk_upsert`` under its entity locks."""
+        entity_ids = sorted({item["data"]["id"] for item in items if (item.get("data") or {}).get("id")})
+        with contextlib.ExitStack() as stack:
+            # Sorted acquisition order avoids deadlocks between batches
+            for entity_id in entity_ids:
+                stack.enter_context(self._acquire_entity_lock(entity_id))
+            return self.host_api.bulk_upsert(items)
+
+    @contextlib.contextmanager
+    def batch(self) -> Generator[VaultBatch, None, None]:
+        """Stage entity writes and commit them together on exit.
+
+        Nothing is written if the block raises. Per-entity outcomes are
+        available in ``VaultBatch.results`` after the block.
+
+        Example:
+            >>> with vault.batch() as batch:
+            ...     for event in calendar_events:
+            ...         batch.upsert("event", event)
+            >>> failed = [r for r in batch.results if not r.ok]
+
+        Yields
+        ------
+        VaultBatch
+            Batch to stage upserts into
+        """
+        batch = VaultBatch()
+        try:
+            yield batch
+        except BaseException:
+            # Drop staged writes so a failed block leaves the vault untouched
+            batch.items.clear()
+            raise
+        if batch.items:
+            batch.results = self.bulk_upsert(batch.items)
+
     def delete(self, uid: str) -> None:
         """Delete entity by UID.
 
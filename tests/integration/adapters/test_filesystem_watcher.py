@@ -0,0 +1,163 @@
+"""Integration tests for the Vault filesystem watcher (ADR-006)."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from kira.adapters.filesystem.watcher import (
+    InotifyBackend,
+    PollingBackend,
+    VaultWatcher,
+    inotify_available,
+)
+from kira.core.events import create_event_bus
+from kira.core.host import HostAPI
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+class TestApplyFileChanges:
+    def test_external_edit_updates_index_cache_and_links(self, tmp_path):
+        host_api = HostAPI(tmp_path)
+        task = host_api.create_entity("task", {"title": "Draft", "status": "todo"})
+        host_api.read_entity(task.id)
+        assert host_api.link_graph.get_outgoing_links(task.id) == []
+
+        text = task.path.read_text(encoding="utf-8").replace("status: todo", "status: doing")
+        _write(task.path, text.replace("title: Draft", "title: Obsidian edit") + "\nSee [[project-alpha]]\n")
+
+        changes = host_api.apply_file_changes([task.path])
+
+        assert [(c.kind, c.entity_id, c.previous_entity_id) for c in changes] == [("modified", task.id, task.id)]
+        assert host_api.read_entity(task.id).metadata["title"] == "Obsidian edit"
+        assert [e.entity_id for e in host_api.entity_index.query(status="doing")] == [task.id]
+        assert [link.target_id for link in host_api.link_graph.get_outgoing_links(task.id)] == ["project-alpha"]
+        if host_api.entity_index.full_text_available:
+            assert [e.id for e in host_api.search_entities("obsidian")] == [task.id]
+
+    def test_own_writes_are_skipped(self, tmp_path):
+        host_api = HostAPI(tmp_path)
+        task = host_api.create_entity("task", {"title": "Task"})
+
+        assert host_api.apply_file_changes([task.path]) == []
+
+    def test_create_delete_and_rename(self, tmp_path):
+        host_api = HostAPI(tmp_path)
+        assert host_api.link_graph is not None  # load graph
+        new_path = tmp_path / "notes" / "note-external.md"
+        _write(new_path, "---\nid: note-external\ntitle: External\n---\n\nSee [[project-alpha]]")
+
+        assert [c.kind for c in host_api.apply_file_changes([new_path])] == ["created"]
+        assert host_api.read_entity("note-external").content == "See [[project-alpha]]"
+
+        renamed = tmp_path / "notes" / "Renamed.md"
+        new_path.rename(renamed)
+        changes = host_api.apply_file_changes([renamed, new_path])
+
+        assert [(c.path, c.kind) for c in changes] == [(new_path, "deleted"), (renamed, "created")]
+        assert host_api.read_entity("note-external").path == renamed
+        assert [link.target_id for link in host_api.link_graph.get_outgoing_links("note-external")] == ["project-alpha"]
+
+        renamed.unlink()
+        assert [c.kind for c in host_api.apply_file_changes([renamed])] == ["deleted"]
+        assert list(host_api.list_entities("note")) == []
+
+    def test_files_outside_entity_folders_are_ignored(self, tmp_path):
+        host_api = HostAPI(tmp_path)
+        inbox_file = tmp_path / "inbox" / "note-1.md"
+        _write(inbox_file, "---\nid: note-1\n---\n")
+
+        assert host_api.apply_file_changes([inbox_file]) == []
+
+
+class TestBackends:
+    def test_polling_backend_reports_changes(self, tmp_path):
+        task_path = tmp_path / "tasks" / "task-1.md"
+        _write(task_path, "---\nid: task-1\n---\n")
+        backend = PollingBackend(tmp_path, ["tasks", "notes"], interval=0)
+
+        assert backend.read(0) == []
+
+        note_path = tmp_path / "notes" / "note-1.md"
+        _write(note_path, "---\nid: note-1\n---\n")
+        _write(tmp_path / "notes" / ".note-1.md.tmp123", "partial")
+        task_path.unlink()
+
+        assert sorted(backend.read(0)) == sorted([note_path, task_path])
+        backend.close()
+
+    @pytest.mark.skipif(not inotify_available(), reason="inotify not available")
+    def test_inotify_backend_reports_atomic_writes(self, tmp_path):
+        (tmp_path / "tasks").mkdir()
+        backend = InotifyBackend(tmp_path, ["tasks", "notes"])
+        try:
+            host_api = HostAPI(tmp_path, use_entity_index=False)
+            task = host_api.create_entity("task", {"title": "Task"})
+            note = host_api.create_entity("note", {"title": "Note in a new folder"})
+
+            seen: set = set()
+            assert _wait_for(lambda: seen.update(backend.read(0.1) or []) or {task.path, note.path} <= seen)
+            assert all(not path.name.startswith(".") for path in seen)
+        finally:
+            backend.close()
+
+
+class TestVaultWatcher:
+    def test_debounce_coalesces_notifications(self, tmp_path):
+        host_api = HostAPI(tmp_path)
+        path = tmp_path / "tasks" / "task-1.md"
+        watcher = VaultWatcher(host_api, backend=PollingBackend(tmp_path, ["tasks"]), debounce=60)
+
+        for i in range(3):
+            _write(path, f"---\nid: task-1\ntitle: v{i}\n---\n")
+            watcher.notify([path])
+
+        assert watcher.process_pending() == []
+        changes = watcher.flush()
+
+        assert [(c.kind, c.entity_id) for c in changes] == [("created", "task-1")]
+        assert watcher.get_stats()["batches"] == 1
+
+    def test_watcher_publishes_file_changed(self, tmp_path):
+        event_bus = create_event_bus()
+        received = []
+        event_bus.subscribe("file.changed", lambda event: received.append(event.payload))
+        host_api = HostAPI(tmp_path, event_bus=event_bus)
+        own = host_api.create_entity("task", {"title": "Own write"})
+
+        with VaultWatcher(host_api, backend="polling", poll_interval=0.05, debounce=0.05) as watcher:
+            _write(tmp_path / "notes" / "note-obsidian.md", "---\nid: note-obsidian\ntitle: From Obsidian\n---\n")
+            assert _wait_for(lambda: received)
+            assert watcher.backend_name == "polling"
+
+        assert received[0]["entity_id"] == "note-obsidian"
+        assert received[0]["kind"] == "created"
+        assert all(payload["entity_id"] != own.id for payload in received)
+
+    def test_lost_events_trigger_resync(self, tmp_path):
+        event_bus = create_event_bus()
+        received = []
+        event_bus.subscribe("file.changed", lambda event: received.append(event.payload))
+        host_api = HostAPI(tmp_path, event_bus=event_bus)
+        assert host_api.link_graph is not None  # load graph
+        watcher = VaultWatcher(host_api, backend=PollingBackend(tmp_path, ["tasks"]))
+
+        watcher.notify(None)
+        watcher.process_pending()
+
+        assert received == [{"path": None, "kind": "rescan", "entity_id": None, "previous_entity_id": None}]
+        assert host_api._link_graph is None
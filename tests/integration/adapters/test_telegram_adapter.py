@@ -15,6 +15,7 @@ from kira.adapters.telegram.adapter import (
     TelegramAdapter,
     TelegramAdapterConfig,
     TelegramMessage,
+    ThinkingIndicator,
     create_telegram_adapter,
 )
 from kira.core.events import create_event_bus
@@ -493,3 +494,49 @@ class TestTelegramAdapterLogging:
             assert log_entry["adapter"] == "telegram"
             assert log_entry["key"] == "value"
             assert "timestamp" in log_entry
+
+
+class TestThinkingIndicatorStreaming:
+    """Test streaming a response into the thinking indicator message."""
+
+    def _indicator(self, interval: float = 1.0) -> tuple[ThinkingIndicator, MagicMock]:
+        adapter = MagicMock()
+        adapter.config = TelegramAdapterConfig(bot_token="test_token", stream_edit_interval=interval)
+        adapter.send_message.return_value = {"ok": True, "result": {"message_id": 7}}
+        adapter.edit_message.return_value = {"ok": True}
+        indicator = ThinkingIndicator(adapter, 123)
+        indicator._stop_animation()  # keep the dots animation out of edit counts
+        return indicator, adapter
+
+    def test_partial_edits_are_throttled(self) -> None:
+        """Only one edit per interval; finish shows the final text."""
+        indicator, adapter = self._indicator(interval=60.0)
+
+        indicator.stream_update("При")
+        indicator.stream_update("Привет")
+
+        assert [c.args[2] for c in adapter.edit_message.call_args_list] == ["При"]
+        assert indicator.finish("Привет!") is True
+        assert adapter.edit_message.call_args.args[2] == "Привет!"
+
+        indicator.stop()
+        adapter.delete_message.assert_not_called()
+
+    def test_finish_without_stream_falls_back(self) -> None:
+        """Unstreamed or oversized responses are left to a new message."""
+        indicator, adapter = self._indicator()
+
+        assert indicator.finish("Ответ") is False
+        indicator.stream_update("Ответ")
+        assert indicator.finish("x" * 5000) is False
+
+        indicator.stop()
+        adapter.delete_message.assert_called_once_with(123, 7)
+
+    def test_failed_final_edit_falls_back(self) -> None:
+        """A failed final edit reports False so the caller sends a message."""
+        indicator, adapter = self._indicator(interval=0.0)
+        indicator.stream_update("Отв")
+        adapter.edit_message.return_value = None
+
+        assert indicator.finish("Ответ") is False
@@ -29,10 +29,11 @@ class TestExitCodes:
         exit_code = task_cli_main(["create", "--title", "Test", "--json"])
         assert exit_code == ExitCode.SUCCESS
 
-    def test_fsm_error_exit_code(self, tmp_path: Path):
+    def test_fsm_error_exit_code(self, tmp_path: Path, monkeypatch):
         """FSM guard violation returns exit code 4."""
         vault_path = tmp_path / "vault"
         init_vault(vault_path)
+        monkeypatch.setenv("KIRA_VAULT_PATH", str(vault_path))
 
         # Create task
         task_cli_main(["create", "--title", "Task", "--json"])
@@ -158,7 +158,11 @@ class TestCoreIntegrationComplete:
         assert pending[0].clarification_id == item.clarification_id
 
         # 2. Test plugin loading with Host API
+        from kira.plugin_sdk.context import PluginContext
+
+        context = PluginContext(config={"vault": {"path": str(vault_path)}}, vault=vault_facade)
         loader = PluginLoader(
+            context=context,
             vault_path=vault_path,
             vault=vault_facade,
             use_sandbox=False,
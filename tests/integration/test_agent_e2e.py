@@ -2,6 +2,7 @@
 
 import json
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -300,3 +301,25 @@ class TestAgentService:
 
             assert response.status_code == 200
             assert "version" in response.json()
+
+    def test_vault_watcher_runs_with_app(self, temp_vault):
+        """Test Vault watcher starts on startup and stops on shutdown."""
+        config = AgentConfig(
+            llm_provider="openrouter",
+            openrouter_api_key="test-key",
+            vault_path=temp_vault,
+        )
+
+        from kira.agent.service import create_agent_app
+
+        def watcher_running() -> bool:
+            return any(thread.name == "kira-vault-watcher" for thread in threading.enumerate())
+
+        with patch("kira.agent.service.OpenRouterAdapter"):
+            app = create_agent_app(config)
+
+            from fastapi.testclient import TestClient
+
+            with TestClient(app):
+                assert watcher_running()
+            assert not watcher_running()
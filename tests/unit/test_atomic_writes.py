@@ -15,7 +15,7 @@ from unittest.mock import patch
 
 import pytest
 
-from kira.core.md_io import MarkdownDocument, MarkdownIOError, write_markdown
+from kira.core.md_io import MarkdownDocument, MarkdownIOError, read_markdown, write_markdown, write_markdown_batch
 
 
 class TestAtomicWriteProtocol:
@@ -352,3 +352,58 @@ class TestConcurrentWrites:
             final_doc = read_markdown(file_path)
             assert final_doc.get_metadata("version") == 9
             assert "Content version 9" in final_doc.content
+
+
+class TestBatchWrite:
+    """Test group-commit batch writes."""
+
+    def test_batch_fsyncs_each_directory_once(self):
+        """Test batch issues one directory fsync per folder."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            documents = [
+                (Path(tmpdir) / folder / f"doc-{i}.md", MarkdownDocument(frontmatter={"i": i}, content=f"Body {i}"))
+                for folder in ("tasks", "notes")
+                for i in range(5)
+            ]
+
+            fsync_calls = []
+            original_fsync = os.fsync
+
+            def tracked_fsync(fd):
+                fsync_calls.append(os.path.isdir(f"/proc/self/fd/{fd}"))
+                return original_fsync(fd)
+
+            with patch("os.fsync", tracked_fsync):
+                errors = write_markdown_batch(documents)
+
+            assert errors == {}
+            assert fsync_calls.count(True) == 2
+            assert fsync_calls.count(False) == 10
+            for path, document in documents:
+                assert read_markdown(path).frontmatter == document.frontmatter
+
+    def test_batch_reports_failed_files_and_cleans_up(self):
+        """Test a failed rename only affects its own file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            good = Path(tmpdir) / "good.md"
+            bad = Path(tmpdir) / "bad.md"
+            write_markdown(bad, MarkdownDocument(frontmatter={"v": 1}, content=""))
+            original_rename = Path.rename
+
+            def failing_rename(self, target):
+                if Path(target).name == "bad.md":
+                    raise OSError("Simulated failure")
+                return original_rename(self, target)
+
+            with patch.object(Path, "rename", failing_rename):
+                errors = write_markdown_batch(
+                    [
+                        (good, MarkdownDocument(frontmatter={"v": 2}, content="")),
+                        (bad, MarkdownDocument(frontmatter={"v": 2}, content="")),
+                    ]
+                )
+
+            assert list(errors) == [bad]
+            assert read_markdown(good).frontmatter == {"v": 2}
+            assert read_markdown(bad).frontmatter == {"v": 1}
+            assert list(Path(tmpdir).glob(".*.tmp*")) == []
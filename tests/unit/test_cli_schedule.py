@@ -0,0 +1,47 @@
+"""Tests for schedule/today CLI helpers over the date index."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+
+from kira.cli.kira_schedule import find_conflicts, load_events, load_tasks_with_deadlines, parse_datetime
+from kira.cli.kira_today import format_time_range
+from kira.core.host import HostAPI
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_parse_datetime_is_always_aware():
+    assert parse_datetime(date(2026, 10, 20)) == datetime(2026, 10, 20, tzinfo=UTC)
+    assert parse_datetime("2026-10-20T10:00:00").tzinfo is UTC
+    assert parse_datetime("2026-10-20T10:00:00+03:00").utcoffset().total_seconds() == 3 * 3600
+
+
+def test_mixed_date_and_datetime_values_sort(tmp_path):
+    _write(tmp_path / "tasks" / "task-1.md", "---\nid: task-1\ntitle: Timed\ndue: 2026-10-20T10:00:00+00:00\n---\n")
+    _write(tmp_path / "tasks" / "task-2.md", "---\nid: task-2\ntitle: All day\ndue: 2026-10-20\n---\n")
+    _write(tmp_path / "tasks" / "task-3.md", "---\nid: task-3\ntitle: Naive\ndue: '2026-10-20T08:00:00'\n---\n")
+    _write(tmp_path / "events" / "event-1.md", "---\nid: event-1\nstart: 2026-10-20\n---\n")
+    _write(
+        tmp_path / "events" / "event-2.md",
+        "---\nid: event-2\nstart: 2026-10-20T09:00:00+00:00\nend: 2026-10-20T10:00:00+00:00\n---\n",
+    )
+    host_api = HostAPI(tmp_path)
+    day = datetime(2026, 10, 20)
+
+    tasks = load_tasks_with_deadlines(tmp_path, day, day, host_api)
+    events = load_events(tmp_path, day, day, host_api)
+
+    assert [t["id"] for t in tasks] == ["task-2", "task-3", "task-1"]
+    assert [t["all_day"] for t in tasks] == [True, False, False]
+    assert [e["id"] for e in events] == ["event-1", "event-2"]
+    assert find_conflicts(events) == []
+
+
+def test_format_time_range_all_day():
+    assert format_time_range(date(2026, 10, 20), None) == "весь день"
+    assert format_time_range("2026-10-20", "2026-10-21") == "весь день"
+    assert format_time_range("2026-10-20T09:00:00+00:00", "2026-10-20T10:30:00+00:00") == "09:00-10:30"
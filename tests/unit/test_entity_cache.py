@@ -0,0 +1,108 @@
+"""Tests for in-process entity cache (ADR-006)."""
+
+from __future__ import annotations
+
+import os
+
+from kira.core.entity_cache import EntityCache
+from kira.core.entity_index import FileFingerprint
+from kira.core.host import Entity, HostAPI
+
+
+def _cached_entity(tmp_path, entity_id, body="Body"):
+    path = tmp_path / f"{entity_id}.md"
+    path.write_text(f"---\nid: {entity_id}\n---\n\n{body}", encoding="utf-8")
+    entity = Entity(id=entity_id, entity_type="task", metadata={"id": entity_id, "tags": ["a"]}, content=body)
+    return entity, path, FileFingerprint.from_stat(path.stat())
+
+
+class TestEntityCache:
+    def test_hit_returns_independent_copy(self, tmp_path):
+        cache = EntityCache()
+        entity, path, fingerprint = _cached_entity(tmp_path, "task-1")
+        cache.put(entity, path, fingerprint)
+
+        first = cache.get("task-1", path)
+        assert first is not None
+        first.metadata["tags"].append("mutated")
+
+        second = cache.get("task-1", path)
+        assert second is not None
+        assert second.metadata["tags"] == ["a"]
+        assert cache.get_stats()["hits"] == 2
+
+    def test_changed_file_is_a_miss(self, tmp_path):
+        cache = EntityCache()
+        entity, path, fingerprint = _cached_entity(tmp_path, "task-1")
+        cache.put(entity, path, fingerprint)
+
+        path.write_text("---\nid: task-1\n---\n\nEdited", encoding="utf-8")
+        os.utime(path, ns=(1, 1))
+
+        assert cache.get("task-1", path) is None
+        stats = cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["entries"] == 0
+
+    def test_lru_eviction_respects_byte_budget(self, tmp_path):
+        entries = [_cached_entity(tmp_path, f"task-{i}", body="x" * 100) for i in range(3)]
+        cache = EntityCache(max_bytes=entries[0][2].size * 2)
+
+        cache.put(*entries[0])
+        cache.put(*entries[1])
+        assert cache.get("task-0", entries[0][1]) is not None  # task-1 becomes LRU
+        cache.put(*entries[2])
+
+        assert cache.get("task-1", entries[1][1]) is None
+        assert cache.get("task-0", entries[0][1]) is not None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_invalidate_path_drops_entities_from_file(self, tmp_path):
+        cache = EntityCache()
+        entity, path, fingerprint = _cached_entity(tmp_path, "task-1")
+        cache.put(entity, path, fingerprint)
+        cache.put(*_cached_entity(tmp_path, "task-2"))
+
+        assert cache.invalidate_path(path) == ["task-1"]
+        assert cache.get_stats()["entries"] == 1
+
+    def test_disabled_cache_stores_nothing(self, tmp_path):
+        cache = EntityCache(max_bytes=0)
+        cache.put(*_cached_entity(tmp_path, "task-1"))
+
+        assert cache.get_stats()["entries"] == 0
+
+
+class TestHostAPICache:
+    def test_repeated_reads_hit_cache(self, tmp_path):
+        host_api = HostAPI(tmp_path)
+        task = host_api.create_entity("task", {"title": "Cached"})
+
+        host_api.read_entity(task.id)
+        host_api.read_entity(task.id)
+
+        stats = host_api.entity_cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    def test_writes_invalidate_cache(self, tmp_path):
+        host_api = HostAPI(tmp_path)
+        task = host_api.create_entity("task", {"title": "Before"})
+        host_api.read_entity(task.id)
+
+        host_api.update_entity(task.id, {"title": "After"})
+        assert host_api.read_entity(task.id).metadata["title"] == "After"
+
+        host_api.delete_entity(task.id)
+        assert not host_api._entity_exists(task.id)
+        assert host_api.entity_cache.get_stats()["entries"] == 0
+
+    def test_external_edit_is_not_served_stale(self, tmp_path):
+        host_api = HostAPI(tmp_path)
+        task = host_api.create_entity("task", {"title": "Original"})
+        host_api.read_entity(task.id)
+
+        text = task.path.read_text(encoding="utf-8").replace("Original", "Edited outside")
+        task.path.write_text(text, encoding="utf-8")
+
+        assert host_api.read_entity(task.id).metadata["title"] == "Edited outside"
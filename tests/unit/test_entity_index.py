@@ -0,0 +1,254 @@
+"""Tests for persistent entity metadata index (ADR-006)."""
+
+from __future__ import annotations
+
+import os
+from datetime import UTC, date, datetime
+
+import pytest
+
+from kira.core.entity_index import EntityIndex, date_index_key, decode_metadata, encode_metadata
+from kira.core.host import HostAPI
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+class TestMetadataEncoding:
+    def test_round_trip_preserves_yaml_types(self):
+        metadata = {
+            "id": "task-1",
+            "due": date(2025, 1, 2),
+            "created": datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC),
+            "tags": ["a", "b"],
+            "x-kira": {"version": 2, "source": None},
+        }
+
+        assert decode_metadata(encode_metadata(metadata)) == metadata
+
+
+class TestDateIndexKey:
+    def test_keys_for_yaml_and_string_values(self):
+        assert date_index_key(date(2025, 1, 2)) == ("2025-01-02", datetime(2025, 1, 2, tzinfo=UTC).timestamp())
+        assert date_index_key("2025-01-02T23:30:00+03:00") == (
+            "2025-01-02",
+            datetime(2025, 1, 2, 20, 30, tzinfo=UTC).timestamp(),
+        )
+        assert date_index_key("2025-01-02T10:00:00Z")[1] == datetime(2025, 1, 2, 10, tzinfo=UTC).timestamp()
+        assert date_index_key(datetime(2025, 1, 2, 10)) == date_index_key("2025-01-02T10:00:00Z")
+
+    def test_non_dates_have_no_key(self):
+        assert date_index_key("tomorrow") is None
+        assert date_index_key(None) is None
+        assert date_index_key(5) is None
+
+
+class TestEntityIndex:
+    def test_refresh_indexes_and_skips_unchanged_files(self, tmp_path):
+        _write(tmp_path / "tasks" / "task-1.md", "---\nid: task-1\ntitle: One\nstatus: todo\n---\n\nBody")
+        _write(tmp_path / "tasks" / "broken.md", "---\nid: [unclosed\n---\n")
+
+        index = EntityIndex(tmp_path, ["tasks"])
+
+        assert index.refresh() == 2
+        assert index.refresh() == 0
+
+        entity = index.get("task-1")
+        assert entity is not None
+        assert entity.metadata["title"] == "One"
+        index.close()
+
+    def test_refresh_detects_modified_and_removed_files(self, tmp_path):
+        task_path = tmp_path / "tasks" / "task-1.md"
+        _write(task_path, "---\nid: task-1\nstatus: todo\n---\n")
+        _write(tmp_path / "tasks" / "task-2.md", "---\nid: task-2\nstatus: todo\n---\n")
+
+        index = EntityIndex(tmp_path, ["tasks"])
+        index.refresh()
+
+        _write(task_path, "---\nid: task-1\nstatus: doing\n---\n")
+        (tmp_path / "tasks" / "task-2.md").unlink()
+
+        assert index.refresh() == 2
+        assert [e.entity_id for e in index.query(status="doing")] == ["task-1"]
+        assert index.get("task-2") is None
+        index.close()
+
+    def test_index_persists_across_instances(self, tmp_path):
+        _write(tmp_path / "notes" / "note-1.md", "---\nid: note-1\ntags:\n  - work\n---\n")
+
+        with EntityIndex(tmp_path, ["notes"]) as index:
+            index.refresh()
+
+        with EntityIndex(tmp_path, ["notes"]) as index:
+            assert index.refresh() == 0
+            assert [e.entity_id for e in index.query(tags=["work"])] == ["note-1"]
+
+    def test_get_reindexes_stale_row(self, tmp_path):
+        task_path = tmp_path / "tasks" / "task-1.md"
+        _write(task_path, "---\nid: task-1\nstatus: todo\n---\n")
+
+        index = EntityIndex(tmp_path, ["tasks"])
+        index.refresh()
+
+        _write(task_path, "---\nid: task-1\nstatus: done\nextra: value\n---\n")
+        os.utime(task_path, ns=(1, 1))
+
+        entity = index.get("task-1")
+        assert entity is not None
+        assert entity.metadata["status"] == "done"
+        index.close()
+
+    def test_query_filters_and_pagination(self, tmp_path):
+        for i in range(5):
+            status = "done" if i % 2 else "todo"
+            _write(tmp_path / "tasks" / f"task-{i}.md", f"---\nid: task-{i}\nstatus: {status}\n---\n")
+
+        index = EntityIndex(tmp_path, ["tasks"])
+        index.refresh()
+
+        todo = [e.entity_id for e in index.query(entity_type="task", status="todo")]
+        assert todo == ["task-0", "task-2", "task-4"]
+
+        page = [e.entity_id for e in index.query(limit=2, offset=1)]
+        assert page == ["task-1", "task-2"]
+        index.close()
+
+    def test_link_snapshot_tracks_changed_files(self, tmp_path):
+        task_path = tmp_path / "tasks" / "task-1.md"
+        _write(task_path, "---\nid: task-1\ndepends_on:\n  - task-2\n---\n\nSee [[note-1]]")
+        _write(tmp_path / "tasks" / "task-2.md", "---\nid: task-2\n---\n")
+
+        index = EntityIndex(tmp_path, ["tasks"])
+        index.refresh()
+
+        snapshot = index.get_links()
+        assert sorted(snapshot["task-1"]) == [("depends_on", "task-2"), ("links_to", "note-1")]
+        assert snapshot["task-2"] == []
+
+        _write(task_path, "---\nid: task-1\n---\n")
+        index.refresh()
+
+        assert index.get_links()["task-1"] == []
+        index.close()
+
+
+class TestDateIndex:
+    @pytest.fixture
+    def index(self, tmp_path):
+        _write(tmp_path / "tasks" / "task-1.md", "---\nid: task-1\nstatus: todo\ndue: 2025-01-03\n---\n")
+        _write(tmp_path / "tasks" / "task-2.md", "---\nid: task-2\nstatus: done\ndue: '2025-01-01T09:00:00Z'\n---\n")
+        _write(tmp_path / "tasks" / "task-3.md", "---\nid: task-3\nstatus: todo\ndue: 2025-01-02T23:30:00+03:00\n---\n")
+        _write(tmp_path / "tasks" / "task-4.md", "---\nid: task-4\nstatus: todo\ndue: someday\n---\n")
+        _write(tmp_path / "tasks" / "task-5.md", "---\nid: task-5\nstatus: todo\n---\n")
+        index = EntityIndex(tmp_path, ["tasks"])
+        index.refresh()
+        yield index
+        index.close()
+
+    def test_range_is_ordered_by_instant(self, index):
+        assert [e.entity_id for e in index.query_dates("due")] == ["task-2", "task-3", "task-1"]
+
+    def test_date_bounds_compare_calendar_days(self, index):
+        found = index.query_dates("due", start=date(2025, 1, 2), end=date(2025, 1, 2))
+        assert [e.entity_id for e in found] == ["task-3"]
+
+        assert [e.entity_id for e in index.query_dates("due", end=date(2025, 1, 2))] == ["task-2", "task-3"]
+
+    def test_datetime_bounds_compare_instants(self, index):
+        found = index.query_dates("due", start=datetime(2025, 1, 2, 21, tzinfo=UTC))
+        assert [e.entity_id for e in found] == ["task-1"]
+
+    def test_range_combines_with_status_filter(self, index):
+        found = index.query_dates("due", end=date(2025, 1, 2), status="todo")
+        assert [e.entity_id for e in found] == ["task-3"]
+
+    def test_range_follows_file_changes(self, index, tmp_path):
+        _write(tmp_path / "tasks" / "task-1.md", "---\nid: task-1\nstatus: todo\n---\n")
+        (tmp_path / "tasks" / "task-2.md").unlink()
+        index.refresh()
+
+        assert [e.entity_id for e in index.query_dates("due")] == ["task-3"]
+
+    def test_unknown_field_is_rejected(self, index):
+        with pytest.raises(ValueError, match="not date-indexed"):
+            index.query_dates("title")
+
+
+class TestHostAPIWithIndex:
+    def test_list_entities_filters_by_status_and_tags(self, tmp_path):
+        host_api = HostAPI(tmp_path)
+        host_api.create_entity("task", {"title": "Work", "status": "todo", "tags": ["work"]})
+        host_api.create_entity("task", {"title": "Home", "status": "todo", "tags": ["home"]})
+        doing = host_api.create_entity("task", {"title": "Doing", "status": "doing", "tags": ["work"]})
+
+        work = list(host_api.list_entities("task", tags=["work"]))
+        assert {e.metadata["title"] for e in work} == {"Work", "Doing"}
+
+        doing_tasks = list(host_api.list_entities("task", status="doing"))
+        assert [e.id for e in doing_tasks] == [doing.id]
+
+    def test_list_entities_matches_scan(self, tmp_path):
+        host_api = HostAPI(tmp_path)
+        for i in range(3):
+            host_api.create_entity("note", {"title": f"Note {i}"}, content=f"Body {i}")
+
+        scanned = HostAPI(tmp_path, use_entity_index=False)
+
+        indexed_entities = {e.id: (e.metadata, e.content) for e in host_api.list_entities()}
+        scanned_entities = {e.id: (e.metadata, e.content) for e in scanned.list_entities()}
+        assert indexed_entities == scanned_entities
+
+    def test_list_entities_sees_external_edits(self, tmp_path):
+        host_api = HostAPI(tmp_path)
+        entity = host_api.create_entity("task", {"title": "Task", "status": "todo"})
+        assert len(list(host_api.list_entities("task", status="todo"))) == 1
+
+        text = entity.path.read_text(encoding="utf-8").replace("status: todo", "status: done")
+        entity.path.write_text(text, encoding="utf-8")
+
+        assert list(host_api.list_entities("task", status="todo")) == []
+        assert len(list(host_api.list_entities("task", status="done"))) == 1
+
+    def test_read_entity_with_nonstandard_filename(self, tmp_path):
+        _write(tmp_path / "notes" / "My Note.md", "---\nid: note-custom\ntitle: Custom\n---\n\nBody")
+        host_api = HostAPI(tmp_path)
+
+        entity = host_api.read_entity("note-custom")
+
+        assert entity.metadata["title"] == "Custom"
+        assert entity.path == tmp_path / "notes" / "My Note.md"
+        assert host_api._entity_exists("note-custom")
+
+    def test_delete_removes_entity_from_listing(self, tmp_path):
+        host_api = HostAPI(tmp_path)
+        entity = host_api.create_entity("task", {"title": "Task"})
+        assert len(list(host_api.list_entities("task"))) == 1
+
+        host_api.delete_entity(entity.id)
+
+        assert list(host_api.list_entities("task")) == []
+        assert not host_api._entity_exists(entity.id)
+
+    def test_list_entities_by_date_matches_scan(self, tmp_path):
+        _write(tmp_path / "events" / "event-1.md", "---\nid: event-1\nstart: 2025-03-01T18:00:00+00:00\n---\n")
+        _write(tmp_path / "events" / "event-2.md", "---\nid: event-2\nstart: 2025-03-01T09:00:00+00:00\n---\n")
+        _write(tmp_path / "events" / "event-3.md", "---\nid: event-3\nstart: 2025-03-02T09:00:00+00:00\n---\n")
+        host_api = HostAPI(tmp_path)
+        scanned = HostAPI(tmp_path, use_entity_index=False)
+
+        for kwargs in (
+            {"start": date(2025, 3, 1), "end": date(2025, 3, 1)},
+            {"start": datetime(2025, 3, 1, 12, tzinfo=UTC)},
+            {"end": date(2025, 3, 1), "limit": 1},
+        ):
+            indexed_ids = [e.id for e in host_api.list_entities_by_date("event", "start", **kwargs)]
+            scanned_ids = [e.id for e in scanned.list_entities_by_date("event", "start", **kwargs)]
+            assert indexed_ids == scanned_ids, kwargs
+
+        assert [e.id for e in host_api.list_entities_by_date("event", "start", end=date(2025, 3, 1))] == [
+            "event-2",
+            "event-1",
+        ]
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import sys
+import threading
+import time
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
-from kira.core.events import Event, EventBus, RetryPolicy, SubscriptionHandle, create_event_bus
+from kira.core.events import (
+    Event,
+    EventBus,
+    LatencyHistogram,
+    RetryPolicy,
+    SubscriptionHandle,
+    create_event_bus,
+    topic_matches,
+)
 
 
 class TestEvent:
@@ -273,6 +285,317 @@ class TestEventBus:
 
         assert received_events[0].correlation_id == correlation_id
 
+    def test_handler_latency_in_stats(self):
+        """Test per-handler latency histograms."""
+        bus = EventBus()
+
+        def handler(event: Event) -> None:
+            pass
+
+        handle = bus.subscribe("test.event", handler)
+        bus.publish("test.event")
+        bus.publish("test.event")
+
+        latency = bus.get_stats()["test.event"]["handlers"][handle.subscription_id]
+
+        assert latency["handler"].endswith("handler")
+        assert latency["count"] == 2
+        assert sum(latency["buckets"].values()) == 2
+
+
+class TestWildcardSubscriptions:
+    def test_topic_matches(self):
+        assert topic_matches("task.created", "task.created")
+        assert topic_matches("task.*", "task.created")
+        assert not topic_matches("task.*", "task")
+        assert not topic_matches("task.*", "task.enter.done")
+        assert topic_matches("*.created", "entity.created")
+        assert topic_matches("sync.**", "sync.gcal.pull.done")
+        assert topic_matches("sync.**", "sync")
+        assert topic_matches("**", "anything.at.all")
+        assert topic_matches("sync.**.done", "sync.gcal.pull.done")
+        assert not topic_matches("sync.**.done", "sync.gcal.pull.failed")
+
+    def test_wildcard_delivery_preserves_subscription_order(self):
+        bus = EventBus()
+        received: list[str] = []
+
+        bus.subscribe("task.*", lambda e: received.append("star"))
+        bus.subscribe("task.created", lambda e: received.append("exact"))
+        bus.subscribe("**", lambda e: received.append("all"))
+        bus.subscribe("note.*", lambda e: received.append("note"))
+
+        assert bus.publish("task.created") == 3
+        assert received == ["star", "exact", "all"]
+        assert bus.get_subscriptions("task.*")[0].event_name == "task.*"
+
+    def test_snapshot_follows_subscription_changes(self):
+        bus = EventBus()
+        received: list[str] = []
+
+        handle = bus.subscribe("sync.**", lambda e: received.append(e.name))
+        bus.publish("sync.gcal.pulled")
+        bus.unsubscribe(handle)
+        bus.publish("sync.gcal.pulled")
+        bus.subscribe("sync.gcal.*", lambda e: received.append(e.name), once=True)
+        bus.publish("sync.gcal.pushed")
+        bus.publish("sync.gcal.pushed")
+
+        assert received == ["sync.gcal.pulled", "sync.gcal.pushed"]
+        assert bus.get_subscriptions() == []
+
+    def test_handler_subscribing_during_publish(self):
+        bus = EventBus()
+        received: list[str] = []
+
+        def subscriber(event: Event) -> None:
+            bus.subscribe("task.*", lambda e: received.append("late"))
+
+        bus.subscribe("task.*", subscriber, once=True)
+        bus.publish("task.created")
+        bus.publish("task.created")
+
+        assert received == ["late"]
+
+    def test_invalid_patterns(self):
+        bus = EventBus()
+
+        for pattern in ("task.", "task.enter_*", "", "a..b"):
+            with pytest.raises(ValueError):
+                bus.subscribe(pattern, lambda e: None)
+
+
+class TestLatencyHistogram:
+    def test_buckets_and_quantiles(self):
+        histogram = LatencyHistogram()
+        for duration_ms in [0.5] * 90 + [20.0] * 9 + [9000.0]:
+            histogram.observe(duration_ms)
+
+        data = histogram.to_dict()
+
+        assert data["count"] == 100
+        assert data["buckets"]["1"] == 90
+        assert data["buckets"]["50"] == 9
+        assert data["buckets"]["+Inf"] == 1
+        assert data["p50_ms"] == pytest.approx(1.0)
+        assert data["p95_ms"] == pytest.approx(50.0)
+        assert data["max_ms"] == pytest.approx(9000.0)
+        assert data["p99_ms"] == pytest.approx(50.0)
+
+
+class TestAsyncEventBus:
+    def test_publish_does_not_block_on_slow_handler(self):
+        bus = EventBus(async_mode=True)
+        release = threading.Event()
+        received: list[str] = []
+        bus.subscribe("test.event", lambda e: release.wait(5))
+        bus.subscribe("test.event", lambda e: received.append(e.name))
+
+        start = time.monotonic()
+        assert bus.publish("test.event") == 2
+        assert time.monotonic() - start < 1.0
+
+        assert _wait_for(lambda: received == ["test.event"])
+        release.set()
+        assert bus.flush(timeout=5)
+        assert bus.get_stats()["test.event"]["delivered"] == 2
+        bus.shutdown()
+
+    def test_per_subscriber_order(self):
+        bus = EventBus(async_mode=True, max_workers=4)
+        received: list[int] = []
+        bus.subscribe("test.event", lambda e: received.append(e.payload["n"]))
+
+        for n in range(200):
+            bus.publish("test.event", {"n": n})
+
+        assert bus.flush(timeout=5)
+        assert received == list(range(200))
+        bus.shutdown()
+
+    def test_retries_do_not_hold_workers(self):
+        bus = EventBus(async_mode=True, max_workers=1)
+        attempts: list[int] = []
+        received: list[str] = []
+
+        def flaky(event: Event) -> None:
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ValueError("Test error")
+
+        bus.subscribe("flaky", flaky, retry_policy=RetryPolicy(max_attempts=3, initial_delay=0.2, jitter=False))
+        bus.subscribe("other", lambda e: received.append(e.name))
+
+        bus.publish("flaky")
+        assert _wait_for(lambda: attempts)
+        bus.publish("other")
+
+        # The single worker delivers "other" while "flaky" waits for its retry
+        assert _wait_for(lambda: received, timeout=0.15)
+        assert len(attempts) == 1
+        assert bus.flush(timeout=5)
+        assert len(attempts) == 3
+        assert bus.get_stats()["flaky"]["delivered"] == 1
+        bus.shutdown()
+
+    def test_publish_and_wait(self):
+        bus = EventBus(async_mode=True)
+        received: list[str] = []
+        bus.subscribe("test.event", lambda e: (time.sleep(0.05), received.append("slow")))
+        bus.subscribe("test.event", lambda e: received.append("fast"))
+
+        def failing(event: Event) -> None:
+            raise ValueError("Always fails")
+
+        bus.subscribe("test.event", failing, retry_policy=RetryPolicy(max_attempts=2, initial_delay=0.01))
+
+        assert bus.publish_and_wait("test.event", timeout=5) == 2
+        assert sorted(received) == ["fast", "slow"]
+        assert bus.get_stats()["test.event"]["failed"] == 1
+        bus.shutdown()
+
+    def test_publish_and_wait_timeout(self):
+        bus = EventBus(async_mode=True)
+        release = threading.Event()
+        bus.subscribe("test.event", lambda e: release.wait(5))
+
+        with pytest.raises(TimeoutError):
+            bus.publish_and_wait("test.event", timeout=0.05)
+
+        release.set()
+        bus.shutdown()
+
+    def test_drop_backpressure(self):
+        bus = EventBus(async_mode=True, queue_size=2, backpressure="drop")
+        release = threading.Event()
+        started = threading.Event()
+        handled: list[int] = []
+
+        def handler(event: Event) -> None:
+            started.set()
+            release.wait(5)
+            handled.append(event.payload["n"])
+
+        bus.subscribe("test.event", handler)
+        bus.publish("test.event", {"n": 0})
+        assert started.wait(5)
+
+        queued = [bus.publish("test.event", {"n": n}) for n in range(1, 6)]
+        release.set()
+
+        assert queued == [1, 1, 0, 0, 0]
+        assert bus.flush(timeout=5)
+        assert handled == [0, 1, 2]
+        assert bus.get_stats()["test.event"]["dropped"] == 3
+        bus.shutdown()
+
+    def test_spill_backpressure_preserves_order(self, tmp_path):
+        bus = EventBus(async_mode=True, queue_size=2, backpressure="spill", spill_dir=tmp_path)
+        release = threading.Event()
+        handled: list[int] = []
+        bus.subscribe("test.event", lambda e: (release.wait(5), handled.append(e.payload["n"])))
+
+        for n in range(10):
+            assert bus.publish("test.event", {"n": n}) == 1
+
+        queue_stats = bus.get_queue_stats()
+        assert sum(q["spilled"] for q in queue_stats["queues"].values()) > 0
+        release.set()
+
+        assert bus.flush(timeout=5)
+        assert handled == list(range(10))
+        assert bus.get_stats()["test.event"]["spilled"] > 0
+        bus.shutdown()
+
+    def test_block_backpressure_waits_for_space(self):
+        bus = EventBus(async_mode=True, queue_size=1, backpressure="block")
+        handled: list[int] = []
+        bus.subscribe("test.event", lambda e: (time.sleep(0.01), handled.append(e.payload["n"])))
+
+        for n in range(5):
+            bus.publish("test.event", {"n": n})
+
+        assert bus.flush(timeout=5)
+        assert handled == list(range(5))
+        assert bus.get_stats()["test.event"]["dropped"] == 0
+        bus.shutdown()
+
+    def test_block_backpressure_never_blocks_a_worker(self):
+        bus = EventBus(async_mode=True, queue_size=1, max_workers=1, backpressure="block")
+        handled: list[int] = []
+
+        def handler(event: Event) -> None:
+            handled.append(event.payload["n"])
+            if event.payload["n"] == 0:
+                # Only this worker could free space in its own full queue
+                bus.publish("test.event", {"n": 1})
+                bus.publish("test.event", {"n": 2})
+
+        bus.subscribe("test.event", handler)
+        bus.publish("test.event", {"n": 0})
+
+        drained = bus.flush(timeout=5)
+        bus.shutdown(wait=drained)
+        assert drained
+        assert handled == [0, 1, 2]
+
+    def test_once_subscription(self):
+        bus = EventBus(async_mode=True)
+        received: list[str] = []
+        bus.subscribe("test.event", lambda e: received.append(e.name), once=True)
+
+        bus.publish("test.event")
+        bus.publish("test.event")
+
+        assert bus.flush(timeout=5)
+        assert received == ["test.event"]
+        assert bus.get_subscriptions("test.event") == []
+        bus.shutdown()
+
+    def test_shutdown_without_wait_releases_waiters(self):
+        bus = EventBus(async_mode=True)
+        attempted = threading.Event()
+
+        def failing(event: Event) -> None:
+            attempted.set()
+            raise ValueError("Test error")
+
+        bus.subscribe("test.event", failing, retry_policy=RetryPolicy(max_attempts=2, initial_delay=5.0, jitter=False))
+        results: list[int] = []
+        waiter = threading.Thread(target=lambda: results.append(bus.publish_and_wait("test.event", timeout=None)))
+        waiter.start()
+        assert attempted.wait(5)
+        assert _wait_for(lambda: bus.get_queue_stats()["pending_retries"] == 1)
+
+        bus.shutdown(wait=False)
+
+        waiter.join(5)
+        assert not waiter.is_alive()
+        assert results == [0]
+        assert bus.get_stats()["test.event"]["failed"] == 1
+
+    def test_publish_after_shutdown_is_synchronous(self):
+        bus = create_event_bus(async_mode=True)
+        received: list[str] = []
+        bus.subscribe("test.event", lambda e: received.append(e.name))
+        bus.shutdown()
+
+        assert bus.publish("test.event") == 1
+        assert received == ["test.event"]
+
+    def test_invalid_backpressure(self):
+        with pytest.raises(ValueError):
+            EventBus(async_mode=True, backpressure="discard")  # type: ignore[arg-type]
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
 
 class TestEventBusFactory:
     def test_create_event_bus(self):
@@ -51,6 +51,22 @@ class TestEntity:
         assert doc.frontmatter["title"] == "Test"
         assert doc.content == "Task description"
 
+    def test_entity_from_frontmatter_loads_content_lazily(self, tmp_path):
+        file_path = tmp_path / "task-123.md"
+        file_path.write_text("---\nid: task-123\n---\n\nOriginal body", encoding="utf-8")
+
+        entity = Entity.from_frontmatter("task-123", {"id": "task-123"}, file_path)
+        assert "_content_loader" in entity.__dict__
+
+        file_path.write_text("---\nid: task-123\n---\n\nLoaded body", encoding="utf-8")
+        assert entity.content == "Loaded body"
+
+        # Loaded once, then cached; assignment replaces it
+        file_path.unlink()
+        assert entity.content == "Loaded body"
+        entity.content = "New body"
+        assert entity.to_markdown().content == "New body"
+
 
 class TestHostAPI:
     def test_create_host_api(self, tmp_path):
@@ -248,6 +264,28 @@ class TestHostAPI:
         assert "incoming" in links
         assert len(links["outgoing"]) > 0
 
+    def test_link_graph_loads_lazily_from_disk(self, tmp_path):
+        writer = HostAPI(tmp_path)
+        task1 = writer.create_entity("task", {"title": "Task 1"})
+        task2 = writer.create_entity("task", {"title": "Task 2", "depends_on": [task1.id]})
+
+        host_api = HostAPI(tmp_path)
+        assert host_api._link_graph is None
+
+        links = host_api.get_entity_links(task1.id)
+
+        assert {"source": task2.id, "type": "depends_on"} in links["incoming"]
+
+    def test_link_graph_reflects_writes_before_first_load(self, tmp_path):
+        host_api = HostAPI(tmp_path)
+        task1 = host_api.create_entity("task", {"title": "Task 1"})
+        task2 = host_api.create_entity("task", {"title": "Task 2", "depends_on": [task1.id]})
+        host_api.update_entity(task2.id, {"depends_on": []})
+
+        links = host_api.get_entity_links(task2.id)
+
+        assert links["outgoing"] == []
+
     def test_event_emission(self, tmp_path):
         event_bus = EventBus()
         events: list[tuple[str, dict]] = []
@@ -6,9 +6,12 @@ Tests SHA-256 event ID generation, SQLite dedupe store, and TTL cleanup.
 
 from __future__ import annotations
 
+import multiprocessing
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from kira.core.idempotency import (
     EventDedupeStore,
     create_dedupe_store,
@@ -268,6 +271,87 @@ class TestEventDedupeStore:
             store.close()
 
 
+class TestBatchedDedupe:
+    """Test batch upserts and the in-memory bloom/LRU front."""
+
+    def test_mark_seen_many(self, tmp_path):
+        store = EventDedupeStore(tmp_path / "dedupe.db")
+        store.mark_seen("event-1")
+
+        results = store.mark_seen_many(["event-1", "event-2", "event-3", "event-2"], source="gcal")
+
+        assert results == [False, True, True, False]
+        assert store.get_event_info("event-2")["seen_count"] == 2
+        assert store.get_event_info("event-3")["source"] == "gcal"
+        store.close()
+
+    def test_uses_wal_journal(self, tmp_path):
+        store = EventDedupeStore(tmp_path / "dedupe.db")
+
+        assert store._get_connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        store.close()
+
+    def test_checks_answered_from_memory(self, tmp_path):
+        store = EventDedupeStore(tmp_path / "dedupe.db")
+        store.mark_seen_many([f"event-{i}" for i in range(100)])
+
+        assert all(store.is_duplicate(f"event-{i}") for i in range(100))
+        assert not any(store.is_duplicate(f"new-{i}") for i in range(100))
+
+        cache = store.get_stats()["cache"]
+        assert cache["recent_hits"] == 100
+        assert cache["bloom_misses"] + cache["db_lookups"] == 100
+        assert cache["db_lookups"] <= 5  # bloom false positives only
+        store.close()
+
+    def test_bloom_filter_grows_with_store(self, tmp_path):
+        store = EventDedupeStore(tmp_path / "dedupe.db", bloom_capacity=10, recent_size=5)
+        store.mark_seen_many([f"event-{i}" for i in range(200)])
+        store.close()
+
+        reopened = EventDedupeStore(tmp_path / "dedupe.db", bloom_capacity=10, recent_size=5)
+
+        assert all(reopened.is_duplicate(f"event-{i}") for i in range(200))
+        assert reopened._bloom.capacity >= 400
+        reopened.close()
+
+    def test_sees_writes_from_other_connections(self, tmp_path):
+        store_a = EventDedupeStore(tmp_path / "dedupe.db")
+        store_b = EventDedupeStore(tmp_path / "dedupe.db")
+
+        assert store_a.is_duplicate("event-1") is False  # bloom loaded, empty
+        assert store_b.mark_seen("event-1") is True
+
+        assert store_a.is_duplicate("event-1") is True
+        assert store_a.mark_seen("event-1") is False
+
+        store_b.cleanup_old_events(ttl_days=-1)  # delete everything
+
+        assert store_a.is_duplicate("event-1") is False
+        assert store_a.mark_seen("event-1") is True
+        store_a.close()
+        store_b.close()
+
+    @pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="fork not available")
+    def test_concurrent_processes_agree_on_first_seen(self, tmp_path):
+        db_path = tmp_path / "dedupe.db"
+        EventDedupeStore(db_path).close()
+        event_ids = [f"event-{i}" for i in range(200)]
+
+        context = multiprocessing.get_context("fork")
+        with context.Pool(3) as pool:
+            results = pool.starmap(_mark_batch, [(db_path, event_ids)] * 3)
+
+        assert [sum(column) for column in zip(*results, strict=True)] == [1] * len(event_ids)
+        with EventDedupeStore(db_path) as store:
+            assert store.get_stats()["total_seen_count"] == 600
+
+
+def _mark_batch(db_path: Path, event_ids: list[str]) -> list[bool]:
+    with EventDedupeStore(db_path) as store:
+        return store.mark_seen_many(event_ids)
+
+
 class TestTTLCleanup:
     """Test TTL-based cleanup (Phase 3, Point 9)."""
 
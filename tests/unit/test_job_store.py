@@ -0,0 +1,61 @@
+"""Tests for persistent scheduler job state (ADR-005)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from kira.core.job_store import JobRecord, JobStore, create_job_store, trigger_key
+from kira.core.scheduler import Trigger, TriggerType
+
+
+def _record(job_id: str = "job", **overrides) -> JobRecord:
+    values = {"name": job_id, "trigger_key": "interval:60.0", "status": "pending", "next_run_at": 1000.0}
+    values.update(overrides)
+    return JobRecord(job_id=job_id, **values)
+
+
+class TestTriggerKey:
+    def test_keys_identify_schedule(self):
+        at = datetime(2025, 1, 15, 9, 0, tzinfo=UTC)
+
+        assert trigger_key(Trigger(type=TriggerType.INTERVAL, interval_seconds=60)) == "interval:60.0"
+        assert trigger_key(Trigger(type=TriggerType.AT, target_datetime=at)) == f"at:{at.isoformat()}"
+        assert trigger_key(Trigger(type=TriggerType.CRON, cron_expression="0 9 * * *")) == "cron:0 9 * * *"
+
+
+class TestJobStore:
+    def test_save_and_load(self, tmp_path):
+        with JobStore(tmp_path / "scheduler.db") as store:
+            assert store.load("job") is None
+
+            store.save(_record(run_count=3, last_error="boom"))
+            record = store.load("job")
+
+        assert record.next_run_at == pytest.approx(1000.0)
+        assert record.run_count == 3
+        assert record.last_error == "boom"
+        assert record.updated_at > 0
+
+    def test_save_replaces_and_delete(self, tmp_path):
+        store = JobStore(tmp_path / "scheduler.db")
+        store.save(_record("b"))
+        store.save(_record("a"))
+        store.save(_record("a", status="completed", next_run_at=None))
+
+        assert [(r.job_id, r.status) for r in store.load_all()] == [("a", "completed"), ("b", "pending")]
+        assert store.delete("a") is True
+        assert store.delete("a") is False
+        store.close()
+
+    def test_state_survives_reopen(self, tmp_path):
+        JobStore(tmp_path / "scheduler.db").save(_record(run_count=7))
+
+        assert JobStore(tmp_path / "scheduler.db").load("job").run_count == 7
+
+    def test_create_job_store(self, tmp_path):
+        store = create_job_store(tmp_path)
+
+        assert store.db_path == tmp_path / ".kira" / "scheduler.db"
+        assert store.db_path.exists()
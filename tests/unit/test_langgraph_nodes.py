@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from unittest.mock import Mock
 
 import pytest
@@ -142,6 +144,7 @@ def test_plan_node_success():
     assert result["plan"][0]["args"] == {"title": "Test"}
     assert result["plan"][0]["tool"] == "task_create"
     assert "reasoning" in result["memory"]
+    assert result["current_step"] == 0
 
 
 def test_plan_node_no_user_message():
@@ -357,6 +360,130 @@ def test_tool_node_no_more_steps():
     assert result["status"] == "completed"
 
 
+class ConcurrentTool(MockTool):
+    """Mock tool recording how many calls overlap."""
+
+    def __init__(self, name: str, delay: float = 0.05):
+        super().__init__(name, ToolResult.ok({}))
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def execute(self, args, dry_run=False):
+        """Execute tool slowly."""
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if args.get("uid") == "bad":
+            return ToolResult.error("Task not found: bad")
+        return ToolResult.ok({"uid": args.get("uid")})
+
+
+def _delete_plan(*uids):
+    return [{"tool": "task_delete", "args": {"uid": uid}, "dry_run": False} for uid in uids]
+
+
+def test_tool_node_runs_independent_steps_in_parallel():
+    """Independent steps run concurrently and merge in plan order."""
+    tool = ConcurrentTool("task_delete")
+    registry = MockToolRegistry()
+    registry.register(tool)
+    state = AgentState(trace_id="test-123", plan=_delete_plan("t1", "t2", "t3", "t4", "t5"))
+
+    result = tool_node(state, registry, max_workers=3)
+
+    assert result["status"] == "executed"
+    assert result["current_step"] == 5
+    assert [r["data"]["uid"] for r in result["tool_results"]] == ["t1", "t2", "t3", "t4", "t5"]
+    assert [r["step"] for r in result["tool_results"]] == [0, 1, 2, 3, 4]
+    assert tool.max_active == 3
+    assert state.budget.steps_used == 5
+
+
+def test_tool_node_batch_stops_at_dependent_step():
+    """Steps touching the same entity or the whole vault are not batched."""
+    tool = ConcurrentTool("task_delete", delay=0)
+    registry = MockToolRegistry()
+    registry.register(tool)
+    registry.register(ConcurrentTool("task_update", delay=0))
+    registry.register(MockTool("task_list", ToolResult.ok({})))
+    plan = [
+        *_delete_plan("t1", "t2"),
+        {"tool": "task_update", "args": {"uid": "t3", "depends_on": ["t1"]}},
+        *_delete_plan("t4"),
+    ]
+
+    assert tool_node(AgentState(trace_id="t", plan=plan), registry)["current_step"] == 2
+    assert tool_node(AgentState(trace_id="t", plan=_delete_plan("t1", "t1")), registry)["current_step"] == 1
+
+    plan = [{"tool": "task_list", "args": {}}, *_delete_plan("t1")]
+    assert tool_node(AgentState(trace_id="t", plan=plan), registry)["current_step"] == 1
+
+
+def test_tool_node_batch_reports_first_error():
+    """A failing step does not stop its independent siblings."""
+    registry = MockToolRegistry()
+    registry.register(ConcurrentTool("task_delete", delay=0))
+    state = AgentState(trace_id="test-123", plan=_delete_plan("t1", "bad", "t3"))
+
+    result = tool_node(state, registry)
+
+    assert result["status"] == "error"
+    assert result["error"] == "Task not found: bad"
+    assert [r["status"] for r in result["tool_results"]] == ["ok", "error", "ok"]
+
+
+def test_tool_node_batch_respects_budget():
+    """Batch size is capped by remaining steps; steps not started are skipped at the time limit."""
+    registry = MockToolRegistry()
+    registry.register(ConcurrentTool("task_delete", delay=0.2))
+    state = AgentState(trace_id="test-123", plan=_delete_plan("t1", "t2", "t3"), budget=Budget(max_steps=2))
+
+    assert tool_node(state, registry)["current_step"] == 2
+
+    state = AgentState(
+        trace_id="test-123",
+        plan=_delete_plan("t1", "t2", "t3"),
+        budget=Budget(max_wall_time_seconds=0.1),
+    )
+    result = tool_node(state, registry, max_workers=1)
+
+    assert result["status"] == "error"
+    assert [r.get("error") for r in result["tool_results"]] == [None] + ["Wall-time budget exhausted"] * 2
+    assert state.budget.steps_used == 1
+    assert state.budget.wall_time_used >= 0.2
+
+
+def test_tool_node_batch_reports_running_writes_after_time_limit():
+    """A mutating step still running at the time limit is reported with its real outcome."""
+    written = []
+
+    class SlowWriteTool(ConcurrentTool):
+        def execute(self, args, dry_run=False):
+            result = super().execute(args, dry_run)
+            written.append(args["uid"])
+            return result
+
+    registry = MockToolRegistry()
+    registry.register(SlowWriteTool("task_delete", delay=0.3))
+    state = AgentState(
+        trace_id="test-123",
+        plan=_delete_plan("t1", "t2"),
+        budget=Budget(max_wall_time_seconds=0.05),
+    )
+
+    result = tool_node(state, registry, max_workers=2)
+
+    assert sorted(written) == ["t1", "t2"]
+    assert result["status"] == "executed"
+    assert [r["status"] for r in result["tool_results"]] == ["ok", "ok"]
+    assert state.budget.steps_used == 2
+
+
 def test_verify_node_success():
     """Test verify node with successful results."""
     registry = MockToolRegistry()
@@ -46,7 +46,7 @@ class TestOpenRouterAdapter:
         }
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+            mock_client.return_value.post.return_value = mock_response
 
             result = adapter.generate("Test prompt")
 
@@ -59,7 +59,7 @@ class TestOpenRouterAdapter:
         adapter = OpenRouterAdapter(api_key="test-key")
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.post.side_effect = (
+            mock_client.return_value.post.side_effect = (
                 __import__("httpx").TimeoutException("Timeout")
             )
 
@@ -74,7 +74,7 @@ class TestOpenRouterAdapter:
         mock_response.status_code = 429
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+            mock_client.return_value.post.return_value = mock_response
 
             with pytest.raises(LLMRateLimitError):
                 adapter.generate("Test prompt")
@@ -102,7 +102,7 @@ class TestOpenRouterAdapter:
         }
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+            mock_client.return_value.post.return_value = mock_response
 
             result = adapter.chat(messages)
 
@@ -146,7 +146,7 @@ class TestOpenRouterAdapter:
         }
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+            mock_client.return_value.post.return_value = mock_response
 
             result = adapter.tool_call(messages, tools)
 
@@ -186,7 +186,7 @@ class TestOpenAIAdapter:
         }
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+            mock_client.return_value.post.return_value = mock_response
 
             result = adapter.generate("Test")
 
@@ -202,7 +202,7 @@ class TestOpenAIAdapter:
         mock_response.json.side_effect = Exception("Not JSON")
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+            mock_client.return_value.post.return_value = mock_response
 
             with pytest.raises(LLMError):
                 adapter.generate("Test")
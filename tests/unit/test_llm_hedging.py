@@ -0,0 +1,116 @@
+"""Tests for hedged LLM requests across providers."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from kira.adapters.llm import LatencyTracker, LLMError, LLMErrorEnhanced, LLMResponse, LLMRouter, Message, RouterConfig
+
+MESSAGES = [Message(role="user", content="Hi")]
+
+
+def _adapter(content: str, *, delay: float = 0.0, release: threading.Event | None = None) -> Mock:
+    def chat(*args, **kwargs):
+        if release is not None:
+            release.wait(5)
+        time.sleep(delay)
+        return LLMResponse(content=content)
+
+    adapter = Mock()
+    adapter.chat.side_effect = chat
+    return adapter
+
+
+def _router(primary: Mock, secondary: Mock, **config) -> LLMRouter:
+    defaults = {"enable_hedging": True, "enable_ollama_fallback": False, "max_retries": 1, "hedge_initial_delay": 0.05}
+    return LLMRouter(
+        RouterConfig(default_provider="openrouter", **{**defaults, **config}),
+        openrouter_adapter=primary,
+        anthropic_adapter=secondary,
+    )
+
+
+class TestLatencyTracker:
+    def test_quantile_needs_min_samples(self):
+        tracker = LatencyTracker(min_samples=3)
+        tracker.record("openai", 1.0)
+        tracker.record("openai", 2.0)
+
+        assert tracker.quantile("openai") is None
+        assert tracker.quantile("anthropic") is None
+
+    def test_nearest_rank_quantile_over_window(self):
+        tracker = LatencyTracker(window=20, min_samples=1)
+        for value in range(100):
+            tracker.record("openai", float(value))
+
+        assert tracker.quantile("openai", 0.95) == pytest.approx(98.0)  # 19th of 80..99
+        assert tracker.quantile("openai", 0.5) == pytest.approx(89.0)
+
+
+class TestHedging:
+    def test_slow_primary_is_hedged(self):
+        release = threading.Event()
+        router = _router(_adapter("slow", release=release), secondary := _adapter("fast"))
+        try:
+            start = time.perf_counter()
+            response = router.chat(MESSAGES)
+            elapsed = time.perf_counter() - start
+        finally:
+            release.set()
+            router.close()
+
+        assert response.content == "fast"
+        assert elapsed < 1.0
+        secondary.chat.assert_called_once()
+
+    def test_fast_primary_is_not_hedged(self):
+        router = _router(_adapter("primary"), secondary := _adapter("secondary"), hedge_initial_delay=1.0)
+
+        assert router.chat(MESSAGES).content == "primary"
+        secondary.chat.assert_not_called()
+        assert len(router.latency._samples["openrouter"]) == 1
+
+    def test_failed_primary_is_hedged_immediately(self):
+        primary = Mock()
+        primary.chat.side_effect = LLMError("invalid api key")
+        router = _router(primary, _adapter("secondary"), hedge_initial_delay=10.0)
+
+        start = time.perf_counter()
+        assert router.chat(MESSAGES).content == "secondary"
+        assert time.perf_counter() - start < 1.0
+
+    def test_all_providers_fail(self):
+        primary, secondary = Mock(), Mock()
+        primary.chat.side_effect = LLMError("primary down")
+        secondary.chat.side_effect = LLMError("secondary down")
+
+        with pytest.raises(LLMErrorEnhanced, match="primary down"):
+            _router(primary, secondary).chat(MESSAGES)
+
+    def test_model_override_is_not_hedged(self):
+        router = _router(_adapter("slow", delay=0.2), secondary := _adapter("fast"))
+
+        assert router.chat(MESSAGES, model="gpt-4").content == "slow"
+        secondary.chat.assert_not_called()
+
+    def test_disabled_without_flag(self):
+        router = _router(_adapter("slow", delay=0.2), secondary := _adapter("fast"), enable_hedging=False)
+
+        assert router.chat(MESSAGES).content == "slow"
+        secondary.chat.assert_not_called()
+
+    def test_delay_follows_provider_latency(self):
+        router = _router(Mock(), Mock(), hedge_min_delay=0.1)
+        assert router._hedge_delay("openrouter", timeout=30.0) == pytest.approx(0.1)  # initial delay, clamped
+
+        for _ in range(9):
+            router.latency.record("openrouter", 0.4)
+        router.latency.record("openrouter", 3.0)
+
+        assert router._hedge_delay("openrouter", timeout=30.0) == pytest.approx(3.0)
+        assert router._hedge_delay("openrouter", timeout=2.0) == pytest.approx(2.0)
@@ -0,0 +1,87 @@
+"""Tests for pooled LLM adapter HTTP connections."""
+
+from unittest.mock import Mock, patch
+
+import httpx
+
+from kira.adapters.llm import (
+    AnthropicAdapter,
+    HTTPPoolConfig,
+    LLMRouter,
+    Message,
+    OllamaAdapter,
+    OpenAIAdapter,
+    PooledHTTPClient,
+    RouterConfig,
+)
+
+
+def _openai_response():
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {
+        "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    }
+    return response
+
+
+class TestPooledHTTPClient:
+    def test_client_is_created_lazily_and_reused(self):
+        pool = PooledHTTPClient(HTTPPoolConfig(max_connections=5, max_keepalive_connections=2, http2=False))
+
+        with patch("httpx.Client") as mock_client:
+            pool.post("http://llm/a", timeout=5.0, json={})
+            pool.post("http://llm/b", timeout=5.0, json={})
+
+        mock_client.assert_called_once()
+        limits = mock_client.call_args.kwargs["limits"]
+        assert (limits.max_connections, limits.max_keepalive_connections) == (5, 2)
+        assert mock_client.call_args.kwargs["http2"] is False
+        assert pool.requests == 2
+
+    def test_per_request_timeout(self):
+        pool = PooledHTTPClient(HTTPPoolConfig(connect_timeout=10.0))
+
+        with patch("httpx.Client") as mock_client:
+            pool.post("http://llm", timeout=3.0)
+
+        timeout = mock_client.return_value.post.call_args.kwargs["timeout"]
+        assert timeout == httpx.Timeout(3.0, connect=3.0)
+
+    def test_close_releases_and_recreates(self):
+        pool = PooledHTTPClient()
+
+        with patch("httpx.Client") as mock_client:
+            pool.post("http://llm", timeout=1.0)
+            pool.close()
+            pool.close()
+            pool.post("http://llm", timeout=1.0)
+
+        mock_client.return_value.close.assert_called_once()
+        assert mock_client.call_count == 2
+
+
+class TestAdapterPooling:
+    def test_adapter_reuses_connection_pool(self):
+        adapter = OpenAIAdapter(api_key="test-key")
+
+        with patch("httpx.Client") as mock_client:
+            mock_client.return_value.post.return_value = _openai_response()
+            for _ in range(3):
+                adapter.chat([Message(role="user", content="hi")])
+
+        mock_client.assert_called_once()
+        assert mock_client.return_value.post.call_count == 3
+
+    def test_router_close_closes_adapters(self):
+        anthropic = AnthropicAdapter(api_key="test-key")
+        ollama = OllamaAdapter()
+        anthropic.close = Mock()
+        ollama.close = Mock()
+
+        with LLMRouter(RouterConfig(), anthropic_adapter=anthropic, ollama_adapter=ollama):
+            pass
+
+        anthropic.close.assert_called_once()
+        ollama.close.assert_called_once()
@@ -0,0 +1,215 @@
+"""Tests for the LLMRouter response cache."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+from kira.adapters.llm import (
+    LLMResponse,
+    LLMRouter,
+    Message,
+    ResponseCache,
+    RouterConfig,
+    TaskType,
+    Tool,
+    ToolCall,
+    create_response_cache,
+)
+from kira.adapters.llm.response_cache import response_cache_key
+from kira.agent.config import AgentConfig
+from kira.agent.metrics import MetricsCollector
+from kira.agent.nodes import plan_node
+from kira.agent.state import AgentState
+from kira.agent.tools import ToolRegistry
+
+MESSAGES = [Message(role="user", content="покажи задачи")]
+TOOLS = [
+    Tool(name="task_list", description="List tasks", parameters={"type": "object", "properties": {}}),
+    Tool(name="task_get", description="Get task", parameters={"type": "object", "properties": {"id": {}}}),
+]
+
+
+def _response(content: str = "ok", finish_reason: str = "stop") -> LLMResponse:
+    return LLMResponse(content=content, finish_reason=finish_reason, usage={"total_tokens": 42}, model="m")
+
+
+def _key(messages=MESSAGES, tools=None, temperature=0.0, **kwargs) -> str:
+    return response_cache_key(
+        kwargs.pop("method", "chat"),
+        kwargs.pop("provider", "openrouter"),
+        messages,
+        tools,
+        model=None,
+        temperature=temperature,
+        max_tokens=1000,
+    )
+
+
+class TestCacheKey:
+    def test_normalizes_whitespace(self):
+        assert _key([Message(role="user", content="  покажи\n задачи ")]) == _key()
+
+    def test_dict_and_dataclass_messages_match(self):
+        assert _key([{"role": "user", "content": "покажи задачи"}]) == _key()
+
+    def test_tool_order_does_not_matter(self):
+        assert _key(tools=TOOLS) == _key(tools=list(reversed(TOOLS)))
+
+    def test_request_parameters_matter(self):
+        keys = {
+            _key(),
+            _key([Message(role="user", content="покажи задачу")]),
+            _key(tools=TOOLS),
+            _key(temperature=0.5),
+            _key(provider="anthropic"),
+            _key(method="tool_call"),
+        }
+        assert len(keys) == 6
+
+
+class TestResponseCache:
+    def test_roundtrip_and_stats(self):
+        cache = ResponseCache()
+        response = LLMResponse(
+            content="",
+            finish_reason="tool_calls",
+            tool_calls=[ToolCall(id="1", name="task_list", arguments={"status": "todo"})],
+            usage={"total_tokens": 42},
+            model="m",
+        )
+
+        assert cache.get("k") is None
+        assert cache.put("k", response, ttl=60)
+        cached = cache.get("k")
+
+        assert cached is not None
+        assert cached.tool_calls == response.tool_calls
+        assert (cache.hits, cache.misses, cache.saved_tokens) == (1, 1, 42)
+
+    def test_expired_entries_are_ignored(self):
+        cache = ResponseCache()
+        with patch("kira.adapters.llm.response_cache.time.time", return_value=1000.0):
+            cache.put("k", _response(), ttl=10)
+        with patch("kira.adapters.llm.response_cache.time.time", return_value=1011.0):
+            assert cache.get("k") is None
+
+    def test_incomplete_responses_are_not_cached(self):
+        cache = ResponseCache()
+
+        assert not cache.put("k", _response(finish_reason="length"), ttl=60)
+        assert not cache.put("k", _response(), ttl=0)
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(max_entries=2)
+        with patch("kira.adapters.llm.response_cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.put("a", _response("a"), ttl=1e12)
+            cache.put("b", _response("b"), ttl=1e12)
+            cache.get("a")
+            cache.put("c", _response("c"), ttl=1e12)
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+    def test_persists_across_instances(self, tmp_path):
+        with create_response_cache(tmp_path) as cache:
+            cache.put("k", _response("persisted"), ttl=60)
+
+        assert (tmp_path / ".kira" / "llm_cache.db").exists()
+        with create_response_cache(tmp_path) as cache:
+            assert cache.get("k").content == "persisted"
+
+
+class TestRouterCache:
+    def _router(self, **config):
+        adapter = Mock()
+        adapter.chat.return_value = _response("from provider")
+        adapter.tool_call.return_value = _response("tool plan")
+        metrics = MetricsCollector()
+        router = LLMRouter(
+            RouterConfig(**config),
+            openrouter_adapter=adapter,
+            response_cache=ResponseCache(),
+            metrics=metrics,
+        )
+        return router, adapter, metrics
+
+    def test_repeated_chat_served_from_cache(self):
+        router, adapter, metrics = self._router()
+
+        first = router.chat(MESSAGES, temperature=0.0)
+        second = router.chat([Message(role="user", content="покажи  задачи")], temperature=0.0)
+
+        assert first.content == second.content == "from provider"
+        adapter.chat.assert_called_once()
+        assert metrics.get_summary()["llm_cache"] == {
+            "hits": 1,
+            "misses": 1,
+            "hit_rate": 0.5,
+            "saved_tokens": 42,
+        }
+        assert 'llm_cache_saved_tokens_total{task_type="default"} 42' in metrics.get_prometheus_metrics()
+
+    def test_tool_call_keyed_on_tools(self):
+        router, adapter, _ = self._router()
+
+        router.tool_call(MESSAGES, TOOLS, temperature=0.0)
+        router.tool_call(MESSAGES, TOOLS, temperature=0.0)
+        router.tool_call(MESSAGES, TOOLS[:1], temperature=0.0)
+
+        assert adapter.tool_call.call_count == 2
+
+    def test_nonzero_temperature_bypasses_cache(self):
+        router, adapter, metrics = self._router()
+
+        router.chat(MESSAGES, temperature=0.7)
+        router.chat(MESSAGES, temperature=0.7)
+
+        assert adapter.chat.call_count == 2
+        assert "llm_cache" not in metrics.get_summary()
+
+    def test_nonzero_temperature_allowed_explicitly(self):
+        router, adapter, _ = self._router(cache_nonzero_temperature=True)
+
+        router.chat(MESSAGES, temperature=0.7)
+        router.chat(MESSAGES, temperature=0.7)
+
+        adapter.chat.assert_called_once()
+
+    def test_ttl_per_task_type(self):
+        router, adapter, _ = self._router(cache_ttl={TaskType.PLANNING: 0})
+        router.adapters["anthropic"] = adapter
+
+        router.chat(MESSAGES, task_type=TaskType.PLANNING, temperature=0.0)
+        router.chat(MESSAGES, task_type=TaskType.PLANNING, temperature=0.0)
+
+        assert adapter.chat.call_count == 2
+        assert router.config.cache_ttl[TaskType.DEFAULT] > 0
+
+    def test_plan_node_hits_cache_with_agent_config(self):
+        router, adapter, metrics = self._router(cache_nonzero_temperature=AgentConfig().llm_cache_nonzero_temperature)
+        adapter.tool_call.return_value = LLMResponse(
+            content="",
+            finish_reason="tool_calls",
+            tool_calls=[ToolCall(id="1", name="task_list", arguments={})],
+            usage={"total_tokens": 42},
+            model="m",
+        )
+        tool = Mock()
+        tool.name = "task_list"
+        tool.description = "List tasks"
+        tool.get_parameters.return_value = {"type": "object", "properties": {}}
+        registry = ToolRegistry()
+        registry.register(tool)
+
+        plans = [
+            plan_node(
+                AgentState(trace_id=f"t{i}", messages=[{"role": "user", "content": "покажи задачи"}]), router, registry
+            )
+            for i in range(2)
+        ]
+
+        assert plans[0]["plan"] == plans[1]["plan"] == [{"tool": "task_list", "args": {}, "dry_run": False}]
+        adapter.tool_call.assert_called_once()
+        assert metrics.get_summary()["llm_cache"]["hits"] == 1
@@ -39,7 +39,7 @@ class TestAnthropicAdapter:
         }
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+            mock_client.return_value.post.return_value = mock_response
 
             result = adapter.generate("Test prompt")
 
@@ -69,7 +69,7 @@ class TestOllamaAdapter:
         }
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+            mock_client.return_value.post.return_value = mock_response
 
             result = adapter.generate("Test prompt")
 
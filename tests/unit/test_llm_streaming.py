@@ -0,0 +1,215 @@
+"""Tests for streamed LLM responses (chat_stream) and their delivery."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, Mock
+
+import httpx
+import pytest
+
+from kira.adapters.llm import (
+    AnthropicAdapter,
+    LLMError,
+    LLMErrorEnhanced,
+    LLMRateLimitError,
+    LLMRouter,
+    Message,
+    OllamaAdapter,
+    OpenAIAdapter,
+    RouterConfig,
+)
+from kira.adapters.llm.streaming import iter_ndjson, iter_sse
+from kira.agent.message_handler import MessageHandler
+from kira.agent.nodes import respond_node
+from kira.agent.state import AgentState
+from kira.core.events import Event
+
+MESSAGES = [Message(role="user", content="Hi")]
+
+
+def _serve(adapter, body: str, status_code: int = 200):
+    """Route the adapter's pooled client to a canned streamed body."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(status_code, content=body.encode())
+
+    adapter._http._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return requests
+
+
+def _sse(*events: tuple[str | None, object]) -> str:
+    lines = []
+    for event, data in events:
+        if event:
+            lines.append(f"event: {event}")
+        lines.append(f"data: {data if isinstance(data, str) else json.dumps(data)}")
+        lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+class TestParsers:
+    def test_sse_events(self):
+        lines = [": keep-alive", "event: ping", "data: {}", "", "data: a", "data: b", "", "data:c"]
+
+        assert list(iter_sse(lines)) == [("ping", "{}"), ("message", "a\nb"), ("message", "c")]
+
+    def test_ndjson(self):
+        assert list(iter_ndjson(['{"a": 1}', "", '{"b": 2}'])) == [{"a": 1}, {"b": 2}]
+
+
+class TestAdapterStreams:
+    def test_openai_deltas(self):
+        adapter = OpenAIAdapter(api_key="test-key")
+        requests = _serve(
+            adapter,
+            _sse(
+                (None, {"choices": [{"delta": {"role": "assistant"}}]}),
+                (None, {"choices": [{"delta": {"content": "Hel"}}]}),
+                (None, {"choices": [{"delta": {"content": "lo"}}]}),
+                (None, "[DONE]"),
+            ),
+        )
+
+        assert list(adapter.chat_stream(MESSAGES)) == ["Hel", "lo"]
+        assert requests[0]["stream"] is True
+
+    def test_openai_rate_limit(self):
+        adapter = OpenAIAdapter(api_key="test-key")
+        _serve(adapter, "{}", status_code=429)
+
+        with pytest.raises(LLMRateLimitError):
+            list(adapter.chat_stream(MESSAGES))
+
+    def test_anthropic_deltas_and_errors(self):
+        adapter = AnthropicAdapter(api_key="test-key")
+        _serve(
+            adapter,
+            _sse(
+                ("message_start", {"type": "message_start"}),
+                ("content_block_delta", {"delta": {"type": "text_delta", "text": "При"}}),
+                ("ping", {"type": "ping"}),
+                ("content_block_delta", {"delta": {"type": "text_delta", "text": "вет"}}),
+                ("message_stop", {"type": "message_stop"}),
+            ),
+        )
+        assert "".join(adapter.chat_stream(MESSAGES)) == "Привет"
+
+        _serve(adapter, _sse(("error", {"error": {"type": "api_error", "message": "boom"}})))
+        with pytest.raises(LLMError, match="boom"):
+            list(adapter.chat_stream(MESSAGES))
+
+    def test_malformed_json_raises_llm_error(self):
+        adapter = OpenAIAdapter(api_key="test-key")
+        _serve(adapter, _sse((None, {"choices": [{"delta": {"content": "Hi"}}]}), (None, "{not json")))
+
+        with pytest.raises(LLMError, match="Malformed JSON"):
+            list(adapter.chat_stream(MESSAGES))
+
+    def test_ollama_ndjson(self):
+        adapter = OllamaAdapter()
+        body = "\n".join(
+            json.dumps(chunk)
+            for chunk in ({"response": "O", "done": False}, {"response": "k", "done": False}, {"done": True})
+        )
+        requests = _serve(adapter, body)
+
+        assert list(adapter.chat_stream(MESSAGES)) == ["O", "k"]
+        assert requests[0]["stream"] is True
+
+
+class TestRouterStream:
+    def test_falls_back_before_first_delta(self):
+        primary = Mock()
+        primary.chat_stream.side_effect = LLMRateLimitError("slow down")
+        ollama = Mock()
+        ollama.chat_stream.return_value = iter(["local"])
+        router = LLMRouter(
+            RouterConfig(default_provider="openrouter", max_retries=1),
+            openrouter_adapter=primary,
+            ollama_adapter=ollama,
+        )
+
+        assert list(router.chat_stream(MESSAGES)) == ["local"]
+
+    def test_errors_after_first_delta_propagate(self):
+        def broken(*args, **kwargs):
+            yield "partial"
+            raise LLMError("connection reset")
+
+        primary = Mock()
+        primary.chat_stream.side_effect = broken
+        router = LLMRouter(RouterConfig(default_provider="openrouter"), openrouter_adapter=primary)
+
+        stream = router.chat_stream(MESSAGES)
+        assert next(stream) == "partial"
+        with pytest.raises(LLMError):
+            next(stream)
+        primary.chat_stream.assert_called_once()
+
+    def test_adapter_without_stream_support(self):
+        adapter = Mock(spec=["chat"])
+        adapter.chat.return_value.content = "whole"
+        router = LLMRouter(RouterConfig(default_provider="openai"), openai_adapter=adapter)
+
+        assert list(router.chat_stream(MESSAGES)) == ["whole"]
+
+    def test_unconfigured_provider(self):
+        with pytest.raises(LLMErrorEnhanced, match="not configured"):
+            LLMRouter(RouterConfig(enable_ollama_fallback=False)).chat_stream(MESSAGES)
+
+
+class TestRespondNodeStreaming:
+    def _state(self, callback):
+        return AgentState(
+            trace_id="t",
+            messages=[{"role": "user", "content": "Покажи задачи"}],
+            tool_results=[{"tool": "task_list", "status": "ok", "data": {"count": 1}}],
+            stream_callback=callback,
+        )
+
+    def test_partial_text_reaches_callback(self):
+        adapter = MagicMock()
+        adapter.chat_stream.return_value = iter(["Нашла ", "одну ", "задачу. "])
+        partials = []
+
+        result = respond_node(self._state(partials.append), adapter)
+
+        assert partials == ["Нашла ", "Нашла одну ", "Нашла одну задачу. "]
+        assert result["response"] == "Нашла одну задачу."
+        adapter.chat.assert_not_called()
+
+    def test_without_callback_uses_chat(self):
+        adapter = MagicMock()
+        adapter.chat.return_value.content = "Готово"
+
+        assert respond_node(self._state(None), adapter)["response"] == "Готово"
+        adapter.chat_stream.assert_not_called()
+
+
+class TestMessageHandlerStreaming:
+    def _handle(self, streamed: bool):
+        indicator = Mock()
+        indicator.finish.return_value = streamed
+        telegram_adapter = Mock()
+        telegram_adapter.start_thinking_indicator.return_value = indicator
+        executor = Mock()
+        executor.chat_and_execute.return_value = Mock(response="Ответ")
+        callback = Mock()
+
+        MessageHandler(executor, callback, telegram_adapter).handle_message_received(
+            Event(name="message.received", payload={"message": "hi", "source": "telegram", "chat_id": 1})
+        )
+
+        assert executor.chat_and_execute.call_args.kwargs["stream_callback"] == indicator.stream_update
+        indicator.finish.assert_called_once_with("Ответ")
+        indicator.stop.assert_called_once()
+        return callback
+
+    def test_streamed_response_is_not_sent_again(self):
+        self._handle(streamed=True).assert_not_called()
+
+    def test_unstreamed_response_is_sent(self):
+        self._handle(streamed=False).assert_called_once_with("telegram", "1", "Ответ")
@@ -0,0 +1,52 @@
+"""Tests for Markdown I/O helpers (ADR-006)."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from kira.core.md_io import MarkdownIOError, parse_markdown, read_frontmatter_only
+
+
+class TestReadFrontmatterOnly:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "---\nid: task-1\ntitle: Task\ndue: 2025-01-02\ntags:\n  - a\n---\n\nBody",
+            "---\ntitle: No body\n---",
+            "plain text without frontmatter",
+            "---\ntitle: unterminated\n",
+            "",
+            "------\n",
+        ],
+    )
+    def test_matches_full_parse(self, tmp_path, text):
+        file_path = tmp_path / "entity.md"
+        file_path.write_text(text, encoding="utf-8")
+
+        assert read_frontmatter_only(file_path) == parse_markdown(text).frontmatter
+
+    def test_stops_at_closing_delimiter(self, tmp_path):
+        file_path = tmp_path / "meeting.md"
+        header = "---\nid: meeting-1\ndate: 2025-01-02\n---\n"
+        # Invalid UTF-8 in the body proves it is never decoded
+        file_path.write_bytes(header.encode() + b"\n" + b"x" * 100_000 + b"\xff\xfe")
+
+        assert read_frontmatter_only(file_path, chunk_size=16) == {"id": "meeting-1", "date": date(2025, 1, 2)}
+
+    def test_delimiter_split_across_chunks(self, tmp_path):
+        file_path = tmp_path / "note.md"
+        file_path.write_text("---\ntitle: abcdefgh\n---\nBody", encoding="utf-8")
+
+        for chunk_size in range(1, 30):
+            assert read_frontmatter_only(file_path, chunk_size=chunk_size) == {"title": "abcdefgh"}
+
+    def test_errors(self, tmp_path):
+        with pytest.raises(MarkdownIOError, match="File not found"):
+            read_frontmatter_only(tmp_path / "missing.md")
+
+        broken = tmp_path / "broken.md"
+        broken.write_text("---\nid: [unclosed\n---\n", encoding="utf-8")
+        with pytest.raises(MarkdownIOError, match="Invalid YAML"):
+            read_frontmatter_only(broken)
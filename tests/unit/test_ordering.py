@@ -502,6 +502,70 @@ class TestBufferSizeLimit:
         assert stats["currently_buffered"] <= 3
 
 
+class TestBufferIndexes:
+    """Test hashed ID index, deadline heap and bounded processed window."""
+
+    @staticmethod
+    def _envelope(external_id: str, task_id: str = "task-001", event_ts: str | None = None) -> EventEnvelope:
+        envelope = create_event_envelope(
+            source="cli",
+            event_type="task.updated",
+            payload={"task_id": task_id, "title": external_id},
+            external_id=external_id,
+        )
+        if event_ts:
+            envelope.event_ts = event_ts
+        return envelope
+
+    def test_only_expired_events_are_processed(self):
+        buffer = create_event_buffer(grace_period_seconds=0.05)
+        buffer.add_event(self._envelope("late", event_ts="2025-10-08T12:02:00+00:00"))
+        buffer.add_event(self._envelope("early", event_ts="2025-10-08T12:01:00+00:00"))
+        time.sleep(0.06)
+        fresh = self._envelope("fresh", event_ts="2025-10-08T12:00:00+00:00")
+        buffer.add_event(fresh)
+
+        _state, processed = buffer.process_ready_events({})
+
+        assert [e.payload["title"] for e in processed] == ["early", "late"]
+        assert buffer.get_stats()["currently_buffered"] == 1
+        assert buffer.add_event(fresh) is False  # still buffered
+        assert buffer.add_event(processed[0]) is False  # processed
+
+    def test_max_size_drops_oldest_received(self):
+        buffer = create_event_buffer(grace_period_seconds=10.0, max_buffer_size=2)
+        first = self._envelope("first", event_ts="2025-10-08T12:05:00+00:00")
+        buffer.add_event(first)
+        buffer.add_event(self._envelope("second", event_ts="2025-10-08T12:01:00+00:00"))
+        buffer.add_event(self._envelope("third", task_id="task-002"))
+
+        _state, processed = buffer.flush_all({})
+
+        assert [e.payload["title"] for e in processed] == ["second", "third"]
+
+    def test_processed_window_is_bounded_by_count(self):
+        buffer = create_event_buffer(grace_period_seconds=10.0, processed_window=3)
+        envelopes = [self._envelope(f"event-{i}", task_id=f"task-{i}") for i in range(5)]
+        for envelope in envelopes:
+            buffer.add_event(envelope)
+
+        buffer.flush_all({})
+
+        assert buffer.get_stats()["processed_ids_tracked"] == 3
+        assert buffer.add_event(envelopes[0]) is True  # forgotten
+        assert buffer.add_event(envelopes[4]) is False
+
+    def test_processed_window_is_bounded_by_age(self):
+        buffer = create_event_buffer(grace_period_seconds=10.0, processed_ttl_seconds=0.05)
+        envelope = self._envelope("event")
+        buffer.add_event(envelope)
+        buffer.flush_all({})
+
+        assert buffer.add_event(envelope) is False
+        time.sleep(0.06)
+        assert buffer.add_event(envelope) is True
+
+
 class TestBufferStatistics:
     """Test buffer statistics."""
 
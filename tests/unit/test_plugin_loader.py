@@ -0,0 +1,199 @@
+"""Tests for manifest caching and lazy plugin activation (ADR-004)."""
+
+from __future__ import annotations
+
+import json
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+from kira.core.events import create_event_bus
+from kira.core.manifest_cache import ManifestCache, create_manifest_cache
+from kira.core.plugin_loader import PluginLoader, PluginLoadError
+from kira.plugin_sdk.context import PluginContext
+
+
+def _write_plugin(tmp_path: Path, *, events=("task.created",), commands=("demo.run",), valid=True) -> tuple[Path, str]:
+    module_name = f"lazy_plugin_{uuid.uuid4().hex[:8]}"
+    plugin_path = tmp_path / module_name
+    (plugin_path / "src").mkdir(parents=True)
+    (plugin_path / "src" / f"{module_name}.py").write_text("""
+RECEIVED = []
+
+
+def activate(context):
+    def on_task(*args):
+        RECEIVED.append(args[-1])
+
+    context.events.subscribe("task.created", on_task)
+    return {"status": "ok"}
+""")
+    manifest = {
+        "name": "lazy-demo",
+        "version": "1.0.0",
+        "displayName": "Lazy demo",
+        "description": "Plugin used by loader tests",
+        "publisher": "kira",
+        "engines": {"kira": "^0.1.0"},
+        "permissions": ["events.subscribe"],
+        "entry": f"{module_name}:activate",
+        "capabilities": ["notify"],
+        "contributes": {"events": list(events), "commands": list(commands)},
+    }
+    if not valid:
+        del manifest["publisher"]
+    (plugin_path / "kira-plugin.json").write_text(json.dumps(manifest))
+    return plugin_path, module_name
+
+
+def _received(module_name: str) -> list:
+    return sys.modules[module_name].RECEIVED
+
+
+class TestManifestCache:
+    def test_unchanged_manifest_is_validated_once(self, tmp_path):
+        plugin_path, _ = _write_plugin(tmp_path)
+        cache = create_manifest_cache(tmp_path / "vault")
+
+        PluginLoader(use_sandbox=False, manifest_cache=cache).load_plugin(plugin_path)
+
+        # A fresh process: new cache object over the same database
+        restarted = PluginLoader(use_sandbox=False, manifest_cache=create_manifest_cache(tmp_path / "vault"))
+        restarted.load_plugin(plugin_path, lazy=True)
+
+        assert restarted.manifest_cache.hits == 1
+        assert restarted._manifest_validator is None  # jsonschema never touched
+
+    def test_changed_manifest_is_revalidated(self, tmp_path):
+        plugin_path, _ = _write_plugin(tmp_path)
+        cache = ManifestCache()
+        loader = PluginLoader(use_sandbox=False, manifest_cache=cache)
+        loader.load_plugin(plugin_path, lazy=True)
+
+        manifest_path = plugin_path / "kira-plugin.json"
+        manifest = json.loads(manifest_path.read_text())
+        manifest["version"] = "1.0.1"
+        manifest_path.write_text(json.dumps(manifest))
+
+        assert loader.load_plugin(plugin_path, lazy=True)["version"] == "1.0.1"
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_cached_errors_still_fail(self, tmp_path):
+        plugin_path, _ = _write_plugin(tmp_path, valid=False)
+        loader = PluginLoader(use_sandbox=False)
+
+        for _ in range(2):
+            with pytest.raises(PluginLoadError, match="publisher"):
+                loader.load_plugin(plugin_path)
+        assert loader.manifest_cache.hits == 1
+
+    def test_returned_manifest_does_not_alias_cache(self, tmp_path):
+        plugin_path, _ = _write_plugin(tmp_path)
+        cache = ManifestCache()
+        manifest_path = plugin_path / "kira-plugin.json"
+
+        first = cache.load(manifest_path, lambda manifest: [], "schema")
+        first.manifest["contributes"]["events"].append("task.deleted")
+        second = cache.load(manifest_path, lambda manifest: [], "schema")
+
+        assert cache.hits == 1
+        assert second.manifest["contributes"]["events"] == ["task.created"]
+
+
+class TestLazyActivation:
+    def test_first_event_activates_and_is_delivered(self, tmp_path):
+        plugin_path, module_name = _write_plugin(tmp_path)
+        context = PluginContext()
+        loader = PluginLoader(context=context, use_sandbox=False)
+
+        info = loader.load_plugin(plugin_path, lazy=True)
+
+        assert info["activated"] is False
+        assert loader.is_plugin_loaded("lazy-demo")
+        assert not loader.is_plugin_activated("lazy-demo")
+        assert module_name not in sys.modules
+
+        context.events.publish("task.created", {"n": 1})
+        context.events.publish("task.created", {"n": 2})
+
+        assert loader.is_plugin_activated("lazy-demo")
+        assert _received(module_name) == [{"n": 1}, {"n": 2}]
+
+    def test_core_event_bus_drops_triggers(self, tmp_path):
+        plugin_path, module_name = _write_plugin(tmp_path)
+        bus = create_event_bus()
+        loader = PluginLoader(context=PluginContext(events=bus), use_sandbox=False)
+        loader.load_plugin(plugin_path, lazy=True)
+
+        bus.publish("task.updated", {"ignored": True})
+        assert module_name not in sys.modules
+
+        bus.publish("task.created", {"n": 1})
+        bus.publish("task.created", {"n": 2})
+
+        assert [event.payload for event in _received(module_name)] == [{"n": 1}, {"n": 2}]
+        assert [s.event_name for s in bus.get_subscriptions()] == ["task.created"]
+
+    def test_command_activates_owner(self, tmp_path):
+        plugin_path, module_name = _write_plugin(tmp_path, events=())
+        loader = PluginLoader(use_sandbox=False)
+        loader.load_plugin(plugin_path, lazy=True)
+
+        info = loader.activate_command("demo.run")
+
+        assert info["result"] == {"status": "ok"}
+        assert module_name in sys.modules
+        with pytest.raises(PluginLoadError, match=r"unknown\.cmd"):
+            loader.activate_command("unknown.cmd")
+
+    def test_plugin_without_triggers_activates_immediately(self, tmp_path):
+        plugin_path, _ = _write_plugin(tmp_path, events=(), commands=())
+        loader = PluginLoader(use_sandbox=False)
+
+        assert loader.load_plugin(plugin_path, lazy=True)["activated"] is True
+
+
+class TestSandboxedPlugins:
+    def test_contributed_events_reach_the_worker_pool(self, tmp_path):
+        from kira.core.sandbox import Sandbox, SandboxConfig
+
+        plugin_path = tmp_path / "pooled-plugin"
+        (plugin_path / "src").mkdir(parents=True)
+        (plugin_path / "src" / "pooled_plugin.py").write_text("""
+import json
+
+
+def activate(context):
+    def on_task(ctx, payload):
+        with open(payload["out"], "a", encoding="utf-8") as out:
+            out.write(json.dumps(payload["n"]) + "\\n")
+
+    context.events.subscribe("task.created", on_task)
+    return "ok"
+""")
+        manifest = {
+            "name": "pooled-demo",
+            "version": "1.0.0",
+            "entry": "pooled_plugin:activate",
+            "permissions": ["events.subscribe"],
+            "contributes": {"events": ["task.created"]},
+        }
+        out = tmp_path / "received.jsonl"
+        bus = create_event_bus()
+        sandbox = Sandbox(SandboxConfig(health_check_interval_seconds=0))
+        loader = PluginLoader(context=PluginContext(events=bus), sandbox=sandbox)
+
+        info = loader.load_plugin_in_sandbox(plugin_path, manifest)
+        try:
+            assert sandbox.get_pool("pooled-demo") is info["pool"]
+            bus.publish("task.created", {"n": 1, "out": str(out)})
+            bus.publish("task.created", {"n": 2, "out": str(out)})
+
+            assert out.read_text(encoding="utf-8").split() == ["1", "2"]
+            assert sandbox.get_process("pooled-demo") is None
+        finally:
+            loader.cleanup()
+
+        assert bus.get_subscriptions("task.created") == []
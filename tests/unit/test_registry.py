@@ -115,6 +115,20 @@ class TestPluginRegistry:
         registry = PluginRegistry(str(nonexistent_file))
         assert len(registry.get_plugins()) == 0
 
+    def test_registry_reloaded_after_change(self):
+        """Тест кэша реестра: повторное чтение только после изменения файла"""
+        first = PluginRegistry(str(self.registry_file))
+        first.get_plugin("kira-inbox")["enabled"] = False
+
+        # Изменения экземпляра не попадают в кэш
+        assert PluginRegistry(str(self.registry_file)).is_plugin_enabled("kira-inbox")
+
+        with open(self.registry_file, "w", encoding="utf-8") as f:
+            yaml.dump({"plugins": [{"name": "kira-mailer", "enabled": True}]}, f)
+
+        reloaded = PluginRegistry(str(self.registry_file))
+        assert [p["name"] for p in reloaded.get_plugins()] == ["kira-mailer"]
+
 
 class TestAdapterRegistry:
     """Тесты реестра адаптеров"""
@@ -0,0 +1,184 @@
+"""Tests for plugin JSON-RPC framing and the binary codec (ADR-004)."""
+
+from __future__ import annotations
+
+import io
+import os
+import threading
+
+import pytest
+
+from kira.plugin_sdk.codec import MAX_DEPTH, CodecError, pack, unpack
+from kira.plugin_sdk.rpc import (
+    NEGOTIATE_METHOD,
+    JSONRPCError,
+    JSONRPCMessage,
+    RPCServer,
+    StdioTransport,
+)
+from kira.plugin_sdk.types import RPCRequest
+
+
+class TestCodec:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            True,
+            False,
+            0,
+            127,
+            128,
+            65536,
+            2**64 - 1,
+            -1,
+            -33,
+            -(2**63),
+            1.5,
+            "",
+            "x" * 31,
+            "задача" * 20,
+            "x" * 70_000,
+            b"\x00\xff",
+            list(range(20)),
+            {str(i): [i, {"nested": None}] for i in range(20)},
+        ],
+    )
+    def test_round_trip(self, value):
+        assert unpack(pack(value)) == value
+
+    def test_known_encodings(self):
+        # Wire format matches MessagePack
+        assert pack({"a": 1}) == b"\x81\xa1a\x01"
+        assert pack([None, True, -1]) == b"\x93\xc0\xc3\xff"
+        assert pack(256) == b"\xcd\x01\x00"
+
+    def test_rejects_unsupported_values(self):
+        with pytest.raises(CodecError):
+            pack({1: "non-string key"})
+        with pytest.raises(CodecError):
+            pack(object())
+        with pytest.raises(CodecError):
+            pack(2**64)
+
+    def test_rejects_malformed_input(self):
+        with pytest.raises(CodecError, match="Truncated"):
+            unpack(pack("hello")[:-1])
+        with pytest.raises(CodecError, match="trailing"):
+            unpack(pack(1) + b"\x01")
+        with pytest.raises(CodecError, match="marker"):
+            unpack(b"\xc1")
+
+    def test_rejects_hostile_containers(self):
+        # Lengths larger than the remaining buffer fail before decoding items
+        with pytest.raises(CodecError, match="Truncated"):
+            unpack(b"\xdd\xff\xff\xff\xff" + b"\xc0" * 8)
+        with pytest.raises(CodecError, match="Truncated"):
+            unpack(b"\xdf\x00\x00\x00\x05" + pack("k") + b"\xc0")
+
+        nested = [[]]
+        for _ in range(MAX_DEPTH):
+            nested = [nested]
+        with pytest.raises(CodecError, match="Nesting"):
+            unpack(b"\x91" * 10_000 + b"\x90")
+        with pytest.raises(CodecError, match="Nesting"):
+            unpack(pack(nested))
+        assert unpack(pack([[[]]])) == [[[]]]
+
+
+def _round_trip(mode: str, send) -> StdioTransport:
+    stream = io.BytesIO()
+    send(StdioTransport(io.BytesIO(), stream, mode=mode))
+    stream.seek(0)
+    return StdioTransport(stream, io.BytesIO(), mode=mode)
+
+
+class TestStdioTransport:
+    @pytest.mark.parametrize("mode", ["text", "binary"])
+    def test_message_round_trip(self, mode):
+        message = JSONRPCMessage(id=7, result={"entities": [{"id": "task-1", "title": "Задача"}]})
+
+        received = _round_trip(mode, lambda transport: transport.send(message)).receive()
+
+        assert received == message
+
+    @pytest.mark.parametrize("mode", ["text", "binary"])
+    def test_batch_round_trip(self, mode):
+        messages = [JSONRPCMessage(id=i, method="vault.list", params={"offset": i * 100}) for i in range(3)]
+
+        transport = _round_trip(mode, lambda t: t.send_batch(messages))
+
+        assert transport.receive_batch() == messages
+
+    def test_binary_frames_are_length_prefixed(self):
+        stream = io.BytesIO()
+        StdioTransport(io.BytesIO(), stream, mode="binary").send(JSONRPCMessage(id=1, result={"ok": True}))
+
+        frame = stream.getvalue()
+        assert int.from_bytes(frame[:4], "big") == len(frame) - 4
+        assert unpack(frame[4:]) == {"jsonrpc": "2.0", "id": 1, "result": {"ok": True}}
+
+    def test_receive_rejects_batch_and_truncated_frames(self):
+        transport = _round_trip("binary", lambda t: t.send_batch([JSONRPCMessage(id=1, method="ping")]))
+        with pytest.raises(JSONRPCError, match="batch"):
+            transport.receive()
+
+        with pytest.raises(JSONRPCError, match="Expected 10 bytes"):
+            StdioTransport(io.BytesIO(b"\x00\x00\x00\x0a\x81"), io.BytesIO(), mode="binary").receive()
+        with pytest.raises(EOFError):
+            StdioTransport(io.BytesIO(), io.BytesIO(), mode="binary").receive()
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError, match="mode"):
+            StdioTransport(io.BytesIO(), io.BytesIO(), mode="xml")
+
+
+class _ServerPair:
+    """Client transport connected to an RPCServer running on a thread."""
+
+    def __init__(self, handlers):
+        to_server_r, to_server_w = os.pipe()
+        to_client_r, to_client_w = os.pipe()
+        self.client = StdioTransport(os.fdopen(to_client_r, "rb"), os.fdopen(to_server_w, "wb"))
+        self.server = RPCServer(handlers, StdioTransport(os.fdopen(to_server_r, "rb"), os.fdopen(to_client_w, "wb")))
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.client.output.close()
+        self.thread.join(timeout=5)
+
+
+class TestRPCServer:
+    def test_batch_requests_get_batch_response(self):
+        pair = _ServerPair({"vault.list": lambda params: {"page": params["page"]}})
+        try:
+            requests = [RPCRequest(method="vault.list", payload={"page": page}) for page in range(3)]
+
+            responses = pair.client.call_batch(requests)
+
+            assert [response.result for response in responses] == [{"page": 0}, {"page": 1}, {"page": 2}]
+        finally:
+            pair.close()
+
+    def test_negotiate_switches_both_sides_to_binary(self):
+        pair = _ServerPair({"echo": lambda params: params})
+        try:
+            pair.client.send(JSONRPCMessage(id=1, method=NEGOTIATE_METHOD, params={"modes": ["binary", "text"]}))
+            assert pair.client.receive().result == {"mode": "binary"}
+            pair.client.set_mode("binary")
+
+            response = pair.client.call(RPCRequest(method="echo", payload={"data": "x" * 1000}))
+
+            assert response.result == {"data": "x" * 1000}
+            assert pair.server._transport.mode == "binary"
+        finally:
+            pair.close()
+
+    def test_negotiate_falls_back_to_text(self):
+        pair = _ServerPair({})
+        try:
+            pair.client.send(JSONRPCMessage(id=1, method=NEGOTIATE_METHOD, params={"modes": ["cbor"]}))
+            assert pair.client.receive().result == {"mode": "text"}
+        finally:
+            pair.close()
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import sys
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -275,3 +277,157 @@ class TestSandboxADR004Compliance:
         sandbox = Sandbox(config=config)
 
         assert sandbox.config.grace_period_seconds == 10.0
+
+
+def _write_event_plugin(tmp_path: Path) -> Path:
+    plugin_path = tmp_path / "event-plugin"
+    (plugin_path / "src").mkdir(parents=True)
+    (plugin_path / "src" / "event_module.py").write_text("""
+def activate(context):
+    def on_task(ctx, payload):
+        print("handling", payload)  # must not corrupt the RPC channel
+        if payload.get("fail"):
+            raise ValueError("handler failed")
+
+    context.events.subscribe("task.created", on_task)
+    return "ok"
+""")
+    return plugin_path
+
+
+def _event_policy() -> Policy:
+    return Policy.from_manifest({"name": "event-plugin", "permissions": [], "entry": "event_module:activate"})
+
+
+class TestPluginWorkerPool:
+    """Warm plugin workers with pipelined JSON-RPC."""
+
+    def test_requests_are_pipelined_over_one_process(self, tmp_path):
+        plugin_path = _write_event_plugin(tmp_path)
+        with Sandbox() as sandbox:
+            process = sandbox.launch("events", "event_module:activate", plugin_path, _event_policy())
+
+            futures = [
+                process.request_async("event.publish", {"event": "task.created", "payload": {"n": i}})
+                for i in range(20)
+            ]
+
+            assert [future.result(timeout=10) for future in futures] == [{"delivered": True}] * 20
+            assert process.request("ping", timeout=5)["status"] == "ok"
+            assert process.requests_served == 21
+
+    def test_plugin_errors_are_returned(self, tmp_path):
+        from kira.plugin_sdk.rpc import RPCError
+
+        plugin_path = _write_event_plugin(tmp_path)
+        with Sandbox() as sandbox:
+            process = sandbox.launch("events", "event_module:activate", plugin_path, _event_policy())
+
+            with pytest.raises(RPCError, match="handler failed"):
+                process.request("event.publish", {"event": "task.created", "payload": {"fail": True}}, timeout=10)
+            with pytest.raises(RPCError, match="Method not found"):
+                process.request("unknown", timeout=5)
+            assert process.is_alive()
+
+    def test_binary_transport_is_negotiated(self, tmp_path):
+        plugin_path = _write_event_plugin(tmp_path)
+        with Sandbox(SandboxConfig(rpc_mode="binary")) as sandbox:
+            process = sandbox.launch("events", "event_module:activate", plugin_path, _event_policy())
+
+            futures = process.request_batch(
+                [("event.publish", {"event": "task.created", "payload": {"n": i}}) for i in range(5)] + [("ping", None)]
+            )
+
+            assert process._transport.mode == "binary"
+            assert [future.result(timeout=10) for future in futures[:5]] == [{"delivered": True}] * 5
+            assert futures[5].result(timeout=10)["status"] == "ok"
+
+    def test_pool_reuses_warm_workers(self, tmp_path):
+        plugin_path = _write_event_plugin(tmp_path)
+        with Sandbox(SandboxConfig(health_check_interval_seconds=0)) as sandbox:
+            pool = sandbox.launch_pool("events", "event_module:activate", plugin_path, _event_policy(), size=2)
+            pids = {worker["pid"] for worker in pool.get_stats()["workers"]}
+
+            for i in range(10):
+                assert pool.publish("task.created", {"n": i}, timeout=10) == {"delivered": True}
+
+            stats = pool.get_stats()
+            assert {worker["pid"] for worker in stats["workers"]} == pids
+            assert stats["requests"] == 10
+            assert sandbox.get_pool("events") is pool
+
+        assert pool.get_stats()["workers"] == []
+        with pytest.raises(SandboxError, match="closed"):
+            pool.publish("task.created", {"n": 0})
+
+    def test_pool_recycles_after_max_requests(self, tmp_path):
+        plugin_path = _write_event_plugin(tmp_path)
+        config = SandboxConfig(max_requests_per_worker=3, health_check_interval_seconds=0)
+        with Sandbox(config) as sandbox:
+            pool = sandbox.launch_pool("events", "event_module:activate", plugin_path, _event_policy(), size=1)
+            first_pid = pool.get_stats()["workers"][0]["pid"]
+
+            for i in range(3):
+                pool.publish("task.created", {"n": i}, timeout=10)
+            assert _wait_for(lambda: pool.get_stats()["recycled"] == 1)
+            pool.publish("task.created", {"n": 3}, timeout=10)
+
+            stats = pool.get_stats()
+            assert stats["workers"][0]["pid"] != first_pid
+            assert stats["workers"][0]["requests_served"] == 1
+
+    def test_workers_spawn_outside_the_pool_lock(self, tmp_path):
+        plugin_path = _write_event_plugin(tmp_path)
+        config = SandboxConfig(max_requests_per_worker=2, health_check_interval_seconds=0)
+        with Sandbox(config) as sandbox:
+            pool = sandbox.launch_pool("events", "event_module:activate", plugin_path, _event_policy(), size=2)
+            spawn = sandbox._spawn
+            spawning = threading.Event()
+            release = threading.Event()
+            lock_held = []
+
+            def slow_spawn(*args):
+                lock_held.append(pool._lock.locked())
+                spawning.set()
+                release.wait(10)
+                return spawn(*args)
+
+            sandbox._spawn = slow_spawn
+            pool.publish("task.created", {"n": 0}, timeout=10)
+            pool.publish("task.created", {"n": 1}, timeout=10)
+            pool.publish("task.created", {"n": 2}, timeout=10)
+            assert spawning.wait(10)
+
+            # The other worker keeps serving while a replacement is starting
+            started = time.monotonic()
+            assert pool.publish("task.created", {"n": 3}, timeout=10) == {"delivered": True}
+            assert time.monotonic() - started < 5
+            release.set()
+
+            assert _wait_for(lambda: pool.get_stats()["recycled"] >= 1)
+            assert lock_held and not any(lock_held)
+
+    def test_health_check_replaces_dead_worker(self, tmp_path):
+        plugin_path = _write_event_plugin(tmp_path)
+        with Sandbox(SandboxConfig(health_check_interval_seconds=0)) as sandbox:
+            pool = sandbox.launch_pool("events", "event_module:activate", plugin_path, _event_policy(), size=2)
+            pool._workers[0].process.kill()
+            pool._workers[0].process.wait()
+
+            assert pool.check_health(timeout=10) == 1
+            assert pool.publish("task.created", {"n": 1}, timeout=10) == {"delivered": True}
+            assert all(worker["alive"] for worker in pool.get_stats()["workers"])
+            assert pool.get_stats()["replaced"] == 1
+
+    def test_pool_size_validation(self, tmp_path):
+        with pytest.raises(ValueError):
+            Sandbox().launch_pool("events", "m:f", tmp_path, _event_policy(), size=0)
+
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
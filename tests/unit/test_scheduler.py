@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+import threading
 import time
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -11,6 +12,7 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
+from kira.core.job_store import JobRecord, JobStore
 from kira.core.scheduler import Job, JobStatus, Scheduler, Trigger, TriggerType, create_scheduler
 
 
@@ -326,9 +328,268 @@ class TestScheduler:
         assert job.metadata["owner"] == "admin"
 
 
+class TestSchedulerLoop:
+    def test_sleeps_until_deadline_and_wakes_on_new_job(self):
+        scheduler = Scheduler()
+        calls: list[float] = []
+        scheduler.schedule_interval("slow", 3600, lambda: None, job_id="slow")
+
+        with scheduler:
+            time.sleep(0.05)  # loop now sleeps towards the hourly deadline
+            scheduler.schedule_at("soon", datetime.now(UTC), lambda: calls.append(time.time()))
+            deadline = time.time() + 2
+            while not calls and time.time() < deadline:
+                time.sleep(0.01)
+
+        assert len(calls) == 1
+        assert scheduler.get_stats()["lag"]["max_ms"] < 500
+
+    def test_slow_job_does_not_delay_others(self):
+        release = threading.Event()
+        fast_calls: list[int] = []
+
+        with Scheduler(max_workers=2) as scheduler:
+            scheduler.schedule_interval("slow", 0.01, lambda: release.wait(2), job_id="slow")
+            scheduler.schedule_interval("fast", 0.02, lambda: fast_calls.append(1), job_id="fast")
+            time.sleep(0.2)
+            slow_runs = scheduler.get_job("slow").run_count
+            release.set()
+
+        assert len(fast_calls) >= 3
+        assert slow_runs == 0  # still in its first run, never overlapped
+
+    def test_replacing_running_job_waits_for_current_run(self):
+        started = threading.Event()
+        release = threading.Event()
+        events: list[str] = []
+
+        def first() -> None:
+            events.append("first")
+            started.set()
+            release.wait(2)
+            events.append("first done")
+
+        with Scheduler() as scheduler:
+            scheduler.schedule_interval("job", 60, first, job_id="job")
+            assert started.wait(2)
+            scheduler.schedule_interval("job", 60, lambda: events.append("second"), job_id="job")
+            time.sleep(0.05)
+            release.set()
+            time.sleep(0.1)
+
+        assert events == ["first", "first done", "second"]
+        assert scheduler.get_stats()["deferred"] == 1
+
+    def test_misfire_grace_skips_late_runs(self):
+        scheduler = Scheduler(misfire_grace_seconds=1.0)
+        calls: list[int] = []
+        late = datetime.now(UTC) - timedelta(seconds=30)
+        job_id = scheduler.schedule_at("late", late, lambda: calls.append(1))
+        interval_id = scheduler.schedule_interval("interval", 60, lambda: calls.append(2))
+        with scheduler._lock:
+            scheduler.get_job(interval_id).next_run_at = time.time() - 300
+            scheduler._push(scheduler.get_job(interval_id))
+
+        with scheduler:
+            time.sleep(0.1)
+
+        assert calls == []
+        assert scheduler.get_job(job_id).status == JobStatus.FAILED
+        assert scheduler.get_job(interval_id).misfire_count == 1
+        assert scheduler.get_job(interval_id).next_run_at > time.time() + 50
+        assert scheduler.get_stats()["misfires"] == 2
+
+    def test_coalesce_policy(self):
+        calls: dict[str, int] = {"coalesced": 0, "catch_up": 0}
+        scheduler = Scheduler()
+        for name, coalesce in (("coalesced", True), ("catch_up", False)):
+            scheduler.schedule_interval(
+                name, 10, lambda n=name: calls.__setitem__(n, calls[n] + 1), job_id=name, coalesce=coalesce
+            )
+            job = scheduler.get_job(name)
+            with scheduler._lock:
+                job.next_run_at = time.time() - 35  # three more occurrences missed
+                scheduler._push(job)
+
+        with scheduler:
+            time.sleep(0.1)
+
+        assert calls == {"coalesced": 1, "catch_up": 4}
+
+    def test_run_duration_metrics(self):
+        with Scheduler() as scheduler:
+            job_id = scheduler.schedule_at("once", datetime.now(UTC), lambda: time.sleep(0.02))
+            time.sleep(0.2)
+
+        stats = scheduler.get_stats()
+        assert stats["runs"] == 1
+        assert stats["durations"][job_id]["count"] == 1
+        assert scheduler.get_job(job_id).last_duration_seconds >= 0.02
+        assert scheduler.get_job(job_id).status == JobStatus.COMPLETED
+
+    def test_cancel_while_running(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def job() -> None:
+            started.set()
+            release.wait(2)
+
+        with Scheduler() as scheduler:
+            job_id = scheduler.schedule_interval("job", 0.01, job)
+            assert started.wait(2)
+            scheduler.cancel(job_id)
+            release.set()
+            time.sleep(0.1)
+
+        assert scheduler.get_job(job_id).status == JobStatus.CANCELLED
+        assert scheduler.get_job(job_id).run_count == 1
+
+    def test_stop_requeues_runs_that_never_started(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls: list[str] = []
+
+        def blocking() -> None:
+            calls.append("first")
+            started.set()
+            release.wait(2)
+
+        scheduler = Scheduler(max_workers=1)
+        scheduler.schedule_at("first", datetime.now(UTC), blocking, job_id="first")
+        scheduler.schedule_at("second", datetime.now(UTC), lambda: calls.append("second"), job_id="second")
+
+        scheduler.start()
+        assert started.wait(2)
+        time.sleep(0.05)  # "second" is queued behind the single busy worker
+        scheduler.stop()
+        release.set()
+
+        assert scheduler.get_job("second").status == JobStatus.PENDING
+        with scheduler:
+            deadline = time.time() + 2
+            while "second" not in calls and time.time() < deadline:
+                time.sleep(0.01)
+
+        assert calls == ["first", "second"]
+        assert scheduler.get_job("second").run_count == 1
+        assert scheduler.get_stats()["active"] == 0
+
+
 class TestSchedulerFactory:
     def test_create_scheduler(self):
         """Test factory function."""
         scheduler = create_scheduler()
 
         assert isinstance(scheduler, Scheduler)
+
+
+class TestSchedulerRestart:
+    """Job state persisted in a JobStore across scheduler restarts."""
+
+    def _store_overdue(self, store: JobStore, job_id: str, overdue_seconds: float, **overrides) -> None:
+        values = {"name": job_id, "trigger_key": "interval:10.0", "status": "pending", "run_count": 5}
+        values.update(overrides)
+        store.save(JobRecord(job_id=job_id, next_run_at=time.time() - overdue_seconds, **values))
+
+    def test_restart_resumes_schedule(self, tmp_path):
+        store = JobStore(tmp_path / "scheduler.db")
+        with Scheduler(job_store=store) as first:
+            first.schedule_interval("job", 60, lambda: None, job_id="job")
+            time.sleep(0.1)
+        next_run = first.get_job("job").next_run_at
+        assert next_run > time.time() + 50
+
+        calls: list[int] = []
+        second = Scheduler(job_store=store)
+        second.schedule_interval("job", 60, lambda: calls.append(1), job_id="job")
+
+        assert second.get_job("job").next_run_at == next_run
+        with second:
+            time.sleep(0.1)
+        assert calls == []
+        assert second.get_stats()["restored"] == 1
+
+    def test_run_once_catches_up_once(self, tmp_path):
+        store = JobStore(tmp_path / "scheduler.db")
+        self._store_overdue(store, "job", 35)
+        calls: list[int] = []
+
+        with Scheduler(job_store=store, misfire_grace_seconds=1.0) as scheduler:
+            scheduler.schedule_interval("job", 10, lambda: calls.append(1), job_id="job")
+            time.sleep(0.1)
+
+        job = scheduler.get_job("job")
+        assert calls == [1]
+        assert job.run_count == 6
+        assert store.load("job").run_count == 6
+        assert store.load("job").next_run_at > time.time() + 5
+
+    def test_run_all_replays_missed_runs(self, tmp_path):
+        store = JobStore(tmp_path / "scheduler.db")
+        self._store_overdue(store, "job", 35)
+        calls: list[int] = []
+
+        with Scheduler(job_store=store, catch_up="run_all") as scheduler:
+            scheduler.schedule_interval("job", 10, lambda: calls.append(1), job_id="job")
+            time.sleep(0.1)
+
+        assert len(calls) == 4
+
+    def test_skip_moves_to_next_occurrence(self, tmp_path):
+        store = JobStore(tmp_path / "scheduler.db")
+        self._store_overdue(store, "job", 35)
+        missed_at = store.load("job").next_run_at
+        calls: list[int] = []
+
+        with Scheduler(job_store=store, catch_up="skip") as scheduler:
+            scheduler.schedule_interval("job", 10, lambda: calls.append(1), job_id="job")
+            time.sleep(0.1)
+
+        job = scheduler.get_job("job")
+        assert calls == []
+        assert job.misfire_count == 1
+        assert job.next_run_at == missed_at + 40  # cadence kept
+
+    def test_catch_up_spread(self, tmp_path):
+        store = JobStore(tmp_path / "scheduler.db")
+        for job_id in ("a", "b"):
+            self._store_overdue(store, job_id, 35)
+        scheduler = Scheduler(job_store=store, catch_up_spread_seconds=600)
+        for job_id in ("a", "b"):
+            scheduler.schedule_interval(job_id, 10, lambda: None, job_id=job_id)
+
+        delays = [scheduler.get_job(job_id).next_run_at - time.time() for job_id in ("a", "b")]
+        assert all(-1 < delay <= 600 for delay in delays)
+        assert delays[0] != delays[1]
+
+    def test_completed_one_time_job_not_rerun(self, tmp_path):
+        store = JobStore(tmp_path / "scheduler.db")
+        at = datetime.now(UTC)
+        calls: list[int] = []
+
+        with Scheduler(job_store=store) as first:
+            first.schedule_at("once", at, lambda: calls.append(1), job_id="once")
+            time.sleep(0.1)
+        with Scheduler(job_store=store) as second:
+            second.schedule_at("once", at, lambda: calls.append(2), job_id="once")
+            time.sleep(0.1)
+
+        assert calls == [1]
+        assert second.get_job("once").status == JobStatus.COMPLETED
+
+    def test_changed_trigger_starts_fresh(self, tmp_path):
+        store = JobStore(tmp_path / "scheduler.db")
+        self._store_overdue(store, "job", 35)
+        scheduler = Scheduler(job_store=store)
+        scheduler.schedule_interval("job", 60, lambda: None, job_id="job")
+
+        job = scheduler.get_job("job")
+        assert job.run_count == 0
+        assert job.next_run_at <= time.time()  # new interval jobs run immediately
+        assert store.load("job").trigger_key == "interval:60.0"
+        assert scheduler.get_stats()["restored"] == 0
+
+    def test_invalid_catch_up_policy(self):
+        with pytest.raises(ValueError, match="catch-up"):
+            Scheduler(catch_up="sometimes")
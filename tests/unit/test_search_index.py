@@ -0,0 +1,120 @@
+"""Tests for full-text search index (ADR-006)."""
+
+from __future__ import annotations
+
+import pytest
+
+from kira.core.entity_index import EntityIndex
+from kira.core.host import HostAPI
+from kira.core.search_index import build_match_query, normalize_search_text, tokenize
+from kira.core.vault_rpc_handlers import VaultRPCHandlers
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+class TestTokenization:
+    def test_normalize_folds_case_and_yo(self):
+        assert normalize_search_text("Ёлка ЗАДАЧА Report") == "елка задача report"
+
+    def test_tokenize_mixed_languages(self):
+        assert tokenize("Купить milk, и_хлеб!") == ["купить", "milk", "и", "хлеб"]
+
+    def test_build_match_query_prefix_and_phrase(self):
+        assert build_match_query('отчёт "weekly review"') == '"отчет"* AND "weekly review"'
+
+    def test_build_match_query_escapes_syntax(self):
+        assert build_match_query("NOT OR (x)") == '"not"* AND "or"* AND "x"*'
+        assert build_match_query("?! --") is None
+
+
+@pytest.fixture
+def index(tmp_path):
+    _write(
+        tmp_path / "notes" / "note-1.md",
+        "---\nid: note-1\ntitle: Еженедельный отчёт\ntags:\n  - work\n---\n\nСобрать метрики за неделю",
+    )
+    _write(
+        tmp_path / "notes" / "note-2.md",
+        "---\nid: note-2\ntitle: Groceries\ntags:\n  - home\n---\n\nКупить молоко и хлеб. Weekly report draft.",
+    )
+    _write(
+        tmp_path / "tasks" / "task-1.md",
+        "---\nid: task-1\ntitle: Weekly report\nstatus: todo\n---\n\nSend the weekly report",
+    )
+    entity_index = EntityIndex(tmp_path, ["tasks", "notes"])
+    if not entity_index.full_text_available:
+        pytest.skip("SQLite built without FTS5")
+    entity_index.refresh()
+    yield entity_index
+    entity_index.close()
+
+
+class TestFullTextSearch:
+    def test_title_matches_rank_first(self, index):
+        results = index.search("weekly report")
+
+        assert results.total == 2
+        assert [hit.entity.entity_id for hit in results.hits] == ["task-1", "note-2"]
+
+    def test_prefix_matches_russian_inflections(self, index):
+        results = index.search("отчет")
+        assert [hit.entity.entity_id for hit in results.hits] == ["note-1"]
+
+        results = index.search("молок")
+        assert [hit.entity.entity_id for hit in results.hits] == ["note-2"]
+
+    def test_phrase_query(self, index):
+        assert [hit.entity.entity_id for hit in index.search('"молоко и хлеб"').hits] == ["note-2"]
+        assert index.search('"хлеб и молоко"').hits == []
+
+    def test_filters_and_pagination(self, index):
+        assert [hit.entity.entity_id for hit in index.search("report", tags=["home"]).hits] == ["note-2"]
+        assert [hit.entity.entity_id for hit in index.search("report", status="todo").hits] == ["task-1"]
+
+        page = index.search("report", limit=1, offset=1)
+        assert page.total == 2
+        assert [hit.entity.entity_id for hit in page.hits] == ["note-2"]
+
+    def test_index_follows_file_changes(self, index, tmp_path):
+        _write(tmp_path / "notes" / "note-2.md", "---\nid: note-2\ntitle: Groceries\n---\n\nApples")
+        index.refresh()
+
+        assert [hit.entity.entity_id for hit in index.search("report").hits] == ["task-1"]
+        assert [hit.entity.entity_id for hit in index.search("apples").hits] == ["note-2"]
+
+
+class TestHostAPISearch:
+    def test_search_sees_writes_without_rescan(self, tmp_path):
+        host_api = HostAPI(tmp_path)
+        task = host_api.create_entity("task", {"title": "Подготовить презентацию"}, content="Слайды для клиента")
+
+        assert [e.id for e in host_api.search_entities("презентац")] == [task.id]
+
+        host_api.update_entity(task.id, {"title": "Prepare slides"})
+        assert host_api.search_entities("презентац") == []
+        assert [e.id for e in host_api.search_entities("slides")] == [task.id]
+
+        host_api.delete_entity(task.id)
+        assert host_api.search_entities("slides") == []
+
+    def test_scan_fallback_without_index(self, tmp_path):
+        writer = HostAPI(tmp_path)
+        note = writer.create_entity("note", {"title": "Urgent call"}, content="Call the bank")
+        writer.create_entity("note", {"title": "Other"}, content="Nothing here")
+
+        host_api = HostAPI(tmp_path, use_entity_index=False)
+
+        assert [e.id for e in host_api.search_entities("urgent")] == [note.id]
+
+    def test_vault_search_rpc_uses_index(self, tmp_path):
+        host_api = HostAPI(tmp_path)
+        task = host_api.create_entity("task", {"title": "Fix login bug"}, content="Users cannot log in")
+        host_api.create_entity("task", {"title": "Write docs"})
+
+        result = VaultRPCHandlers(host_api).handle_vault_search({"query": "login", "entity_type": "task"})
+
+        assert result["count"] == 1
+        assert result["entities"][0]["id"] == task.id
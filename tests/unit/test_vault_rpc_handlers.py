@@ -0,0 +1,190 @@
+"""Tests for paginated and streaming Vault RPC handlers (ADR-006)."""
+
+from __future__ import annotations
+
+import os
+import threading
+
+import pytest
+
+from kira.core.host import HostAPI
+from kira.core.vault_rpc_handlers import (
+    DEFAULT_PAGE_SIZE,
+    STREAM_CHUNK_METHOD,
+    VaultRPCHandlers,
+    register_vault_rpc_handlers,
+)
+from kira.plugin_sdk.rpc import HostRPCClient, JSONRPCMessage, RPCError, RPCServer, StdioTransport
+from kira.plugin_sdk.types import RPCResponse
+
+
+@pytest.fixture
+def host_api(tmp_path):
+    host_api = HostAPI(tmp_path)
+    for i in range(7):
+        host_api.create_entity(
+            "task",
+            {"title": f"Report {i}", "status": "todo" if i % 2 else "doing", "tags": ["work"]},
+            content=f"Body {i}",
+        )
+    host_api.create_entity("note", {"title": "Report note"})
+    return host_api
+
+
+def _walk(handlers, method, params):
+    ids = []
+    cursor = None
+    while True:
+        page = handlers[method]({**params, "cursor": cursor} if cursor else params)
+        ids.extend(entity["id"] for entity in page["entities"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+class TestPagination:
+    def test_cursor_walk_returns_every_entity_once(self, host_api):
+        handlers = register_vault_rpc_handlers(host_api)
+
+        ids = _walk(handlers, "vault.list", {"entity_type": "task", "limit": 3})
+
+        assert ids == [entity.id for entity in host_api.list_entities("task")]
+        assert len(ids) == 7
+
+    def test_last_page_has_no_cursor(self, host_api):
+        page = VaultRPCHandlers(host_api).handle_vault_list({"entity_type": "task", "limit": 7})
+
+        assert page["count"] == 7
+        assert page["next_cursor"] is None
+
+    def test_default_page_size_and_validation(self, tmp_path):
+        host_api = HostAPI(tmp_path)
+        for i in range(DEFAULT_PAGE_SIZE + 1):
+            host_api.create_entity("note", {"title": f"Note {i}"})
+        handlers = VaultRPCHandlers(host_api)
+
+        page = handlers.handle_vault_list({"limit": DEFAULT_PAGE_SIZE})
+
+        assert page["count"] == DEFAULT_PAGE_SIZE
+        assert page["next_cursor"] is not None
+        last = handlers.handle_vault_list({"cursor": page["next_cursor"]})
+        assert (last["offset"], last["count"], last["next_cursor"]) == (DEFAULT_PAGE_SIZE, 1, None)
+        with pytest.raises(ValueError, match="limit"):
+            handlers.handle_vault_list({"limit": 0})
+
+    def test_list_without_limit_or_cursor_is_unpaged(self, tmp_path):
+        host_api = HostAPI(tmp_path)
+        for i in range(DEFAULT_PAGE_SIZE + 5):
+            host_api.create_entity("note", {"title": f"Note {i}"})
+        handlers = VaultRPCHandlers(host_api)
+
+        page = handlers.handle_vault_list({})
+
+        assert page["count"] == DEFAULT_PAGE_SIZE + 5
+        assert page["next_cursor"] is None
+        assert handlers.handle_vault_list({"offset": 3})["count"] == DEFAULT_PAGE_SIZE + 2
+
+    def test_filters_and_legacy_offset(self, host_api):
+        handlers = VaultRPCHandlers(host_api)
+
+        page = handlers.handle_vault_list({"entity_type": "task", "status": "todo", "offset": 1})
+
+        assert page["offset"] == 1
+        assert [e["metadata"]["status"] for e in page["entities"]] == ["todo", "todo"]
+
+    def test_cursor_is_bound_to_its_query(self, host_api):
+        handlers = VaultRPCHandlers(host_api)
+        cursor = handlers.handle_vault_list({"entity_type": "task", "limit": 2})["next_cursor"]
+
+        with pytest.raises(ValueError, match="does not match"):
+            handlers.handle_vault_list({"entity_type": "note", "cursor": cursor})
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            handlers.handle_vault_list({"cursor": "not-a-cursor"})
+
+    def test_search_pages(self, host_api):
+        handlers = register_vault_rpc_handlers(host_api)
+
+        ids = _walk(handlers, "vault.search", {"query": "report", "limit": 2})
+
+        assert len(ids) == len(set(ids)) == 8
+
+
+class TestProjection:
+    def test_fields_and_content(self, host_api):
+        page = VaultRPCHandlers(host_api).handle_vault_list(
+            {"entity_type": "task", "limit": 1, "fields": ["title", "missing"], "include_content": False}
+        )
+
+        entity = page["entities"][0]
+        assert entity["metadata"] == {"title": "Report 0"}
+        assert "content" not in entity
+
+    def test_content_included_by_default(self, host_api):
+        result = VaultRPCHandlers(host_api).handle_vault_search({"query": "report", "entity_type": "task", "limit": 1})
+
+        assert result["entities"][0]["content"].startswith("Body")
+        assert set(result["entities"][0]["metadata"]) >= {"title", "status", "tags"}
+
+
+class TestStreaming:
+    def test_stream_pushes_one_notification_per_page(self, host_api):
+        sent = []
+        handlers = register_vault_rpc_handlers(host_api, notify=lambda method, params: sent.append((method, params)))
+
+        summary = handlers["vault.list.stream"]({"entity_type": "task", "limit": 3, "stream_id": "s1"})
+
+        assert summary == {"stream_id": "s1", "chunks": 3, "count": 7}
+        assert {method for method, _ in sent} == {STREAM_CHUNK_METHOD}
+        assert [params["seq"] for _, params in sent] == [0, 1, 2]
+        assert [len(params["entities"]) for _, params in sent] == [3, 3, 1]
+        assert [params["last"] for _, params in sent] == [False, False, True]
+
+    def test_stream_methods_need_notifier(self, host_api):
+        assert "vault.list.stream" not in register_vault_rpc_handlers(host_api)
+
+    def test_empty_search_stream(self, host_api):
+        sent = []
+        handlers = register_vault_rpc_handlers(host_api, notify=lambda method, params: sent.append(params))
+
+        assert handlers["vault.search.stream"]({"query": "", "stream_id": "s"})["chunks"] == 0
+        assert sent == []
+
+
+class TestPluginClient:
+    def test_paginate_follows_cursors(self, host_api):
+        handlers = register_vault_rpc_handlers(host_api)
+        client = HostRPCClient(lambda request: RPCResponse(result=handlers[request.method](dict(request.payload))))
+
+        pages = list(client.paginate("vault.list", {"entity_type": "task", "limit": 4, "fields": ["title"]}))
+
+        assert [page["count"] for page in pages] == [4, 3]
+
+    def test_stream_over_stdio(self, host_api):
+        to_host_r, to_host_w = os.pipe()
+        to_plugin_r, to_plugin_w = os.pipe()
+        host_transport = StdioTransport(os.fdopen(to_host_r, "rb"), os.fdopen(to_plugin_w, "wb"))
+        plugin_transport = StdioTransport(os.fdopen(to_plugin_r, "rb"), os.fdopen(to_host_w, "wb"))
+
+        def notify(method, params):
+            host_transport.send(JSONRPCMessage(method=method, params=params))
+
+        server = RPCServer(register_vault_rpc_handlers(host_api, notify=notify), host_transport)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            client = HostRPCClient(plugin_transport)
+
+            chunks = list(client.stream("vault.list.stream", {"entity_type": "task", "limit": 2}))
+
+            assert [len(chunk["entities"]) for chunk in chunks] == [2, 2, 2, 1]
+            with pytest.raises(RPCError, match="Invalid cursor"):
+                list(client.stream("vault.list.stream", {"cursor": "bogus"}))
+        finally:
+            plugin_transport.output.close()
+            thread.join(timeout=5)
+
+    def test_stream_requires_stdio_transport(self):
+        client = HostRPCClient(lambda request: RPCResponse(result={}))
+
+        with pytest.raises(TypeError):
+            list(client.stream("vault.list.stream"))
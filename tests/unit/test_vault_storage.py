@@ -7,6 +7,7 @@ from pathlib import Path
 
 import pytest
 
+from kira.core.events import EventBus
 from kira.core.host import EntityNotFoundError
 from kira.storage.vault import Vault, VaultConfig
 
@@ -225,3 +226,81 @@ def test_vault_round_trip():
         assert retrieved2.content == "Updated content"
         # Priority should still be there (partial update)
         assert retrieved2.metadata["priority"] == "high"
+
+
+def test_vault_batch_commits_together_and_reports_results():
+    """Test batch writes entities, reports per-entity results and emits events after commit."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        vault = Vault(VaultConfig(vault_path=Path(tmpdir)))
+        existing = vault.upsert(entity_type="task", data={"title": "Existing", "status": "todo"})
+
+        bus = EventBus()
+        events = []
+        bus.subscribe("entity.created", lambda event: events.append(event.name))
+        bus.subscribe("entity.updated", lambda event: events.append(event.name))
+        vault.host_api.event_bus = bus
+
+        with vault.batch() as batch:
+            for i in range(3):
+                batch.upsert("note", {"title": f"Note {i}"}, content=f"Body {i}")
+            batch.upsert("task", {"id": existing.id, "status": "doing"})
+            batch.upsert("task", {"title": "Invalid", "status": "not-a-status"})
+            assert events == []
+
+        results = batch.results
+        assert [r.ok for r in results] == [True, True, True, True, False]
+        assert results[3].operation == "update"
+        assert results[4].error
+        assert sorted(events) == ["entity.created"] * 3 + ["entity.updated"]
+
+        assert vault.get(existing.id).metadata["status"] == "doing"
+        assert {e.metadata["title"] for e in vault.list_entities("note")} == {"Note 0", "Note 1", "Note 2"}
+
+
+def test_vault_batch_discarded_on_error():
+    """Test nothing is written if the batch block raises."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        vault = Vault(VaultConfig(vault_path=Path(tmpdir)))
+
+        with pytest.raises(RuntimeError), vault.batch() as batch:
+            batch.upsert("note", {"title": "Never written"})
+            raise RuntimeError("abort")
+
+        assert vault.list_entities("note") == []
+
+
+def test_vault_bulk_upsert_holds_bounded_locks(monkeypatch):
+    """Test bulk_upsert locks in chunks so open lock files stay bounded."""
+    from kira.storage.vault import EntityLock
+
+    held = []
+    peak = []
+    original_enter = EntityLock.__enter__
+    original_exit = EntityLock.__exit__
+
+    def counting_enter(self):
+        lock = original_enter(self)
+        held.append(self.entity_id)
+        peak.append(len(held))
+        return lock
+
+    def counting_exit(self, *exc_info):
+        held.remove(self.entity_id)
+        return original_exit(self, *exc_info)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        vault = Vault(VaultConfig(vault_path=Path(tmpdir), bulk_lock_chunk_size=3))
+        existing = [vault.upsert(entity_type="note", data={"title": f"Note {i}"}) for i in range(7)]
+
+        monkeypatch.setattr(EntityLock, "__enter__", counting_enter)
+        monkeypatch.setattr(EntityLock, "__exit__", counting_exit)
+
+        items = [{"entity_type": "note", "data": {"id": e.id, "title": f"Updated {i}"}} for i, e in enumerate(existing)]
+        items.append({"entity_type": "note", "data": {"title": "New"}})
+        results = vault.bulk_upsert(items)
+
+        assert [r.index for r in results] == list(range(8))
+        assert all(r.ok for r in results)
+        assert max(peak) == 3
+        assert held == []
+        assert vault.get(existing[6].id).metadata["title"] == "Updated 6"
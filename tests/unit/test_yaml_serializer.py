@@ -339,3 +339,199 @@ def test_deterministic_with_special_characters():
     assert yaml_str == yaml_str2
     assert parsed_data["title"] == data["title"]
     assert parsed_data["description"] == data["description"]
+
+
+def _typed(value):
+    """Structure with types attached, so 1 != True and "1" != 1."""
+    if isinstance(value, dict):
+        return {_typed(k): _typed(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_typed(v) for v in value]
+    return (type(value).__name__, value)
+
+
+FRONTMATTER_CORPUS = [
+    "",
+    "id: task-1\ntitle: Simple",
+    "title: Buy milk, bread and eggs\nstatus: todo\npriority: high",
+    "count: 42\nratio: 0.5\nneg: -3\nhex: 0x1F\nflag: true\nother: no\nnothing: null\ntilde: ~",
+    "due: 2025-10-08\nwhen: 2025-10-08T12:30:00+00:00\nquoted: '2025-10-08T12:30:00+00:00'",
+    "time: 10:30\nversion: 1.0\nexp: 1e3\ninf: .inf",
+    "title: 'It''s quoted: yes'\nother: \"double quoted\"\nempty: ''",
+    "tags:\n  - work\n  - urgent\n  - '[[note-1]]'\nlinks: []\nmeta: {}",
+    "depends_on:\n- task-1\n- task-2\nblocks:\n  -\n  - 7",
+    "x-kira:\n  source: gcal\n  version: 2\n  remote_id: abc123\n  last_write_ts: '2025-01-01T00:00:00+00:00'",
+    "x-kira:\n  nested:\n    deep: value\n  items:\n  - 1\n  - two\nafter: top",
+    "title: Заметка про ёлку\nописание: Русский ключ\nemoji: ✅ done",
+    "title: See [[project-1]] and {braces}\npath: a/b#c\nurl: http://example.com",
+    "empty_value:\nnext: 1",
+    "title: trailing spaces   \n\nblank_lines: above",
+    # Outside the canonical subset: must fall back
+    "tags: [a, b]\nmeta: {x: 1}",
+    "description: |\n  Multi\n  line",
+    "title: first line\n  continues here",
+    "anchor: &a 1\nalias: *a",
+    "title: value # comment",
+    "---\ntitle: doc marker",
+    "? complex\n: key",
+    "yes: bool key\n1: int key",
+    'title: "escaped \\n newline"',
+    "items:\n  - a: 1\n    b: 2",
+    "\ttabbed: value",
+]
+
+
+@pytest.mark.parametrize("yaml_str", FRONTMATTER_CORPUS)
+def test_parse_frontmatter_matches_safe_load(yaml_str):
+    """Test fast path and loader fallbacks agree with yaml.safe_load."""
+    import yaml
+
+    try:
+        expected = yaml.safe_load(yaml_str)
+    except yaml.YAMLError:
+        with pytest.raises(ValueError):
+            parse_frontmatter(yaml_str)
+        return
+
+    if not isinstance(expected, dict | None):
+        with pytest.raises(ValueError):
+            parse_frontmatter(yaml_str)
+        return
+
+    assert _typed(parse_frontmatter(yaml_str)) == _typed(expected or {})
+
+
+def test_serialized_frontmatter_round_trips_through_fast_path():
+    """Test serialize_frontmatter output is parsed by the fast path, identically to safe_load."""
+    import random
+
+    import yaml
+
+    from kira.core.yaml_serializer import _parse_canonical_frontmatter
+
+    rng = random.Random(20251008)
+    words = ["alpha", "Бета", "gamma delta", "yes", "null", "10:30", "1e3", "0x1F", "-5", "x-y", "a,b", "ёж"]
+    scalars = [*words, 0, 7, -3, 2.5, True, False, None, "2025-10-08", "[[note-1]]", "a: b", "#tag", "@user"]
+
+    for _ in range(300):
+        data = {"id": f"task-{rng.randint(1, 999)}", "title": rng.choice(words)}
+        for key in rng.sample(["status", "priority", "category", "custom", "estimate", "location"], 3):
+            data[key] = rng.choice(scalars)
+        data["tags"] = rng.sample(words, rng.randint(0, 4))
+        data["x-kira"] = {"source": rng.choice(words), "version": rng.randint(1, 5), "flag": rng.choice(scalars)}
+        data["created"] = datetime(2025, 1, rng.randint(1, 28), rng.randint(0, 23), tzinfo=UTC)
+
+        yaml_str = serialize_frontmatter(data)
+
+        fast = _parse_canonical_frontmatter(yaml_str)
+        assert fast is not None, yaml_str
+        assert _typed(fast) == _typed(yaml.safe_load(yaml_str))
+
+
+def _random_scalar(rng):
+    """Random scalar covering quoting, resolver and folding edge cases."""
+    from datetime import date
+
+    pieces = [
+        "plain",
+        "Задача",
+        "yes",
+        "null",
+        "10:30",
+        "1e3",
+        "-5",
+        "a: b",
+        "#tag",
+        "@user",
+        "it's",
+        "[[note-1]]",
+        "{x}",
+        "...",
+        "---",
+        " ",
+        "a#b",
+        "x\ny",
+        "日本語",
+        "%",
+        "!",
+        "&anchor",
+        "",
+        "'",
+        '"',
+        "\\",
+        "ü",
+        "\t",
+    ]
+    choice = rng.randrange(12)
+    if choice == 0:
+        return None
+    if choice == 1:
+        return rng.choice([True, False])
+    if choice == 2:
+        return rng.randint(-1000, 10**12)
+    if choice == 3:
+        return rng.choice([0.5, -2.25, 1e17, 1e-05, float("inf"), 3.0])
+    if choice == 4:
+        return date(2025, rng.randint(1, 12), rng.randint(1, 28))
+    if choice == 5:
+        return datetime(2025, 1, 2, rng.randint(0, 23), 30, tzinfo=UTC)
+    return "".join(rng.choice(pieces) for _ in range(rng.randint(1, 4))) * rng.choice([1, 1, 1, 8, 20])
+
+
+def _random_frontmatter(rng):
+    data = {"id": f"task-{rng.randint(1, 999)}", "title": _random_scalar(rng)}
+    keys = ["status", "priority", "category", "custom", "estimate", "created", "updated", "due_date", "zzz", "a key"]
+    for key in rng.sample(keys, rng.randint(0, len(keys))):
+        data[key] = _random_scalar(rng)
+    if rng.random() < 0.7:
+        data["tags"] = [_random_scalar(rng) for _ in range(rng.randint(0, 4))]
+    if rng.random() < 0.7:
+        nested = {"source": _random_scalar(rng), "last_write_ts": _random_scalar(rng)}
+        if rng.random() < 0.5:
+            nested["items"] = [_random_scalar(rng) for _ in range(rng.randint(0, 3))]
+        if rng.random() < 0.3:
+            nested["deep"] = {"value": _random_scalar(rng), "empty": {}}
+        if rng.random() < 0.2:
+            nested[_random_scalar(rng) if rng.random() < 0.5 else "odd key"] = 1
+        data["x-kira"] = nested
+    if rng.random() < 0.1:
+        data["x-empty"] = {}
+    return data
+
+
+def test_serialize_frontmatter_matches_pyyaml_reference():
+    """Test the fast emitter is byte-identical to the per-value yaml.dump implementation."""
+    import random
+
+    from kira.core.yaml_serializer import (
+        _serialize_frontmatter_pyyaml,
+        get_canonical_key_order,
+        normalize_timestamps_to_utc,
+    )
+
+    rng = random.Random(8)
+    for _ in range(2000):
+        data = _random_frontmatter(rng)
+        for normalize in (True, False):
+            reference_data = normalize_timestamps_to_utc(data) if normalize else data
+            expected = _serialize_frontmatter_pyyaml(reference_data, get_canonical_key_order(list(data)))
+
+            assert serialize_frontmatter(data, normalize_timestamps=normalize) == expected, data
+
+
+def test_serialize_frontmatter_avoids_yaml_dump_for_canonical_data():
+    """Test typical entity frontmatter is emitted without PyYAML."""
+    from unittest.mock import patch
+
+    data = {
+        "id": "task-20251008-1200-report",
+        "title": "Report: Q3 numbers",
+        "status": "todo",
+        "created": datetime(2025, 10, 8, 12, 0, tzinfo=UTC),
+        "tags": ["work", "[[project-1]]"],
+        "x-kira": {"source": "gcal", "version": 2, "last_write_ts": "2025-10-08T12:00:00Z"},
+    }
+    expected = serialize_frontmatter(data)
+
+    with patch("yaml.dump", side_effect=AssertionError("yaml.dump called")):
+        assert serialize_frontmatter(data) == expected